@@ -0,0 +1,245 @@
+"""
+Archival of resolved alert groups.
+
+Resolved alert groups older than a configurable age are moved out of the alert group, alert and log record tables
+to ArchivedAlertGroup, so the hot tables and their indexes don't grow without bound. Archived alert groups keep
+a serialized copy of every row deleted along with the alert group (ArchivedAlertGroupRow), collected the same way
+the deletion itself is performed, so no data is lost and archived alert groups can be read or restored
+(see ArchivedAlertGroup). Attached alert groups are archived together with their root alert group, and email,
+phone call and SMS records of an alert group are archived with it.
+
+Alert groups are archived in batches of ALERT_GROUP_ARCHIVE_BATCH_SIZE. A batch is split into transactions of
+at most ALERT_GROUP_ARCHIVE_MAX_ROWS_PER_TRANSACTION rows, so locks are held and rows are kept in memory only
+for a bounded number of rows. A root alert group with its attached alert groups is always archived in a single
+transaction, even if it has more rows than that.
+"""
+import dataclasses
+import datetime
+import typing
+
+from django.core import serializers
+from django.db import models, router, transaction
+from django.db.models.deletion import Collector
+from django.utils import timezone
+
+if typing.TYPE_CHECKING:
+    from apps.alerts.models import AlertGroup
+
+ALERT_GROUP_ARCHIVE_BATCH_SIZE = 100
+ALERT_GROUP_ARCHIVE_MAX_ROWS_PER_TRANSACTION = 10000
+# rows of a single model are loaded and archived in chunks
+ALERT_GROUP_ARCHIVE_CHUNK_SIZE = 1000
+
+
+@dataclasses.dataclass
+class ArchiveResult:
+    alert_groups: int = 0
+    rows: int = 0
+
+    def __iadd__(self, other: "ArchiveResult") -> "ArchiveResult":
+        self.alert_groups += other.alert_groups
+        self.rows += other.rows
+        return self
+
+
+def get_alert_groups_to_archive(older_than: datetime.timedelta) -> "models.QuerySet[AlertGroup]":
+    """
+    Return resolved root alert groups older than `older_than`. Attached alert groups are archived with their root
+    alert group, and root alert groups with unresolved attached alert groups are left out, so they don't take up
+    batches without being archived.
+    """
+    from apps.alerts.models import AlertGroup
+
+    return (
+        AlertGroup.objects.filter(
+            resolved=True, resolved_at__lt=timezone.now() - older_than, root_alert_group__isnull=True
+        )
+        .exclude(dependent_alert_groups__resolved=False)
+        .order_by("pk")
+    )
+
+
+def archive_alert_groups(older_than: datetime.timedelta, max_batches: int | None = None, dry_run: bool = False):
+    """
+    Archive resolved alert groups older than `older_than` batch by batch, yielding ArchiveResult for each batch.
+    With `dry_run=True` nothing is archived, results contain numbers of alert groups and rows that would be archived.
+    """
+    alert_group_ids = get_alert_groups_to_archive(older_than).values_list("pk", flat=True)
+
+    last_id = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        batch_ids = list(alert_group_ids.filter(pk__gt=last_id)[:ALERT_GROUP_ARCHIVE_BATCH_SIZE])
+        if not batch_ids:
+            return
+
+        yield archive_alert_group_batch(batch_ids, dry_run=dry_run)
+        last_id = batch_ids[-1]
+        batches += 1
+
+
+def archive_alert_group_batch(alert_group_ids: typing.List[int], dry_run: bool = False) -> ArchiveResult:
+    """
+    Archive resolved alert groups with given ids. Attached alert groups are archived only together with their root
+    alert group, and a root alert group is skipped while any of its attached alert groups is not resolved, so archival
+    never turns attached alert groups into root alert groups.
+    """
+    result = ArchiveResult()
+    remaining_ids = sorted(alert_group_ids)
+    while remaining_ids:
+        transaction_result, remaining_ids = _archive_alert_groups_in_transaction(remaining_ids, dry_run)
+        result += transaction_result
+    return result
+
+
+def _archive_alert_groups_in_transaction(
+    alert_group_ids: typing.List[int], dry_run: bool
+) -> typing.Tuple[ArchiveResult, typing.List[int]]:
+    """
+    Archive root alert groups with given ids in a single transaction until ALERT_GROUP_ARCHIVE_MAX_ROWS_PER_TRANSACTION
+    rows are collected, return ids of root alert groups left for the next transaction.
+    """
+    from apps.alerts.models import AlertGroup
+
+    using = router.db_for_write(AlertGroup)
+    result = ArchiveResult()
+
+    with transaction.atomic(using=using):
+        alert_groups_by_root = _get_alert_groups_with_dependents(alert_group_ids, using, lock=not dry_run)
+
+        collected: typing.List[typing.Tuple["AlertGroup", Collector]] = []
+        remaining_ids: typing.List[int] = []
+        for root_pk, alert_groups in alert_groups_by_root.items():
+            collectors = [_collect_alert_group(alert_group, using) for alert_group in alert_groups]
+            rows = sum(_count_collected_rows(collector) for collector in collectors)
+            if collected and result.rows + rows > ALERT_GROUP_ARCHIVE_MAX_ROWS_PER_TRANSACTION:
+                remaining_ids = [pk for pk in alert_group_ids if pk >= root_pk]
+                break
+
+            collected += zip(alert_groups, collectors)
+            result.alert_groups += len(alert_groups)
+            result.rows += rows
+
+        if dry_run:
+            return result, remaining_ids
+
+        for alert_group, collector in collected:
+            _archive_collected_rows(alert_group, collector, using)
+        for _, collector in collected:
+            collector.delete()
+
+        # archived alert groups are not counted in metrics anymore, same as deleted ones
+        alert_groups_by_organization: typing.Dict[int, typing.List[AlertGroup]] = {}
+        for alert_group, _ in collected:
+            alert_groups_by_organization.setdefault(alert_group.channel.organization_id, []).append(alert_group)
+        for organization_id, organization_alert_groups in alert_groups_by_organization.items():
+            AlertGroup._bulk_update_metrics(
+                organization_id,
+                organization_alert_groups,
+                [alert_group.state for alert_group in organization_alert_groups],
+                None,
+            )
+
+    return result, remaining_ids
+
+
+def _get_alert_groups_with_dependents(
+    alert_group_ids: typing.List[int], using: str, lock: bool
+) -> typing.Dict[int, typing.List["AlertGroup"]]:
+    """
+    Return resolved root alert groups with given ids together with all their (resolved) attached alert groups,
+    by root alert group id in id order.
+    Root alert groups with unresolved attached alert groups are left out along with their attached alert groups.
+    """
+    from apps.alerts.models import AlertGroup
+
+    # integrations are prefetched rather than joined, so they are not locked along with alert groups
+    queryset = AlertGroup.objects.using(using).prefetch_related("channel").order_by("pk")
+    if lock:
+        # lock alert groups, so they can't be changed (e.g. unresolved or attached) while being archived
+        queryset = queryset.select_for_update()
+
+    roots = list(queryset.filter(pk__in=alert_group_ids, resolved=True, root_alert_group__isnull=True))
+
+    # attached alert groups can have alert groups attached to them as well, so follow the chain
+    dependents_by_root: typing.Dict[int, typing.List[AlertGroup]] = {root.pk: [] for root in roots}
+    root_pk_by_pk = {root.pk: root.pk for root in roots}
+    parent_ids = list(root_pk_by_pk)
+    while parent_ids:
+        dependents = list(queryset.filter(root_alert_group_id__in=parent_ids).exclude(pk__in=root_pk_by_pk))
+        for dependent in dependents:
+            root_pk = root_pk_by_pk[dependent.root_alert_group_id]
+            root_pk_by_pk[dependent.pk] = root_pk
+            dependents_by_root[root_pk].append(dependent)
+        parent_ids = [dependent.pk for dependent in dependents]
+
+    return {
+        root.pk: [root, *dependents_by_root[root.pk]]
+        for root in roots
+        if all(dependent.resolved for dependent in dependents_by_root[root.pk])
+    }
+
+
+def _collect_alert_group(alert_group: "AlertGroup", using: str) -> Collector:
+    """
+    Collect rows to be archived and deleted along with the alert group.
+    Notification records referencing the alert group with on_delete=SET_NULL are archived with it as well,
+    so they don't lose the reference to the alert group.
+    """
+    from apps.email.models import EmailMessage
+    from apps.phone_notifications.models import PhoneCallRecord, SMSRecord
+
+    collector = Collector(using=using)
+    collector.collect([alert_group])
+    for model in (EmailMessage, PhoneCallRecord, SMSRecord):
+        collector.collect(model._base_manager.using(using).filter(represents_alert_group=alert_group))
+    return collector
+
+
+def _count_collected_rows(collector: Collector) -> int:
+    return sum(len(instances) for instances in collector.data.values()) + sum(
+        queryset.count() for queryset in collector.fast_deletes
+    )
+
+
+def _archive_collected_rows(alert_group: "AlertGroup", collector: Collector, using: str) -> None:
+    """
+    Save rows collected for deletion to ArchivedAlertGroupRow in the order they can be restored in
+    (referenced rows first). Collector loads only the fields needed for deletion for models without delete signal
+    receivers, so rows are reloaded with all the fields in chunks and archived chunk by chunk.
+    """
+    from apps.alerts.models import ArchivedAlertGroup, ArchivedAlertGroupRow
+
+    archived_alert_group = ArchivedAlertGroup.objects.using(using).create(
+        organization_id=alert_group.channel.organization_id,
+        channel_id=alert_group.channel_id,
+        alert_group_id=alert_group.pk,
+        root_alert_group_id=alert_group.root_alert_group_id,
+        public_primary_key=alert_group.public_primary_key,
+        started_at=alert_group.started_at,
+        resolved_at=alert_group.resolved_at,
+    )
+
+    def archive_rows(rows: typing.Iterable[models.Model]) -> None:
+        ArchivedAlertGroupRow.objects.using(using).bulk_create(
+            [
+                ArchivedAlertGroupRow(archived_alert_group=archived_alert_group, model=data["model"], data=data)
+                for data in serializers.serialize("python", rows)
+            ],
+            batch_size=ALERT_GROUP_ARCHIVE_CHUNK_SIZE,
+        )
+
+    collector.sort()
+    # collector deletes rows referencing other rows first
+    for model, instances in reversed(collector.data.items()):
+        pks = sorted(instance.pk for instance in instances)
+        for i in range(0, len(pks), ALERT_GROUP_ARCHIVE_CHUNK_SIZE):
+            chunk = pks[i : i + ALERT_GROUP_ARCHIVE_CHUNK_SIZE]
+            archive_rows(model._base_manager.using(using).filter(pk__in=chunk).order_by("pk"))
+
+    # fast deletes don't have rows referencing them
+    for queryset in collector.fast_deletes:
+        pks = list(queryset.order_by("pk").values_list("pk", flat=True))
+        for i in range(0, len(pks), ALERT_GROUP_ARCHIVE_CHUNK_SIZE):
+            chunk = pks[i : i + ALERT_GROUP_ARCHIVE_CHUNK_SIZE]
+            archive_rows(queryset.model._base_manager.using(using).filter(pk__in=chunk).order_by("pk"))
@@ -0,0 +1,234 @@
+"""
+Alert group counts for the alert groups page stats.
+
+Counts for the common filter shapes (status, integration, team, root alert groups only) are served from small
+per-organization counters of alert groups by (integration, is root, status). Counters are built with a single
+aggregating query when they are not cached, and then updated incrementally by alert group changes (created,
+state changed, attached/unattached, deleted) with atomic cache increments. Concurrent requests wait for a single
+rebuild instead of running the query at the same time.
+
+Counters may drift slightly when an alert group changes while counters are being rebuilt, so they expire after
+ALERT_GROUP_COUNTERS_CACHE_TIMEOUT and are rebuilt from the database. Arbitrary filters fall back to a count bounded
+by ALERT_GROUPS_MAX_COUNT, cached for a short time per filter.
+"""
+import hashlib
+import json
+import time
+import typing
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Count, ExpressionWrapper, Q
+
+from apps.alerts.constants import AlertGroupState
+
+if typing.TYPE_CHECKING:
+    from apps.alerts.models import AlertGroup
+
+ALERT_GROUP_COUNTERS_CACHE_TIMEOUT = 60 * 30
+# how long a counters rebuild is expected to take at most
+ALERT_GROUP_COUNTERS_REBUILD_TIMEOUT = 30
+# how long requests wait for counters being rebuilt by another request before counting alert groups themselves
+ALERT_GROUP_COUNTERS_REBUILD_WAIT = 5
+ALERT_GROUPS_COUNT_CACHE_TIMEOUT = 15
+ALERT_GROUPS_MAX_COUNT = 100000
+
+# (integration id, is root alert group, alert group status) -> number of alert groups
+AlertGroupCounters = typing.Dict[typing.Tuple[int, bool, int], int]
+# (integration id, is root alert group, alert group state)
+AlertGroupCounterKey = typing.Tuple[int, bool, AlertGroupState]
+
+
+def _get_status(state: AlertGroupState) -> int:
+    from apps.alerts.models import AlertGroup
+
+    # same as AlertGroup.status
+    return {
+        AlertGroupState.FIRING: AlertGroup.NEW,
+        AlertGroupState.ACKNOWLEDGED: AlertGroup.ACKNOWLEDGED,
+        AlertGroupState.RESOLVED: AlertGroup.RESOLVED,
+        AlertGroupState.SILENCED: AlertGroup.SILENCED,
+    }[state]
+
+
+def _get_alert_group_counters_cache_key(organization_id: int) -> str:
+    # integrations the counters are cached for
+    return f"alert_group_counters_{organization_id}"
+
+
+def _get_alert_group_counter_cache_key(organization_id: int, channel_id: int, is_root: bool, status: int) -> str:
+    return f"alert_group_counter_{organization_id}_{channel_id}_{int(is_root)}_{status}"
+
+
+def _get_alert_group_counters_lock_key(organization_id: int) -> str:
+    return f"alert_group_counters_lock_{organization_id}"
+
+
+def _get_alert_groups_count_cache_key(filters: typing.Dict[str, typing.Any]) -> str:
+    filters_hash = hashlib.md5(json.dumps(filters, sort_keys=True, default=str).encode()).hexdigest()
+    return f"alert_groups_count_{filters_hash}"
+
+
+def get_alert_group_counters(organization_id: int) -> AlertGroupCounters:
+    counters = _get_cached_alert_group_counters(organization_id)
+    if counters is not None:
+        return counters
+
+    lock_key = _get_alert_group_counters_lock_key(organization_id)
+    if cache.add(lock_key, True, timeout=ALERT_GROUP_COUNTERS_REBUILD_TIMEOUT):
+        try:
+            return _rebuild_alert_group_counters(organization_id)
+        finally:
+            cache.delete(lock_key)
+
+    # counters are being rebuilt by another request
+    deadline = time.monotonic() + ALERT_GROUP_COUNTERS_REBUILD_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(0.1)
+        counters = _get_cached_alert_group_counters(organization_id)
+        if counters is not None:
+            return counters
+    return _count_alert_groups(organization_id)
+
+
+def _get_cached_alert_group_counters(organization_id: int) -> typing.Optional[AlertGroupCounters]:
+    from apps.alerts.models import AlertGroup
+
+    channel_ids = cache.get(_get_alert_group_counters_cache_key(organization_id))
+    if channel_ids is None:
+        return None
+
+    counter_keys = {
+        _get_alert_group_counter_cache_key(organization_id, channel_id, is_root, status): (channel_id, is_root, status)
+        for channel_id in channel_ids
+        for is_root in (True, False)
+        for status, _ in AlertGroup.STATUS_CHOICES
+    }
+    counts = cache.get_many(counter_keys)
+    if len(counts) < len(counter_keys):
+        # some counters were evicted
+        return None
+    return {counter_keys[key]: max(count, 0) for key, count in counts.items() if count}
+
+
+def _count_alert_groups(organization_id: int) -> AlertGroupCounters:
+    from apps.alerts.models import AlertGroup
+
+    rows = (
+        AlertGroup.objects.filter(channel__organization_id=organization_id)
+        .annotate(is_root=ExpressionWrapper(Q(root_alert_group__isnull=True), output_field=models.BooleanField()))
+        .values("channel_id", "is_root", "resolved", "acknowledged", "silenced")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+
+    result: AlertGroupCounters = {}
+    for row in rows:
+        # same as AlertGroup.state
+        if row["resolved"]:
+            status = AlertGroup.RESOLVED
+        elif row["acknowledged"]:
+            status = AlertGroup.ACKNOWLEDGED
+        elif row["silenced"]:
+            status = AlertGroup.SILENCED
+        else:
+            status = AlertGroup.NEW
+        key = (row["channel_id"], bool(row["is_root"]), status)
+        result[key] = result.get(key, 0) + row["count"]
+    return result
+
+
+def _rebuild_alert_group_counters(organization_id: int) -> AlertGroupCounters:
+    from apps.alerts.models import AlertGroup, AlertReceiveChannel
+
+    channel_ids = list(
+        AlertReceiveChannel.objects_with_deleted.filter(organization_id=organization_id).values_list("pk", flat=True)
+    )
+    counters = _count_alert_groups(organization_id)
+
+    # all the counters are stored, so missing ones mean they were evicted
+    cache.set_many(
+        {
+            _get_alert_group_counter_cache_key(organization_id, channel_id, is_root, status): counters.get(
+                (channel_id, is_root, status), 0
+            )
+            for channel_id in channel_ids
+            for is_root in (True, False)
+            for status, _ in AlertGroup.STATUS_CHOICES
+        },
+        timeout=ALERT_GROUP_COUNTERS_CACHE_TIMEOUT,
+    )
+    cache.set(
+        _get_alert_group_counters_cache_key(organization_id), channel_ids, timeout=ALERT_GROUP_COUNTERS_CACHE_TIMEOUT
+    )
+    return counters
+
+
+def update_alert_group_counters(
+    organization_id: int,
+    removed: typing.Iterable[AlertGroupCounterKey] = (),
+    added: typing.Iterable[AlertGroupCounterKey] = (),
+) -> None:
+    """
+    Update cached counters after commit: alert groups in `removed` are not counted anymore for their
+    (integration, is root, state), and alert groups in `added` are counted.
+    """
+    changes: typing.Dict[typing.Tuple[int, bool, int], int] = {}
+    for delta, keys in ((-1, removed), (1, added)):
+        for channel_id, is_root, state in keys:
+            key = (channel_id, is_root, _get_status(state))
+            changes[key] = changes.get(key, 0) + delta
+    changes = {key: delta for key, delta in changes.items() if delta}
+    if changes:
+        transaction.on_commit(lambda: _apply_alert_group_counter_changes(organization_id, changes))
+
+
+def _apply_alert_group_counter_changes(
+    organization_id: int, changes: typing.Dict[typing.Tuple[int, bool, int], int]
+) -> None:
+    if cache.get(_get_alert_group_counters_cache_key(organization_id)) is None:
+        # counters are built from the database when requested
+        return
+
+    for (channel_id, is_root, status), delta in changes.items():
+        try:
+            cache.incr(_get_alert_group_counter_cache_key(organization_id, channel_id, is_root, status), delta)
+        except ValueError:
+            # the counter is not cached (e.g. new integration or evicted), rebuild counters when requested
+            cache.delete(_get_alert_group_counters_cache_key(organization_id))
+            return
+
+
+def count_alert_groups_from_counters(
+    counters: AlertGroupCounters,
+    channel_ids: typing.Iterable[int],
+    is_root: typing.Optional[bool] = None,
+    statuses: typing.Optional[typing.Iterable[int]] = None,
+) -> int:
+    channel_ids = set(channel_ids)
+    statuses = set(statuses) if statuses else None
+    return sum(
+        count
+        for (channel_id, counter_is_root, status), count in counters.items()
+        if channel_id in channel_ids
+        and (is_root is None or counter_is_root == is_root)
+        and (statuses is None or status in statuses)
+    )
+
+
+def get_bounded_alert_groups_count(
+    queryset: "models.QuerySet[AlertGroup]", filters: typing.Dict[str, typing.Any]
+) -> typing.Tuple[int, bool]:
+    """
+    Count alert groups up to ALERT_GROUPS_MAX_COUNT, the result is cached per `filters`.
+    Returns the count and whether the count is exact (not capped).
+    """
+    cache_key = _get_alert_groups_count_cache_key(filters)
+    count = cache.get(cache_key)
+    if count is None:
+        count = queryset[: ALERT_GROUPS_MAX_COUNT + 1].count()
+        cache.set(cache_key, count, timeout=ALERT_GROUPS_COUNT_CACHE_TIMEOUT)
+
+    if count > ALERT_GROUPS_MAX_COUNT:
+        return ALERT_GROUPS_MAX_COUNT, False
+    return count, True
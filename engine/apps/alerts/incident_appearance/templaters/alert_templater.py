@@ -4,7 +4,6 @@ from dataclasses import dataclass
 from django.conf import settings
 
 from apps.base.messaging import get_messaging_backend_from_id
-from apps.slack.slack_formatter import SlackFormatter
 from common.jinja_templater import apply_jinja_template
 from common.jinja_templater.apply_jinja_template import JinjaTemplateError, JinjaTemplateWarning
 
@@ -73,6 +72,8 @@ class TemplatedAlert:
 
 class AlertTemplater(ABC):
     def __init__(self, alert):
+        from apps.slack.slack_formatter import SlackFormatter
+
         self.alert = alert
         self.slack_formatter = SlackFormatter(alert.group.channel.organization)
         self.template_manager = TemplateLoader()
@@ -1,5 +1,9 @@
+import hashlib
+import json
 import typing
 
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
 
@@ -12,6 +16,17 @@ if typing.TYPE_CHECKING:
     from apps.alerts.models import AlertGroup, AlertGroupLogRecord, ResolutionNote
     from apps.base.models import UserNotificationPolicyLogRecord
 
+LogRecord = typing.Union["AlertGroupLogRecord", "ResolutionNote", "UserNotificationPolicyLogRecord"]
+
+INCIDENT_LOG_CACHE_VERSION = 1
+INCIDENT_LOG_CACHE_TIMEOUT = 60 * 60
+# Log records created less than this time ago are rendered on every call and not cached yet. Log records are
+# fetched by primary key cursors, and a record from a transaction that is committed later than a record with
+# a greater primary key would be skipped otherwise.
+INCIDENT_LOG_CACHE_SETTLE_DELAY = timezone.timedelta(seconds=30)
+
+ESCALATION_PLAN_CACHE_TIMEOUT = 60 * 5
+
 
 class IncidentLogBuilder:
     def __init__(self, alert_group: "AlertGroup"):
@@ -43,6 +58,62 @@ class IncidentLogBuilder:
         all_log_records_sorted = sorted(all_log_records, key=lambda log: log.created_at)
         return all_log_records_sorted
 
+    def get_rendered_log_records_list(
+        self, renderer_name: str, render: typing.Callable[[LogRecord], typing.Any], with_resolution_notes: bool = False
+    ) -> typing.List[typing.Any]:
+        """
+        Same as `get_log_records_list`, but returns log records rendered with `render`.
+
+        Rendered `AlertGroupLogRecord` and `UserNotificationPolicyLogRecord` logs are cached per alert group and
+        `renderer_name` along with primary key cursors, so only log records created since the previous call are
+        fetched and rendered. `ResolutionNote`s can be edited and deleted, so they are rendered on every call.
+        """
+        cache_key = self._get_incident_log_cache_key(self.alert_group.pk)
+        cached_timelines = cache.get(cache_key) or {}
+        timeline = cached_timelines.get(renderer_name) or {"cursors": {}, "entries": []}
+        cursors = timeline["cursors"]
+
+        settled_before = timezone.now() - INCIDENT_LOG_CACHE_SETTLE_DELAY
+        settled_entries = []
+        recent_entries = []
+        for records_type, log_records in (
+            ("alert_group", self._get_log_records_for_after_resolve_report()),
+            ("user_notification", self._get_user_notification_log_records_for_log_report()),
+        ):
+            is_settled = True
+            for log_record in sorted(log_records.filter(pk__gt=cursors.get(records_type, 0)), key=lambda r: r.pk):
+                entry = (log_record.created_at, render(log_record))
+                # move the cursor only over settled log records without gaps
+                is_settled = is_settled and log_record.created_at < settled_before
+                if is_settled:
+                    settled_entries.append(entry)
+                    cursors[records_type] = log_record.pk
+                else:
+                    recent_entries.append(entry)
+
+        if settled_entries:
+            timeline["entries"] = sorted(timeline["entries"] + settled_entries, key=lambda entry: entry[0])
+            cached_timelines[renderer_name] = timeline
+            cache.set(cache_key, cached_timelines, timeout=INCIDENT_LOG_CACHE_TIMEOUT)
+
+        entries = timeline["entries"] + recent_entries
+        if with_resolution_notes:
+            entries += [(note.created_at, render(note)) for note in self._get_resolution_notes()]
+
+        # sort logs by date
+        return [rendered for _, rendered in sorted(entries, key=lambda entry: entry[0])]
+
+    @staticmethod
+    def _get_incident_log_cache_key(alert_group_id: int) -> str:
+        return f"incident_log_v{INCIDENT_LOG_CACHE_VERSION}_{alert_group_id}"
+
+    @staticmethod
+    def invalidate_rendered_log_records(alert_group_id: int) -> None:
+        """Drop rendered log records for an alert group, e.g. when an existing log record is changed."""
+        cache_key = IncidentLogBuilder._get_incident_log_cache_key(alert_group_id)
+        # invalidate after commit, so log records are not cached again with the data being changed
+        transaction.on_commit(lambda: cache.delete(cache_key))
+
     def _get_log_records_for_after_resolve_report(self) -> "RelatedManager['AlertGroupLogRecord']":
         from apps.alerts.models import AlertGroupLogRecord, EscalationPolicy
 
@@ -120,10 +191,49 @@ class IncidentLogBuilder:
 
     def get_incident_escalation_plan(self, for_slack=False):
         """
-        Generates dict with escalation plan with timedelta as keys and list with plan lines as values
+        Generates dict with escalation plan with timedelta as keys and list with plan lines as values.
+        The plan is cached until the escalation snapshot, the alert group state or its log records change,
+        cached timedeltas are shifted by the time passed since the plan was generated.
         :param for_slack: (bool) add user slack id to plan line or not
         :return:
         """
+        cache_key = self._get_escalation_plan_cache_key(for_slack)
+        cached_plan = cache.get(cache_key)
+        now = timezone.now()
+        if cached_plan is not None:
+            generated_at, incident_escalation_plan = cached_plan
+            return self._shift_escalation_plan(incident_escalation_plan, now - generated_at)
+
+        incident_escalation_plan = self._generate_incident_escalation_plan(for_slack=for_slack)
+        cache.set(cache_key, (now, incident_escalation_plan), timeout=ESCALATION_PLAN_CACHE_TIMEOUT)
+        return incident_escalation_plan
+
+    def _get_escalation_plan_cache_key(self, for_slack: bool) -> str:
+        """
+        The cache key includes the escalation snapshot version: the escalation snapshot, alert group state and
+        the last log records, as the plan starts from the last passed escalation and notification steps.
+        """
+        alert_group = self.alert_group
+        version = {
+            "escalation_snapshot": alert_group.raw_escalation_snapshot,
+            "state": [alert_group.acknowledged, alert_group.resolved, alert_group.silenced, alert_group.silenced_until],
+            "last_log_record": alert_group.log_records.order_by("-pk").values_list("pk", flat=True).first(),
+            "last_personal_log_record": (
+                alert_group.personal_log_records.order_by("-pk").values_list("pk", flat=True).first()
+            ),
+        }
+        version_hash = hashlib.md5(json.dumps(version, sort_keys=True, default=str).encode()).hexdigest()
+        return f"escalation_plan_{alert_group.pk}_{for_slack}_{version_hash}"
+
+    @staticmethod
+    def _shift_escalation_plan(escalation_plan_dict, elapsed):
+        shifted_escalation_plan_dict = dict()
+        for timedelta in sorted(escalation_plan_dict):
+            shifted_timedelta = max(timedelta - elapsed, timezone.timedelta())
+            shifted_escalation_plan_dict.setdefault(shifted_timedelta, []).extend(escalation_plan_dict[timedelta])
+        return shifted_escalation_plan_dict
+
+    def _generate_incident_escalation_plan(self, for_slack=False):
         incident_escalation_plan = dict()
         incident_escalation_plan = self._add_invitation_plan(incident_escalation_plan, for_slack=for_slack)
         if not self.alert_group.acknowledged and not self.alert_group.is_silenced_forever:
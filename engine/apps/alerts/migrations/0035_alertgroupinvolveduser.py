@@ -0,0 +1,28 @@
+# Generated by Django 3.2.20 on 2026-10-19 10:17
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_management', '0016_alter_user_role'),
+        ('alerts', '0034_alter_resolutionnote_source'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AlertGroupInvolvedUser',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('first_involved_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('alert_group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='involved_users', to='alerts.alertgroup')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='involved_alert_groups', to='user_management.user')),
+            ],
+            options={
+                'unique_together': {('user', 'alert_group')},
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 3.2.20 on 2026-10-19 11:59
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_management', '0016_alter_user_role'),
+        ('alerts', '0035_alertgroupinvolveduser'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedAlertGroup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('channel_id', models.IntegerField(db_index=True)),
+                ('alert_group_id', models.BigIntegerField(unique=True)),
+                ('root_alert_group_id', models.BigIntegerField(db_index=True, default=None, null=True)),
+                ('public_primary_key', models.CharField(max_length=20, unique=True)),
+                ('started_at', models.DateTimeField()),
+                ('resolved_at', models.DateTimeField(default=None, null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('organization', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_alert_groups', to='user_management.organization')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedAlertGroupRow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=100)),
+                ('data', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('archived_alert_group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rows', to='alerts.archivedalertgroup')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='archivedalertgrouprow',
+            index=models.Index(fields=['archived_alert_group', 'model'], name='alerts_arch_archive_d6fa40_idx'),
+        ),
+    ]
@@ -14,7 +14,7 @@ from apps.alerts.constants import TASK_DELAY_SECONDS
 from apps.alerts.incident_appearance.templaters import TemplateLoader
 from common.jinja_templater import apply_jinja_template
 from common.jinja_templater.apply_jinja_template import JinjaTemplateError, JinjaTemplateWarning
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -26,20 +26,10 @@ logger.setLevel(logging.DEBUG)
 
 
 def generate_public_primary_key_for_alert():
-    prefix = "A"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while Alert.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="Alert"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("A")
 
 
-class Alert(models.Model):
+class Alert(PublicPrimaryKeyModelMixin, models.Model):
     group: typing.Optional["AlertGroup"]
     resolved_alert_groups: "RelatedManager['AlertGroup']"
 
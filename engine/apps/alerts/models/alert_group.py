@@ -11,11 +11,12 @@ from django.conf import settings
 from django.core.validators import MinLengthValidator
 from django.db import IntegrityError, models, transaction
 from django.db.models import JSONField, Q, QuerySet
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.functional import cached_property
 
+from apps.alerts.alert_group_stats import update_alert_group_counters
 from apps.alerts.constants import ActionSource, AlertGroupState
 from apps.alerts.escalation_snapshot import EscalationSnapshotMixin
 from apps.alerts.escalation_snapshot.escalation_snapshot_mixin import START_ESCALATION_DELAY
@@ -23,11 +24,10 @@ from apps.alerts.incident_appearance.renderers.constants import DEFAULT_BACKUP_T
 from apps.alerts.incident_appearance.renderers.slack_renderer import AlertGroupSlackRenderer
 from apps.alerts.incident_log_builder import IncidentLogBuilder
 from apps.alerts.signals import alert_group_action_triggered_signal, alert_group_created_signal
-from apps.alerts.tasks import acknowledge_reminder_task, send_alert_group_signal, unsilence_task
+from apps.alerts.tasks import acknowledge_reminder_task, send_alert_group_signal_for_bulk_action, unsilence_task
 from apps.metrics_exporter.metrics_cache_manager import MetricsCacheManager
-from apps.slack.slack_formatter import SlackFormatter
 from apps.user_management.models import User
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 from common.utils import clean_markup, str_or_backup
 
 from .alert_group_counter import AlertGroupCounter
@@ -50,17 +50,7 @@ logger.setLevel(logging.DEBUG)
 
 
 def generate_public_primary_key_for_alert_group():
-    prefix = "I"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while AlertGroup.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="AlertGroup"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("I")
 
 
 class LogRecordUser(typing.TypedDict):
@@ -155,7 +145,7 @@ class AlertGroupSlackRenderingMixin:
         return self.slack_renderer.alert_renderer.templated_alert
 
 
-class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.Model):
+class AlertGroup(PublicPrimaryKeyModelMixin, AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.Model):
     alerts: "RelatedManager['Alert']"
     dependent_alert_groups: "RelatedManager['AlertGroup']"
     channel: "AlertReceiveChannel"
@@ -535,21 +525,116 @@ class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.
             response_time = min_timestamp - self.started_at
         return response_time
 
-    def _update_metrics(self, organization_id, previous_state, state):
-        """Update metrics cache for response time and state as needed."""
-        updated_response_time = self.response_time
+    def _get_metrics_response_time(self, previous_state):
         if previous_state != AlertGroupState.FIRING or self.restarted_at:
             # only consider response time from the first action
-            updated_response_time = None
+            return None
+        return self.response_time
+
+    def _update_metrics(self, organization_id, previous_state, state):
+        """Update metrics cache for response time and state as needed."""
+        if previous_state is not None and state is not None:
+            # alert groups created and deleted are counted by post_save and post_delete receivers
+            is_root = self.root_alert_group_id is None
+            update_alert_group_counters(
+                organization_id,
+                removed=[(self.channel_id, is_root, previous_state)],
+                added=[(self.channel_id, is_root, state)],
+            )
         MetricsCacheManager.metrics_update_cache_for_alert_group(
             self.channel_id,
             organization_id=organization_id,
             old_state=previous_state,
             new_state=state,
-            response_time=updated_response_time,
+            response_time=self._get_metrics_response_time(previous_state),
             started_at=self.started_at,
         )
 
+    @staticmethod
+    def _bulk_update_metrics(organization_id, alert_groups, previous_states, state):
+        """Update metrics cache for alert groups changed by a bulk action, applying one diff per integration."""
+        if not alert_groups:
+            return
+
+        if state is not None:
+            # deleted alert groups are counted by post_delete receiver
+            update_alert_group_counters(
+                organization_id,
+                removed=[
+                    (alert_group.channel_id, alert_group.root_alert_group_id is None, previous_state)
+                    for alert_group, previous_state in zip(alert_groups, previous_states)
+                ],
+                added=[
+                    (alert_group.channel_id, alert_group.root_alert_group_id is None, state)
+                    for alert_group in alert_groups
+                ],
+            )
+        MetricsCacheManager.metrics_update_cache_for_alert_groups(
+            organization_id,
+            [
+                (
+                    alert_group.channel_id,
+                    previous_state,
+                    state,
+                    alert_group._get_metrics_response_time(previous_state),
+                    alert_group.started_at,
+                )
+                for alert_group, previous_state in zip(alert_groups, previous_states)
+            ],
+        )
+
+    @staticmethod
+    def _bulk_create_log_records(user: User, alert_groups: typing.List["AlertGroup"], log_type: int, **kwargs) -> None:
+        """Create a log record of the same type for each alert group changed by a bulk action."""
+        from apps.alerts.models import AlertGroupLogRecord
+
+        AlertGroupLogRecord.objects.bulk_create(
+            [
+                AlertGroupLogRecord(alert_group=alert_group, type=log_type, author=user, **kwargs)
+                for alert_group in alert_groups
+            ],
+            batch_size=5000,
+        )
+
+    @staticmethod
+    def _bulk_create_action_log_records(
+        user: User, alert_groups: typing.List["AlertGroup"], log_type: int, **kwargs
+    ) -> None:
+        """
+        Create action log records for alert groups changed by a bulk action and send alert_group_action_triggered_signal
+        for all of them in a single task once the transaction is committed.
+        Log records created in bulk don't trigger post_save, log reports are updated by the same task.
+        """
+        from apps.alerts.models import AlertGroupInvolvedUser, AlertGroupLogRecord
+
+        if not alert_groups:
+            return
+
+        if log_type in AlertGroupLogRecord.INVOLVED_USER_TYPES:
+            AlertGroupInvolvedUser.objects.add((user.pk, alert_group.pk) for alert_group in alert_groups)
+
+        created_after = timezone.now()
+        log_records = AlertGroupLogRecord.objects.bulk_create(
+            [
+                AlertGroupLogRecord(alert_group=alert_group, type=log_type, author=user, **kwargs)
+                for alert_group in alert_groups
+            ],
+            batch_size=5000,
+        )
+        alert_group_pks = [alert_group.pk for alert_group in alert_groups]
+        log_record_ids = [log_record.pk for log_record in log_records]
+        if None in log_record_ids:
+            # primary keys are not set by bulk_create on some databases (e.g. MySQL), get them from the db
+            log_record_ids = list(
+                AlertGroupLogRecord.objects.filter(
+                    alert_group_id__in=alert_group_pks, type=log_type, author=user, created_at__gte=created_after
+                )
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+
+        transaction.on_commit(partial(send_alert_group_signal_for_bulk_action.delay, log_record_ids, alert_group_pks))
+
     def acknowledge_by_user(self, user: User, action_source: typing.Optional[ActionSource] = None) -> None:
         from apps.alerts.models import AlertGroupLogRecord
 
@@ -1239,30 +1324,28 @@ class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.
         ]
         AlertGroup.objects.bulk_update(alert_groups_to_acknowledge_list, fields=fields_to_update, batch_size=100)
 
-        for alert_group in alert_groups_to_unresolve_before_acknowledge_list:
-            alert_group.log_records.create(
-                type=AlertGroupLogRecord.TYPE_UN_RESOLVED,
-                author=user,
-                reason="Bulk action acknowledge",
-            )
-
-        for alert_group in alert_groups_to_unsilence_before_acknowledge_list:
-            alert_group.log_records.create(
-                type=AlertGroupLogRecord.TYPE_UN_SILENCE, author=user, reason="Bulk action acknowledge"
-            )
+        AlertGroup._bulk_create_log_records(
+            user,
+            alert_groups_to_unresolve_before_acknowledge_list,
+            AlertGroupLogRecord.TYPE_UN_RESOLVED,
+            reason="Bulk action acknowledge",
+        )
+        AlertGroup._bulk_create_log_records(
+            user,
+            alert_groups_to_unsilence_before_acknowledge_list,
+            AlertGroupLogRecord.TYPE_UN_SILENCE,
+            reason="Bulk action acknowledge",
+        )
 
-        for alert_group, previous_state in zip(alert_groups_to_acknowledge_list, previous_states):
-            # update metrics cache
-            alert_group._update_metrics(
-                organization_id=user.organization_id,
-                previous_state=previous_state,
-                state=AlertGroupState.ACKNOWLEDGED,
-            )
+        # update metrics cache
+        AlertGroup._bulk_update_metrics(
+            user.organization_id, alert_groups_to_acknowledge_list, previous_states, AlertGroupState.ACKNOWLEDGED
+        )
 
+        for alert_group in alert_groups_to_acknowledge_list:
             alert_group.start_ack_reminder_if_needed()
 
-            log_record = alert_group.log_records.create(type=AlertGroupLogRecord.TYPE_ACK, author=user)
-            transaction.on_commit(partial(send_alert_group_signal.delay, log_record.pk))
+        AlertGroup._bulk_create_action_log_records(user, alert_groups_to_acknowledge_list, AlertGroupLogRecord.TYPE_ACK)
 
     @staticmethod
     def bulk_acknowledge(user: User, alert_groups: "QuerySet[AlertGroup]") -> None:
@@ -1321,20 +1404,21 @@ class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.
         ]
         AlertGroup.objects.bulk_update(alert_groups_to_resolve_list, fields=fields_to_update, batch_size=100)
 
-        for alert_group in alert_groups_to_unsilence_before_resolve_list:
-            alert_group.log_records.create(
-                type=AlertGroupLogRecord.TYPE_UN_SILENCE, author=user, reason="Bulk action resolve"
-            )
+        AlertGroup._bulk_create_log_records(
+            user,
+            alert_groups_to_unsilence_before_resolve_list,
+            AlertGroupLogRecord.TYPE_UN_SILENCE,
+            reason="Bulk action resolve",
+        )
 
-        for alert_group, previous_state in zip(alert_groups_to_resolve_list, previous_states):
-            # update metrics cache
-            alert_group._update_metrics(
-                organization_id=user.organization_id,
-                previous_state=previous_state,
-                state=AlertGroupState.RESOLVED,
-            )
-            log_record = alert_group.log_records.create(type=AlertGroupLogRecord.TYPE_RESOLVED, author=user)
-            transaction.on_commit(partial(send_alert_group_signal.delay, log_record.pk))
+        # update metrics cache
+        AlertGroup._bulk_update_metrics(
+            user.organization_id, alert_groups_to_resolve_list, previous_states, AlertGroupState.RESOLVED
+        )
+
+        AlertGroup._bulk_create_action_log_records(
+            user, alert_groups_to_resolve_list, AlertGroupLogRecord.TYPE_RESOLVED
+        )
 
     @staticmethod
     def bulk_resolve(user: User, alert_groups: "QuerySet[AlertGroup]") -> None:
@@ -1390,25 +1474,23 @@ class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.
             restarted_at=timezone.now(),
         )
 
+        # update metrics cache (note alert_group.state is the original alert group's state)
+        AlertGroup._bulk_update_metrics(
+            user.organization_id,
+            alert_groups_to_restart_unack_list,
+            [alert_group.state for alert_group in alert_groups_to_restart_unack_list],
+            AlertGroupState.FIRING,
+        )
+
         # unacknowledge alert groups
-        for alert_group in alert_groups_to_restart_unack_list:
-            # update metrics cache (note alert_group.state is the original alert group's state)
-            alert_group._update_metrics(
-                organization_id=user.organization_id,
-                previous_state=alert_group.state,
-                state=AlertGroupState.FIRING,
-            )
-            log_record = alert_group.log_records.create(
-                type=AlertGroupLogRecord.TYPE_UN_ACK,
-                author=user,
-                reason="Bulk action restart",
-            )
+        AlertGroup._bulk_create_action_log_records(
+            user, alert_groups_to_restart_unack_list, AlertGroupLogRecord.TYPE_UN_ACK, reason="Bulk action restart"
+        )
 
+        for alert_group in alert_groups_to_restart_unack_list:
             if alert_group.is_root_alert_group:
                 alert_group.start_escalation_if_needed()
 
-            transaction.on_commit(partial(send_alert_group_signal.delay, log_record.pk))
-
     @staticmethod
     def _bulk_restart_unresolve(user: User, alert_groups_to_restart_unresolve: "QuerySet[AlertGroup]") -> None:
         from apps.alerts.models import AlertGroupLogRecord
@@ -1433,25 +1515,26 @@ class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.
             restarted_at=timezone.now(),
         )
 
+        # update metrics cache (note alert_group.state is the original alert group's state)
+        AlertGroup._bulk_update_metrics(
+            user.organization_id,
+            alert_groups_to_restart_unresolve_list,
+            [alert_group.state for alert_group in alert_groups_to_restart_unresolve_list],
+            AlertGroupState.FIRING,
+        )
+
         # unresolve alert groups
-        for alert_group in alert_groups_to_restart_unresolve_list:
-            # update metrics cache (note alert_group.state is the original alert group's state)
-            alert_group._update_metrics(
-                organization_id=user.organization_id,
-                previous_state=alert_group.state,
-                state=AlertGroupState.FIRING,
-            )
-            log_record = alert_group.log_records.create(
-                type=AlertGroupLogRecord.TYPE_UN_RESOLVED,
-                author=user,
-                reason="Bulk action restart",
-            )
+        AlertGroup._bulk_create_action_log_records(
+            user,
+            alert_groups_to_restart_unresolve_list,
+            AlertGroupLogRecord.TYPE_UN_RESOLVED,
+            reason="Bulk action restart",
+        )
 
+        for alert_group in alert_groups_to_restart_unresolve_list:
             if alert_group.is_root_alert_group:
                 alert_group.start_escalation_if_needed()
 
-            transaction.on_commit(partial(send_alert_group_signal.delay, log_record.pk))
-
     @staticmethod
     def _bulk_restart_unsilence(user: User, alert_groups_to_restart_unsilence: "QuerySet[AlertGroup]") -> None:
         from apps.alerts.models import AlertGroupLogRecord
@@ -1476,21 +1559,25 @@ class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.
             restarted_at=timezone.now(),
         )
 
+        # update metrics cache (note alert_group.state is the original alert group's state)
+        AlertGroup._bulk_update_metrics(
+            user.organization_id,
+            alert_groups_to_restart_unsilence_list,
+            [alert_group.state for alert_group in alert_groups_to_restart_unsilence_list],
+            AlertGroupState.FIRING,
+        )
+
         # unsilence alert groups
+        AlertGroup._bulk_create_action_log_records(
+            user,
+            alert_groups_to_restart_unsilence_list,
+            AlertGroupLogRecord.TYPE_UN_SILENCE,
+            reason="Bulk action restart",
+        )
+
         for alert_group in alert_groups_to_restart_unsilence_list:
-            # update metrics cache (note alert_group.state is the original alert group's state)
-            alert_group._update_metrics(
-                organization_id=user.organization_id,
-                previous_state=alert_group.state,
-                state=AlertGroupState.FIRING,
-            )
-            log_record = alert_group.log_records.create(
-                type=AlertGroupLogRecord.TYPE_UN_SILENCE, author=user, reason="Bulk action restart"
-            )
             alert_group.start_escalation_if_needed()
 
-            transaction.on_commit(partial(send_alert_group_signal.delay, log_record.pk))
-
     @staticmethod
     def bulk_restart(user: User, alert_groups: "QuerySet[AlertGroup]") -> None:
         root_alert_groups_unack = alert_groups.filter(
@@ -1590,44 +1677,42 @@ class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.
         AlertGroup.objects.bulk_update(alert_groups_to_silence_list, fields=fields_to_update, batch_size=100)
 
         # create log records
-        for alert_group in alert_groups_to_unresolve_before_silence_list:
-            alert_group.log_records.create(
-                type=AlertGroupLogRecord.TYPE_UN_RESOLVED,
-                author=user,
-                reason="Bulk action silence",
-            )
-
-        for alert_group in alert_groups_to_unsilence_before_silence_list:
-            alert_group.log_records.create(
-                type=AlertGroupLogRecord.TYPE_UN_SILENCE,
-                author=user,
-                reason="Bulk action silence",
-            )
+        AlertGroup._bulk_create_log_records(
+            user,
+            alert_groups_to_unresolve_before_silence_list,
+            AlertGroupLogRecord.TYPE_UN_RESOLVED,
+            reason="Bulk action silence",
+        )
+        AlertGroup._bulk_create_log_records(
+            user,
+            alert_groups_to_unsilence_before_silence_list,
+            AlertGroupLogRecord.TYPE_UN_SILENCE,
+            reason="Bulk action silence",
+        )
+        AlertGroup._bulk_create_log_records(
+            user,
+            alert_groups_to_unacknowledge_before_silence_list,
+            AlertGroupLogRecord.TYPE_UN_ACK,
+            reason="Bulk action silence",
+        )
 
-        for alert_group in alert_groups_to_unacknowledge_before_silence_list:
-            alert_group.log_records.create(
-                type=AlertGroupLogRecord.TYPE_UN_ACK,
-                author=user,
-                reason="Bulk action silence",
-            )
+        # update metrics cache
+        AlertGroup._bulk_update_metrics(
+            user.organization_id, alert_groups_to_silence_list, previous_states, AlertGroupState.SILENCED
+        )
 
-        for alert_group, previous_state in zip(alert_groups_to_silence_list, previous_states):
-            # update metrics cache
-            alert_group._update_metrics(
-                organization_id=user.organization_id,
-                previous_state=previous_state,
-                state=AlertGroupState.SILENCED,
-            )
-            log_record = alert_group.log_records.create(
-                type=AlertGroupLogRecord.TYPE_SILENCE,
-                author=user,
-                silence_delay=silence_delay_timedelta,
-                reason="Bulk action silence",
-            )
+        AlertGroup._bulk_create_action_log_records(
+            user,
+            alert_groups_to_silence_list,
+            AlertGroupLogRecord.TYPE_SILENCE,
+            silence_delay=silence_delay_timedelta,
+            reason="Bulk action silence",
+        )
 
-            transaction.on_commit(partial(send_alert_group_signal.delay, log_record.pk))
-            if silence_for_period and alert_group.is_root_alert_group:
-                alert_group.start_unsilence_task(countdown=silence_delay)
+        if silence_for_period:
+            for alert_group in alert_groups_to_silence_list:
+                if alert_group.is_root_alert_group:
+                    alert_group.start_unsilence_task(countdown=silence_delay)
 
     @staticmethod
     def bulk_silence(user: User, alert_groups: "QuerySet[AlertGroup]", silence_delay: int) -> None:
@@ -1757,6 +1842,8 @@ class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.
 
     @property
     def long_verbose_name_without_formatting(self):
+        from apps.slack.slack_formatter import SlackFormatter
+
         sf = SlackFormatter(self.channel.organization)
         title = self.long_verbose_name
         title = sf.format(title)
@@ -1789,21 +1876,15 @@ class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.
             return "Acknowledged"
 
     def render_after_resolve_report_json(self) -> list[LogRecords]:
-        from apps.alerts.models import AlertGroupLogRecord, ResolutionNote
         from apps.base.models import UserNotificationPolicyLogRecord
 
+        def _render_log_record(log_record):
+            if type(log_record) == UserNotificationPolicyLogRecord:
+                return log_record.rendered_notification_log_line_json
+            return log_record.render_log_line_json()  # AlertGroupLogRecord and ResolutionNote
+
         log_builder = IncidentLogBuilder(self)
-        log_records_list = log_builder.get_log_records_list(with_resolution_notes=True)
-        result_log_report = list()
-
-        for log_record in log_records_list:
-            if type(log_record) == AlertGroupLogRecord:
-                result_log_report.append(log_record.render_log_line_json())
-            elif type(log_record) == UserNotificationPolicyLogRecord:
-                result_log_report.append(log_record.rendered_notification_log_line_json)
-            elif type(log_record) == ResolutionNote:
-                result_log_report.append(log_record.render_log_line_json())
-        return result_log_report
+        return log_builder.get_rendered_log_records_list("json", _render_log_record, with_resolution_notes=True)
 
     @property
     def has_resolution_notes(self):
@@ -1878,11 +1959,31 @@ class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.
 
 @receiver(post_save, sender=AlertGroup)
 def listen_for_alertgroup_model_save(sender, instance, created, *args, **kwargs):
-    if created and not instance.is_maintenance_incident:
-        # Update alert group state and response time metrics cache
-        instance._update_metrics(
-            organization_id=instance.channel.organization_id, previous_state=None, state=AlertGroupState.FIRING
+    is_root = instance.root_alert_group_id is None
+    if created:
+        update_alert_group_counters(
+            instance.channel.organization_id, added=[(instance.channel_id, is_root, instance.state)]
+        )
+        if not instance.is_maintenance_incident:
+            # Update alert group state and response time metrics cache
+            instance._update_metrics(
+                organization_id=instance.channel.organization_id, previous_state=None, state=AlertGroupState.FIRING
+            )
+    elif "root_alert_group" in (kwargs.get("update_fields") or []):
+        # alert group attached/unattached
+        update_alert_group_counters(
+            instance.channel.organization_id,
+            removed=[(instance.channel_id, not is_root, instance.state)],
+            added=[(instance.channel_id, is_root, instance.state)],
         )
 
 
 post_save.connect(listen_for_alertgroup_model_save, AlertGroup)
+
+
+@receiver(post_delete, sender=AlertGroup)
+def listen_for_alertgroup_model_delete(sender, instance, *args, **kwargs):
+    update_alert_group_counters(
+        instance.channel.organization_id,
+        removed=[(instance.channel_id, instance.root_alert_group_id is None, instance.state)],
+    )
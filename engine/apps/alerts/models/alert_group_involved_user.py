@@ -0,0 +1,47 @@
+import typing
+
+from django.db import models
+from django.utils import timezone
+
+
+class AlertGroupInvolvedUserQuerySet(models.QuerySet):
+    def add(self, involved_users: typing.Iterable[typing.Tuple[int, int]]) -> None:
+        """
+        Add (user_id, alert_group_id) pairs, existing pairs are ignored so `first_involved_at` is kept.
+        """
+        self.bulk_create(
+            [
+                AlertGroupInvolvedUser(user_id=user_id, alert_group_id=alert_group_id)
+                for user_id, alert_group_id in set(involved_users)
+                if user_id is not None
+            ],
+            batch_size=5000,
+            ignore_conflicts=True,
+        )
+
+
+class AlertGroupInvolvedUser(models.Model):
+    """
+    Users involved in alert groups: users notified about the alert group (see UserNotificationPolicyLogRecord)
+    and users who acknowledged, resolved or silenced it (see AlertGroupLogRecord.INVOLVED_USER_TYPES).
+    It's denormalized from the log records to filter alert groups by involved users without scanning log tables.
+    The ("user", "alert_group") unique index covers the filter lookup.
+    Existing data can be backfilled with the `backfill_alert_group_involved_users` management command.
+    """
+
+    objects = models.Manager.from_queryset(AlertGroupInvolvedUserQuerySet)()
+
+    user = models.ForeignKey(
+        "user_management.User",
+        on_delete=models.CASCADE,
+        related_name="involved_alert_groups",
+    )
+    alert_group = models.ForeignKey(
+        "alerts.AlertGroup",
+        on_delete=models.CASCADE,
+        related_name="involved_users",
+    )
+    first_involved_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        unique_together = ("user", "alert_group")
@@ -11,8 +11,8 @@ from rest_framework.fields import DateTimeField
 
 from apps.alerts import tasks
 from apps.alerts.constants import ActionSource
+from apps.alerts.incident_log_builder import IncidentLogBuilder
 from apps.alerts.utils import render_relative_timeline
-from apps.slack.slack_formatter import SlackFormatter
 from common.utils import clean_markup
 
 if typing.TYPE_CHECKING:
@@ -78,6 +78,12 @@ class AlertGroupLogRecord(models.Model):
         TYPE_DIRECT_PAGING,
     )
 
+    # messaging representatives only re-render the alert group message with its current state for these types
+    MESSAGE_UPDATE_TYPES = (TYPE_ACK, TYPE_UN_ACK, TYPE_RESOLVED, TYPE_UN_RESOLVED, TYPE_SILENCE, TYPE_UN_SILENCE)
+
+    # log record authors are added to alert group involved users, see AlertGroupInvolvedUser
+    INVOLVED_USER_TYPES = (TYPE_ACK, TYPE_RESOLVED, TYPE_SILENCE)
+
     TYPE_CHOICES = (
         (TYPE_ACK, "Acknowledged"),
         (TYPE_UN_ACK, "Unacknowledged"),
@@ -219,6 +225,8 @@ class AlertGroupLogRecord(models.Model):
     STEP_SPECIFIC_INFO_KEYS = ["schedule_name", "custom_button_name", "usergroup_handle"]
 
     def render_log_line_json(self):
+        from apps.slack.slack_formatter import SlackFormatter
+
         time = humanize.naturaldelta(self.alert_group.started_at - self.created_at)
         created_at = DateTimeField().to_representation(self.created_at)
         author = self.author.short() if self.author is not None else None
@@ -590,6 +598,14 @@ class AlertGroupLogRecord(models.Model):
 
 @receiver(post_save, sender=AlertGroupLogRecord)
 def listen_for_alertgrouplogrecord(sender, instance, created, *args, **kwargs):
+    from apps.alerts.models import AlertGroupInvolvedUser
+
+    if created and instance.author_id is not None and instance.type in AlertGroupLogRecord.INVOLVED_USER_TYPES:
+        AlertGroupInvolvedUser.objects.add([(instance.author_id, instance.alert_group_id)])
+
+    if not created:
+        IncidentLogBuilder.invalidate_rendered_log_records(instance.alert_group_id)
+
     if instance.type != AlertGroupLogRecord.TYPE_DELETED:
         alert_group_pk = instance.alert_group.pk
         logger.debug(
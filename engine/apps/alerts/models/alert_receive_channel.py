@@ -36,7 +36,7 @@ from common.api_helpers.utils import create_engine_url
 from common.exceptions import TeamCanNotBeChangedError, UnableToSendDemoAlert
 from common.insight_log import EntityEvent, write_resource_insight_log
 from common.jinja_templater import jinja_template_env
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -48,17 +48,7 @@ logger = logging.getLogger(__name__)
 
 
 def generate_public_primary_key_for_alert_receive_channel():
-    prefix = "C"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while AlertReceiveChannel.objects_with_deleted.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="AlertReceiveChannel"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("C")
 
 
 def random_token_generator():
@@ -110,7 +100,7 @@ class AlertReceiveChannelManagerWithMaintenance(models.Manager):
         return self.get_queryset().hard_delete()
 
 
-class AlertReceiveChannel(IntegrationOptionsMixin, MaintainableObject):
+class AlertReceiveChannel(PublicPrimaryKeyModelMixin, IntegrationOptionsMixin, MaintainableObject):
     """
     Channel generated by user to receive Alerts to.
     """
@@ -0,0 +1,169 @@
+import typing
+from functools import cached_property
+
+from django.core import serializers
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, models, transaction
+
+if typing.TYPE_CHECKING:
+    from django.db.models.manager import RelatedManager
+
+    from apps.alerts.models import Alert, AlertGroup, AlertGroupLogRecord
+    from apps.alerts.models.alert_group import Permalinks
+    from apps.base.models import UserNotificationPolicyLogRecord
+
+# archived rows are read and restored in chunks
+ARCHIVED_ROWS_CHUNK_SIZE = 2000
+
+
+class ArchivedAlertGroup(models.Model):
+    """
+    Resolved alert group moved out of the alert group, alert and log record tables by `archive_alert_groups`
+    (see apps.alerts.alert_group_archive).
+
+    `rows` are serialized copies of the alert group and all the rows deleted along with it (alerts, log records,
+    resolution notes, messages, etc.) in the order they can be restored in. Objects are deserialized as unsaved
+    model instances, so archived alert groups can be read without restoring them.
+
+    Attached alert groups are archived together with their root alert group, `root_alert_group_id` links them
+    to the root's ArchivedAlertGroup.
+    """
+
+    rows: "RelatedManager['ArchivedAlertGroupRow']"
+
+    organization = models.ForeignKey(
+        "user_management.Organization",
+        on_delete=models.CASCADE,
+        related_name="archived_alert_groups",
+    )
+    # integration of the alert group, not a foreign key as the integration can be deleted later
+    channel_id = models.IntegerField(db_index=True)
+    alert_group_id = models.BigIntegerField(unique=True)
+    root_alert_group_id = models.BigIntegerField(null=True, default=None, db_index=True)
+    public_primary_key = models.CharField(max_length=20, unique=True)
+    started_at = models.DateTimeField()
+    resolved_at = models.DateTimeField(null=True, default=None)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def get_objects(self) -> typing.List[models.Model]:
+        return self._get_objects(self.rows.all())
+
+    @cached_property
+    def _alert_group(self) -> "AlertGroup":
+        from apps.alerts.models import AlertGroup
+
+        return self._get_objects_of_type(AlertGroup)[0]
+
+    def get_alert_group(self) -> "AlertGroup":
+        return self._alert_group
+
+    def get_alerts(self) -> typing.List["Alert"]:
+        from apps.alerts.models import Alert
+
+        return self._get_objects_of_type(Alert)
+
+    def get_latest_alerts(self, limit: int) -> typing.List["Alert"]:
+        from apps.alerts.models import Alert
+
+        # rows of a model are archived in primary key order
+        return self._get_objects(self._get_rows_of_type(Alert).order_by("-pk")[:limit])
+
+    def get_alerts_count(self) -> int:
+        from apps.alerts.models import Alert
+
+        return self._get_rows_of_type(Alert).count()
+
+    def get_log_records(self) -> typing.List["AlertGroupLogRecord"]:
+        from apps.alerts.models import AlertGroupLogRecord
+
+        return self._get_objects_of_type(AlertGroupLogRecord)
+
+    def get_personal_log_records(self) -> typing.List["UserNotificationPolicyLogRecord"]:
+        from apps.base.models import UserNotificationPolicyLogRecord
+
+        return self._get_objects_of_type(UserNotificationPolicyLogRecord)
+
+    def get_permalinks(self) -> "Permalinks":
+        """
+        Same as AlertGroup.permalinks, but uses archived Slack and Telegram messages.
+        The Slack permalink is only available if it was cached before archival.
+        """
+        from apps.slack.models import SlackMessage
+        from apps.telegram.models import TelegramMessage
+
+        slack_messages = sorted(self._get_objects_of_type(SlackMessage), key=lambda message: message.created_at)
+        telegram_messages = [
+            message
+            for message in self._get_objects_of_type(TelegramMessage)
+            if message.chat_id.startswith("-") and message.message_type == TelegramMessage.ALERT_GROUP_MESSAGE
+        ]
+        return {
+            "slack": slack_messages[0].cached_permalink if slack_messages else None,
+            "telegram": telegram_messages[0].link if telegram_messages else None,
+            "web": self.get_alert_group().web_link,
+        }
+
+    def restore(self) -> None:
+        """
+        Move the alert group back to the alert group, alert and log record tables with the original primary keys.
+        Alert groups archived together (a root alert group and its attached alert groups) are restored together.
+        References from other rows that were set to NULL on archival (e.g. attach log records of other alert groups)
+        are not restored.
+        """
+        if self.root_alert_group_id is not None:
+            root = ArchivedAlertGroup.objects.filter(alert_group_id=self.root_alert_group_id).first()
+            if root is not None:
+                root.restore()
+                return
+
+        archived_alert_groups = [self, *ArchivedAlertGroup.objects.filter(root_alert_group_id=self.alert_group_id)]
+        with transaction.atomic():
+            # alert groups archived together reference each other (e.g. attach log records), so constraints are checked
+            # after all of them are restored, same as loaddata does
+            with connection.constraint_checks_disabled():
+                table_names = set()
+                for archived_alert_group in archived_alert_groups:
+                    rows = archived_alert_group.rows.order_by("pk").values_list("data", flat=True)
+                    for deserialized in serializers.deserialize(
+                        "python", rows.iterator(chunk_size=ARCHIVED_ROWS_CHUNK_SIZE)
+                    ):
+                        deserialized.save()
+                        table_names.add(deserialized.object._meta.db_table)
+                    archived_alert_group.rows.all().delete()
+                    archived_alert_group.delete()
+            connection.check_constraints(table_names=list(table_names))
+
+    def _get_rows_of_type(self, model: typing.Type[models.Model]) -> "models.QuerySet[ArchivedAlertGroupRow]":
+        return self.rows.filter(model=model._meta.label_lower)
+
+    def _get_objects_of_type(self, model: typing.Type[models.Model]) -> typing.List[typing.Any]:
+        return self._get_objects(self._get_rows_of_type(model))
+
+    @staticmethod
+    def _get_objects(rows: "models.QuerySet[ArchivedAlertGroupRow]") -> typing.List[models.Model]:
+        if not rows.ordered:
+            rows = rows.order_by("pk")
+        data = rows.values_list("data", flat=True)
+        return [deserialized.object for deserialized in serializers.deserialize("python", data)]
+
+
+class ArchivedAlertGroupRow(models.Model):
+    """
+    Serialized copy of a single row archived with an alert group (see ArchivedAlertGroup).
+    Rows are stored one per database row, so archiving large alert groups doesn't produce oversized values,
+    and objects of a single model can be read without deserializing the whole alert group.
+    """
+
+    archived_alert_group = models.ForeignKey(
+        "alerts.ArchivedAlertGroup",
+        on_delete=models.CASCADE,
+        related_name="rows",
+    )
+    # model label, e.g. "alerts.alert"
+    model = models.CharField(max_length=100)
+    data = models.JSONField(encoder=DjangoJSONEncoder)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["archived_alert_group", "model"]),
+        ]
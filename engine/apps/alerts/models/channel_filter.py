@@ -10,7 +10,7 @@ from django.db import models
 from common.jinja_templater import apply_jinja_template
 from common.jinja_templater.apply_jinja_template import JinjaTemplateError, JinjaTemplateWarning
 from common.ordered_model.ordered_model import OrderedModel
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -21,20 +21,10 @@ logger = logging.getLogger(__name__)
 
 
 def generate_public_primary_key_for_channel_filter():
-    prefix = "R"
-    new_public_primary_key = generate_public_primary_key(prefix)
+    return generate_public_primary_key("R")
 
-    failure_counter = 0
-    while ChannelFilter.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="ChannelFilter"
-        )
-        failure_counter += 1
 
-    return new_public_primary_key
-
-
-class ChannelFilter(OrderedModel):
+class ChannelFilter(PublicPrimaryKeyModelMixin, OrderedModel):
     """
     Actually it's a Router based on terms now. Not a Filter.
     """
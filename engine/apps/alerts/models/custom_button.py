@@ -13,7 +13,7 @@ from requests.auth import HTTPBasicAuth
 
 from common.jinja_templater import apply_jinja_template
 from common.jinja_templater.apply_jinja_template import JinjaTemplateError, JinjaTemplateWarning
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -26,17 +26,7 @@ logger.setLevel(logging.DEBUG)
 
 
 def generate_public_primary_key_for_custom_button():
-    prefix = "K"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while CustomButton.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="CustomButton"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("K")
 
 
 class CustomButtonQueryset(models.QuerySet):
@@ -52,7 +42,7 @@ class CustomButtonManager(models.Manager):
         return self.get_queryset().hard_delete()
 
 
-class CustomButton(models.Model):
+class CustomButton(PublicPrimaryKeyModelMixin, models.Model):
     escalation_policies: "RelatedManager['EscalationPolicy']"
 
     objects = CustomButtonManager()
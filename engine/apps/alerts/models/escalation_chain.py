@@ -4,8 +4,7 @@ from django.conf import settings
 from django.core.validators import MinLengthValidator
 from django.db import models, transaction
 
-from apps.alerts.models.escalation_policy import generate_public_primary_key_for_escalation_policy
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -14,20 +13,10 @@ if typing.TYPE_CHECKING:
 
 
 def generate_public_primary_key_for_escalation_chain():
-    prefix = "F"
-    new_public_primary_key = generate_public_primary_key(prefix)
+    return generate_public_primary_key("F")
 
-    failure_counter = 0
-    while EscalationChain.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="EscalationChain"
-        )
-        failure_counter += 1
 
-    return new_public_primary_key
-
-
-class EscalationChain(models.Model):
+class EscalationChain(PublicPrimaryKeyModelMixin, models.Model):
     channel_filters: "RelatedManager['ChannelFilter']"
     escalation_policies: "RelatedManager['EscalationPolicy']"
 
@@ -68,7 +57,7 @@ class EscalationChain(models.Model):
                 notify_to_users_queue = escalation_policy.notify_to_users_queue.all()
 
                 escalation_policy.pk = None
-                escalation_policy.public_primary_key = generate_public_primary_key_for_escalation_policy()
+                escalation_policy.reset_public_primary_key()
                 escalation_policy.last_notified_user = None
                 escalation_policy.escalation_chain = copied_chain
                 escalation_policy.save()
@@ -5,24 +5,14 @@ from django.core.validators import MinLengthValidator
 from django.db import models
 
 from common.ordered_model.ordered_model import OrderedModel
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 
 def generate_public_primary_key_for_escalation_policy():
-    prefix = "E"
-    new_public_primary_key = generate_public_primary_key(prefix)
+    return generate_public_primary_key("E")
 
-    failure_counter = 0
-    while EscalationPolicy.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="EscalationPolicy"
-        )
-        failure_counter += 1
 
-    return new_public_primary_key
-
-
-class EscalationPolicy(OrderedModel):
+class EscalationPolicy(PublicPrimaryKeyModelMixin, OrderedModel):
     order_with_respect_to = ["escalation_chain_id"]
 
     MAX_TIMES_REPEAT = 5
@@ -7,8 +7,7 @@ from django.db import models
 from django.utils import timezone
 from rest_framework.fields import DateTimeField
 
-from apps.slack.slack_formatter import SlackFormatter
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 from common.utils import clean_markup
 
 if typing.TYPE_CHECKING:
@@ -16,31 +15,11 @@ if typing.TYPE_CHECKING:
 
 
 def generate_public_primary_key_for_alert_group_postmortem():
-    prefix = "P"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while AlertGroupPostmortem.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="AlertGroupPostmortem"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("P")
 
 
 def generate_public_primary_key_for_resolution_note():
-    prefix = "M"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while ResolutionNote.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="ResolutionNote"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("M")
 
 
 class ResolutionNoteSlackMessageQueryset(models.QuerySet):
@@ -112,7 +91,7 @@ class ResolutionNoteQueryset(models.QuerySet):
         return super().filter(*args, **kwargs, deleted_at__isnull=True)
 
 
-class ResolutionNote(models.Model):
+class ResolutionNote(PublicPrimaryKeyModelMixin, models.Model):
     alert_group: "AlertGroup"
     resolution_note_slack_message: typing.Optional[ResolutionNoteSlackMessage]
 
@@ -177,6 +156,8 @@ class ResolutionNote(models.Model):
         self.save(update_fields=["deleted_at"])
 
     def render_log_line_json(self):
+        from apps.slack.slack_formatter import SlackFormatter
+
         time = humanize.naturaldelta(self.alert_group.started_at - self.created_at)
         created_at = DateTimeField().to_representation(self.created_at)
         author = self.author.short() if self.author is not None else None
@@ -207,7 +188,7 @@ class ResolutionNote(models.Model):
             return ""
 
 
-class AlertGroupPostmortem(models.Model):
+class AlertGroupPostmortem(PublicPrimaryKeyModelMixin, models.Model):
     public_primary_key = models.CharField(
         max_length=20,
         validators=[MinLengthValidator(settings.PUBLIC_PRIMARY_KEY_MIN_LENGTH + 1)],
@@ -15,7 +15,8 @@ from apps.alerts.models import (
     UserHasNotification,
 )
 from apps.alerts.tasks.notify_user import notify_user_task
-from apps.schedules.ical_utils import list_users_to_notify_from_ical
+from apps.alerts.tasks.send_update_log_report_signal import send_update_log_report_signal
+from apps.schedules.ical_utils import get_oncall_users_for_multiple_schedules
 from apps.schedules.models import OnCallSchedule
 from apps.user_management.models import Organization, Team, User
 
@@ -68,6 +69,41 @@ class DirectPagingAlertPayload(typing.TypedDict):
     oncall: _OnCall
 
 
+def _get_direct_paging_channel_filter(
+    alert_receive_channel: AlertReceiveChannel, escalation_chain: EscalationChain | None
+) -> ChannelFilter:
+    """
+    Get the route to use for direct paging, fetching the default route and the escalation chain route in a single query.
+    Routes are only created if they don't exist yet.
+    """
+    routes_filter = Q(is_default=True)
+    if escalation_chain is not None:
+        routes_filter |= Q(escalation_chain=escalation_chain, is_default=False)
+    routes = list(alert_receive_channel.channel_filters.filter(routes_filter).order_by("-is_default", "pk"))
+
+    default_channel_filter = next((r for r in routes if r.is_default), None)
+    if default_channel_filter is None:
+        default_channel_filter = ChannelFilter.objects.create(
+            alert_receive_channel=alert_receive_channel,
+            notify_in_slack=True,
+            is_default=True,
+        )
+
+    if escalation_chain is None:
+        return default_channel_filter
+
+    channel_filter = next((r for r in routes if not r.is_default), None)
+    if channel_filter is None:
+        channel_filter = ChannelFilter.objects.create(
+            alert_receive_channel=alert_receive_channel,
+            escalation_chain=escalation_chain,
+            is_default=False,
+            filtering_term=f"escalate to {escalation_chain.name}",
+            notify_in_slack=True,
+        )
+    return channel_filter
+
+
 def _trigger_alert(
     organization: Organization,
     team: Team | None,
@@ -87,24 +123,7 @@ def _trigger_alert(
             "verbal_name": f"Direct paging ({team.name if team else 'No'} team)",
         },
     )
-    if alert_receive_channel.default_channel_filter is None:
-        ChannelFilter.objects.create(
-            alert_receive_channel=alert_receive_channel,
-            notify_in_slack=True,
-            is_default=True,
-        )
-
-    channel_filter = None
-    if escalation_chain is not None:
-        channel_filter, _ = ChannelFilter.objects.get_or_create(
-            alert_receive_channel=alert_receive_channel,
-            escalation_chain=escalation_chain,
-            is_default=False,
-            defaults={
-                "filtering_term": f"escalate to {escalation_chain.name}",
-                "notify_in_slack": True,
-            },
-        )
+    channel_filter = _get_direct_paging_channel_filter(alert_receive_channel, escalation_chain)
 
     permalink = None
     if not title:
@@ -148,19 +167,18 @@ def check_user_availability(user: User) -> typing.List[AvailabilityWarning]:
             }
         )
 
-    is_on_call = False
-    schedules = OnCallSchedule.objects.filter(
-        Q(cached_ical_file_primary__contains=user.username) | Q(cached_ical_file_primary__contains=user.email),
-        organization=user.organization,
+    schedules = list(
+        OnCallSchedule.objects.filter(
+            Q(cached_ical_file_primary__contains=user.username) | Q(cached_ical_file_primary__contains=user.email),
+            organization=user.organization,
+        )
     )
-    schedules_data: ScheduleWarnings = {}
-    for s in schedules:
-        # keep track of schedules and on call users to suggest if needed
-        oncall_users = list_users_to_notify_from_ical(s)
-        schedules_data[s.name] = set(u.public_primary_key for u in oncall_users)
-        if user in oncall_users:
-            is_on_call = True
-            break
+    oncall_users = get_oncall_users_for_multiple_schedules(schedules)
+    is_on_call = any(user in oncall_users[s.pk] for s in schedules)
+    # keep track of schedules and on call users to suggest if needed
+    schedules_data: ScheduleWarnings = {
+        s.name: set(u.public_primary_key for u in oncall_users[s.pk]) for s in schedules
+    }
 
     if not is_on_call:
         # user is not on-call
@@ -213,31 +231,45 @@ def direct_paging(
     # initialize direct paged users (without a schedule)
     users = [(u, important, None) for u, important in users]
 
-    # get on call users, add log entry for each schedule
+    # get on call users for all the schedules at once, add log entry for each schedule
+    log_records = []
+    oncall_users = get_oncall_users_for_multiple_schedules([s for s, _ in schedules])
     for s, important in schedules:
-        oncall_users = list_users_to_notify_from_ical(s)
-        users += [(u, important, s) for u in oncall_users]
-        alert_group.log_records.create(
-            type=AlertGroupLogRecord.TYPE_DIRECT_PAGING,
-            author=from_user,
-            reason=f"{from_user.username} paged schedule {s.name}",
-            step_specific_info={"schedule": s.public_primary_key},
+        users += [(u, important, s) for u in oncall_users[s.pk]]
+        log_records.append(
+            AlertGroupLogRecord(
+                alert_group=alert_group,
+                type=AlertGroupLogRecord.TYPE_DIRECT_PAGING,
+                author=from_user,
+                reason=f"{from_user.username} paged schedule {s.name}",
+                step_specific_info={"schedule": s.public_primary_key},
+            )
         )
 
     for u, important, schedule in users:
         reason = f"{from_user.username} paged user {u.username}"
         if schedule:
             reason += f" (from schedule {schedule.name})"
-        alert_group.log_records.create(
-            type=AlertGroupLogRecord.TYPE_DIRECT_PAGING,
-            author=from_user,
-            reason=reason,
-            step_specific_info={
-                "user": u.public_primary_key,
-                "schedule": schedule.public_primary_key if schedule else None,
-                "important": important,
-            },
+        log_records.append(
+            AlertGroupLogRecord(
+                alert_group=alert_group,
+                type=AlertGroupLogRecord.TYPE_DIRECT_PAGING,
+                author=from_user,
+                reason=reason,
+                step_specific_info={
+                    "user": u.public_primary_key,
+                    "schedule": schedule.public_primary_key if schedule else None,
+                    "important": important,
+                },
+            )
         )
+
+    if log_records:
+        AlertGroupLogRecord.objects.bulk_create(log_records, batch_size=5000)
+        # post_save signal is not sent by bulk_create, schedule a single log report update for all the records
+        send_update_log_report_signal.apply_async(kwargs={"alert_group_pk": alert_group.pk}, countdown=8)
+
+    for u, important, _ in users:
         notify_user_task.apply_async(
             (u.pk, alert_group.pk), {"important": important, "notify_even_acknowledged": True, "notify_anyway": True}
         )
@@ -0,0 +1,32 @@
+import datetime
+
+from celery.utils.log import get_task_logger
+from django.conf import settings
+
+from apps.alerts.alert_group_archive import ArchiveResult
+from apps.alerts.alert_group_archive import archive_alert_groups as _archive_alert_groups
+from common.custom_celery_tasks import shared_dedicated_queue_retry_task
+
+logger = get_task_logger(__name__)
+
+
+@shared_dedicated_queue_retry_task(
+    autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else None
+)
+def archive_alert_groups() -> None:
+    """
+    Archive resolved alert groups older than ALERT_GROUP_ARCHIVE_AFTER_DAYS.
+    The number of batches per run is limited, the rest is archived by the next runs.
+    """
+    if settings.ALERT_GROUP_ARCHIVE_AFTER_DAYS is None:
+        logger.info("ALERT_GROUP_ARCHIVE_AFTER_DAYS is not set, skipping archive_alert_groups")
+        return
+
+    result = ArchiveResult()
+    for batch_result in _archive_alert_groups(
+        datetime.timedelta(days=settings.ALERT_GROUP_ARCHIVE_AFTER_DAYS),
+        max_batches=settings.ALERT_GROUP_ARCHIVE_MAX_BATCHES_PER_RUN,
+    ):
+        result += batch_result
+
+    logger.info(f"Archived {result.alert_groups} alert groups, {result.rows} rows")
@@ -6,7 +6,6 @@ from typing import TYPE_CHECKING
 from django.utils import timezone
 
 from apps.schedules.ical_utils import calculate_shift_diff, parse_event_uid
-from apps.slack.client import SlackClient
 from apps.slack.errors import (
     SlackAPIChannelArchivedError,
     SlackAPIChannelNotFoundError,
@@ -59,6 +58,8 @@ def convert_prev_shifts_to_new_format(prev_shifts: dict, schedule: "OnCallSchedu
 
 @shared_dedicated_queue_retry_task()
 def notify_ical_schedule_shift(schedule_pk):
+    from apps.slack.client import SlackClient
+
     task_logger.info(f"Start notify ical schedule shift {schedule_pk}")
     from apps.schedules.models import OnCallSchedule
 
@@ -33,7 +33,7 @@ def notify_user_task(
     from apps.user_management.models import User
 
     try:
-        alert_group = AlertGroup.objects.get(pk=alert_group_pk)
+        alert_group = AlertGroup.objects.select_related("channel__organization").get(pk=alert_group_pk)
     except AlertGroup.DoesNotExist:
         return f"notify_user_task: alert_group {alert_group_pk} doesn't exist"
 
@@ -61,28 +61,26 @@ def notify_user_task(
             ).save()
             return
 
-        user_has_notification, _ = UserHasNotification.objects.get_or_create(
+        user_has_notification, _ = UserHasNotification.objects.select_for_update().get_or_create(
             user=user,
             alert_group=alert_group,
         )
 
-        user_has_notification = UserHasNotification.objects.filter(pk=user_has_notification.pk).select_for_update()[0]
+        notification_policies = UserNotificationPolicy.get_notification_policy_chain(user, important)
 
         if previous_notification_policy_pk is None:
-            notification_policy = user.get_or_create_notification_policies(important=important).first()
-            if notification_policy is None:
+            if not notification_policies:
                 task_logger.info(
                     f"notify_user_task: Failed to notify. No notification policies. user_id={user_pk} alert_group_id={alert_group_pk} important={important}"
                 )
                 return
+            notification_policy = notification_policies[0]
             # Here we collect a brief overview of notification steps configured for user to send it to thread.
             collected_steps_ids = []
-            next_notification_policy = notification_policy.next()
-            while next_notification_policy is not None:
+            for next_notification_policy in notification_policies[1:]:
                 if next_notification_policy.step == UserNotificationPolicy.Step.NOTIFY:
                     if next_notification_policy.notify_by not in collected_steps_ids:
                         collected_steps_ids.append(next_notification_policy.notify_by)
-                next_notification_policy = next_notification_policy.next()
             collected_steps = ", ".join(
                 UserNotificationPolicy.NotificationChannel(step_id).label for step_id in collected_steps_ids
             )
@@ -97,18 +95,31 @@ def notify_user_task(
                 )
                 return
 
-            try:
-                notification_policy = UserNotificationPolicy.objects.get(pk=previous_notification_policy_pk)
-                if notification_policy.user.organization != organization:
-                    notification_policy = UserNotificationPolicy.objects.get(
-                        order=notification_policy.order, user=user, important=important
-                    )
-                notification_policy = notification_policy.next()
-            except UserNotificationPolicy.DoesNotExist:
-                task_logger.info(
-                    f"notify_user_taskLNotification policy {previous_notification_policy_pk} has been deleted"
+            previous_notification_policy_index = next(
+                (i for i, policy in enumerate(notification_policies) if policy.pk == previous_notification_policy_pk),
+                None,
+            )
+            if previous_notification_policy_index is not None:
+                next_notification_policy_index = previous_notification_policy_index + 1
+                notification_policy = (
+                    notification_policies[next_notification_policy_index]
+                    if next_notification_policy_index < len(notification_policies)
+                    else None
                 )
-                return
+            else:
+                # the policy is not in the user's chain, e.g. it has been deleted or belongs to another organization
+                try:
+                    notification_policy = UserNotificationPolicy.objects.get(pk=previous_notification_policy_pk)
+                    if notification_policy.user.organization != organization:
+                        notification_policy = UserNotificationPolicy.objects.get(
+                            order=notification_policy.order, user=user, important=important
+                        )
+                    notification_policy = notification_policy.next()
+                except UserNotificationPolicy.DoesNotExist:
+                    task_logger.info(
+                        f"notify_user_taskLNotification policy {previous_notification_policy_pk} has been deleted"
+                    )
+                    return
             reason = None
         if notification_policy is None:
             stop_escalation = True
@@ -125,7 +136,7 @@ def notify_user_task(
                 (alert_group.acknowledged and not notify_even_acknowledged)
                 or alert_group.resolved
                 or alert_group.wiped_at
-                or alert_group.root_alert_group
+                or alert_group.root_alert_group_id
             ):
                 return "Acknowledged, resolved, attached or wiped."
 
@@ -212,6 +223,7 @@ def notify_user_task(
                         "notify_even_acknowledged": notify_even_acknowledged,
                         "notify_anyway": notify_anyway,
                         "prevent_posting_to_thread": prevent_posting_to_thread,
+                        "important": important,
                     },
                     countdown=delay,
                     task_id=task_id,
@@ -370,7 +382,6 @@ def send_user_notification_signal(log_record_pk):
     from apps.base.models import UserNotificationPolicyLogRecord
 
     task_logger.debug(f"LOG RECORD PK: {log_record_pk}")
-    task_logger.debug(f"LOG RECORD LAST: {UserNotificationPolicyLogRecord.objects.last()}")
 
     log_record = UserNotificationPolicyLogRecord.objects.get(pk=log_record_pk)
     user_notification_action_triggered_signal.send(sender=send_user_notification_signal, log_record=log_record)
@@ -3,15 +3,42 @@ import time
 from django.conf import settings
 
 from apps.alerts.signals import alert_group_action_triggered_signal
+from apps.metrics_exporter.constants import ALERT_GROUP_SIGNAL_DURATION_SECONDS, ALERT_GROUP_SIGNALS_SENT
+from apps.metrics_exporter.helpers import metrics_increment_internal_counter, metrics_observe_internal_histogram
 from common.custom_celery_tasks import shared_dedicated_queue_retry_task
 
+from .send_update_log_report_signal import send_update_log_report_signal
+from .task_logger import task_logger
+
 
 @shared_dedicated_queue_retry_task(
     autoretry_for=(Exception,), retry_backoff=True, max_retries=0 if settings.DEBUG else None
 )
 def send_alert_group_signal(log_record_id):
-    start_time = time.time()
+    start = time.perf_counter()
 
     alert_group_action_triggered_signal.send(sender=send_alert_group_signal, log_record=log_record_id)
 
-    print("--- %s seconds ---" % (time.time() - start_time))
+    metrics_increment_internal_counter(ALERT_GROUP_SIGNALS_SENT)
+    metrics_observe_internal_histogram(ALERT_GROUP_SIGNAL_DURATION_SECONDS, time.perf_counter() - start)
+
+
+@shared_dedicated_queue_retry_task(
+    autoretry_for=(Exception,), retry_backoff=True, max_retries=0 if settings.DEBUG else None
+)
+def send_alert_group_signal_for_bulk_action(log_record_ids, alert_group_pks):
+    """
+    Send alert_group_action_triggered_signal for the log records created by a bulk action in a single task
+    and update log reports for the alert groups (log records created in bulk don't trigger post_save).
+    """
+    for log_record_id in log_record_ids:
+        try:
+            alert_group_action_triggered_signal.send(sender=send_alert_group_signal, log_record=log_record_id)
+            metrics_increment_internal_counter(ALERT_GROUP_SIGNALS_SENT)
+        except Exception as e:
+            # retry failed log records separately, so representatives of other alert groups are not updated twice
+            task_logger.warning(f"Error while sending alert group signal for log record {log_record_id}: {e}")
+            send_alert_group_signal.delay(log_record_id)
+
+    for alert_group_pk in alert_group_pks:
+        send_update_log_report_signal.apply_async(kwargs={"alert_group_pk": alert_group_pk}, countdown=8)
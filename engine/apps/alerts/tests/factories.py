@@ -13,7 +13,7 @@ from apps.alerts.models import (
     ResolutionNote,
     ResolutionNoteSlackMessage,
 )
-from common.utils import UniqueFaker
+from common.tests.factories import UniqueFaker
 
 
 class AlertReceiveChannelFactory(factory.DjangoModelFactory):
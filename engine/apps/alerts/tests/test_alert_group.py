@@ -4,9 +4,12 @@ import pytest
 
 from apps.alerts.constants import ActionSource
 from apps.alerts.incident_appearance.renderers.phone_call_renderer import AlertGroupPhoneCallRenderer
-from apps.alerts.models import AlertGroup, AlertGroupLogRecord
+from apps.alerts.models import AlertGroup, AlertGroupInvolvedUser, AlertGroupLogRecord
 from apps.alerts.tasks import wipe
 from apps.alerts.tasks.delete_alert_group import delete_alert_group
+from apps.alerts.tasks.send_alert_group_signal import send_alert_group_signal, send_alert_group_signal_for_bulk_action
+from apps.base.models import UserNotificationPolicyLogRecord
+from apps.metrics_exporter.constants import ALERT_GROUP_SIGNAL_DURATION_SECONDS, ALERT_GROUP_SIGNALS_SENT
 from apps.slack.client import SlackClient
 from apps.slack.errors import SlackAPIMessageNotFoundError, SlackAPIRatelimitError
 from apps.slack.models import SlackMessage
@@ -428,6 +431,114 @@ def test_bulk_silence_forever(
     assert not mocked_start_unsilence_task.called
 
 
+@pytest.mark.parametrize("bulk_create_returns_pks", [True, False])
+@patch("apps.alerts.models.alert_group.send_alert_group_signal_for_bulk_action")
+@pytest.mark.django_db
+def test_bulk_resolve_log_records(
+    mocked_bulk_action_signal_task,
+    bulk_create_returns_pks,
+    make_organization_and_user,
+    make_alert_receive_channel,
+    make_alert_group,
+    django_capture_on_commit_callbacks,
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_groups = [make_alert_group(alert_receive_channel) for _ in range(3)]
+    alert_groups[0].silence_by_user(user, silence_delay=None)
+
+    bulk_create = AlertGroupLogRecord.objects.bulk_create
+
+    def _bulk_create(*args, **kwargs):
+        log_records = bulk_create(*args, **kwargs)
+        if not bulk_create_returns_pks:
+            # e.g. MySQL doesn't set primary keys on bulk insert
+            for log_record in log_records:
+                log_record.pk = None
+        return log_records
+
+    with patch.object(AlertGroupLogRecord.objects, "bulk_create", side_effect=_bulk_create):
+        with django_capture_on_commit_callbacks(execute=True):
+            AlertGroup.bulk_resolve(user, AlertGroup.objects.filter(pk__in=[ag.pk for ag in alert_groups]))
+
+    assert AlertGroupLogRecord.objects.filter(
+        alert_group=alert_groups[0], type=AlertGroupLogRecord.TYPE_UN_SILENCE, reason="Bulk action resolve"
+    ).exists()
+    resolved_log_records = AlertGroupLogRecord.objects.filter(
+        type=AlertGroupLogRecord.TYPE_RESOLVED, author=user
+    ).order_by("pk")
+    assert [log_record.alert_group_id for log_record in resolved_log_records] == [ag.pk for ag in alert_groups]
+    # signal is sent for all the log records by a single task
+    mocked_bulk_action_signal_task.delay.assert_called_once_with(
+        [log_record.pk for log_record in resolved_log_records], [ag.pk for ag in alert_groups]
+    )
+
+
+@patch("apps.alerts.models.alert_group.send_alert_group_signal_for_bulk_action")
+@pytest.mark.django_db
+def test_involved_users(
+    _mocked_bulk_action_signal_task,
+    make_organization_and_user,
+    make_user_for_organization,
+    make_alert_receive_channel,
+    make_alert_group,
+):
+    organization, user = make_organization_and_user()
+    notified_user = make_user_for_organization(organization)
+    other_user = make_user_for_organization(organization)
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(alert_receive_channel)
+    other_alert_group = make_alert_group(alert_receive_channel)
+
+    # notified users and users that acknowledged/resolved/silenced the alert group are involved
+    alert_group.personal_log_records.create(
+        type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_TRIGGERED, author=notified_user
+    )
+    alert_group.acknowledge_by_user(user)
+    AlertGroup.bulk_resolve(user, AlertGroup.objects.filter(pk__in=[alert_group.pk, other_alert_group.pk]))
+    # other log record types don't make users involved
+    alert_group.log_records.create(type=AlertGroupLogRecord.TYPE_UN_ACK, author=other_user)
+
+    assert set(AlertGroupInvolvedUser.objects.values_list("user_id", "alert_group_id")) == {
+        (notified_user.pk, alert_group.pk),
+        (user.pk, alert_group.pk),
+        (user.pk, other_alert_group.pk),
+    }
+
+
+@patch("apps.alerts.tasks.send_alert_group_signal.send_update_log_report_signal")
+@patch("apps.alerts.tasks.send_alert_group_signal.send_alert_group_signal")
+@patch("apps.alerts.tasks.send_alert_group_signal.alert_group_action_triggered_signal")
+def test_send_alert_group_signal_for_bulk_action(
+    mocked_action_triggered_signal, mocked_send_alert_group_signal, mocked_send_update_log_report_signal
+):
+    mocked_action_triggered_signal.send.side_effect = [None, Exception("error"), None]
+
+    send_alert_group_signal_for_bulk_action([1, 2, 3], [10, 20, 30])
+
+    assert mocked_action_triggered_signal.send.call_count == 3
+    # failed log record is retried by a separate task
+    mocked_send_alert_group_signal.delay.assert_called_once_with(2)
+    assert mocked_send_update_log_report_signal.apply_async.call_args_list == [
+        call(kwargs={"alert_group_pk": alert_group_pk}, countdown=8) for alert_group_pk in (10, 20, 30)
+    ]
+
+
+@patch("apps.alerts.tasks.send_alert_group_signal.metrics_observe_internal_histogram")
+@patch("apps.alerts.tasks.send_alert_group_signal.metrics_increment_internal_counter")
+@patch("apps.alerts.tasks.send_alert_group_signal.alert_group_action_triggered_signal")
+def test_send_alert_group_signal_metrics(
+    mocked_action_triggered_signal, mocked_increment_counter, mocked_observe_histogram, capsys
+):
+    send_alert_group_signal(1)
+
+    mocked_action_triggered_signal.send.assert_called_once_with(sender=send_alert_group_signal, log_record=1)
+    mocked_increment_counter.assert_called_once_with(ALERT_GROUP_SIGNALS_SENT)
+    assert mocked_observe_histogram.call_args.args[0] == ALERT_GROUP_SIGNAL_DURATION_SECONDS
+    # timing is recorded as a metric, not printed
+    assert capsys.readouterr().out == ""
+
+
 @pytest.mark.parametrize("action_source", ActionSource)
 @pytest.mark.django_db
 def test_alert_group_log_record_action_source(
@@ -0,0 +1,321 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.alerts import alert_group_archive
+from apps.alerts.alert_group_archive import ArchiveResult, archive_alert_groups
+from apps.alerts.models import Alert, AlertGroup, AlertGroupLogRecord, ArchivedAlertGroup, ArchivedAlertGroupRow
+from apps.alerts.tasks.archive_alert_groups import archive_alert_groups as archive_alert_groups_task
+from apps.base.models import UserNotificationPolicyLogRecord
+from apps.email.models import EmailMessage
+from apps.phone_notifications.models import PhoneCallRecord, SMSRecord
+
+OLDER_THAN = datetime.timedelta(days=30)
+
+
+@pytest.fixture
+def make_old_resolved_alert_group(make_alert_group, make_alert, make_alert_group_log_record):
+    def _make_old_resolved_alert_group(alert_receive_channel, user, days=31):
+        resolved_at = timezone.now() - datetime.timedelta(days=days)
+        alert_group = make_alert_group(
+            alert_receive_channel, resolved=True, resolved_at=resolved_at, resolved_by_user=user
+        )
+        make_alert(alert_group, raw_request_data={"alert": 1})
+        make_alert(alert_group, raw_request_data={"alert": 2})
+        make_alert_group_log_record(alert_group, AlertGroupLogRecord.TYPE_RESOLVED, user)
+        return alert_group
+
+    return _make_old_resolved_alert_group
+
+
+@pytest.mark.django_db
+def test_archive_alert_groups(
+    make_organization_and_user,
+    make_alert_receive_channel,
+    make_user_notification_policy_log_record,
+    make_resolution_note,
+    make_old_resolved_alert_group,
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_old_resolved_alert_group(alert_receive_channel, user)
+    make_user_notification_policy_log_record(
+        author=user,
+        alert_group=alert_group,
+        type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_TRIGGERED,
+    )
+    make_resolution_note(alert_group=alert_group, author=user, message_text="fixed")
+    alert_ids = list(alert_group.alerts.order_by("pk").values_list("pk", flat=True))
+
+    with patch.object(AlertGroup, "_bulk_update_metrics") as mock_update_metrics:
+        results = list(archive_alert_groups(OLDER_THAN))
+
+    assert len(results) == 1
+    assert results[0].alert_groups == 1
+    assert not AlertGroup.objects.filter(pk=alert_group.pk).exists()
+    assert not Alert.objects.filter(pk__in=alert_ids).exists()
+    assert not AlertGroupLogRecord.objects.filter(alert_group_id=alert_group.pk).exists()
+    assert not UserNotificationPolicyLogRecord.objects.filter(alert_group_id=alert_group.pk).exists()
+    mock_update_metrics.assert_called_once()
+
+    archived_alert_group = ArchivedAlertGroup.objects.get(alert_group_id=alert_group.pk)
+    assert archived_alert_group.organization == organization
+    assert archived_alert_group.channel_id == alert_receive_channel.pk
+    assert archived_alert_group.public_primary_key == alert_group.public_primary_key
+    assert archived_alert_group.resolved_at == alert_group.resolved_at
+    assert archived_alert_group.get_alert_group().resolved_by_user_id == user.pk
+    assert [alert.pk for alert in archived_alert_group.get_alerts()] == alert_ids
+    assert archived_alert_group.get_alerts()[1].raw_request_data == {"alert": 2}
+    assert archived_alert_group.get_alerts_count() == 2
+    assert [alert.pk for alert in archived_alert_group.get_latest_alerts(1)] == alert_ids[-1:]
+    assert [log_record.type for log_record in archived_alert_group.get_log_records()] == [
+        AlertGroupLogRecord.TYPE_RESOLVED
+    ]
+    assert len(archived_alert_group.get_personal_log_records()) == 1
+    assert results[0].rows == len(archived_alert_group.get_objects())
+
+
+@pytest.mark.django_db
+def test_restore_archived_alert_group(
+    make_organization_and_user,
+    make_alert_receive_channel,
+    make_resolution_note,
+    make_old_resolved_alert_group,
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_old_resolved_alert_group(alert_receive_channel, user)
+    make_resolution_note(alert_group=alert_group, author=user, message_text="fixed")
+
+    list(archive_alert_groups(OLDER_THAN))
+    ArchivedAlertGroup.objects.get(alert_group_id=alert_group.pk).restore()
+
+    restored_alert_group = AlertGroup.objects.get(pk=alert_group.pk)
+    assert restored_alert_group.public_primary_key == alert_group.public_primary_key
+    assert restored_alert_group.resolved_by_user == user
+    assert restored_alert_group.alerts.count() == 2
+    assert restored_alert_group.log_records.filter(type=AlertGroupLogRecord.TYPE_RESOLVED).count() == 1
+    assert restored_alert_group.resolution_notes.get().message_text == "fixed"
+    assert not ArchivedAlertGroup.objects.exists()
+
+
+@pytest.mark.django_db
+def test_archive_alert_groups_with_notification_records(
+    make_organization_and_user,
+    make_alert_receive_channel,
+    make_old_resolved_alert_group,
+    make_email_message,
+    make_phone_call_record,
+    make_sms_record,
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_old_resolved_alert_group(alert_receive_channel, user)
+    email_message = make_email_message(user, represents_alert_group=alert_group)
+    phone_call_record = make_phone_call_record(user, represents_alert_group=alert_group)
+    sms_record = make_sms_record(user, represents_alert_group=alert_group)
+
+    list(archive_alert_groups(OLDER_THAN))
+
+    # records referencing the alert group are archived with it instead of losing the reference
+    assert not EmailMessage.objects.filter(pk=email_message.pk).exists()
+    assert not PhoneCallRecord.objects.filter(pk=phone_call_record.pk).exists()
+    assert not SMSRecord.objects.filter(pk=sms_record.pk).exists()
+    archived_alert_group = ArchivedAlertGroup.objects.get(alert_group_id=alert_group.pk)
+    archived_records = {
+        (type(obj), obj.pk): obj
+        for obj in archived_alert_group.get_objects()
+        if isinstance(obj, (EmailMessage, PhoneCallRecord, SMSRecord))
+    }
+    assert archived_records.keys() == {
+        (EmailMessage, email_message.pk),
+        (PhoneCallRecord, phone_call_record.pk),
+        (SMSRecord, sms_record.pk),
+    }
+    assert all(record.represents_alert_group_id == alert_group.pk for record in archived_records.values())
+
+    archived_alert_group.restore()
+    assert EmailMessage.objects.get(pk=email_message.pk).represents_alert_group_id == alert_group.pk
+    assert PhoneCallRecord.objects.get(pk=phone_call_record.pk).represents_alert_group_id == alert_group.pk
+    assert SMSRecord.objects.get(pk=sms_record.pk).represents_alert_group_id == alert_group.pk
+
+
+@pytest.mark.django_db
+def test_archive_alert_groups_with_attached_alert_groups(
+    make_organization_and_user, make_alert_receive_channel, make_alert_group, make_old_resolved_alert_group
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    root_alert_group = make_old_resolved_alert_group(alert_receive_channel, user)
+    # attached alert groups are archived with the root alert group regardless of their age
+    dependent_alert_group = make_alert_group(
+        alert_receive_channel, root_alert_group=root_alert_group, resolved=True, resolved_at=timezone.now()
+    )
+
+    results = list(archive_alert_groups(OLDER_THAN))
+
+    assert sum(result.alert_groups for result in results) == 2
+    assert not AlertGroup.objects.exists()
+    archived_dependent = ArchivedAlertGroup.objects.get(alert_group_id=dependent_alert_group.pk)
+    assert archived_dependent.root_alert_group_id == root_alert_group.pk
+    assert archived_dependent.get_alert_group().root_alert_group_id == root_alert_group.pk
+
+    # restoring an attached alert group restores its root alert group as well
+    archived_dependent.restore()
+    assert not ArchivedAlertGroup.objects.exists()
+    assert AlertGroup.objects.get(pk=dependent_alert_group.pk).root_alert_group_id == root_alert_group.pk
+    assert AlertGroup.objects.filter(pk=root_alert_group.pk).exists()
+
+
+@pytest.mark.django_db
+def test_archive_alert_groups_skips_root_with_unresolved_attached_alert_groups(
+    make_organization_and_user, make_alert_receive_channel, make_alert_group, make_old_resolved_alert_group
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    root_alert_group = make_old_resolved_alert_group(alert_receive_channel, user)
+    dependent_alert_group = make_alert_group(alert_receive_channel, root_alert_group=root_alert_group)
+    # an old attached alert group is not archived without its root alert group
+    other_root_alert_group = make_alert_group(alert_receive_channel)
+    other_dependent_alert_group = make_old_resolved_alert_group(alert_receive_channel, user)
+    other_dependent_alert_group.root_alert_group = other_root_alert_group
+    other_dependent_alert_group.save(update_fields=["root_alert_group"])
+
+    results = list(archive_alert_groups(OLDER_THAN))
+
+    assert sum(result.alert_groups for result in results) == 0
+    assert not ArchivedAlertGroup.objects.exists()
+    dependent_alert_group.refresh_from_db()
+    other_dependent_alert_group.refresh_from_db()
+    assert dependent_alert_group.root_alert_group == root_alert_group
+    assert other_dependent_alert_group.root_alert_group == other_root_alert_group
+
+
+@pytest.mark.django_db
+@patch("apps.alerts.alert_group_archive.ALERT_GROUP_ARCHIVE_BATCH_SIZE", 1)
+def test_archive_alert_groups_root_with_unresolved_attached_alert_groups_does_not_block(
+    make_organization_and_user, make_alert_receive_channel, make_alert_group, make_old_resolved_alert_group
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    root_alert_group = make_old_resolved_alert_group(alert_receive_channel, user)
+    make_alert_group(alert_receive_channel, root_alert_group=root_alert_group)
+    old_alert_group = make_old_resolved_alert_group(alert_receive_channel, user)
+
+    # alert groups that can't be archived don't take up batches
+    results = list(archive_alert_groups(OLDER_THAN, max_batches=1))
+
+    assert [result.alert_groups for result in results] == [1]
+    assert list(ArchivedAlertGroup.objects.values_list("alert_group_id", flat=True)) == [old_alert_group.pk]
+
+
+@pytest.mark.django_db
+@patch("apps.alerts.alert_group_archive.ALERT_GROUP_ARCHIVE_MAX_ROWS_PER_TRANSACTION", 5)
+@patch("apps.alerts.alert_group_archive.ALERT_GROUP_ARCHIVE_CHUNK_SIZE", 1)
+def test_archive_alert_groups_max_rows_per_transaction(
+    make_organization_and_user, make_alert_receive_channel, make_alert_group, make_old_resolved_alert_group
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_groups = [make_old_resolved_alert_group(alert_receive_channel, user) for _ in range(3)]
+    # a root alert group with its attached alert groups is archived in a single transaction regardless of size
+    make_alert_group(alert_receive_channel, root_alert_group=alert_groups[1], resolved=True)
+
+    with patch.object(
+        alert_group_archive,
+        "_archive_alert_groups_in_transaction",
+        wraps=alert_group_archive._archive_alert_groups_in_transaction,
+    ) as mock_archive_in_transaction:
+        results = list(archive_alert_groups(OLDER_THAN))
+
+    # each root alert group has more than 2 rows, so every transaction archives a single root alert group
+    assert mock_archive_in_transaction.call_count == 3
+    assert [result.alert_groups for result in results] == [4]
+    assert not AlertGroup.objects.exists()
+    assert ArchivedAlertGroupRow.objects.count() == results[0].rows
+    for alert_group in alert_groups:
+        archived_alert_group = ArchivedAlertGroup.objects.get(alert_group_id=alert_group.pk)
+        assert [alert.raw_request_data for alert in archived_alert_group.get_alerts()] == [{"alert": 1}, {"alert": 2}]
+
+
+@pytest.mark.django_db
+def test_archive_alert_groups_dry_run(
+    make_organization_and_user, make_alert_receive_channel, make_old_resolved_alert_group
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_old_resolved_alert_group(alert_receive_channel, user)
+
+    results = list(archive_alert_groups(OLDER_THAN, dry_run=True))
+
+    # alert group, 2 alerts and a log record at least
+    assert results[0].alert_groups == 1
+    assert results[0].rows >= 4
+    assert AlertGroup.objects.filter(pk=alert_group.pk).exists()
+    assert alert_group.alerts.count() == 2
+    assert not ArchivedAlertGroup.objects.exists()
+
+
+@pytest.mark.django_db
+def test_archive_alert_groups_skips_unresolved_and_recent(
+    make_organization_and_user, make_alert_receive_channel, make_alert_group, make_old_resolved_alert_group
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    make_alert_group(alert_receive_channel)
+    make_alert_group(alert_receive_channel, resolved=True, resolved_at=timezone.now())
+    old_alert_group = make_old_resolved_alert_group(alert_receive_channel, user)
+
+    results = list(archive_alert_groups(OLDER_THAN))
+
+    assert sum(result.alert_groups for result in results) == 1
+    assert AlertGroup.objects.count() == 2
+    assert list(ArchivedAlertGroup.objects.values_list("alert_group_id", flat=True)) == [old_alert_group.pk]
+
+
+@pytest.mark.django_db
+@patch("apps.alerts.alert_group_archive.ALERT_GROUP_ARCHIVE_BATCH_SIZE", 2)
+def test_archive_alert_groups_max_batches(
+    make_organization_and_user, make_alert_receive_channel, make_old_resolved_alert_group
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    for _ in range(5):
+        make_old_resolved_alert_group(alert_receive_channel, user)
+
+    results = list(archive_alert_groups(OLDER_THAN, max_batches=2))
+
+    assert [result.alert_groups for result in results] == [2, 2]
+    assert AlertGroup.objects.count() == 1
+
+    # the rest is archived by the next run
+    result = ArchiveResult()
+    for batch_result in archive_alert_groups(OLDER_THAN):
+        result += batch_result
+    assert result.alert_groups == 1
+    assert ArchivedAlertGroup.objects.count() == 5
+
+
+@pytest.mark.django_db
+def test_archive_alert_groups_task(
+    make_organization_and_user, make_alert_receive_channel, make_old_resolved_alert_group
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_old_resolved_alert_group(alert_receive_channel, user, days=10)
+
+    with override_settings(ALERT_GROUP_ARCHIVE_AFTER_DAYS=None):
+        archive_alert_groups_task()
+    assert AlertGroup.objects.filter(pk=alert_group.pk).exists()
+
+    with override_settings(ALERT_GROUP_ARCHIVE_AFTER_DAYS=30):
+        archive_alert_groups_task()
+    assert AlertGroup.objects.filter(pk=alert_group.pk).exists()
+
+    with override_settings(ALERT_GROUP_ARCHIVE_AFTER_DAYS=7):
+        archive_alert_groups_task()
+    assert not AlertGroup.objects.filter(pk=alert_group.pk).exists()
+    assert ArchivedAlertGroup.objects.filter(alert_group_id=alert_group.pk).exists()
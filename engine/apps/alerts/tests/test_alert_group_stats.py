@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from apps.alerts import alert_group_stats
+from apps.alerts.alert_group_stats import _count_alert_groups, get_alert_group_counters
+from apps.alerts.models import AlertGroup
+
+
+@pytest.mark.django_db
+def test_alert_group_counters_updated_incrementally(
+    make_organization_and_user,
+    make_alert_receive_channel,
+    make_alert_group,
+    django_capture_on_commit_callbacks,
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    root_alert_group = make_alert_group(alert_receive_channel)
+    alert_group = make_alert_group(alert_receive_channel)
+
+    assert get_alert_group_counters(organization.id) == {(alert_receive_channel.pk, True, AlertGroup.NEW): 2}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        new_alert_group = make_alert_group(alert_receive_channel)
+        root_alert_group.acknowledge_by_user(user)
+        alert_group.attach_by_user(user, root_alert_group)
+        new_alert_group.resolve_by_user(user)
+    with django_capture_on_commit_callbacks(execute=True):
+        new_alert_group.delete()
+
+    # counters are not rebuilt from the database
+    with patch("apps.alerts.alert_group_stats._count_alert_groups") as mock_count_alert_groups:
+        counters = get_alert_group_counters(organization.id)
+    assert not mock_count_alert_groups.called
+    assert counters == _count_alert_groups(organization.id)
+    assert counters == {
+        (alert_receive_channel.pk, True, AlertGroup.ACKNOWLEDGED): 1,
+        (alert_receive_channel.pk, False, AlertGroup.ACKNOWLEDGED): 1,
+    }
+
+
+@pytest.mark.django_db
+def test_alert_group_counters_new_integration(
+    make_organization, make_alert_receive_channel, make_alert_group, django_capture_on_commit_callbacks
+):
+    organization = make_organization()
+    make_alert_group(make_alert_receive_channel(organization))
+    get_alert_group_counters(organization.id)
+
+    # counters are not cached for the new integration, so they are rebuilt
+    with django_capture_on_commit_callbacks(execute=True):
+        alert_receive_channel = make_alert_receive_channel(organization)
+        make_alert_group(alert_receive_channel)
+    assert get_alert_group_counters(organization.id)[(alert_receive_channel.pk, True, AlertGroup.NEW)] == 1
+
+
+@pytest.mark.django_db
+def test_alert_group_counters_evicted(make_organization, make_alert_receive_channel, make_alert_group):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    make_alert_group(alert_receive_channel)
+    get_alert_group_counters(organization.id)
+
+    cache.delete(
+        alert_group_stats._get_alert_group_counter_cache_key(organization.id, alert_receive_channel.pk, True, 0)
+    )
+    assert get_alert_group_counters(organization.id) == {(alert_receive_channel.pk, True, AlertGroup.NEW): 1}
+
+
+@pytest.mark.django_db
+@patch("apps.alerts.alert_group_stats.ALERT_GROUP_COUNTERS_REBUILD_WAIT", 0)
+def test_alert_group_counters_rebuild_locked(make_organization, make_alert_receive_channel, make_alert_group):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    make_alert_group(alert_receive_channel)
+
+    # counters are being rebuilt by another request, they're counted without caching
+    cache.set(alert_group_stats._get_alert_group_counters_lock_key(organization.id), True)
+    assert get_alert_group_counters(organization.id) == {(alert_receive_channel.pk, True, AlertGroup.NEW): 1}
+    assert cache.get(alert_group_stats._get_alert_group_counters_cache_key(organization.id)) is None
@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 import pytest
+from django.utils import timezone
 
 from apps.alerts.incident_log_builder import IncidentLogBuilder
-from apps.alerts.models import EscalationPolicy
-from apps.base.models import UserNotificationPolicy
+from apps.alerts.models import AlertGroupLogRecord, EscalationPolicy
+from apps.base.models import UserNotificationPolicy, UserNotificationPolicyLogRecord
 
 
 @pytest.mark.django_db
@@ -37,3 +40,135 @@ def test_escalation_plan_messaging_backends(
     log_builder = IncidentLogBuilder(alert_group=alert_group)
     plan = log_builder.get_incident_escalation_plan()
     assert list(plan.values()) == [["send test only backend message to {}".format(user.username)]]
+
+
+@pytest.mark.django_db
+def test_rendered_log_records_cache(
+    make_organization_and_user,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert_group_log_record,
+    make_user_notification_policy_log_record,
+    make_resolution_note,
+    django_capture_on_commit_callbacks,
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization=organization)
+    alert_group = make_alert_group(alert_receive_channel)
+
+    ack = make_alert_group_log_record(alert_group, AlertGroupLogRecord.TYPE_ACK, user)
+    notification = make_user_notification_policy_log_record(
+        author=user,
+        alert_group=alert_group,
+        type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_SUCCESS,
+    )
+    resolution_note = make_resolution_note(alert_group, author=user)
+    # settled log records are cached, recent ones are rendered on every call
+    settled_at = timezone.now() - timezone.timedelta(minutes=5)
+    AlertGroupLogRecord.objects.filter(pk=ack.pk).update(created_at=settled_at)
+    UserNotificationPolicyLogRecord.objects.filter(pk=notification.pk).update(
+        created_at=settled_at + timezone.timedelta(seconds=1)
+    )
+    resolve = make_alert_group_log_record(alert_group, AlertGroupLogRecord.TYPE_RESOLVED, user)
+
+    rendered_log_records = []
+
+    def _render(log_record):
+        rendered_log_records.append(log_record)
+        return type(log_record).__name__, log_record.pk
+
+    def _get_rendered_log_records():
+        rendered_log_records.clear()
+        log_builder = IncidentLogBuilder(alert_group)
+        return log_builder.get_rendered_log_records_list("test", _render, with_resolution_notes=True)
+
+    expected = [
+        ("AlertGroupLogRecord", ack.pk),
+        ("UserNotificationPolicyLogRecord", notification.pk),
+        ("ResolutionNote", resolution_note.pk),
+        ("AlertGroupLogRecord", resolve.pk),
+    ]
+    assert _get_rendered_log_records() == expected
+    assert rendered_log_records == [ack, resolve, notification, resolution_note]
+
+    assert _get_rendered_log_records() == expected
+    assert rendered_log_records == [resolve, resolution_note]
+
+    # changing an existing log record invalidates the cache
+    ack.refresh_from_db()
+    with django_capture_on_commit_callbacks(execute=True):
+        ack.reason = "updated"
+        ack.save()
+    assert _get_rendered_log_records() == expected
+    assert rendered_log_records == [ack, resolve, notification, resolution_note]
+
+    # other renderers are cached separately
+    log_builder = IncidentLogBuilder(alert_group)
+    assert log_builder.get_rendered_log_records_list("other", lambda log_record: log_record.created_at) == sorted(
+        [log_record.created_at for log_record in alert_group.log_records.all()]
+        + [notification.created_at for notification in alert_group.personal_log_records.all()]
+    )
+
+
+@pytest.mark.django_db
+def test_escalation_plan_cache(
+    make_organization_and_user,
+    make_user_notification_policy,
+    make_escalation_chain,
+    make_escalation_policy,
+    make_channel_filter,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert_group_log_record,
+):
+    organization, user = make_organization_and_user()
+    make_user_notification_policy(
+        user,
+        UserNotificationPolicy.Step.NOTIFY,
+        notify_by=UserNotificationPolicy.NotificationChannel.TESTONLY,
+    )
+    escalation_chain = make_escalation_chain(organization=organization)
+    make_escalation_policy(
+        escalation_chain=escalation_chain,
+        escalation_policy_step=EscalationPolicy.STEP_WAIT,
+        wait_delay=EscalationPolicy.FIFTEEN_MINUTES,
+    )
+    escalation_policy = make_escalation_policy(
+        escalation_chain=escalation_chain,
+        escalation_policy_step=EscalationPolicy.STEP_NOTIFY_MULTIPLE_USERS,
+    )
+    escalation_policy.notify_to_users_queue.set([user])
+    alert_receive_channel = make_alert_receive_channel(organization=organization)
+    channel_filter = make_channel_filter(alert_receive_channel, escalation_chain=escalation_chain)
+    alert_group = make_alert_group(alert_receive_channel, channel_filter=channel_filter)
+    alert_group.raw_escalation_snapshot = alert_group.build_raw_escalation_snapshot()
+    alert_group.save()
+
+    expected_plan_lines = [
+        [
+            'escalation step "Notify multiple Users"',
+            "send test only backend message to {}".format(user.username),
+        ]
+    ]
+
+    def _get_plan(elapsed=timezone.timedelta()):
+        now = timezone.now()
+        with patch("apps.alerts.incident_log_builder.incident_log_builder.timezone.now", return_value=now + elapsed):
+            plan = IncidentLogBuilder(alert_group).get_incident_escalation_plan()
+        # cached plan is shifted by the time passed since it was generated
+        assert len(plan) == 1
+        assert abs(list(plan)[0] + elapsed - timezone.timedelta(minutes=15)) < timezone.timedelta(seconds=1)
+        return list(plan.values())
+
+    generate_plan = IncidentLogBuilder._generate_incident_escalation_plan
+    with patch.object(
+        IncidentLogBuilder, "_generate_incident_escalation_plan", autospec=True, side_effect=generate_plan
+    ) as mock_generate_plan:
+        assert _get_plan() == expected_plan_lines
+        assert _get_plan(elapsed=timezone.timedelta(minutes=5)) == expected_plan_lines
+        assert mock_generate_plan.call_count == 1
+
+        # new log records change the plan version
+        make_alert_group_log_record(alert_group, AlertGroupLogRecord.TYPE_ACK, user)
+        _get_plan()
+        assert mock_generate_plan.call_count == 2
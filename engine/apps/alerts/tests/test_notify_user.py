@@ -1,7 +1,10 @@
 from unittest.mock import patch
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from apps.alerts.models import UserHasNotification
 from apps.alerts.tasks.notify_user import notify_user_task, perform_notification
 from apps.api.permissions import LegacyAccessControlRole
 from apps.base.models.user_notification_policy import UserNotificationPolicy
@@ -178,3 +181,47 @@ def test_notify_user_error_if_viewer(
     assert error_log_record.type == UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_FAILED
     assert error_log_record.reason == NOTIFICATION_UNAUTHORIZED_MSG
     assert error_log_record.notification_error_code == UserNotificationPolicyLogRecord.ERROR_NOTIFICATION_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_notify_user_task_cached_notification_policy_chain(
+    make_organization,
+    make_user,
+    make_user_notification_policy,
+    make_alert_receive_channel,
+    make_alert_group,
+):
+    organization = make_organization()
+    user = make_user(organization=organization)
+    user.notification_policies.all().delete()
+    notification_policies = [
+        make_user_notification_policy(
+            user=user,
+            step=UserNotificationPolicy.Step.NOTIFY,
+            notify_by=UserNotificationPolicy.NotificationChannel.TESTONLY,
+        ),
+        make_user_notification_policy(user=user, step=UserNotificationPolicy.Step.WAIT),
+    ]
+    alert_receive_channel = make_alert_receive_channel(organization=organization)
+    alert_group = make_alert_group(alert_receive_channel=alert_receive_channel)
+
+    notify_user_task(user.pk, alert_group.pk)
+
+    # next notification steps use the cached chain and don't query notification policies
+    UserHasNotification.objects.update(active_notification_policy_id=None)
+    with CaptureQueriesContext(connection) as queries:
+        notify_user_task(user.pk, alert_group.pk, previous_notification_policy_pk=notification_policies[0].pk)
+    assert not any('"base_usernotificationpolicy"' in query["sql"] for query in queries.captured_queries)
+
+    log_records = UserNotificationPolicyLogRecord.objects.filter(
+        type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_TRIGGERED
+    ).order_by("pk")
+    assert [log_record.notification_policy_id for log_record in log_records] == [
+        notification_policy.pk for notification_policy in notification_policies
+    ]
+
+    UserHasNotification.objects.update(active_notification_policy_id=None)
+    notify_user_task(user.pk, alert_group.pk, previous_notification_policy_pk=notification_policies[1].pk)
+
+    finished_log_record = UserNotificationPolicyLogRecord.objects.last()
+    assert finished_log_record.type == UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_FINISHED
@@ -6,6 +6,7 @@ from django.utils import timezone
 from apps.alerts.models import AlertGroup, AlertGroupLogRecord, UserHasNotification
 from apps.alerts.paging import PagingError, check_user_availability, direct_paging, unpage_user
 from apps.base.models import UserNotificationPolicy
+from apps.schedules.ical_utils import users_in_ical
 from apps.schedules.models import CustomOnCallShift, OnCallScheduleWeb
 
 
@@ -190,6 +191,34 @@ def test_direct_paging_schedule(
         )
 
 
+@pytest.mark.django_db
+def test_direct_paging_multiple_schedules_set_based(
+    make_organization, make_team, make_user_for_organization, make_schedule, make_on_call_shift
+):
+    organization = make_organization()
+    some_team = make_team(organization)
+    from_user = make_user_for_organization(organization)
+    users = [make_user_for_organization(organization) for _ in range(3)]
+    schedules = [
+        setup_always_on_call_schedule(make_schedule, make_on_call_shift, organization, some_team, u) for u in users
+    ]
+
+    with patch("apps.alerts.paging.notify_user_task") as notify_task:
+        with patch("apps.alerts.paging.send_update_log_report_signal") as mock_log_report:
+            with patch("apps.schedules.ical_utils.users_in_ical", wraps=users_in_ical) as spy_users_in_ical:
+                direct_paging(organization, None, from_user, schedules=[(s, False) for s in schedules])
+
+    ag = AlertGroup.objects.get()
+    # on call users resolved with a single query for all the schedules
+    all_emails = {u.email for u in users}
+    assert len([c for c in spy_users_in_ical.call_args_list if set(c.args[0]) == all_emails]) == 1
+    # log records created in bulk, log report updated once
+    assert ag.log_records.filter(type=AlertGroupLogRecord.TYPE_DIRECT_PAGING).count() == 6
+    mock_log_report.apply_async.assert_called_once_with(kwargs={"alert_group_pk": ag.pk}, countdown=8)
+    # each user is notified by an independent task
+    assert sorted(c.args[0][0] for c in notify_task.apply_async.call_args_list) == sorted(u.pk for u in users)
+
+
 @pytest.mark.django_db
 def test_direct_paging_reusing_alert_group(
     make_organization, make_user_for_organization, make_alert_receive_channel, make_alert_group
@@ -1,7 +1,16 @@
+import contextlib
+from unittest.mock import patch
+
 import pytest
 
 from apps.alerts.models import AlertGroupLogRecord, AlertReceiveChannel
-from apps.slack.representatives.alert_group_representative import AlertGroupSlackRepresentative
+from apps.slack.representatives.alert_group_representative import (
+    ALERT_GROUP_ACTIONS_BATCH_WINDOW_SECONDS,
+    AlertGroupSlackRepresentative,
+    alert_group_actions_queue,
+    on_alert_group_actions_triggered_async,
+)
+from common.cache_queue import CacheBatch
 
 
 @pytest.mark.django_db
@@ -43,3 +52,107 @@ def test_handler_escalation_triggered(
     representative = AlertGroupSlackRepresentative(escalation_log_record)
     handler = representative.get_handler()
     assert handler.__name__ == "on_handler_not_found"
+
+
+@patch("apps.slack.representatives.alert_group_representative.on_alert_group_action_triggered_async")
+@patch("apps.slack.representatives.alert_group_representative.on_alert_group_actions_triggered_async")
+@pytest.mark.django_db
+def test_slack_representative_coalesces_actions(
+    mocked_batch_task,
+    mocked_task,
+    make_organization_and_user,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert_group_log_record,
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(alert_receive_channel)
+
+    log_record_types = [
+        AlertGroupLogRecord.TYPE_RESOLVED,
+        AlertGroupLogRecord.TYPE_UN_RESOLVED,
+        AlertGroupLogRecord.TYPE_INVITE,
+        AlertGroupLogRecord.TYPE_RESOLVED,
+        AlertGroupLogRecord.TYPE_ACK_REMINDER_TRIGGERED,
+    ]
+    log_records = [make_alert_group_log_record(alert_group, type=t, author=user) for t in log_record_types]
+
+    for log_record in log_records:
+        AlertGroupSlackRepresentative.on_alert_group_action_triggered(log_record=log_record.pk)
+
+    # actions are queued and processed by a single task
+    mocked_batch_task.apply_async.assert_called_once_with(
+        (alert_group.pk,), countdown=ALERT_GROUP_ACTIONS_BATCH_WINDOW_SECONDS
+    )
+    mocked_task.apply_async.assert_not_called()
+
+    processed_log_record_pks = []
+    with patch(
+        "apps.slack.representatives.alert_group_representative._process_alert_group_action",
+        side_effect=lambda log_record: processed_log_record_pks.append(log_record.pk),
+    ):
+        on_alert_group_actions_triggered_async(alert_group.pk)
+
+    # only the latest message update is processed, other actions are processed in order
+    assert processed_log_record_pks == [log_records[2].pk, log_records[3].pk, log_records[4].pk]
+
+
+@patch("apps.slack.representatives.alert_group_representative.on_alert_group_action_triggered_async")
+@pytest.mark.django_db
+def test_slack_representative_coalesced_actions_retry_failed(
+    mocked_task,
+    make_organization_and_user,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert_group_log_record,
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(alert_receive_channel)
+    log_records = [
+        make_alert_group_log_record(alert_group, type=AlertGroupLogRecord.TYPE_INVITE, author=user) for _ in range(2)
+    ]
+
+    for log_record in log_records:
+        AlertGroupSlackRepresentative.on_alert_group_action_triggered(log_record=log_record)
+
+    with patch(
+        "apps.slack.representatives.alert_group_representative._process_alert_group_action",
+        side_effect=[Exception("error"), None],
+    ) as mocked_process:
+        on_alert_group_actions_triggered_async(alert_group.pk)
+
+    assert mocked_process.call_count == 2
+    # failed log record is retried by a separate task
+    mocked_task.apply_async.assert_called_once_with(
+        (log_records[0].pk,), countdown=ALERT_GROUP_ACTIONS_BATCH_WINDOW_SECONDS
+    )
+
+
+@patch("apps.slack.representatives.alert_group_representative._process_alert_group_action")
+@pytest.mark.django_db
+def test_slack_representative_coalesced_actions_pending(
+    mocked_process,
+    make_organization_and_user,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert_group_log_record,
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(alert_receive_channel)
+    log_record = make_alert_group_log_record(alert_group, type=AlertGroupLogRecord.TYPE_INVITE, author=user)
+
+    @contextlib.contextmanager
+    def _pop(key):
+        yield CacheBatch([log_record.pk], pending=True)
+
+    with patch.object(alert_group_actions_queue, "pop", side_effect=_pop), patch.object(
+        on_alert_group_actions_triggered_async, "apply_async"
+    ) as mocked_batch_task:
+        on_alert_group_actions_triggered_async(alert_group.pk)
+
+    # popped actions are processed, the rest is processed by the next task
+    mocked_process.assert_called_once()
+    mocked_batch_task.assert_called_once_with((alert_group.pk,), countdown=ALERT_GROUP_ACTIONS_BATCH_WINDOW_SECONDS)
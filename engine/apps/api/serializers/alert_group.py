@@ -8,9 +8,11 @@ from rest_framework import serializers
 
 from apps.alerts.incident_appearance.renderers.classic_markdown_renderer import AlertGroupClassicMarkdownRenderer
 from apps.alerts.incident_appearance.renderers.web_renderer import AlertGroupWebRenderer
-from apps.alerts.models import AlertGroup
+from apps.alerts.models import AlertGroup, ArchivedAlertGroup
+from apps.user_management.models import User
 from common.api_helpers.custom_fields import TeamPrimaryKeyRelatedField
 from common.api_helpers.mixins import EagerLoadingMixin
+from common.constants.alert_group_restrictions import IS_RESTRICTED_TITLE
 
 from .alert import AlertSerializer
 from .alert_receive_channel import FastAlertReceiveChannelSerializer
@@ -247,3 +249,77 @@ class AlertGroupSerializer(AlertGroupListSerializer):
         paged_users = obj.get_paged_users()
         serializer = UserShortSerializer(paged_users, many=True)
         return serializer.data
+
+
+class ArchivedAlertGroupSerializer(serializers.ModelSerializer):
+    """
+    Read-only representation of an archived alert group (see ArchivedAlertGroup),
+    with the fields of AlertGroupSerializer that can be read from the archive.
+    """
+
+    pk = serializers.CharField(read_only=True, source="public_primary_key")
+    archived = serializers.SerializerMethodField()
+    alerts_count = serializers.SerializerMethodField()
+    inside_organization_number = serializers.IntegerField(source="get_alert_group.inside_organization_number")
+    alert_receive_channel = FastAlertReceiveChannelSerializer(source="get_alert_group.channel")
+    resolved_by = serializers.IntegerField(source="get_alert_group.resolved_by")
+    resolved_by_user = serializers.SerializerMethodField()
+    acknowledged_at = serializers.DateTimeField(source="get_alert_group.acknowledged_at")
+    status = serializers.IntegerField(source="get_alert_group.status")
+    is_restricted = serializers.BooleanField(source="get_alert_group.is_restricted")
+    title = serializers.SerializerMethodField()
+    alerts = serializers.SerializerMethodField()
+    permalinks = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ArchivedAlertGroup
+        fields = [
+            "pk",
+            "archived",
+            "archived_at",
+            "alerts_count",
+            "inside_organization_number",
+            "alert_receive_channel",
+            "resolved_by",
+            "resolved_by_user",
+            "resolved_at",
+            "acknowledged_at",
+            "started_at",
+            "status",
+            "is_restricted",
+            "title",
+            "alerts",
+            "permalinks",
+        ]
+        read_only_fields = fields
+
+    def get_archived(self, obj) -> bool:
+        return True
+
+    def get_alerts_count(self, obj) -> int:
+        return obj.get_alerts_count()
+
+    @extend_schema_field(FastUserSerializer(allow_null=True))
+    def get_resolved_by_user(self, obj):
+        user = User.objects.filter(pk=obj.get_alert_group().resolved_by_user_id).first()
+        return FastUserSerializer(user).data if user else None
+
+    def get_title(self, obj) -> str | None:
+        alert_group = obj.get_alert_group()
+        return IS_RESTRICTED_TITLE if alert_group.is_restricted else alert_group.web_title_cache
+
+    def get_alerts(self, obj):
+        # same limit as AlertGroupSerializer.get_limited_alerts
+        alerts = obj.get_latest_alerts(100)
+        is_restricted = obj.get_alert_group().is_restricted
+        return [
+            {
+                "id": alert.public_primary_key,
+                "created_at": alert.created_at,
+                "raw_request_data": {} if is_restricted else alert.raw_request_data,
+            }
+            for alert in alerts
+        ]
+
+    def get_permalinks(self, obj):
+        return obj.get_permalinks()
@@ -9,6 +9,8 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.test import APIClient
 
+from apps.alerts.alert_group_archive import archive_alert_group_batch
+from apps.alerts.alert_group_stats import get_alert_group_counters
 from apps.alerts.constants import ActionSource
 from apps.alerts.models import AlertGroup, AlertGroupLogRecord, ResolutionNote
 from apps.alerts.tasks import wipe
@@ -646,6 +648,7 @@ def test_get_filter_mine(
         acknowledged=True,
         acknowledged_by_user=first_user,
     )
+    acknowledged_alert_group.log_records.create(type=AlertGroupLogRecord.TYPE_ACK, author=first_user)
     make_alert(alert_group=acknowledged_alert_group, raw_request_data=alert_raw_request_data)
 
     # other alert group
@@ -700,6 +703,7 @@ def test_get_filter_involved_users(
         acknowledged=True,
         acknowledged_by_user=first_user,
     )
+    acknowledged_alert_group.log_records.create(type=AlertGroupLogRecord.TYPE_ACK, author=first_user)
     make_alert(alert_group=acknowledged_alert_group, raw_request_data=alert_raw_request_data)
 
     # other alert group
@@ -1192,6 +1196,93 @@ def test_alert_group_stats_permissions(
     assert response.status_code == expected_status
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "query_params,from_counters",
+    [
+        ("", True),
+        (f"?status={AlertGroup.NEW}&status={AlertGroup.ACKNOWLEDGED}", True),
+        (f"?status={AlertGroup.RESOLVED}&is_root=true", True),
+        ("?team=null&mine=false", True),
+        ("?team={team}", True),
+        ("?integration={integration}&status=0", True),
+        ("?started_at=1970-01-01T00:00:00/2099-01-01T23:59:59&status=0", False),
+        ("?search=test", False),
+    ],
+)
+def test_alert_group_stats(
+    alert_group_internal_api_setup,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_team,
+    make_user_auth_headers,
+    query_params,
+    from_counters,
+):
+    user, token, alert_groups = alert_group_internal_api_setup
+    team = make_team(user.organization)
+    user.teams.add(team)
+    alert_receive_channel = make_alert_receive_channel(user.organization, team=team)
+    make_alert_group(alert_receive_channel)
+    make_alert_group(alert_receive_channel, root_alert_group=alert_groups[2])
+    make_alert_group(alert_receive_channel, acknowledged=True)
+    query_params = query_params.format(
+        team=team.public_primary_key, integration=alert_groups[0].channel.public_primary_key
+    )
+
+    client = APIClient()
+    list_response = client.get(
+        reverse("api-internal:alertgroup-list") + query_params, **make_user_auth_headers(user, token)
+    )
+    expected_count = len(list_response.json()["results"])
+
+    with patch(
+        "apps.api.views.alert_group.get_alert_group_counters", wraps=get_alert_group_counters
+    ) as mock_get_counters:
+        response = client.get(
+            reverse("api-internal:alertgroup-stats") + query_params, **make_user_auth_headers(user, token)
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"count": str(expected_count), "is_exact": True}
+    assert mock_get_counters.called == from_counters
+
+
+@pytest.mark.django_db
+def test_alert_group_stats_counters_invalidated(
+    alert_group_internal_api_setup, make_user_auth_headers, django_capture_on_commit_callbacks
+):
+    user, token, alert_groups = alert_group_internal_api_setup
+    _, _, new_alert_group, _ = alert_groups
+
+    client = APIClient()
+    url = reverse("api-internal:alertgroup-stats") + f"?status={AlertGroup.NEW}"
+    response = client.get(url, **make_user_auth_headers(user, token))
+    assert response.json()["count"] == "1"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        new_alert_group.acknowledge_by_user(user)
+
+    response = client.get(url, **make_user_auth_headers(user, token))
+    assert response.json()["count"] == "0"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query_params", ["", "?search=test"])
+def test_alert_group_stats_capped(alert_group_internal_api_setup, make_user_auth_headers, query_params):
+    user, token, _ = alert_group_internal_api_setup
+
+    client = APIClient()
+    with patch("apps.api.views.alert_group.ALERT_GROUPS_MAX_COUNT", 3):
+        with patch("apps.alerts.alert_group_stats.ALERT_GROUPS_MAX_COUNT", 3):
+            response = client.get(
+                reverse("api-internal:alertgroup-stats") + query_params, **make_user_auth_headers(user, token)
+            )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"count": "3+", "is_exact": False}
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "role,expected_status",
@@ -1295,6 +1386,49 @@ def test_alert_group_detail_permissions(
     assert response.status_code == expected_status
 
 
+@pytest.mark.django_db
+def test_get_archived_alert_group(
+    make_organization_and_user_with_plugin_token,
+    make_user_for_organization,
+    make_team,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+    make_user_auth_headers,
+):
+    organization, user, token = make_organization_and_user_with_plugin_token()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(alert_receive_channel, web_title_cache="title")
+    alert = make_alert(alert_group=alert_group, raw_request_data={"test": 1})
+    alert_group.resolve(resolved_by=AlertGroup.USER, resolved_by_user=user)
+    archive_alert_group_batch([alert_group.pk])
+
+    client = APIClient()
+    url = reverse("api-internal:alertgroup-detail", kwargs={"pk": alert_group.public_primary_key})
+    response = client.get(url, format="json", **make_user_auth_headers(user, token))
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["pk"] == alert_group.public_primary_key
+    assert data["archived"] is True
+    assert data["status"] == AlertGroup.RESOLVED
+    assert data["title"] == "title"
+    assert data["alert_receive_channel"]["id"] == alert_receive_channel.public_primary_key
+    assert data["resolved_by_user"]["pk"] == user.public_primary_key
+    assert data["alerts_count"] == 1
+    assert data["alerts"][0]["id"] == alert.public_primary_key
+    assert data["alerts"][0]["raw_request_data"] == {"test": 1}
+    assert data["permalinks"]["web"] == alert_group.web_link
+
+    # archived alert groups of integrations not available to the user are not returned
+    team = make_team(organization)
+    alert_receive_channel.team = team
+    alert_receive_channel.save(update_fields=["team"])
+    editor = make_user_for_organization(organization, role=LegacyAccessControlRole.EDITOR)
+    response = client.get(url, format="json", **make_user_auth_headers(editor, token))
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.django_db
 def test_silence(alert_group_internal_api_setup, make_user_auth_headers):
     client = APIClient()
@@ -1392,14 +1526,12 @@ def test_invalid_bulk_action(
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-@patch("apps.alerts.tasks.send_alert_group_signal.send_alert_group_signal.delay", return_value=None)
-@patch("apps.alerts.tasks.send_update_log_report_signal.send_update_log_report_signal.apply_async", return_value=None)
+@patch("apps.alerts.tasks.send_alert_group_signal.send_alert_group_signal_for_bulk_action.delay", return_value=None)
 @patch("apps.alerts.models.AlertGroup.start_escalation_if_needed", return_value=None)
 @pytest.mark.django_db
 def test_bulk_action_restart(
-    mocked_alert_group_signal_task,
-    mocked_log_report_signal_task,
     mocked_start_escalate_alert,
+    mocked_alert_group_signal_task,
     make_user_auth_headers,
     alert_group_internal_api_setup,
     django_capture_on_commit_callbacks,
@@ -1438,7 +1570,8 @@ def test_bulk_action_restart(
         )
 
     assert response.status_code == status.HTTP_200_OK
-    assert len(callbacks) == 3
+    # signal task and alert group counters invalidation
+    assert len(callbacks) == 6
 
     assert resolved_alert_group.log_records.filter(
         type=AlertGroupLogRecord.TYPE_UN_RESOLVED,
@@ -1455,17 +1588,15 @@ def test_bulk_action_restart(
         author=user,
     ).exists()
 
-    assert mocked_alert_group_signal_task.called
-    assert mocked_log_report_signal_task.called
+    # one signal task per bulk restart step
+    assert mocked_alert_group_signal_task.call_count == 3
     assert mocked_start_escalate_alert.called
 
 
-@patch("apps.alerts.tasks.send_alert_group_signal.send_alert_group_signal.delay", return_value=None)
-@patch("apps.alerts.tasks.send_update_log_report_signal.send_update_log_report_signal.apply_async", return_value=None)
+@patch("apps.alerts.tasks.send_alert_group_signal.send_alert_group_signal_for_bulk_action.delay", return_value=None)
 @pytest.mark.django_db
 def test_bulk_action_acknowledge(
     mocked_alert_group_signal_task,
-    mocked_log_report_signal_task,
     make_user_auth_headers,
     alert_group_internal_api_setup,
     django_capture_on_commit_callbacks,
@@ -1494,7 +1625,8 @@ def test_bulk_action_acknowledge(
         )
 
     assert response.status_code == status.HTTP_200_OK
-    assert len(callbacks) == 3
+    # signal task and alert group counters invalidation
+    assert len(callbacks) == 2
 
     assert new_alert_group.log_records.filter(
         type=AlertGroupLogRecord.TYPE_ACK,
@@ -1516,16 +1648,17 @@ def test_bulk_action_acknowledge(
         author=user,
     ).exists()
 
-    assert mocked_alert_group_signal_task.called
-    assert mocked_log_report_signal_task.called
+    # signal is sent for all the alert groups by a single task
+    log_records = AlertGroupLogRecord.objects.filter(type=AlertGroupLogRecord.TYPE_ACK, author=user).order_by("pk")
+    mocked_alert_group_signal_task.assert_called_once_with(
+        [log_record.pk for log_record in log_records], [log_record.alert_group_id for log_record in log_records]
+    )
 
 
-@patch("apps.alerts.tasks.send_alert_group_signal.send_alert_group_signal.delay", return_value=None)
-@patch("apps.alerts.tasks.send_update_log_report_signal.send_update_log_report_signal.apply_async", return_value=None)
+@patch("apps.alerts.tasks.send_alert_group_signal.send_alert_group_signal_for_bulk_action.delay", return_value=None)
 @pytest.mark.django_db
 def test_bulk_action_resolve(
     mocked_alert_group_signal_task,
-    mocked_log_report_signal_task,
     make_user_auth_headers,
     alert_group_internal_api_setup,
     django_capture_on_commit_callbacks,
@@ -1554,7 +1687,8 @@ def test_bulk_action_resolve(
         )
 
     assert response.status_code == status.HTTP_200_OK
-    assert len(callbacks) == 3
+    # signal task and alert group counters invalidation
+    assert len(callbacks) == 2
 
     assert new_alert_group.log_records.filter(
         type=AlertGroupLogRecord.TYPE_RESOLVED,
@@ -1571,18 +1705,19 @@ def test_bulk_action_resolve(
         author=user,
     ).exists()
 
-    assert mocked_alert_group_signal_task.called
-    assert mocked_log_report_signal_task.called
+    # signal is sent for all the alert groups by a single task
+    log_records = AlertGroupLogRecord.objects.filter(type=AlertGroupLogRecord.TYPE_RESOLVED, author=user).order_by("pk")
+    mocked_alert_group_signal_task.assert_called_once_with(
+        [log_record.pk for log_record in log_records], [log_record.alert_group_id for log_record in log_records]
+    )
 
 
-@patch("apps.alerts.tasks.send_alert_group_signal.send_alert_group_signal.delay", return_value=None)
-@patch("apps.alerts.tasks.send_update_log_report_signal.send_update_log_report_signal.apply_async", return_value=None)
+@patch("apps.alerts.tasks.send_alert_group_signal.send_alert_group_signal_for_bulk_action.delay", return_value=None)
 @patch("apps.alerts.models.AlertGroup.start_unsilence_task", return_value=None)
 @pytest.mark.django_db
 def test_bulk_action_silence(
-    mocked_alert_group_signal_task,
-    mocked_log_report_signal_task,
     mocked_start_unsilence_task,
+    mocked_alert_group_signal_task,
     make_user_auth_headers,
     alert_group_internal_api_setup,
     django_capture_on_commit_callbacks,
@@ -1612,7 +1747,8 @@ def test_bulk_action_silence(
         )
 
     assert response.status_code == status.HTTP_200_OK
-    assert len(callbacks) == 4
+    # signal task and alert group counters invalidation
+    assert len(callbacks) == 2
 
     assert new_alert_group.log_records.filter(
         type=AlertGroupLogRecord.TYPE_SILENCE,
@@ -1652,8 +1788,11 @@ def test_bulk_action_silence(
         author=user,
     ).exists()
 
-    assert mocked_alert_group_signal_task.called
-    assert mocked_log_report_signal_task.called
+    # signal is sent for all the alert groups by a single task
+    log_records = AlertGroupLogRecord.objects.filter(type=AlertGroupLogRecord.TYPE_SILENCE, author=user).order_by("pk")
+    mocked_alert_group_signal_task.assert_called_once_with(
+        [log_record.pk for log_record in log_records], [log_record.alert_group_id for log_record in log_records]
+    )
     assert mocked_start_unsilence_task.called
 
 
@@ -332,6 +332,60 @@ def test_move_to_position_cant_move_default(
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
+@pytest.mark.django_db
+def test_reorder(
+    make_organization_and_user_with_plugin_token,
+    make_alert_receive_channel,
+    make_channel_filter,
+    make_user_auth_headers,
+):
+    organization, user, token = make_organization_and_user_with_plugin_token()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    # create default channel filter
+    make_channel_filter(alert_receive_channel, is_default=True, order=0)
+    first_channel_filter = make_channel_filter(alert_receive_channel, filtering_term="a", is_default=False, order=1)
+    second_channel_filter = make_channel_filter(alert_receive_channel, filtering_term="b", is_default=False, order=2)
+    third_channel_filter = make_channel_filter(alert_receive_channel, filtering_term="c", is_default=False, order=3)
+
+    client = APIClient()
+    url = reverse("api-internal:channel_filter-reorder")
+    data = {
+        "order": [
+            third_channel_filter.public_primary_key,
+            first_channel_filter.public_primary_key,
+            second_channel_filter.public_primary_key,
+        ]
+    }
+    response = client.put(url, data, format="json", **make_user_auth_headers(user, token))
+
+    assert response.status_code == status.HTTP_200_OK
+    first_channel_filter.refresh_from_db()
+    second_channel_filter.refresh_from_db()
+    third_channel_filter.refresh_from_db()
+    assert (first_channel_filter.order, second_channel_filter.order, third_channel_filter.order) == (2, 3, 1)
+
+
+@pytest.mark.django_db
+def test_reorder_cant_move_default(
+    make_organization_and_user_with_plugin_token,
+    make_alert_receive_channel,
+    make_channel_filter,
+    make_user_auth_headers,
+):
+    organization, user, token = make_organization_and_user_with_plugin_token()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    # create default channel filter
+    default_channel_filter = make_channel_filter(alert_receive_channel, is_default=True, order=0)
+    channel_filter = make_channel_filter(alert_receive_channel, filtering_term="b", is_default=False, order=1)
+
+    client = APIClient()
+    url = reverse("api-internal:channel_filter-reorder")
+    data = {"order": [channel_filter.public_primary_key, default_channel_filter.public_primary_key]}
+    response = client.put(url, data, format="json", **make_user_auth_headers(user, token))
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.django_db
 def test_channel_filter_update(
     make_organization_and_user_with_plugin_token,
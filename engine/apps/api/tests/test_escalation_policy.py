@@ -134,6 +134,56 @@ def test_move_to_position_invalid_index(escalation_policy_internal_api_setup, ma
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
+@pytest.mark.django_db
+def test_reorder(escalation_policy_internal_api_setup, make_escalation_policy, make_user_auth_headers):
+    token, escalation_chain, first_policy, user, _ = escalation_policy_internal_api_setup
+    second_policy = make_escalation_policy(escalation_chain, escalation_policy_step=EscalationPolicy.STEP_FINAL_RESOLVE)
+    third_policy = make_escalation_policy(
+        escalation_chain, escalation_policy_step=EscalationPolicy.STEP_FINAL_NOTIFYALL
+    )
+    client = APIClient()
+
+    url = reverse("api-internal:escalation_policy-reorder")
+    data = {
+        "order": [
+            third_policy.public_primary_key,
+            first_policy.public_primary_key,
+            second_policy.public_primary_key,
+        ]
+    }
+    response = client.put(url, data, format="json", **make_user_auth_headers(user, token))
+    assert response.status_code == status.HTTP_200_OK
+
+    assert list(escalation_chain.escalation_policies.order_by("order")) == [third_policy, first_policy, second_policy]
+
+
+@pytest.mark.django_db
+def test_reorder_invalid_order(
+    escalation_policy_internal_api_setup, make_escalation_chain, make_escalation_policy, make_user_auth_headers
+):
+    token, escalation_chain, escalation_policy, user, _ = escalation_policy_internal_api_setup
+    other_escalation_chain = make_escalation_chain(user.organization)
+    other_escalation_policy = make_escalation_policy(
+        other_escalation_chain, escalation_policy_step=EscalationPolicy.STEP_FINAL_RESOLVE
+    )
+    client = APIClient()
+    url = reverse("api-internal:escalation_policy-reorder")
+
+    for order in (
+        [],  # empty
+        [escalation_policy.public_primary_key, escalation_policy.public_primary_key],  # duplicates
+        [escalation_policy.public_primary_key, "NONEXISTENT"],  # unknown pk
+        [escalation_policy.public_primary_key, other_escalation_policy.public_primary_key],  # different chains
+    ):
+        response = client.put(url, {"order": order}, format="json", **make_user_auth_headers(user, token))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    escalation_policy.refresh_from_db()
+    other_escalation_policy.refresh_from_db()
+    assert escalation_policy.order == 0
+    assert other_escalation_policy.order == 0
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "role,expected_status",
@@ -146,6 +146,38 @@ def test_move_to_position_position_error(user_notification_policy_internal_api_s
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
+@pytest.mark.django_db
+def test_reorder(user_notification_policy_internal_api_setup, make_user_auth_headers):
+    token, steps, users = user_notification_policy_internal_api_setup
+    admin, _ = users
+    wait_notification_step, notify_notification_step, _, _ = steps
+    client = APIClient()
+    url = reverse("api-internal:notification_policy-reorder")
+
+    data = {"order": [notify_notification_step.public_primary_key, wait_notification_step.public_primary_key]}
+    response = client.put(url, data, format="json", **make_user_auth_headers(admin, token))
+    assert response.status_code == status.HTTP_200_OK
+
+    wait_notification_step.refresh_from_db()
+    notify_notification_step.refresh_from_db()
+    assert (notify_notification_step.order, wait_notification_step.order) == (0, 1)
+
+
+@pytest.mark.django_db
+def test_reorder_other_user_forbidden(user_notification_policy_internal_api_setup, make_user_auth_headers):
+    token, steps, users = user_notification_policy_internal_api_setup
+    admin, user = users
+    wait_notification_step, notify_notification_step, _, _ = steps
+    client = APIClient()
+    url = reverse("api-internal:notification_policy-reorder")
+
+    data = {"order": [notify_notification_step.public_primary_key, wait_notification_step.public_primary_key]}
+    response = client.put(
+        f"{url}?user={admin.public_primary_key}", data, format="json", **make_user_auth_headers(user, token)
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
 @pytest.mark.django_db
 def test_update_step(user_notification_policy_internal_api_setup, make_user_auth_headers):
     token, steps, users = user_notification_policy_internal_api_setup
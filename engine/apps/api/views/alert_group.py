@@ -1,3 +1,4 @@
+import typing
 from datetime import timedelta
 
 from django.core.exceptions import ObjectDoesNotExist
@@ -13,16 +14,33 @@ from rest_framework.filters import SearchFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from apps.alerts.alert_group_stats import (
+    ALERT_GROUPS_MAX_COUNT,
+    count_alert_groups_from_counters,
+    get_alert_group_counters,
+    get_bounded_alert_groups_count,
+)
 from apps.alerts.constants import ActionSource
-from apps.alerts.models import Alert, AlertGroup, AlertReceiveChannel, EscalationChain, ResolutionNote
+from apps.alerts.models import (
+    Alert,
+    AlertGroup,
+    AlertGroupInvolvedUser,
+    AlertReceiveChannel,
+    ArchivedAlertGroup,
+    EscalationChain,
+    ResolutionNote,
+)
 from apps.alerts.paging import unpage_user
 from apps.alerts.tasks import send_update_resolution_note_signal
 from apps.api.errors import AlertGroupAPIError
 from apps.api.permissions import RBACPermission
-from apps.api.serializers.alert_group import AlertGroupListSerializer, AlertGroupSerializer
+from apps.api.serializers.alert_group import (
+    AlertGroupListSerializer,
+    AlertGroupSerializer,
+    ArchivedAlertGroupSerializer,
+)
 from apps.api.serializers.team import TeamSerializer
 from apps.auth_token.auth import PluginAuthentication
-from apps.base.models.user_notification_policy_log_record import UserNotificationPolicyLogRecord
 from apps.mobile_app.auth import MobileAppAuthTokenAuthentication
 from apps.user_management.models import Team, User
 from common.api_helpers.exceptions import BadRequest
@@ -87,8 +105,6 @@ class AlertGroupFilter(DateRangeFilterMixin, ByTeamModelFieldFilterMixin, ModelF
     Examples of possible date formats here https://docs.djangoproject.com/en/1.9/ref/settings/#datetime-input-formats
     """
 
-    FILTER_BY_INVOLVED_USERS_ALERT_GROUPS_CUTOFF = 1000
-
     started_at_gte = filters.DateTimeFilter(field_name="started_at", lookup_expr="gte")
     started_at_lte = filters.DateTimeFilter(field_name="started_at", lookup_expr="lte")
     resolved_at_lte = filters.DateTimeFilter(field_name="resolved_at", lookup_expr="lte")
@@ -196,24 +212,10 @@ class AlertGroupFilter(DateRangeFilterMixin, ByTeamModelFieldFilterMixin, ModelF
         if not users:
             return queryset
 
-        # This is expensive to filter all alert groups with involved users,
-        # so we limit the number of alert groups to filter by the last 1000 for the given user(s)
-        alert_group_notified_users_ids = list(
-            UserNotificationPolicyLogRecord.objects.filter(author__in=users)
-            .order_by("-alert_group_id")
-            .values_list("alert_group_id", flat=True)
-            .distinct()[: self.FILTER_BY_INVOLVED_USERS_ALERT_GROUPS_CUTOFF]
-        )
-
+        # users that were notified or acknowledged/resolved/silenced the alert group, see AlertGroupInvolvedUser
         queryset = queryset.filter(
-            # user was notified
-            Q(id__in=alert_group_notified_users_ids)
-            |
-            # or interacted with the alert group
-            Q(acknowledged_by_user__in=users)
-            | Q(resolved_by_user__in=users)
-            | Q(silenced_by_user__in=users)
-        ).distinct()
+            id__in=AlertGroupInvolvedUser.objects.filter(user__in=users).values("alert_group_id")
+        )
         return queryset
 
     def filter_mine(self, queryset, name, value):
@@ -315,21 +317,27 @@ class AlertGroupView(
 
     filterset_class = AlertGroupFilter
 
+    # filters supported by alert group counters in stats, see apps.alerts.alert_group_stats
+    STATS_COUNTERS_FILTERS = {"status", "integration", "team", "is_root", "mine"}
+
     def get_serializer_class(self):
         if self.action == "list":
             return AlertGroupListSerializer
 
         return super().get_serializer_class()
 
-    def get_queryset(self, ignore_filtering_by_available_teams=False):
-        # no select_related or prefetch_related is used at this point, it will be done on paginate_queryset.
-
+    def _get_alert_receive_channels_queryset(self, ignore_filtering_by_available_teams=False):
         alert_receive_channels_qs = AlertReceiveChannel.objects.filter(
             organization_id=self.request.auth.organization.id
         )
         if not ignore_filtering_by_available_teams:
             alert_receive_channels_qs = alert_receive_channels_qs.filter(*self.available_teams_lookup_args)
+        return alert_receive_channels_qs
+
+    def get_queryset(self, ignore_filtering_by_available_teams=False):
+        # no select_related or prefetch_related is used at this point, it will be done on paginate_queryset.
 
+        alert_receive_channels_qs = self._get_alert_receive_channels_queryset(ignore_filtering_by_available_teams)
         alert_receive_channels_ids = list(alert_receive_channels_qs.values_list("id", flat=True))
 
         queryset = AlertGroup.objects.filter(
@@ -411,8 +419,25 @@ class AlertGroupView(
         - 0: slack
         - 1: web
 
+        Alert groups archived by `archive_alert_groups` are returned in a reduced form, with `archived` set to true
+        (see ArchivedAlertGroupSerializer).
         """
-        return super().retrieve(request, pk, *args, **kwargs)
+        try:
+            return super().retrieve(request, pk, *args, **kwargs)
+        except NotFound:
+            archived_alert_group = self._get_archived_alert_group(pk)
+            return Response(ArchivedAlertGroupSerializer(archived_alert_group).data)
+
+    def _get_archived_alert_group(self, pk: str) -> ArchivedAlertGroup:
+        alert_receive_channels_qs = self._get_alert_receive_channels_queryset()
+        try:
+            return ArchivedAlertGroup.objects.get(
+                organization=self.request.auth.organization,
+                public_primary_key=pk,
+                channel_id__in=alert_receive_channels_qs.values("pk"),
+            )
+        except ArchivedAlertGroup.DoesNotExist:
+            raise NotFound
 
     def enrich(self, alert_groups):
         """
@@ -456,19 +481,75 @@ class AlertGroupView(
 
         return alert_groups
 
-    @extend_schema(responses=inline_serializer(name="AlertGroupStats", fields={"count": serializers.IntegerField()}))
+    @extend_schema(
+        responses=inline_serializer(
+            name="AlertGroupStats",
+            fields={"count": serializers.IntegerField(), "is_exact": serializers.BooleanField()},
+        )
+    )
     @action(detail=False)
     def stats(self, *args, **kwargs):
-        """Return number of alert groups capped at 100001"""
-        MAX_COUNT = 100001
-        alert_groups = self.filter_queryset(self.get_queryset())[:MAX_COUNT]
-        count = alert_groups.count()
-        count = f"{MAX_COUNT-1}+" if count == MAX_COUNT else str(count)
+        """
+        Return number of alert groups capped at 100000.
+        `is_exact` is false when the number of alert groups is over the cap.
+        """
+        queryset = self.get_queryset()
+        count, is_exact = self._get_stats_count_from_counters(queryset)
+        if count is None:
+            filters = {
+                "organization_id": self.request.auth.organization.id,
+                "user_id": self.request.user.pk,
+                "params": sorted(self.request.query_params.lists()),
+            }
+            count, is_exact = get_bounded_alert_groups_count(self.filter_queryset(queryset), filters)
+
         return Response(
             {
-                "count": count,
+                "count": str(count) if is_exact else f"{count}+",
+                "is_exact": is_exact,
+            }
+        )
+
+    def _get_stats_count_from_counters(self, queryset) -> typing.Tuple[typing.Optional[int], bool]:
+        """
+        Count alert groups using alert group counters if only filters supported by the counters are used.
+        Returns (None, False) if the count can't be served by the counters.
+        """
+        params = {name for name, values in self.request.query_params.lists() if any(values)}
+        if not params.issubset(self.STATS_COUNTERS_FILTERS):
+            return None, False
+
+        filterset = AlertGroupFilterBackend().get_filterset(self.request, queryset, self)
+        if not filterset.is_valid():
+            # let filter_queryset raise validation errors
+            return None, False
+
+        filters = filterset.form.cleaned_data
+        if filters["mine"]:
+            return None, False
+
+        alert_receive_channels = dict(self._get_alert_receive_channels_queryset().values_list("id", "team_id"))
+        channel_ids = set(alert_receive_channels)
+        if filters["integration"]:
+            channel_ids &= {integration.pk for integration in filters["integration"]}
+        if filters["team"]:
+            team_ids = {team.pk for team in filters["team"] if isinstance(team, Team)}
+            include_no_team = any(not isinstance(team, Team) for team in filters["team"])
+            channel_ids = {
+                channel_id
+                for channel_id in channel_ids
+                if alert_receive_channels[channel_id] in team_ids
+                or (include_no_team and alert_receive_channels[channel_id] is None)
             }
+
+        counters = get_alert_group_counters(self.request.auth.organization.id)
+        count = count_alert_groups_from_counters(
+            counters,
+            channel_ids,
+            is_root=filters["is_root"],
+            statuses=[int(status) for status in filters["status"]],
         )
+        return min(count, ALERT_GROUPS_MAX_COUNT), count <= ALERT_GROUPS_MAX_COUNT
 
     @action(methods=["post"], detail=True)
     def acknowledge(self, request, pk):
@@ -709,7 +790,6 @@ class AlertGroupView(
                 "type": "options",
                 "href": api_root + "users/?filters=true&roles=0&roles=1&roles=2",
                 "default": {"display_name": self.request.user.username, "value": self.request.user.public_primary_key},
-                "description": f"This filter works only for last {AlertGroupFilter.FILTER_BY_INVOLVED_USERS_ALERT_GROUPS_CUTOFF} alert groups these users involved in.",
             },
             {
                 "name": "status",
@@ -741,7 +821,6 @@ class AlertGroupView(
                 "name": "mine",
                 "type": "boolean",
                 "default": "true",
-                "description": f"This filter works only for last {AlertGroupFilter.FILTER_BY_INVOLVED_USERS_ALERT_GROUPS_CUTOFF} alert groups you're involved in.",
             },
         ]
 
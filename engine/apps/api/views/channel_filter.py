@@ -42,6 +42,7 @@ class ChannelFilterView(
         "partial_update": [RBACPermission.Permissions.INTEGRATIONS_WRITE],
         "destroy": [RBACPermission.Permissions.INTEGRATIONS_WRITE],
         "move_to_position": [RBACPermission.Permissions.INTEGRATIONS_WRITE],
+        "reorder": [RBACPermission.Permissions.INTEGRATIONS_WRITE],
         "convert_from_regex_to_jinja2": [RBACPermission.Permissions.INTEGRATIONS_WRITE],
     }
 
@@ -117,6 +118,14 @@ class ChannelFilterView(
 
         return super().move_to_position(request, pk)
 
+    @action(detail=False, methods=["put"])
+    def reorder(self, request):
+        public_primary_keys = self._get_reorder_param(request)
+        if self.get_queryset().filter(public_primary_key__in=public_primary_keys, is_default=True).exists():
+            raise BadRequest(detail="Unable to change position for default filter")
+
+        return super().reorder(request)
+
     @action(detail=True, methods=["post"])
     def convert_from_regex_to_jinja2(self, request, pk):
         instance = self.get_object()
@@ -43,6 +43,7 @@ class EscalationPolicyView(
         "partial_update": [RBACPermission.Permissions.ESCALATION_CHAINS_WRITE],
         "destroy": [RBACPermission.Permissions.ESCALATION_CHAINS_WRITE],
         "move_to_position": [RBACPermission.Permissions.ESCALATION_CHAINS_WRITE],
+        "reorder": [RBACPermission.Permissions.ESCALATION_CHAINS_WRITE],
     }
 
     model = EscalationPolicy
@@ -40,6 +40,7 @@ class UserNotificationPolicyView(UpdateSerializerMixin, OrderedModelViewSet):
         "partial_update": [RBACPermission.Permissions.USER_SETTINGS_WRITE],
         "destroy": [RBACPermission.Permissions.USER_SETTINGS_WRITE],
         "move_to_position": [RBACPermission.Permissions.USER_SETTINGS_WRITE],
+        "reorder": [RBACPermission.Permissions.USER_SETTINGS_WRITE],
     }
 
     IsOwnerOrHasUserSettingsAdminPermission = IsOwnerOrHasRBACPermissions(
@@ -53,6 +54,7 @@ class UserNotificationPolicyView(UpdateSerializerMixin, OrderedModelViewSet):
             "partial_update",
             "destroy",
             "move_to_position",
+            "reorder",
         ],
     }
 
@@ -5,24 +5,14 @@ from django.db.models import JSONField
 from django.db.utils import IntegrityError
 
 from apps.base.utils import LiveSettingValidator
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 
 def generate_public_primary_key_for_live_setting():
-    prefix = "L"
-    new_public_primary_key = generate_public_primary_key(prefix)
+    return generate_public_primary_key("L")
 
-    failure_counter = 0
-    while LiveSetting.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="LiveSetting"
-        )
-        failure_counter += 1
 
-    return new_public_primary_key
-
-
-class LiveSetting(models.Model):
+class LiveSetting(PublicPrimaryKeyModelMixin, models.Model):
     public_primary_key = models.CharField(
         max_length=20,
         validators=[MinLengthValidator(settings.PUBLIC_PRIMARY_KEY_MIN_LENGTH + 1)],
@@ -1,32 +1,30 @@
 import datetime
 from enum import unique
-from typing import Tuple
+from typing import Any, List, Tuple
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.validators import MinLengthValidator
-from django.db import IntegrityError, models
+from django.db import IntegrityError, models, router, transaction
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from apps.base.messaging import get_messaging_backends
 from apps.user_management.models import User
 from common.exceptions import UserNotificationPolicyCouldNotBeDeleted
 from common.ordered_model.ordered_model import OrderedModel
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 
 def generate_public_primary_key_for_notification_policy():
-    prefix = "N"
-    new_public_primary_key = generate_public_primary_key(prefix)
+    return generate_public_primary_key("N")
 
-    failure_counter = 0
-    while UserNotificationPolicy.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="UserNotificationPolicy"
-        )
-        failure_counter += 1
 
-    return new_public_primary_key
+NOTIFICATION_POLICY_CHAIN_CACHE_TIMEOUT = 60 * 5
+# bump when the cached chain format changes
+NOTIFICATION_POLICY_CHAIN_CACHE_VERSION = 1
 
 
 # base supported notification backends
@@ -90,7 +88,7 @@ class UserNotificationPolicyQuerySet(models.QuerySet):
             pass
 
 
-class UserNotificationPolicy(OrderedModel):
+class UserNotificationPolicy(PublicPrimaryKeyModelMixin, OrderedModel):
     objects = UserNotificationPolicyQuerySet.as_manager()
     order_with_respect_to = ("user_id", "important")
 
@@ -177,6 +175,64 @@ class UserNotificationPolicy(OrderedModel):
         else:
             super().delete()
 
+    # orders are changed with queryset updates, which don't send post_save signals
+    def to(self, order: int) -> None:
+        super().to(order)
+        UserNotificationPolicy.invalidate_notification_policy_chain(self.user_id)
+
+    def to_index(self, index: int) -> None:
+        super().to_index(index)
+        UserNotificationPolicy.invalidate_notification_policy_chain(self.user_id)
+
+    def swap(self, order: int) -> None:
+        super().swap(order)
+        UserNotificationPolicy.invalidate_notification_policy_chain(self.user_id)
+
+    @classmethod
+    def reorder(cls, pks: List[int], **ordering_params: Any) -> None:
+        super().reorder(pks, **ordering_params)
+        cls.invalidate_notification_policy_chain(ordering_params["user_id"])
+
+    @staticmethod
+    def _get_notification_policy_chain_cache_key(user_id: int, important: bool) -> str:
+        return f"notification_policy_chain_v{NOTIFICATION_POLICY_CHAIN_CACHE_VERSION}_{user_id}_{important}"
+
+    @classmethod
+    def get_notification_policy_chain(cls, user: User, important: bool) -> List["UserNotificationPolicy"]:
+        """
+        Return user notification policies in order, creating the default ones if needed.
+        The chain is cached, so notify_user_task doesn't query policies on every notification step.
+        """
+        cache_key = cls._get_notification_policy_chain_cache_key(user.pk, important)
+        field_names = [field.attname for field in cls._meta.concrete_fields]
+
+        # empty chains are not cached, default policies are created for them
+        cached_chain = cache.get(cache_key)
+        if cached_chain:
+            db = router.db_for_read(cls)
+            return [cls.from_db(db, field_names, values) for values in cached_chain]
+
+        chain = list(user.get_or_create_notification_policies(important=important))
+        if chain:
+            cache.set(
+                cache_key,
+                [tuple(getattr(policy, field_name) for field_name in field_names) for policy in chain],
+                timeout=NOTIFICATION_POLICY_CHAIN_CACHE_TIMEOUT,
+            )
+        return chain
+
+    @classmethod
+    def invalidate_notification_policy_chain(cls, user_id: int) -> None:
+        cache_keys = [cls._get_notification_policy_chain_cache_key(user_id, important) for important in (False, True)]
+        # invalidate after commit, so the chain is not cached again with the data being changed
+        transaction.on_commit(lambda: cache.delete_many(cache_keys))
+
+
+@receiver(post_save, sender=UserNotificationPolicy)
+@receiver(post_delete, sender=UserNotificationPolicy)
+def listen_for_usernotificationpolicy_model_change(sender, instance, *args, **kwargs):
+    UserNotificationPolicy.invalidate_notification_policy_chain(instance.user_id)
+
 
 class NotificationChannelOptions:
     """
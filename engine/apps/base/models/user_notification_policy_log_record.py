@@ -7,12 +7,12 @@ from django.dispatch import receiver
 from django.utils.functional import cached_property
 from rest_framework.fields import DateTimeField
 
+from apps.alerts.incident_log_builder import IncidentLogBuilder
 from apps.alerts.tasks import send_update_log_report_signal
 from apps.alerts.utils import render_relative_timeline
 from apps.base.messaging import get_messaging_backend_from_id
 from apps.base.models import UserNotificationPolicy
 from apps.base.models.user_notification_policy import validate_channel_choice
-from apps.slack.slack_formatter import SlackFormatter
 from common.utils import clean_markup
 
 logger = logging.getLogger(__name__)
@@ -123,6 +123,8 @@ class UserNotificationPolicyLogRecord(models.Model):
 
     @cached_property
     def rendered_notification_log_line_json(self):
+        from apps.slack.slack_formatter import SlackFormatter
+
         time = humanize.naturaldelta(self.alert_group.started_at - self.created_at)
         created_at = DateTimeField().to_representation(self.created_at)
         author = self.author.short() if self.author is not None else None
@@ -300,6 +302,13 @@ class UserNotificationPolicyLogRecord(models.Model):
 
 @receiver(post_save, sender=UserNotificationPolicyLogRecord)
 def listen_for_usernotificationpolicylogrecord_model_save(sender, instance, created, *args, **kwargs):
+    from apps.alerts.models import AlertGroupInvolvedUser
+
+    if created:
+        AlertGroupInvolvedUser.objects.add([(instance.author_id, instance.alert_group_id)])
+    else:
+        IncidentLogBuilder.invalidate_rendered_log_records(instance.alert_group_id)
+
     alert_group_pk = instance.alert_group.pk
     if instance.type != UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_FINISHED:
         logger.debug(
@@ -103,3 +103,32 @@ def test_unable_to_delete_last_notification_policy(
     first_policy.delete()
     with pytest.raises(UserNotificationPolicyCouldNotBeDeleted):
         second_policy.delete()
+
+
+@pytest.mark.django_db
+def test_notification_policy_chain_invalidation(
+    make_organization_and_user, make_user_notification_policy, django_capture_on_commit_callbacks
+):
+    _, user = make_organization_and_user()
+    first_policy = make_user_notification_policy(user=user, step=UserNotificationPolicy.Step.NOTIFY)
+
+    def _get_chain():
+        return [policy.pk for policy in UserNotificationPolicy.get_notification_policy_chain(user, important=False)]
+
+    assert _get_chain() == [first_policy.pk]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        second_policy = make_user_notification_policy(user=user, step=UserNotificationPolicy.Step.WAIT)
+    assert _get_chain() == [first_policy.pk, second_policy.pk]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        second_policy.to_index(0)
+    assert _get_chain() == [second_policy.pk, first_policy.pk]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        UserNotificationPolicy.reorder([first_policy.pk, second_policy.pk], user_id=user.pk, important=False)
+    assert _get_chain() == [first_policy.pk, second_policy.pk]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        first_policy.delete()
+    assert _get_chain() == [second_policy.pk]
@@ -5,9 +5,6 @@ from urllib.parse import urlparse
 import phonenumbers
 from django.conf import settings
 from phonenumbers import NumberParseException
-from telegram import Bot
-from twilio.base.exceptions import TwilioException
-from twilio.rest import Client
 
 from common.api_helpers.utils import create_engine_url
 
@@ -58,6 +55,8 @@ class LiveSettingValidator:
 
     @classmethod
     def _check_twilio_api_key_sid(cls, twilio_api_key_sid):
+        from twilio.rest import Client
+
         if live_settings.TWILIO_AUTH_TOKEN:
             return
 
@@ -70,6 +69,8 @@ class LiveSettingValidator:
 
     @classmethod
     def _check_twilio_api_key_secret(cls, twilio_api_key_secret):
+        from twilio.rest import Client
+
         if live_settings.TWILIO_AUTH_TOKEN:
             return
 
@@ -82,6 +83,8 @@ class LiveSettingValidator:
 
     @classmethod
     def _check_twilio_account_sid(cls, twilio_account_sid):
+        from twilio.rest import Client
+
         try:
             if live_settings.TWILIO_API_KEY_SID and live_settings.TWILIO_API_KEY_SECRET:
                 Client(
@@ -94,6 +97,8 @@ class LiveSettingValidator:
 
     @classmethod
     def _check_twilio_auth_token(cls, twilio_auth_token):
+        from twilio.rest import Client
+
         if live_settings.TWILIO_API_KEY_SID and live_settings.TWILIO_API_KEY_SECRET:
             return
 
@@ -104,6 +109,8 @@ class LiveSettingValidator:
 
     @classmethod
     def _check_twilio_verify_service_sid(cls, twilio_verify_service_sid):
+        from twilio.rest import Client
+
         try:
             if live_settings.TWILIO_API_KEY_SID and live_settings.TWILIO_API_KEY_SECRET:
                 twilio_client = Client(
@@ -130,6 +137,8 @@ class LiveSettingValidator:
 
     @classmethod
     def _check_telegram_token(cls, telegram_token):
+        from telegram import Bot
+
         try:
             bot = Bot(telegram_token)
             bot.get_me()
@@ -171,6 +180,8 @@ class LiveSettingValidator:
 
     @staticmethod
     def _prettify_twilio_error(exc):
+        from twilio.base.exceptions import TwilioException
+
         if isinstance(exc, TwilioException):
             if len(exc.args) > 1:
                 response_content = exc.args[1].content
@@ -1,3 +1,5 @@
+import typing
+
 from django.template.loader import render_to_string
 from emoji.core import emojize
 
@@ -23,7 +25,16 @@ class AlertEmailTemplater(AlertTemplater):
         return sf.format(data)
 
 
-def build_subject_and_message(alert_group, emails_left):
+class RenderedAlertGroupEmail(typing.TypedDict):
+    url: str
+    title: str
+    message: str
+    organization: str
+    integration: str
+
+
+def render_alert_group_email(alert_group) -> RenderedAlertGroupEmail:
+    """Render the parts of the email that are the same for all the recipients"""
     alert = alert_group.alerts.first()
     templated_alert = AlertEmailTemplater(alert).render()
 
@@ -36,20 +47,28 @@ def build_subject_and_message(alert_group, emails_left):
     if message:
         message = convert_md_to_html(templated_alert.message) if templated_alert.message else ""
 
+    return {
+        "url": alert_group.slack_permalink or alert_group.web_link,
+        "title": str_or_backup(templated_alert.title, title_fallback),
+        "message": str_or_backup(message, ""),  # not render message at all if smth goes wrong
+        "organization": alert_group.channel.organization.org_title,
+        "integration": emojize(alert_group.channel.short_name, language="alias"),
+    }
+
+
+def build_subject_and_message(alert_group, emails_left, rendered_alert_group=None):
+    if rendered_alert_group is None:
+        rendered_alert_group = render_alert_group_email(alert_group)
+
     content = render_to_string(
         "email_notification.html",
         {
-            "url": alert_group.slack_permalink or alert_group.web_link,
-            "title": str_or_backup(templated_alert.title, title_fallback),
-            "message": str_or_backup(message, ""),  # not render message at all if smth goes wrong
-            "organization": alert_group.channel.organization.org_title,
-            "integration": emojize(alert_group.channel.short_name, language="alias"),
+            **rendered_alert_group,
             "limit_notification": emails_left <= 20,
             "emails_left": emails_left,
         },
     )
 
-    title = str_or_backup(templated_alert.title, title_fallback)
-    subject = f"[{title}] You are invited to check an alert group".replace("\n", "")
+    subject = f"[{rendered_alert_group['title']}] You are invited to check an alert group".replace("\n", "")
 
     return subject, content
@@ -1,5 +1,5 @@
 from apps.base.messaging import BaseMessagingBackend
-from apps.email.tasks import notify_user_async
+from apps.email.tasks import queue_user_notification
 
 
 class EmailBackend(BaseMessagingBackend):
@@ -15,6 +15,6 @@ class EmailBackend(BaseMessagingBackend):
         return {"email": user.email}
 
     def notify_user(self, user, alert_group, notification_policy):
-        notify_user_async.delay(
+        queue_user_notification(
             user_pk=user.pk, alert_group_pk=alert_group.pk, notification_policy_pk=notification_policy.pk
         )
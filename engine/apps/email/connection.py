@@ -0,0 +1,85 @@
+import threading
+import time
+import typing
+from smtplib import SMTPServerDisconnected
+
+from django.core.mail import get_connection
+
+from apps.base.utils import live_settings
+
+if typing.TYPE_CHECKING:
+    from django.core.mail import EmailMessage
+    from django.core.mail.backends.base import BaseEmailBackend
+
+
+class SMTPConnectionPool:
+    """
+    Keeps an open SMTP connection per worker process, so sending several emails doesn't open a new
+    (usually TLS) session for every email.
+    The connection is reopened when SMTP settings change, when it has been idle for longer than the keepalive time
+    (SMTP servers drop idle connections) and once when the server disconnects while sending.
+    """
+
+    KEEPALIVE_SECONDS = 60
+    TIMEOUT = 5
+
+    def __init__(self) -> None:
+        self._connection: typing.Optional["BaseEmailBackend"] = None
+        self._connection_params: typing.Optional[dict] = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_connection_params() -> dict:
+        return {
+            "host": live_settings.EMAIL_HOST,
+            "port": live_settings.EMAIL_PORT,
+            "username": live_settings.EMAIL_HOST_USER,
+            "password": live_settings.EMAIL_HOST_PASSWORD,
+            "use_tls": live_settings.EMAIL_USE_TLS,
+        }
+
+    def _get_connection(self) -> "BaseEmailBackend":
+        connection_params = self._get_connection_params()
+        is_expired = time.monotonic() - self._last_used > self.KEEPALIVE_SECONDS
+        if self._connection is not None and (is_expired or connection_params != self._connection_params):
+            self._close()
+
+        if self._connection is None:
+            connection = get_connection(fail_silently=False, timeout=self.TIMEOUT, **connection_params)
+            connection.open()
+            self._connection = connection
+            self._connection_params = connection_params
+        return self._connection
+
+    def _close(self) -> None:
+        try:
+            self._connection.close()
+        except Exception:
+            # the connection is dropped anyway
+            pass
+        self._connection = None
+        self._connection_params = None
+
+    def send_messages(self, messages: typing.List["EmailMessage"]) -> int:
+        with self._lock:
+            try:
+                try:
+                    return self._get_connection().send_messages(messages)
+                except SMTPServerDisconnected:
+                    self._close()
+                    return self._get_connection().send_messages(messages)
+            except Exception:
+                # don't reuse a connection in unknown state
+                self._close()
+                raise
+            finally:
+                self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._close()
+
+
+smtp_connection_pool = SMTPConnectionPool()
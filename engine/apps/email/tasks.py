@@ -1,20 +1,30 @@
+import typing
 from socket import gaierror
 
 from celery.utils.log import get_task_logger
 from django.conf import settings
-from django.core.mail import BadHeaderError, get_connection, send_mail
+from django.core.mail import BadHeaderError, EmailMultiAlternatives
 from django.utils.html import strip_tags
 
 from apps.alerts.models import AlertGroup
 from apps.base.utils import live_settings
-from apps.email.alert_rendering import build_subject_and_message
+from apps.email.alert_rendering import build_subject_and_message, render_alert_group_email
+from apps.email.connection import smtp_connection_pool
 from apps.email.models import EmailMessage
 from apps.user_management.models import User
+from common.cache_queue import CacheBatchQueue
 from common.custom_celery_tasks import shared_dedicated_queue_retry_task
 
+if typing.TYPE_CHECKING:
+    from apps.base.models import UserNotificationPolicy
+
 MAX_RETRIES = 1 if settings.DEBUG else 10
 logger = get_task_logger(__name__)
 
+# notifications for the same alert group queued within this time are sent together
+EMAIL_NOTIFICATIONS_BATCH_WINDOW_SECONDS = 2
+email_notifications_queue = CacheBatchQueue("email_notifications")
+
 
 def get_from_email(user):
     if live_settings.EMAIL_FROM_ADDRESS:
@@ -26,19 +36,110 @@ def get_from_email(user):
     return live_settings.EMAIL_HOST_USER
 
 
+def _create_failed_log_record(user, alert_group, notification_policy, **kwargs):
+    # imported here to avoid circular import error
+    from apps.base.models import UserNotificationPolicyLogRecord
+
+    UserNotificationPolicyLogRecord.objects.create(
+        author=user,
+        type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_FAILED,
+        notification_policy=notification_policy,
+        alert_group=alert_group,
+        reason="Error while sending email",
+        notification_step=notification_policy.step,
+        notification_channel=notification_policy.notify_by,
+        **kwargs,
+    )
+
+
+def _notify_users(
+    alert_group: AlertGroup,
+    notifications: typing.List[typing.Tuple[User, "UserNotificationPolicy"]],
+    on_notified: typing.Callable[[int], None] = lambda _: None,
+) -> typing.List[typing.Tuple[User, "UserNotificationPolicy"]]:
+    """
+    Send email notifications for the alert group using the pooled SMTP connection.
+    The alert group is rendered once for all the recipients.
+    `on_notified` is called with the index of every notification that is sent or failed without retry.
+    Returns notifications that failed with unexpected errors and may be retried.
+    """
+    # imported here to avoid circular import error
+    from apps.base.models import UserNotificationPolicyLogRecord
+
+    # create an error log in case EMAIL_HOST is not specified
+    if not live_settings.EMAIL_HOST:
+        for i, (user, notification_policy) in enumerate(notifications):
+            _create_failed_log_record(user, alert_group, notification_policy)
+            on_notified(i)
+        logger.error("Error while sending email: empty EMAIL_HOST env variable")
+        return []
+
+    rendered_alert_group = None
+    failed_notifications = []
+
+    for i, (user, notification_policy) in enumerate(notifications):
+        emails_left = user.organization.emails_left(user)
+        if emails_left <= 0:
+            _create_failed_log_record(
+                user,
+                alert_group,
+                notification_policy,
+                notification_error_code=UserNotificationPolicyLogRecord.ERROR_NOTIFICATION_MAIL_LIMIT_EXCEEDED,
+            )
+            EmailMessage.objects.create(
+                represents_alert_group=alert_group,
+                notification_policy=notification_policy,
+                receiver=user,
+                exceeded_limit=True,
+            )
+            on_notified(i)
+            continue
+
+        if rendered_alert_group is None:
+            rendered_alert_group = render_alert_group_email(alert_group)
+        subject, html_message = build_subject_and_message(alert_group, emails_left, rendered_alert_group)
+
+        message = EmailMultiAlternatives(subject, strip_tags(html_message), get_from_email(user), [user.email])
+        message.attach_alternative(html_message, "text/html")
+
+        try:
+            smtp_connection_pool.send_messages([message])
+        except (gaierror, BadHeaderError) as e:
+            # gaierror is raised when EMAIL_HOST is invalid
+            # BadHeaderError is raised when there's newlines in the subject
+            _create_failed_log_record(user, alert_group, notification_policy)
+            logger.error(f"Error while sending email: {e}")
+            on_notified(i)
+            continue
+        except Exception as e:
+            logger.warning(f"Error while sending email to user {user.pk}: {e}")
+            failed_notifications.append((user, notification_policy))
+            continue
+
+        EmailMessage.objects.create(
+            represents_alert_group=alert_group,
+            notification_policy=notification_policy,
+            receiver=user,
+            exceeded_limit=False,
+        )
+        on_notified(i)
+
+    return failed_notifications
+
+
 @shared_dedicated_queue_retry_task(autoretry_for=(Exception,), retry_backoff=True, max_retries=MAX_RETRIES)
 def notify_user_async(user_pk, alert_group_pk, notification_policy_pk):
     # imported here to avoid circular import error
-    from apps.base.models import UserNotificationPolicy, UserNotificationPolicyLogRecord
+    from apps.base.models import UserNotificationPolicy
 
     try:
-        user = User.objects.get(pk=user_pk)
+        user = User.objects.select_related("organization").get(pk=user_pk)
     except User.DoesNotExist:
         logger.warning(f"User {user_pk} does not exist")
         return
 
     try:
-        alert_group = AlertGroup.objects.get(pk=alert_group_pk)
+        alert_group = AlertGroup.objects.select_related("channel__organization").get(pk=alert_group_pk)
     except AlertGroup.DoesNotExist:
         logger.warning(f"Alert group {alert_group_pk} does not exist")
         return
@@ -49,75 +150,70 @@ def notify_user_async(user_pk, alert_group_pk, notification_policy_pk):
         logger.warning(f"User notification policy {notification_policy_pk} does not exist")
         return
 
-    # create an error log in case EMAIL_HOST is not specified
-    if not live_settings.EMAIL_HOST:
-        UserNotificationPolicyLogRecord.objects.create(
-            author=user,
-            type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_FAILED,
-            notification_policy=notification_policy,
-            alert_group=alert_group,
-            reason="Error while sending email",
-            notification_step=notification_policy.step,
-            notification_channel=notification_policy.notify_by,
-        )
-        logger.error("Error while sending email: empty EMAIL_HOST env variable")
-        return
-
-    emails_left = user.organization.emails_left(user)
-    if emails_left <= 0:
-        UserNotificationPolicyLogRecord.objects.create(
-            author=user,
-            type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_FAILED,
-            notification_policy=notification_policy,
-            alert_group=alert_group,
-            reason="Error while sending email",
-            notification_step=notification_policy.step,
-            notification_channel=notification_policy.notify_by,
-            notification_error_code=UserNotificationPolicyLogRecord.ERROR_NOTIFICATION_MAIL_LIMIT_EXCEEDED,
-        )
-        EmailMessage.objects.create(
-            represents_alert_group=alert_group,
-            notification_policy=notification_policy,
-            receiver=user,
-            exceeded_limit=True,
-        )
-        return
+    if _notify_users(alert_group, [(user, notification_policy)]):
+        raise Exception(f"Failed to send email to user {user_pk}")
 
-    subject, html_message = build_subject_and_message(alert_group, emails_left)
 
-    message = strip_tags(html_message)
-    from_email = get_from_email(user)
-    recipient_list = [user.email]
+def queue_user_notification(user_pk, alert_group_pk, notification_policy_pk):
+    """
+    Queue an email notification to be sent by notify_users_async together with the other notifications
+    for the same alert group queued within EMAIL_NOTIFICATIONS_BATCH_WINDOW_SECONDS.
+    """
+    if email_notifications_queue.push(alert_group_pk, (user_pk, notification_policy_pk)):
+        notify_users_async.apply_async((alert_group_pk,), countdown=EMAIL_NOTIFICATIONS_BATCH_WINDOW_SECONDS)
 
-    connection = get_connection(
-        host=live_settings.EMAIL_HOST,
-        port=live_settings.EMAIL_PORT,
-        username=live_settings.EMAIL_HOST_USER,
-        password=live_settings.EMAIL_HOST_PASSWORD,
-        use_tls=live_settings.EMAIL_USE_TLS,
-        fail_silently=False,
-        timeout=5,
-    )
 
-    try:
-        send_mail(subject, message, from_email, recipient_list, html_message=html_message, connection=connection)
-        EmailMessage.objects.create(
-            represents_alert_group=alert_group,
-            notification_policy=notification_policy,
-            receiver=user,
-            exceeded_limit=False,
-        )
-    except (gaierror, BadHeaderError) as e:
-        # gaierror is raised when EMAIL_HOST is invalid
-        # BadHeaderError is raised when there's newlines in the subject
-        UserNotificationPolicyLogRecord.objects.create(
-            author=user,
-            type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_FAILED,
-            notification_policy=notification_policy,
-            alert_group=alert_group,
-            reason="Error while sending email",
-            notification_step=notification_policy.step,
-            notification_channel=notification_policy.notify_by,
-        )
-        logger.error(f"Error while sending email: {e}")
-        return
+@shared_dedicated_queue_retry_task(autoretry_for=(Exception,), retry_backoff=True, max_retries=MAX_RETRIES)
+def notify_users_async(alert_group_pk):
+    """Send the email notifications queued for the alert group by queue_user_notification"""
+    # imported here to avoid circular import error
+    from apps.base.models import UserNotificationPolicy
+
+    with email_notifications_queue.pop(alert_group_pk) as notification_pks:
+        if notification_pks is None:
+            # notifications are being sent by another task, try again later
+            notify_users_async.apply_async((alert_group_pk,), countdown=EMAIL_NOTIFICATIONS_BATCH_WINDOW_SECONDS)
+            return
+
+        if notification_pks.pending:
+            # some notifications are not stored yet, send them with the next task
+            notify_users_async.apply_async((alert_group_pk,), countdown=EMAIL_NOTIFICATIONS_BATCH_WINDOW_SECONDS)
+
+        if not notification_pks:
+            return
+
+        try:
+            alert_group = AlertGroup.objects.select_related("channel__organization").get(pk=alert_group_pk)
+        except AlertGroup.DoesNotExist:
+            logger.warning(f"Alert group {alert_group_pk} does not exist")
+            return
+
+        users = User.objects.select_related("organization").in_bulk({pk for pk, _ in notification_pks})
+        notification_policies = UserNotificationPolicy.objects.in_bulk({pk for _, pk in notification_pks})
+
+        notifications = []
+        # position of every notification in the queue
+        queue_indexes = []
+        for queue_index, (user_pk, notification_policy_pk) in enumerate(notification_pks):
+            user = users.get(user_pk)
+            notification_policy = notification_policies.get(notification_policy_pk)
+            if user is None or notification_policy is None:
+                logger.warning(f"User {user_pk} or user notification policy {notification_policy_pk} does not exist")
+                continue
+            notifications.append((user, notification_policy))
+            queue_indexes.append(queue_index)
+
+        def _on_notified(i):
+            # don't send the email again if the task is retried after an error
+            notification_pks.mark_processed(queue_indexes[i])
+
+        # retry failed notifications separately, so other users don't get duplicate emails
+        for user, notification_policy in _notify_users(alert_group, notifications, _on_notified):
+            notify_user_async.apply_async(
+                kwargs={
+                    "user_pk": user.pk,
+                    "alert_group_pk": alert_group_pk,
+                    "notification_policy_pk": notification_policy.pk,
+                },
+                countdown=EMAIL_NOTIFICATIONS_BATCH_WINDOW_SECONDS,
+            )
@@ -1,13 +1,24 @@
 import socket
+import time
+from smtplib import SMTPException, SMTPServerDisconnected
 from unittest.mock import patch
 
 import pytest
 from django.core import mail
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.core.mail.backends.locmem import EmailBackend
 
 from apps.base.models import UserNotificationPolicy, UserNotificationPolicyLogRecord
-from apps.email.alert_rendering import build_subject_and_message
-from apps.email.tasks import get_from_email, notify_user_async
+from apps.email.alert_rendering import build_subject_and_message, render_alert_group_email
+from apps.email.connection import SMTPConnectionPool
+from apps.email.models import EmailMessage
+from apps.email.tasks import (
+    EMAIL_NOTIFICATIONS_BATCH_WINDOW_SECONDS,
+    get_from_email,
+    notify_user_async,
+    notify_users_async,
+    queue_user_notification,
+)
 from apps.user_management.subscription_strategy.free_public_beta_subscription_strategy import (
     FreePublicBetaSubscriptionStrategy,
 )
@@ -209,3 +220,163 @@ def test_subject_newlines_removed(
 
     subject, _ = build_subject_and_message(alert_group, 1)
     assert subject == "[testnewlines] You are invited to check an alert group"
+
+
+@pytest.mark.django_db
+def test_notify_users_async(
+    settings,
+    make_organization,
+    make_user_for_organization,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+    make_user_notification_policy,
+):
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    settings.EMAIL_HOST = "test"
+
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(alert_receive_channel)
+    make_alert(alert_group=alert_group, raw_request_data=alert_receive_channel.config.example_payload)
+
+    users = [make_user_for_organization(organization) for _ in range(3)]
+    notification_policies = [
+        make_user_notification_policy(user, UserNotificationPolicy.Step.NOTIFY, notify_by=8, important=False)
+        for user in users
+    ]
+
+    with patch.object(notify_users_async, "apply_async") as mock_notify_users_async:
+        for user, notification_policy in zip(users, notification_policies):
+            queue_user_notification(user.pk, alert_group.pk, notification_policy.pk)
+    # a single task is scheduled for all the notifications
+    mock_notify_users_async.assert_called_once_with(
+        (alert_group.pk,), countdown=EMAIL_NOTIFICATIONS_BATCH_WINDOW_SECONDS
+    )
+
+    with patch(
+        "apps.email.tasks.render_alert_group_email", wraps=render_alert_group_email
+    ) as mock_render_alert_group_email:
+        notify_users_async(alert_group.pk)
+
+    mock_render_alert_group_email.assert_called_once_with(alert_group)
+    assert sorted(message.to[0] for message in mail.outbox) == sorted(user.email for user in users)
+    assert EmailMessage.objects.filter(represents_alert_group=alert_group, exceeded_limit=False).count() == 3
+
+    # notifications are sent once
+    notify_users_async(alert_group.pk)
+    assert len(mail.outbox) == 3
+
+    # notifications queued later are sent by a new task
+    with patch.object(notify_users_async, "apply_async") as mock_notify_users_async:
+        queue_user_notification(users[0].pk, alert_group.pk, notification_policies[0].pk)
+    assert mock_notify_users_async.called
+
+    notify_users_async(alert_group.pk)
+    assert len(mail.outbox) == 4
+
+
+@pytest.mark.django_db
+def test_notify_users_async_retry_failed(
+    settings,
+    make_organization,
+    make_user_for_organization,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+    make_user_notification_policy,
+):
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    settings.EMAIL_HOST = "test"
+
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(alert_receive_channel)
+    make_alert(alert_group=alert_group, raw_request_data=alert_receive_channel.config.example_payload)
+
+    user = make_user_for_organization(organization)
+    notification_policy = make_user_notification_policy(
+        user, UserNotificationPolicy.Step.NOTIFY, notify_by=8, important=False
+    )
+    queue_user_notification(user.pk, alert_group.pk, notification_policy.pk)
+
+    with patch.object(EmailBackend, "send_messages", side_effect=SMTPException):
+        with patch.object(notify_user_async, "apply_async") as mock_notify_user_async:
+            notify_users_async(alert_group.pk)
+
+    assert len(mail.outbox) == 0
+    mock_notify_user_async.assert_called_once_with(
+        kwargs={
+            "user_pk": user.pk,
+            "alert_group_pk": alert_group.pk,
+            "notification_policy_pk": notification_policy.pk,
+        },
+        countdown=EMAIL_NOTIFICATIONS_BATCH_WINDOW_SECONDS,
+    )
+
+
+@pytest.mark.django_db
+def test_notify_users_async_error_after_send(
+    settings,
+    make_organization,
+    make_user_for_organization,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+    make_user_notification_policy,
+):
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    settings.EMAIL_HOST = "test"
+
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(alert_receive_channel)
+    make_alert(alert_group=alert_group, raw_request_data=alert_receive_channel.config.example_payload)
+
+    users = [make_user_for_organization(organization) for _ in range(3)]
+    for user in users:
+        notification_policy = make_user_notification_policy(
+            user, UserNotificationPolicy.Step.NOTIFY, notify_by=8, important=False
+        )
+        queue_user_notification(user.pk, alert_group.pk, notification_policy.pk)
+
+    # database error after the second email is sent
+    with patch.object(
+        EmailMessage.objects, "create", side_effect=[EmailMessage(), Exception("db error"), EmailMessage()]
+    ):
+        with pytest.raises(Exception, match="db error"):
+            notify_users_async(alert_group.pk)
+    assert len(mail.outbox) == 2
+
+    # the task retry doesn't send the first email again
+    notify_users_async(alert_group.pk)
+    assert sorted(message.to[0] for message in mail.outbox) == sorted(
+        [users[0].email, users[1].email, users[1].email, users[2].email]
+    )
+
+
+@pytest.mark.django_db
+def test_smtp_connection_pool_reconnect(settings):
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    settings.EMAIL_HOST = "test"
+
+    pool = SMTPConnectionPool()
+    message = EmailMultiAlternatives("subject", "body", "from@example.com", ["to@example.com"])
+
+    with patch("apps.email.connection.get_connection", wraps=get_connection) as mock_get_connection:
+        pool.send_messages([message])
+        pool.send_messages([message])
+        # the connection is reused
+        assert mock_get_connection.call_count == 1
+
+        with patch.object(EmailBackend, "send_messages", side_effect=[SMTPServerDisconnected, 1]):
+            pool.send_messages([message])
+        # reconnected after the server disconnected
+        assert mock_get_connection.call_count == 2
+
+        with patch("apps.email.connection.time.monotonic", return_value=time.monotonic() + pool.KEEPALIVE_SECONDS + 1):
+            pool.send_messages([message])
+        # reconnected after the connection was idle for too long
+        assert mock_get_connection.call_count == 3
+
+    assert len(mail.outbox) == 3
@@ -0,0 +1,30 @@
+# Generated by Django 3.2.20 on 2026-10-19 11:02
+
+import datetime
+
+from django.db import migrations, models
+
+
+def populate_expires_at(apps, schema_editor):
+    IntegrationHeartBeat = apps.get_model("heartbeat", "IntegrationHeartBeat")
+
+    heartbeats = IntegrationHeartBeat.objects.filter(last_heartbeat_time__isnull=False).exclude(timeout_seconds=0)
+    for heartbeat in heartbeats.iterator():
+        heartbeat.expires_at = heartbeat.last_heartbeat_time + datetime.timedelta(seconds=heartbeat.timeout_seconds)
+        heartbeat.save(update_fields=["expires_at"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('heartbeat', '0002_delete_heartbeat'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='integrationheartbeat',
+            name='expires_at',
+            field=models.DateTimeField(db_index=True, default=None, null=True),
+        ),
+        migrations.RunPython(populate_expires_at, migrations.RunPython.noop),
+    ]
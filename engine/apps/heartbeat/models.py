@@ -1,3 +1,4 @@
+import datetime
 import logging
 import typing
 from urllib.parse import urljoin
@@ -7,26 +8,16 @@ from django.core.validators import MinLengthValidator
 from django.db import models
 from django.utils import timezone
 
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 logger = logging.getLogger(__name__)
 
 
 def generate_public_primary_key_for_integration_heart_beat():
-    prefix = "B"
-    new_public_primary_key = generate_public_primary_key(prefix)
+    return generate_public_primary_key("B")
 
-    failure_counter = 0
-    while IntegrationHeartBeat.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="IntegrationHeartBeat"
-        )
-        failure_counter += 1
 
-    return new_public_primary_key
-
-
-class IntegrationHeartBeat(models.Model):
+class IntegrationHeartBeat(PublicPrimaryKeyModelMixin, models.Model):
     TIMEOUT_CHOICES = (
         (60, "1 minute"),
         (120, "2 minutes"),
@@ -58,6 +49,13 @@ class IntegrationHeartBeat(models.Model):
     Deprecated. Stored the latest scheduled `integration_heartbeat_checkup` task id. TODO: remove it
     """
 
+    expires_at = models.DateTimeField(default=None, null=True, db_index=True)
+    """
+    Time when the heartbeat expires if no new signal is received (last_heartbeat_time + timeout_seconds).
+    None if the heartbeat is not enabled. Kept up to date in `save` and used by `check_heartbeats` to find
+    expired heartbeats with an index lookup.
+    """
+
     previous_alerted_state_was_life = models.BooleanField(default=True)
     """
     Last status of the heartbeat. Determines if integration was alive on latest checkup
@@ -74,6 +72,21 @@ class IntegrationHeartBeat(models.Model):
         "alerts.AlertReceiveChannel", on_delete=models.CASCADE, related_name="integration_heartbeat"
     )
 
+    def save(self, *args, **kwargs):
+        self.expires_at = self.get_expires_at(self.last_heartbeat_time, self.timeout_seconds)
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = [*kwargs["update_fields"], "expires_at"]
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def get_expires_at(last_heartbeat_time: datetime.datetime | None, timeout_seconds: int) -> datetime.datetime | None:
+        # Heartbeat is considered enabled if it
+        # * has timeout_seconds set to non-zero (non-default) value,
+        # * received at least one checkup (last_heartbeat_time set to non-null value)
+        if last_heartbeat_time is None or not timeout_seconds:
+            return None
+        return last_heartbeat_time + datetime.timedelta(seconds=timeout_seconds)
+
     @property
     def is_expired(self) -> bool:
         if self.last_heartbeat_time is None:
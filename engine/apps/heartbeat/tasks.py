@@ -1,95 +1,124 @@
-import datetime
+import time
+import typing
 
 from celery.utils.log import get_task_logger
-from django.conf import settings
 from django.db import transaction
-from django.db.models import DateTimeField, DurationField, ExpressionWrapper, F
-from django.db.models.functions import Cast
 from django.utils import timezone
 
 from apps.heartbeat.models import IntegrationHeartBeat
+from apps.heartbeat.utils import get_heartbeat_pings, mark_heartbeats_expired, mark_heartbeats_restored
 from apps.integrations.tasks import create_alert
+from apps.metrics_exporter.constants import HEARTBEATS_CHECK_DURATION_SECONDS, HEARTBEATS_CHECKED
+from apps.metrics_exporter.helpers import metrics_set_internal_gauge
 from common.custom_celery_tasks import shared_dedicated_queue_retry_task
-from settings.base import DatabaseTypes
+from common.utils import batch_queryset
 
 logger = get_task_logger(__name__)
 
+HEARTBEAT_PINGS_FLUSH_BATCH_SIZE = 1000
+HEARTBEAT_ALERTS_BATCH_SIZE = 100
+
 
 @shared_dedicated_queue_retry_task()
 def check_heartbeats() -> str:
     """
     Periodic task to check heartbeats status change and create alerts (or auto-resolve alerts) if needed
     """
-    # Heartbeat is considered enabled if it
-    # * has timeout_seconds set to non-zero (non-default) value,
-    # * received at least one checkup (last_heartbeat_time set to non-null value)\
-
-    def _get_timeout_expression() -> ExpressionWrapper:
-        if settings.DATABASES["default"]["ENGINE"] == f"django.db.backends.{DatabaseTypes.POSTGRESQL}":
-            # DurationField: When used on PostgreSQL, the data type used is an interval
-            # https://docs.djangoproject.com/en/3.2/ref/models/fields/#durationfield
-            return ExpressionWrapper(datetime.timedelta(seconds=1) * F("timeout_seconds"), output_field=DurationField())
-        else:
-            # DurationField: ...Otherwise a bigint of microseconds is used...
-            # microseconds = seconds * 10**6
-            # https://docs.djangoproject.com/en/3.2/ref/models/fields/#durationfield
-            return ExpressionWrapper(F("timeout_seconds") * 10**6, output_field=DurationField())
-
-    enabled_heartbeats = (
-        IntegrationHeartBeat.objects.filter(last_heartbeat_time__isnull=False)
-        .exclude(timeout_seconds=0)
-        .annotate(period_start=(Cast(timezone.now() - _get_timeout_expression(), DateTimeField())))
-    )
+    started_at = time.monotonic()
+
+    # Write pending pings to the database first, so heartbeats pinged since the last flush are not considered expired
+    flush_heartbeat_pings()
+
+    now = timezone.now()
     with transaction.atomic():
         # Heartbeat is considered expired if it
-        # * is enabled,
+        # * is enabled (expires_at is set only for enabled heartbeats),
         # * is not already expired,
         # * last check in was before the timeout period start
-        expired_heartbeats = enabled_heartbeats.select_for_update().filter(
-            last_heartbeat_time__lte=F("period_start"), previous_alerted_state_was_life=True
+        expired_heartbeats = IntegrationHeartBeat.objects.select_for_update().filter(
+            expires_at__lte=now, previous_alerted_state_was_life=True
         )
-        # Schedule alert creation for each expired heartbeat after transaction commit
-        for heartbeat in expired_heartbeats:
-            transaction.on_commit(
-                lambda: create_alert.apply_async(
-                    kwargs={
-                        "title": heartbeat.alert_receive_channel.heartbeat_expired_title,
-                        "message": heartbeat.alert_receive_channel.heartbeat_expired_message,
-                        "image_url": None,
-                        "link_to_upstream_details": None,
-                        "alert_receive_channel_pk": heartbeat.alert_receive_channel.pk,
-                        "integration_unique_data": {},
-                        "raw_request_data": heartbeat.alert_receive_channel.heartbeat_expired_payload,
-                    },
-                )
-            )
-        # Update previous_alerted_state_was_life to False
-        expired_count = expired_heartbeats.update(previous_alerted_state_was_life=False)
+        expired_pks, expired_channel_pks = _lock_heartbeats(expired_heartbeats)
+        IntegrationHeartBeat.objects.filter(pk__in=expired_pks).update(previous_alerted_state_was_life=False)
+        # Remember expired heartbeats, so the next ping is processed right away (see record_heartbeat_ping)
+        transaction.on_commit(lambda: mark_heartbeats_expired(expired_channel_pks))
+        transaction.on_commit(lambda: _start_create_heartbeat_alerts(expired_channel_pks, restored=False))
+
     with transaction.atomic():
         # Heartbeat is considered restored if it
         # * is enabled,
         # * last check in was after the timeout period start,
         # * was is alerted state (previous_alerted_state_was_life is False), i.e. was expired
-        restored_heartbeats = enabled_heartbeats.select_for_update().filter(
-            last_heartbeat_time__gte=F("period_start"), previous_alerted_state_was_life=False
+        restored_heartbeats = IntegrationHeartBeat.objects.select_for_update().filter(
+            expires_at__gt=now, previous_alerted_state_was_life=False
+        )
+        restored_pks, restored_channel_pks = _lock_heartbeats(restored_heartbeats)
+        IntegrationHeartBeat.objects.filter(pk__in=restored_pks).update(previous_alerted_state_was_life=True)
+        transaction.on_commit(lambda: mark_heartbeats_restored(restored_channel_pks))
+        transaction.on_commit(lambda: _start_create_heartbeat_alerts(restored_channel_pks, restored=True))
+
+    checked_count = IntegrationHeartBeat.objects.filter(expires_at__isnull=False).count()
+    duration = time.monotonic() - started_at
+    metrics_set_internal_gauge(HEARTBEATS_CHECKED, checked_count)
+    metrics_set_internal_gauge(HEARTBEATS_CHECK_DURATION_SECONDS, duration)
+    logger.info(f"Checked {checked_count} heartbeats in {duration:.3f} seconds")
+
+    return f"Found {len(expired_pks)} expired and {len(restored_pks)} restored heartbeats"
+
+
+def _lock_heartbeats(heartbeats) -> typing.Tuple[typing.List[int], typing.List[int]]:
+    """Lock heartbeats and return their ids and integration ids"""
+    pks, alert_receive_channel_pks = [], []
+    for pk, alert_receive_channel_pk in heartbeats.values_list("pk", "alert_receive_channel_id"):
+        pks.append(pk)
+        alert_receive_channel_pks.append(alert_receive_channel_pk)
+    return pks, alert_receive_channel_pks
+
+
+def _start_create_heartbeat_alerts(alert_receive_channel_pks: typing.List[int], restored: bool) -> None:
+    for i in range(0, len(alert_receive_channel_pks), HEARTBEAT_ALERTS_BATCH_SIZE):
+        create_heartbeat_alerts.apply_async(
+            (alert_receive_channel_pks[i : i + HEARTBEAT_ALERTS_BATCH_SIZE], restored),
         )
-        # Schedule auto-resolve alert creation for each expired heartbeat after transaction commit
-        for heartbeat in restored_heartbeats:
-            transaction.on_commit(
-                lambda: create_alert.apply_async(
-                    kwargs={
-                        "title": heartbeat.alert_receive_channel.heartbeat_restored_title,
-                        "message": heartbeat.alert_receive_channel.heartbeat_restored_message,
-                        "image_url": None,
-                        "link_to_upstream_details": None,
-                        "alert_receive_channel_pk": heartbeat.alert_receive_channel.pk,
-                        "integration_unique_data": {},
-                        "raw_request_data": heartbeat.alert_receive_channel.heartbeat_restored_payload,
-                    },
-                )
-            )
-        restored_count = restored_heartbeats.update(previous_alerted_state_was_life=True)
-    return f"Found {expired_count} expired and {restored_count} restored heartbeats"
+
+
+@shared_dedicated_queue_retry_task()
+def create_heartbeat_alerts(alert_receive_channel_pks: typing.List[int], restored: bool) -> None:
+    """
+    Create heartbeat expired (or auto-resolve heartbeat restored) alerts for a batch of integrations.
+    Alert creation for an integration that fails is retried separately with the create_alert task.
+    """
+    from apps.alerts.models import AlertReceiveChannel
+
+    for alert_receive_channel in AlertReceiveChannel.objects.filter(pk__in=alert_receive_channel_pks):
+        alert_kwargs = _get_heartbeat_alert_kwargs(alert_receive_channel, restored)
+        try:
+            create_alert(**alert_kwargs)
+        except Exception:
+            logger.exception(f"Failed to create heartbeat alert for integration {alert_receive_channel.pk}, retrying")
+            create_alert.apply_async(kwargs=alert_kwargs)
+
+
+def _get_heartbeat_alert_kwargs(alert_receive_channel, restored: bool) -> dict:
+    if restored:
+        return {
+            "title": alert_receive_channel.heartbeat_restored_title,
+            "message": alert_receive_channel.heartbeat_restored_message,
+            "image_url": None,
+            "link_to_upstream_details": None,
+            "alert_receive_channel_pk": alert_receive_channel.pk,
+            "integration_unique_data": {},
+            "raw_request_data": alert_receive_channel.heartbeat_restored_payload,
+        }
+    return {
+        "title": alert_receive_channel.heartbeat_expired_title,
+        "message": alert_receive_channel.heartbeat_expired_message,
+        "image_url": None,
+        "link_to_upstream_details": None,
+        "alert_receive_channel_pk": alert_receive_channel.pk,
+        "integration_unique_data": {},
+        "raw_request_data": alert_receive_channel.heartbeat_expired_payload,
+    }
 
 
 @shared_dedicated_queue_retry_task()
@@ -100,6 +129,54 @@ def integration_heartbeat_checkup(heartbeat_id: int) -> None:
 
 @shared_dedicated_queue_retry_task()
 def process_heartbeat_task(alert_receive_channel_pk):
-    IntegrationHeartBeat.objects.filter(
-        alert_receive_channel__pk=alert_receive_channel_pk,
-    ).update(last_heartbeat_time=timezone.now())
+    """
+    Process a heartbeat ping immediately.
+    Regular pings are only recorded in cache (see record_heartbeat_ping), this task is used for expired heartbeats
+    to send an auto-resolve alert without waiting for the next check_heartbeats run.
+    """
+    with transaction.atomic():
+        heartbeat = (
+            IntegrationHeartBeat.objects.select_for_update()
+            .filter(alert_receive_channel__pk=alert_receive_channel_pk)
+            .first()
+        )
+        if heartbeat is None:
+            return
+
+        heartbeat.last_heartbeat_time = timezone.now()
+        update_fields = ["last_heartbeat_time"]
+        if heartbeat.timeout_seconds and not heartbeat.previous_alerted_state_was_life:
+            heartbeat.previous_alerted_state_was_life = True
+            update_fields.append("previous_alerted_state_was_life")
+            transaction.on_commit(lambda: _start_create_heartbeat_alerts([alert_receive_channel_pk], restored=True))
+        heartbeat.save(update_fields=update_fields)
+
+
+@shared_dedicated_queue_retry_task()
+def flush_heartbeat_pings() -> str:
+    """
+    Periodic task to write heartbeat pings recorded in cache to the database in bulk
+    """
+    updated_heartbeats = []
+    heartbeats = IntegrationHeartBeat.objects.order_by("pk").values_list(
+        "pk", "alert_receive_channel_id", "last_heartbeat_time", "timeout_seconds"
+    )
+    for batch in batch_queryset(heartbeats, HEARTBEAT_PINGS_FLUSH_BATCH_SIZE):
+        pings = get_heartbeat_pings(alert_receive_channel_pk for _, alert_receive_channel_pk, _, _ in batch)
+        for pk, alert_receive_channel_pk, last_heartbeat_time, timeout_seconds in batch:
+            ping_time = pings.get(alert_receive_channel_pk)
+            if ping_time is not None and (last_heartbeat_time is None or ping_time > last_heartbeat_time):
+                updated_heartbeats.append(
+                    IntegrationHeartBeat(
+                        pk=pk,
+                        last_heartbeat_time=ping_time,
+                        expires_at=IntegrationHeartBeat.get_expires_at(ping_time, timeout_seconds),
+                    )
+                )
+
+    IntegrationHeartBeat.objects.bulk_update(
+        updated_heartbeats,
+        fields=["last_heartbeat_time", "expires_at"],
+        batch_size=HEARTBEAT_PINGS_FLUSH_BATCH_SIZE,
+    )
+    return f"Flushed pings for {len(updated_heartbeats)} heartbeats"
@@ -4,8 +4,13 @@ import pytest
 from django.utils import timezone
 
 from apps.alerts.models import AlertReceiveChannel
-from apps.heartbeat.tasks import check_heartbeats
-from apps.integrations.tasks import create_alert
+from apps.heartbeat.tasks import (
+    check_heartbeats,
+    create_heartbeat_alerts,
+    flush_heartbeat_pings,
+    process_heartbeat_task,
+)
+from apps.heartbeat.utils import record_heartbeat_ping
 
 
 @pytest.mark.django_db
@@ -18,7 +23,7 @@ def test_check_heartbeats(
     django_capture_on_commit_callbacks,
 ):
     # No heartbeats, nothing happens
-    with patch.object(create_alert, "apply_async") as mock_create_alert_apply_async:
+    with patch.object(create_heartbeat_alerts, "apply_async") as mock_create_alert_apply_async:
         with django_capture_on_commit_callbacks(execute=True):
             result = check_heartbeats()
     assert result == "Found 0 expired and 0 restored heartbeats"
@@ -34,7 +39,7 @@ def test_check_heartbeats(
     )
 
     # Heartbeat is alive, nothing happens
-    with patch.object(create_alert, "apply_async") as mock_create_alert_apply_async:
+    with patch.object(create_heartbeat_alerts, "apply_async") as mock_create_alert_apply_async:
         with django_capture_on_commit_callbacks(execute=True):
             result = check_heartbeats()
     assert result == "Found 0 expired and 0 restored heartbeats"
@@ -44,7 +49,7 @@ def test_check_heartbeats(
     integration_heartbeat.refresh_from_db()
     integration_heartbeat.last_heartbeat_time = timezone.now() - timezone.timedelta(seconds=timeout * 10)
     integration_heartbeat.save()
-    with patch.object(create_alert, "apply_async") as mock_create_alert_apply_async:
+    with patch.object(create_heartbeat_alerts, "apply_async") as mock_create_alert_apply_async:
         with django_capture_on_commit_callbacks(execute=True):
             result = check_heartbeats()
     assert result == "Found 1 expired and 0 restored heartbeats"
@@ -52,7 +57,7 @@ def test_check_heartbeats(
 
     # Heartbeat is still expired, nothing happens
     integration_heartbeat.refresh_from_db()
-    with patch.object(create_alert, "apply_async") as mock_create_alert_apply_async:
+    with patch.object(create_heartbeat_alerts, "apply_async") as mock_create_alert_apply_async:
         with django_capture_on_commit_callbacks(execute=True):
             result = check_heartbeats()
     assert result == "Found 0 expired and 0 restored heartbeats"
@@ -62,7 +67,7 @@ def test_check_heartbeats(
     integration_heartbeat.refresh_from_db()
     integration_heartbeat.last_heartbeat_time = timezone.now()
     integration_heartbeat.save()
-    with patch.object(create_alert, "apply_async") as mock_create_alert_apply_async:
+    with patch.object(create_heartbeat_alerts, "apply_async") as mock_create_alert_apply_async:
         with django_capture_on_commit_callbacks(execute=True):
             result = check_heartbeats()
     assert result == "Found 0 expired and 1 restored heartbeats"
@@ -73,8 +78,125 @@ def test_check_heartbeats(
     integration_heartbeat.last_heartbeat_time = timezone.now()
     integration_heartbeat.save()
     integration_heartbeat.refresh_from_db()
-    with patch.object(create_alert, "apply_async") as mock_create_alert_apply_async:
+    with patch.object(create_heartbeat_alerts, "apply_async") as mock_create_alert_apply_async:
         with django_capture_on_commit_callbacks(execute=True):
             result = check_heartbeats()
     assert result == "Found 0 expired and 0 restored heartbeats"
     assert mock_create_alert_apply_async.call_count == 0
+
+
+@pytest.mark.django_db
+def test_flush_heartbeat_pings(make_organization, make_alert_receive_channel, make_integration_heartbeat):
+    organization = make_organization()
+    last_heartbeat_time = timezone.now() - timezone.timedelta(minutes=5)
+    pinged_channel = make_alert_receive_channel(organization)
+    pinged_heartbeat = make_integration_heartbeat(pinged_channel, 60, last_heartbeat_time=last_heartbeat_time)
+    idle_channel = make_alert_receive_channel(organization)
+    idle_heartbeat = make_integration_heartbeat(idle_channel, 60, last_heartbeat_time=last_heartbeat_time)
+
+    with patch.object(process_heartbeat_task, "apply_async") as mock_process_heartbeat_task:
+        record_heartbeat_ping(pinged_channel.pk)
+    # regular pings are not processed one by one
+    assert mock_process_heartbeat_task.call_count == 0
+
+    pinged_heartbeat.refresh_from_db()
+    assert pinged_heartbeat.last_heartbeat_time == last_heartbeat_time
+
+    assert flush_heartbeat_pings() == "Flushed pings for 1 heartbeats"
+    pinged_heartbeat.refresh_from_db()
+    idle_heartbeat.refresh_from_db()
+    assert pinged_heartbeat.last_heartbeat_time > last_heartbeat_time
+    assert idle_heartbeat.last_heartbeat_time == last_heartbeat_time
+
+    # ping is already in the database
+    assert flush_heartbeat_pings() == "Flushed pings for 0 heartbeats"
+
+
+@pytest.mark.django_db
+def test_check_heartbeats_flushes_pings(
+    make_organization, make_alert_receive_channel, make_integration_heartbeat, django_capture_on_commit_callbacks
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    make_integration_heartbeat(
+        alert_receive_channel, 60, last_heartbeat_time=timezone.now() - timezone.timedelta(minutes=5)
+    )
+    record_heartbeat_ping(alert_receive_channel.pk)
+
+    with patch.object(create_heartbeat_alerts, "apply_async") as mock_create_alert_apply_async:
+        with django_capture_on_commit_callbacks(execute=True):
+            result = check_heartbeats()
+    assert result == "Found 0 expired and 0 restored heartbeats"
+    assert mock_create_alert_apply_async.call_count == 0
+
+
+@pytest.mark.django_db
+def test_expired_heartbeat_ping_processed_immediately(
+    make_organization, make_alert_receive_channel, make_integration_heartbeat, django_capture_on_commit_callbacks
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    integration_heartbeat = make_integration_heartbeat(
+        alert_receive_channel, 60, last_heartbeat_time=timezone.now() - timezone.timedelta(minutes=5)
+    )
+
+    with patch.object(create_heartbeat_alerts, "apply_async"):
+        with django_capture_on_commit_callbacks(execute=True):
+            assert check_heartbeats() == "Found 1 expired and 0 restored heartbeats"
+
+    with patch.object(process_heartbeat_task, "apply_async") as mock_process_heartbeat_task:
+        record_heartbeat_ping(alert_receive_channel.pk)
+        # only the first ping after expiration is processed right away
+        record_heartbeat_ping(alert_receive_channel.pk)
+    mock_process_heartbeat_task.assert_called_once_with((alert_receive_channel.pk,))
+
+    with patch.object(create_heartbeat_alerts, "apply_async") as mock_create_heartbeat_alerts:
+        with django_capture_on_commit_callbacks(execute=True):
+            process_heartbeat_task(alert_receive_channel.pk)
+    mock_create_heartbeat_alerts.assert_called_once_with(([alert_receive_channel.pk], True))
+    integration_heartbeat.refresh_from_db()
+    assert integration_heartbeat.previous_alerted_state_was_life is True
+
+
+@pytest.mark.django_db
+def test_check_heartbeats_batches_alerts(
+    make_organization, make_alert_receive_channel, make_integration_heartbeat, django_capture_on_commit_callbacks
+):
+    organization = make_organization()
+    alert_receive_channel_pks = []
+    for _ in range(3):
+        alert_receive_channel = make_alert_receive_channel(organization)
+        make_integration_heartbeat(
+            alert_receive_channel, 60, last_heartbeat_time=timezone.now() - timezone.timedelta(minutes=5)
+        )
+        alert_receive_channel_pks.append(alert_receive_channel.pk)
+
+    with patch("apps.heartbeat.tasks.HEARTBEAT_ALERTS_BATCH_SIZE", 2):
+        with patch.object(create_heartbeat_alerts, "apply_async") as mock_create_heartbeat_alerts:
+            with django_capture_on_commit_callbacks(execute=True):
+                result = check_heartbeats()
+
+    assert result == "Found 3 expired and 0 restored heartbeats"
+    assert mock_create_heartbeat_alerts.call_count == 2
+    batched_pks = [pk for call in mock_create_heartbeat_alerts.call_args_list for pk in call.args[0][0]]
+    assert sorted(batched_pks) == sorted(alert_receive_channel_pks)
+    assert all(call.args[0][1] is False for call in mock_create_heartbeat_alerts.call_args_list)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("restored", [True, False])
+def test_create_heartbeat_alerts(make_organization, make_alert_receive_channel, restored):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(
+        organization, integration=AlertReceiveChannel.INTEGRATION_FORMATTED_WEBHOOK
+    )
+
+    with patch("apps.heartbeat.tasks.create_alert") as mock_create_alert:
+        create_heartbeat_alerts([alert_receive_channel.pk], restored)
+
+    expected_title = (
+        alert_receive_channel.heartbeat_restored_title if restored else alert_receive_channel.heartbeat_expired_title
+    )
+    assert mock_create_alert.call_count == 1
+    assert mock_create_alert.call_args.kwargs["title"] == expected_title
+    assert mock_create_alert.call_args.kwargs["alert_receive_channel_pk"] == alert_receive_channel.pk
@@ -0,0 +1,46 @@
+import datetime
+import typing
+
+from django.core.cache import cache
+from django.utils import timezone
+
+# pings are flushed to the database every minute and before every heartbeat check,
+# the timeout only matters if the flush task is not running
+HEARTBEAT_PING_CACHE_TIMEOUT = 60 * 60
+
+
+def get_heartbeat_ping_cache_key(alert_receive_channel_pk: int) -> str:
+    return f"heartbeat_ping_{alert_receive_channel_pk}"
+
+
+def get_heartbeat_expired_cache_key(alert_receive_channel_pk: int) -> str:
+    return f"heartbeat_expired_{alert_receive_channel_pk}"
+
+
+def record_heartbeat_ping(alert_receive_channel_pk: int) -> None:
+    """
+    Record the latest heartbeat ping in cache. Pings are written to the database in bulk by flush_heartbeat_pings.
+    If the heartbeat is known to be expired, process the ping right away so the auto-resolve alert is not delayed.
+    """
+    from apps.heartbeat.tasks import process_heartbeat_task
+
+    cache.set(get_heartbeat_ping_cache_key(alert_receive_channel_pk), timezone.now(), HEARTBEAT_PING_CACHE_TIMEOUT)
+
+    expired_cache_key = get_heartbeat_expired_cache_key(alert_receive_channel_pk)
+    if cache.get(expired_cache_key):
+        cache.delete(expired_cache_key)
+        process_heartbeat_task.apply_async((alert_receive_channel_pk,))
+
+
+def get_heartbeat_pings(alert_receive_channel_pks: typing.Iterable[int]) -> typing.Dict[int, datetime.datetime]:
+    """Return latest recorded pings for given integrations"""
+    cache_keys = {get_heartbeat_ping_cache_key(pk): pk for pk in alert_receive_channel_pks}
+    return {cache_keys[key]: ping_time for key, ping_time in cache.get_many(cache_keys.keys()).items()}
+
+
+def mark_heartbeats_expired(alert_receive_channel_pks: typing.Iterable[int]) -> None:
+    cache.set_many({get_heartbeat_expired_cache_key(pk): True for pk in alert_receive_channel_pks}, timeout=None)
+
+
+def mark_heartbeats_restored(alert_receive_channel_pks: typing.Iterable[int]) -> None:
+    cache.delete_many([get_heartbeat_expired_cache_key(pk) for pk in alert_receive_channel_pks])
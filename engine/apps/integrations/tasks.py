@@ -8,7 +8,6 @@ from django.core.cache import cache
 
 from apps.alerts.models.alert_group_counter import ConcurrentUpdateError
 from apps.alerts.tasks import resolve_alert_group_by_source_if_needed
-from apps.slack.client import SlackClient
 from apps.slack.errors import SlackAPIError
 from common.custom_celery_tasks import shared_dedicated_queue_retry_task
 from common.custom_celery_tasks.create_alert_base_task import CreateAlertBaseTask
@@ -141,6 +140,7 @@ def start_notify_about_integration_ratelimit(team_id, text, **kwargs):
 )
 def notify_about_integration_ratelimit_in_slack(organization_id, text, **kwargs):
     # TODO: Review ratelimits
+    from apps.slack.client import SlackClient
     from apps.user_management.models import Organization
 
     try:
@@ -11,7 +11,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.alerts.models import AlertReceiveChannel
-from apps.heartbeat.tasks import process_heartbeat_task
+from apps.heartbeat.utils import record_heartbeat_ping
 from apps.integrations.legacy_prefix import has_legacy_prefix
 from apps.integrations.mixins import (
     AlertChannelDefiningMixin,
@@ -327,6 +327,4 @@ class IntegrationHeartBeatAPIView(AlertChannelDefiningMixin, IntegrationHeartBea
         return Response(status=200)
 
     def _process_heartbeat_signal(self, request, alert_receive_channel):
-        process_heartbeat_task.apply_async(
-            (alert_receive_channel.pk,),
-        )
+        record_heartbeat_ping(alert_receive_channel.pk)
@@ -1,8 +1,10 @@
 import logging
 import typing
+from concurrent.futures import ThreadPoolExecutor
 
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 
 from apps.labels.client import LabelsAPIClient
@@ -13,6 +15,11 @@ from common.custom_celery_tasks import shared_dedicated_queue_retry_task
 logger = get_task_logger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# max number of concurrent requests to the labels API when refreshing outdated labels cache
+LABELS_CACHE_REFRESH_MAX_WORKERS = 5
+# label keys being refreshed by a worker are skipped by other workers for this time
+LABELS_CACHE_REFRESH_LOCK_TIMEOUT = 60
+
 
 class ValueData(typing.TypedDict):
     value_name: str
@@ -34,35 +41,43 @@ def unify_labels_data(labels_data: LabelsData | LabelKeyData) -> typing.Dict[str
     return values_data
 
 
-@shared_dedicated_queue_retry_task(
-    autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else None
-)
-def update_labels_cache(labels_data: LabelsData | LabelKeyData):
+def _update_labels_cache(values_data: typing.Dict[str, ValueData]) -> None:
     from apps.labels.models import LabelKeyCache, LabelValueCache
 
-    values_data: typing.Dict[str, ValueData] = unify_labels_data(labels_data)
     values = LabelValueCache.objects.filter(id__in=values_data).select_related("key")
     now = timezone.now()
 
     if not values:
         return
 
-    keys_to_update = set()
+    keys_to_update: typing.Dict[str, LabelKeyCache] = {}
 
     for value in values:
         if value.name != values_data[value.id]["value_name"]:
             value.name = values_data[value.id]["value_name"]
         value.last_synced = now
 
-        if value.key.name != values_data[value.id]["key_name"]:
-            value.key.name = values_data[value.id]["key_name"]
-        value.key.last_synced = now
-        keys_to_update.add(value.key)
+        # use the same key instance for all the values of the key
+        key = keys_to_update.setdefault(value.key_id, value.key)
+        if key.name != values_data[value.id]["key_name"]:
+            key.name = values_data[value.id]["key_name"]
+        key.last_synced = now
 
-    LabelKeyCache.objects.bulk_update(keys_to_update, fields=["name", "last_synced"])
+    LabelKeyCache.objects.bulk_update(keys_to_update.values(), fields=["name", "last_synced"])
     LabelValueCache.objects.bulk_update(values, fields=["name", "last_synced"])
 
 
+def _get_labels_cache_refresh_lock_key(key_id: str) -> str:
+    return f"labels_cache_refresh_{key_id}"
+
+
+@shared_dedicated_queue_retry_task(
+    autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else None
+)
+def update_labels_cache(labels_data: LabelsData | LabelKeyData):
+    _update_labels_cache(unify_labels_data(labels_data))
+
+
 @shared_dedicated_queue_retry_task(
     autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else 10
 )
@@ -82,10 +97,26 @@ def update_instances_labels_cache(organization_id: int, instance_ids: typing.Lis
     if not values:
         return
 
-    keys_ids = set(value.key_id for value in values)
+    # skip keys that are being refreshed by other workers at the moment
+    keys_ids = [
+        key_id
+        for key_id in set(value.key_id for value in values)
+        if cache.add(_get_labels_cache_refresh_lock_key(key_id), True, timeout=LABELS_CACHE_REFRESH_LOCK_TIMEOUT)
+    ]
+    if not keys_ids:
+        return
 
     client = LabelsAPIClient(organization.grafana_url, organization.api_token)
-    for key_id in keys_ids:
-        label_data, _ = client.get_values(key_id)
-        if label_data:
-            update_labels_cache.apply_async((label_data,))
+    try:
+        with ThreadPoolExecutor(max_workers=min(len(keys_ids), LABELS_CACHE_REFRESH_MAX_WORKERS)) as executor:
+            results = executor.map(client.get_values, keys_ids)
+
+            # merge the values of all the keys to update labels cache for the organization at once
+            values_data: typing.Dict[str, ValueData] = {}
+            for label_data, _ in results:
+                if label_data:
+                    values_data.update(unify_labels_data(label_data))
+
+        _update_labels_cache(values_data)
+    finally:
+        cache.delete_many([_get_labels_cache_refresh_lock_key(key_id) for key_id in keys_ids])
@@ -1,7 +1,7 @@
 import factory
 
 from apps.labels.models import AlertReceiveChannelAssociatedLabel, LabelKeyCache, LabelValueCache
-from common.utils import UniqueFaker
+from common.tests.factories import UniqueFaker
 
 
 class LabelKeyFactory(factory.DjangoModelFactory):
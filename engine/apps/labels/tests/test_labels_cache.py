@@ -1,10 +1,11 @@
 from unittest.mock import call, patch
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 
 from apps.labels.models import LabelKeyCache, LabelValueCache
-from apps.labels.tasks import update_instances_labels_cache, update_labels_cache
+from apps.labels.tasks import _get_labels_cache_refresh_lock_key, update_instances_labels_cache, update_labels_cache
 from apps.labels.utils import LABEL_OUTDATED_TIMEOUT_MINUTES
 
 
@@ -121,16 +122,81 @@ def test_update_instances_labels_cache_outdated(
     assert label_association.key.is_outdated
     assert label_association.value.is_outdated
 
+    new_key_name = "updatekeyname"
+    new_value_name = "updatevaluename"
     label_data = {
-        "key": {"id": label_association.key.id, "name": label_association.key.name},
-        "values": [{"id": label_association.value.id, "name": label_association.value.name}],
+        "key": {"id": label_association.key.id, "name": new_key_name},
+        "values": [{"id": label_association.value.id, "name": new_value_name}],
     }
 
     with patch("apps.labels.client.LabelsAPIClient.get_values", return_value=(label_data, None)) as mock_get_values:
-        with patch("apps.labels.tasks.update_labels_cache.apply_async") as mock_update_cache:
-            update_instances_labels_cache(
-                organization.id, [alert_receive_channel.id], alert_receive_channel._meta.model.__name__
-            )
-    assert mock_get_values.called
-    assert mock_update_cache.called
-    assert mock_update_cache.call_args == call((label_data,))
+        update_instances_labels_cache(
+            organization.id, [alert_receive_channel.id], alert_receive_channel._meta.model.__name__
+        )
+    assert mock_get_values.call_args == call(label_association.key.id)
+
+    label_association.key.refresh_from_db()
+    label_association.value.refresh_from_db()
+    assert not label_association.key.is_outdated
+    assert not label_association.value.is_outdated
+    assert label_association.key.name == new_key_name
+    assert label_association.value.name == new_value_name
+
+
+@pytest.mark.django_db
+def test_update_instances_labels_cache_outdated_multiple_keys(
+    make_organization, make_alert_receive_channel, make_integration_label_association
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    label_associations = [make_integration_label_association(organization, alert_receive_channel) for _ in range(3)]
+    outdated_last_synced = timezone.now() - timezone.timedelta(minutes=LABEL_OUTDATED_TIMEOUT_MINUTES + 1)
+    LabelKeyCache.objects.filter(organization=organization).update(last_synced=outdated_last_synced)
+    LabelValueCache.objects.filter(key__organization=organization).update(last_synced=outdated_last_synced)
+
+    labels_data = {
+        association.key_id: {
+            "key": {"id": association.key_id, "name": f"{association.key_id}-new"},
+            "values": [{"id": association.value_id, "name": f"{association.value_id}-new"}],
+        }
+        for association in label_associations
+    }
+    # the API failed for one of the keys
+    labels_data[label_associations[0].key_id] = None
+
+    with patch(
+        "apps.labels.client.LabelsAPIClient.get_values", side_effect=lambda key_id: (labels_data[key_id], None)
+    ) as mock_get_values:
+        update_instances_labels_cache(
+            organization.id, [alert_receive_channel.id], alert_receive_channel._meta.model.__name__
+        )
+    assert mock_get_values.call_count == 3
+
+    for i, association in enumerate(label_associations):
+        association.key.refresh_from_db()
+        association.value.refresh_from_db()
+        assert association.key.is_outdated == (i == 0)
+        assert association.value.is_outdated == (i == 0)
+        if i > 0:
+            assert association.key.name == f"{association.key_id}-new"
+            assert association.value.name == f"{association.value_id}-new"
+
+
+@pytest.mark.django_db
+def test_update_instances_labels_cache_refresh_in_progress(
+    make_organization, make_alert_receive_channel, make_integration_label_association
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    label_association = make_integration_label_association(organization, alert_receive_channel)
+    outdated_last_synced = timezone.now() - timezone.timedelta(minutes=LABEL_OUTDATED_TIMEOUT_MINUTES + 1)
+    LabelValueCache.objects.filter(id=label_association.value_id).update(last_synced=outdated_last_synced)
+
+    # another worker is refreshing the key
+    cache.set(_get_labels_cache_refresh_lock_key(label_association.key_id), True)
+
+    with patch("apps.labels.client.LabelsAPIClient.get_values") as mock_get_values:
+        update_instances_labels_cache(
+            organization.id, [alert_receive_channel.id], alert_receive_channel._meta.model.__name__
+        )
+    assert not mock_get_values.called
@@ -61,3 +61,45 @@ METRICS_RECALCULATION_CACHE_TIMEOUT_DISPERSE = (0, 3600)  # 1 hour
 
 METRICS_ORGANIZATIONS_IDS = "metrics_organizations_ids"
 METRICS_ORGANIZATIONS_IDS_CACHE_TIMEOUT = 3600  # 1 hour
+
+# Service-wide metrics recorded by the application itself, see InternalMetricsCollector.
+# Counter names must not end with "_total", it's added by the exporter.
+SLACK_MESSAGE_UPDATES_SENT = METRICS_PREFIX + "slack_message_updates_sent"
+SLACK_MESSAGE_UPDATES_SKIPPED = METRICS_PREFIX + "slack_message_updates_skipped"
+SLACK_ALERT_GROUP_ACTIONS_COALESCED = METRICS_PREFIX + "slack_alert_group_actions_coalesced"
+ALERT_GROUP_SIGNALS_SENT = METRICS_PREFIX + "alert_group_signals_sent"
+ALERT_GROUP_SIGNAL_DURATION_SECONDS = METRICS_PREFIX + "alert_group_signal_duration_seconds"
+HEARTBEATS_CHECKED = METRICS_PREFIX + "heartbeats_checked"
+HEARTBEATS_CHECK_DURATION_SECONDS = METRICS_PREFIX + "heartbeats_check_duration_seconds"
+MOBILE_PUSH_NOTIFICATIONS_SENT = METRICS_PREFIX + "mobile_push_notifications_sent"
+MOBILE_PUSH_NOTIFICATIONS_FAILED = METRICS_PREFIX + "mobile_push_notifications_failed"
+MOBILE_PUSH_BATCH_DURATION_SECONDS = METRICS_PREFIX + "mobile_push_batch_duration_seconds"
+ORGANIZATION_SYNC_DIFFS_APPLIED = METRICS_PREFIX + "organization_sync_diffs_applied"
+ORGANIZATION_SYNC_DIFFS_SKIPPED = METRICS_PREFIX + "organization_sync_diffs_skipped"
+
+INTERNAL_COUNTERS: typing.Dict[str, str] = {
+    SLACK_MESSAGE_UPDATES_SENT: "Alert group Slack message updates sent to Slack",
+    SLACK_MESSAGE_UPDATES_SKIPPED: "Alert group Slack message updates skipped because the message didn't change",
+    SLACK_ALERT_GROUP_ACTIONS_COALESCED: (
+        "Alert group Slack message updates skipped because a later action for the same alert group was processed"
+    ),
+    ALERT_GROUP_SIGNALS_SENT: "Alert group action signals sent to messaging representatives by send_alert_group_signal",
+    MOBILE_PUSH_NOTIFICATIONS_SENT: "New alert group mobile push notifications sent in batches",
+    MOBILE_PUSH_NOTIFICATIONS_FAILED: "New alert group mobile push notifications failed or retried",
+    ORGANIZATION_SYNC_DIFFS_APPLIED: "Organization users, teams and team members synced with the database",
+    ORGANIZATION_SYNC_DIFFS_SKIPPED: (
+        "Organization users, teams and team members syncs skipped because Grafana API response didn't change"
+    ),
+}
+INTERNAL_GAUGES: typing.Dict[str, str] = {
+    HEARTBEATS_CHECKED: "Number of enabled heartbeats checked by the latest check_heartbeats run",
+    HEARTBEATS_CHECK_DURATION_SECONDS: "Duration of the latest check_heartbeats run",
+    MOBILE_PUSH_BATCH_DURATION_SECONDS: "Duration of the latest new alert group mobile push notifications batch send",
+}
+# name: (documentation, bucket upper bounds), "+Inf" bucket is added by the exporter
+INTERNAL_HISTOGRAMS: typing.Dict[str, typing.Tuple[str, typing.Tuple[float, ...]]] = {
+    ALERT_GROUP_SIGNAL_DURATION_SECONDS: (
+        "Duration of alert group action signals sent by send_alert_group_signal",
+        (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+    ),
+}
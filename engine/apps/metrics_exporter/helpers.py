@@ -9,6 +9,7 @@ from apps.alerts.constants import AlertGroupState
 from apps.metrics_exporter.constants import (
     ALERT_GROUPS_RESPONSE_TIME,
     ALERT_GROUPS_TOTAL,
+    INTERNAL_HISTOGRAMS,
     METRICS_CACHE_LIFETIME,
     METRICS_CACHE_TIMER,
     METRICS_ORGANIZATIONS_IDS,
@@ -295,3 +296,46 @@ def metrics_update_user_cache(user):
     )["counter"] += 1
 
     cache.set(metric_user_was_notified_key, metric_user_was_notified, timeout=metrics_cache_timeout)
+
+
+def get_internal_metric_key(metric_name: str) -> str:
+    return f"internal_metric_{metric_name}"
+
+
+def get_internal_histogram_bucket_key(metric_name: str, bucket: str) -> str:
+    return f"{get_internal_metric_key(metric_name)}_bucket_{bucket}"
+
+
+def get_internal_histogram_sum_key(metric_name: str) -> str:
+    return f"{get_internal_metric_key(metric_name)}_sum_us"
+
+
+def metrics_increment_internal_counter(metric_name: str, value: int = 1) -> None:
+    """Increment service-wide counter, see INTERNAL_COUNTERS"""
+    _increment_internal_metric_key(get_internal_metric_key(metric_name), value)
+
+
+def metrics_observe_internal_histogram(metric_name: str, value: float) -> None:
+    """
+    Record an observation of service-wide histogram, see INTERNAL_HISTOGRAMS.
+    Only the bucket the value falls into is incremented, buckets are made cumulative by InternalMetricsCollector.
+    """
+    _, buckets = INTERNAL_HISTOGRAMS[metric_name]
+    bucket = next((str(upper_bound) for upper_bound in buckets if value <= upper_bound), "+Inf")
+    _increment_internal_metric_key(get_internal_histogram_bucket_key(metric_name, bucket))
+    # cache.incr works with integers only, so the sum is stored in microseconds
+    _increment_internal_metric_key(get_internal_histogram_sum_key(metric_name), round(value * 1_000_000))
+
+
+def _increment_internal_metric_key(key: str, value: int = 1) -> None:
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key, value)
+    except ValueError:
+        # key was evicted between add and incr
+        cache.set(key, value, timeout=None)
+
+
+def metrics_set_internal_gauge(metric_name: str, value: int | float) -> None:
+    """Set service-wide gauge value, see INTERNAL_GAUGES"""
+    cache.set(get_internal_metric_key(metric_name), value, timeout=None)
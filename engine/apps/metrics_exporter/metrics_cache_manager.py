@@ -93,3 +93,26 @@ class MetricsCacheManager:
             MetricsCacheManager.metrics_update_state_cache_for_alert_group(
                 integration_id, organization_id, old_state, new_state
             )
+
+    @staticmethod
+    def metrics_update_cache_for_alert_groups(organization_id, alert_groups_diff):
+        """
+        Update state and response time metrics cache for multiple alert groups at once, applying one aggregated
+        diff per integration. `alert_groups_diff` is a list of
+        (integration_id, old_state, new_state, response_time, started_at) tuples.
+        """
+        metrics_state_diff = {}
+        metrics_response_time = {}
+        response_time_period = get_response_time_period()
+        for integration_id, old_state, new_state, response_time, started_at in alert_groups_diff:
+            if response_time and old_state == AlertGroupState.FIRING and started_at > response_time_period:
+                MetricsCacheManager.update_integration_response_time_diff(
+                    metrics_response_time, integration_id, int(response_time.total_seconds())
+                )
+            if old_state or new_state:
+                MetricsCacheManager.update_integration_states_diff(
+                    metrics_state_diff, integration_id, previous_state=old_state, new_state=new_state
+                )
+
+        metrics_update_alert_groups_response_time_cache(metrics_response_time, organization_id)
+        metrics_update_alert_groups_state_cache(metrics_state_diff, organization_id)
@@ -4,11 +4,15 @@ import typing
 from django.core.cache import cache
 from prometheus_client import CollectorRegistry
 from prometheus_client.metrics_core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+from prometheus_client.utils import floatToGoString
 
 from apps.alerts.constants import AlertGroupState
 from apps.metrics_exporter.constants import (
     ALERT_GROUPS_RESPONSE_TIME,
     ALERT_GROUPS_TOTAL,
+    INTERNAL_COUNTERS,
+    INTERNAL_GAUGES,
+    INTERNAL_HISTOGRAMS,
     USER_WAS_NOTIFIED_OF_ALERT_GROUPS,
     AlertGroupsResponseTimeMetricsDict,
     AlertGroupsTotalMetricsDict,
@@ -16,6 +20,9 @@ from apps.metrics_exporter.constants import (
     UserWasNotifiedOfAlertGroupsMetricsDict,
 )
 from apps.metrics_exporter.helpers import (
+    get_internal_histogram_bucket_key,
+    get_internal_histogram_sum_key,
+    get_internal_metric_key,
     get_metric_alert_groups_response_time_key,
     get_metric_alert_groups_total_key,
     get_metric_calculation_started_key,
@@ -193,4 +200,39 @@ class ApplicationMetricsCollector:
         return buckets_values, sum_value
 
 
+class InternalMetricsCollector:
+    """
+    Service-wide counters, gauges and histograms recorded with metrics_increment_internal_counter,
+    metrics_set_internal_gauge and metrics_observe_internal_histogram
+    """
+
+    def collect(self):
+        metric_keys = [get_internal_metric_key(metric_name) for metric_name in (*INTERNAL_COUNTERS, *INTERNAL_GAUGES)]
+        for metric_name, (_, buckets) in INTERNAL_HISTOGRAMS.items():
+            metric_keys += [
+                get_internal_histogram_bucket_key(metric_name, bucket) for bucket in (*map(str, buckets), "+Inf")
+            ]
+            metric_keys.append(get_internal_histogram_sum_key(metric_name))
+        values = cache.get_many(metric_keys)
+
+        for metric_name, documentation in INTERNAL_COUNTERS.items():
+            yield CounterMetricFamily(
+                metric_name, documentation, value=values.get(get_internal_metric_key(metric_name), 0)
+            )
+        for metric_name, documentation in INTERNAL_GAUGES.items():
+            yield GaugeMetricFamily(
+                metric_name, documentation, value=values.get(get_internal_metric_key(metric_name), 0)
+            )
+        for metric_name, (documentation, buckets) in INTERNAL_HISTOGRAMS.items():
+            # buckets are stored non-cumulative, see metrics_observe_internal_histogram
+            cumulative_buckets = []
+            count = 0
+            for bucket in (*map(str, buckets), "+Inf"):
+                count += values.get(get_internal_histogram_bucket_key(metric_name, bucket), 0)
+                cumulative_buckets.append((floatToGoString(bucket), count))
+            sum_value = values.get(get_internal_histogram_sum_key(metric_name), 0) / 1_000_000
+            yield HistogramMetricFamily(metric_name, documentation, buckets=cumulative_buckets, sum_value=sum_value)
+
+
 application_metrics_registry.register(ApplicationMetricsCollector())
+application_metrics_registry.register(InternalMetricsCollector())
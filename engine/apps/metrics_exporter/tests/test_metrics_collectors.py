@@ -5,11 +5,15 @@ from prometheus_client import CollectorRegistry, generate_latest
 
 from apps.alerts.constants import AlertGroupState
 from apps.metrics_exporter.constants import (
+    ALERT_GROUP_SIGNAL_DURATION_SECONDS,
     ALERT_GROUPS_RESPONSE_TIME,
     ALERT_GROUPS_TOTAL,
+    INTERNAL_COUNTERS,
+    SLACK_MESSAGE_UPDATES_SENT,
     USER_WAS_NOTIFIED_OF_ALERT_GROUPS,
 )
-from apps.metrics_exporter.metrics_collectors import ApplicationMetricsCollector
+from apps.metrics_exporter.helpers import metrics_increment_internal_counter, metrics_observe_internal_histogram
+from apps.metrics_exporter.metrics_collectors import ApplicationMetricsCollector, InternalMetricsCollector
 
 
 @patch("apps.metrics_exporter.metrics_collectors.get_organization_ids", return_value=[1])
@@ -38,3 +42,40 @@ def test_application_metrics_collector(
     # Since there is no recalculation timer for test org in cache, start_calculate_and_cache_metrics must be called
     assert mocked_start_calculate_and_cache_metrics.called
     test_metrics_registry.unregister(collector)
+
+
+@pytest.mark.django_db
+def test_internal_metrics_collector():
+    metrics_increment_internal_counter(SLACK_MESSAGE_UPDATES_SENT)
+    metrics_increment_internal_counter(SLACK_MESSAGE_UPDATES_SENT, 2)
+
+    test_metrics_registry = CollectorRegistry()
+    test_metrics_registry.register(InternalMetricsCollector())
+    samples = {sample.name: sample.value for metric in test_metrics_registry.collect() for sample in metric.samples}
+
+    assert samples[f"{SLACK_MESSAGE_UPDATES_SENT}_total"] == 3
+    # counters that were never incremented are reported as 0
+    assert len([name for name in samples if name.endswith("_total")]) == len(INTERNAL_COUNTERS)
+
+
+@pytest.mark.django_db
+def test_internal_metrics_collector_histogram():
+    for value in (0.01, 0.07, 0.07, 100):
+        metrics_observe_internal_histogram(ALERT_GROUP_SIGNAL_DURATION_SECONDS, value)
+
+    test_metrics_registry = CollectorRegistry()
+    test_metrics_registry.register(InternalMetricsCollector())
+    samples = {
+        (sample.name, sample.labels.get("le")): sample.value
+        for metric in test_metrics_registry.collect()
+        for sample in metric.samples
+        if metric.name == ALERT_GROUP_SIGNAL_DURATION_SECONDS
+    }
+
+    # buckets are cumulative
+    assert samples[(f"{ALERT_GROUP_SIGNAL_DURATION_SECONDS}_bucket", "0.05")] == 1
+    assert samples[(f"{ALERT_GROUP_SIGNAL_DURATION_SECONDS}_bucket", "0.1")] == 3
+    assert samples[(f"{ALERT_GROUP_SIGNAL_DURATION_SECONDS}_bucket", "30.0")] == 3
+    assert samples[(f"{ALERT_GROUP_SIGNAL_DURATION_SECONDS}_bucket", "+Inf")] == 4
+    assert samples[(f"{ALERT_GROUP_SIGNAL_DURATION_SECONDS}_count", None)] == 4
+    assert samples[(f"{ALERT_GROUP_SIGNAL_DURATION_SECONDS}_sum", None)] == pytest.approx(100.15)
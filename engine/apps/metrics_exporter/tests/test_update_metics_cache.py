@@ -4,6 +4,7 @@ import pytest
 from django.core.cache import cache
 from django.test import override_settings
 
+from apps.alerts.models import AlertGroup
 from apps.alerts.tasks import notify_user_task
 from apps.base.models import UserNotificationPolicy, UserNotificationPolicyLogRecord
 from apps.metrics_exporter.helpers import (
@@ -227,6 +228,52 @@ def test_update_metric_alert_groups_response_time_cache_on_action(
         get_called_arg_index_and_compare_results()
 
 
+@patch("apps.alerts.models.alert_group.send_alert_group_signal_for_bulk_action")
+@pytest.mark.django_db
+def test_update_metrics_cache_on_bulk_action(
+    mocked_bulk_action_signal_task,
+    make_organization,
+    make_user_for_organization,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+    monkeypatch,
+    make_metrics_cache_params,
+):
+    organization = make_organization(
+        org_id=METRICS_TEST_ORG_ID,
+        stack_slug=METRICS_TEST_INSTANCE_SLUG,
+        stack_id=METRICS_TEST_INSTANCE_ID,
+    )
+    user = make_user_for_organization(organization)
+    alert_receive_channel = make_alert_receive_channel(organization, verbal_name=METRICS_TEST_INTEGRATION_NAME)
+    alert_groups = [make_alert_group(alert_receive_channel) for _ in range(3)]
+    for alert_group in alert_groups:
+        make_alert(alert_group=alert_group, raw_request_data={})
+
+    metric_alert_groups_total_key = get_metric_alert_groups_total_key(organization.id)
+    metric_alert_groups_response_time_key = get_metric_alert_groups_response_time_key(organization.id)
+
+    metrics_cache = make_metrics_cache_params(alert_receive_channel.id, organization.id)
+    monkeypatch.setattr(cache, "get", metrics_cache)
+
+    with patch("apps.metrics_exporter.tasks.cache.set") as mock_cache_set:
+        AlertGroup.bulk_resolve(user, AlertGroup.objects.filter(pk__in=[ag.pk for ag in alert_groups]))
+
+    # metrics cache is updated once for all the alert groups
+    total_calls = [c for c in mock_cache_set.call_args_list if c.args[0] == metric_alert_groups_total_key]
+    assert len(total_calls) == 1
+    integration_total = total_calls[0].args[1][alert_receive_channel.id]
+    assert integration_total["resolved"] == 3
+    assert integration_total["firing"] == 0
+
+    response_time_calls = [
+        c for c in mock_cache_set.call_args_list if c.args[0] == metric_alert_groups_response_time_key
+    ]
+    assert len(response_time_calls) == 1
+    assert len(response_time_calls[0].args[1][alert_receive_channel.id]["response_time"]) == 3
+
+
 @pytest.mark.django_db
 def test_update_metrics_cache_on_update_integration(
     make_organization,
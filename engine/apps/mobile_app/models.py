@@ -38,6 +38,14 @@ class FCMDevice(BaseFCMDevice):
     def get_active_device_for_user(cls, user: "User") -> FCMDevice | None:
         return cls.active_objects.filter(user=user).first()
 
+    @classmethod
+    def get_active_devices_for_users(cls, user_pks: typing.Iterable[int]) -> typing.Dict[int, FCMDevice]:
+        """Same as get_active_device_for_user for multiple users at once, returns {user_pk: device}"""
+        devices: typing.Dict[int, FCMDevice] = {}
+        for device in cls.active_objects.filter(user_id__in=user_pks).order_by("pk"):
+            devices.setdefault(device.user_id, device)
+        return devices
+
 
 class MobileAppVerificationTokenQueryset(models.QuerySet):
     def filter(self, *args, **kwargs):
@@ -176,6 +184,20 @@ class MobileAppUserSettings(models.Model):
     locale = models.CharField(max_length=50, null=True)
     time_zone = models.CharField(max_length=100, default="UTC")
 
+    @classmethod
+    def get_or_create_for_users(cls, user_pks: typing.Iterable[int]) -> typing.Dict[int, MobileAppUserSettings]:
+        """Same as get_or_create for multiple users at once, returns {user_pk: settings}"""
+        user_pks = set(user_pks)
+        user_settings = {settings.user_id: settings for settings in cls.objects.filter(user_id__in=user_pks)}
+        missing_user_pks = user_pks - user_settings.keys()
+        if missing_user_pks:
+            # settings can be created concurrently, so refetch instead of relying on bulk_create results
+            cls.objects.bulk_create([cls(user_id=user_pk) for user_pk in missing_user_pks], ignore_conflicts=True)
+            user_settings.update(
+                {settings.user_id: settings for settings in cls.objects.filter(user_id__in=missing_user_pks)}
+            )
+        return user_settings
+
     def get_notification_sound_name(self, message_type: MessageType, platform: Platform) -> str:
         sound_name = {
             MessageType.DEFAULT: self.default_notification_sound_name,
@@ -1,4 +1,5 @@
 import datetime
+import hashlib
 import json
 import logging
 import math
@@ -25,6 +26,14 @@ if typing.TYPE_CHECKING:
 logger = get_task_logger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# notifications are sent for shifts starting within this time,
+# should be updated if user's notification timing preference is taken into account again (see _should_we_send_push_notification)
+GOING_ONCALL_NOTIFICATION_WINDOW_SECONDS = 15 * 60
+PUSH_NOTIFICATION_TRACKING_CACHE_KEY_TTL = 60 * 60  # 60 minutes
+# schedule final events are recalculated at least this often, even if the schedule iCal files don't change,
+# to pick up changes in users matched by the events
+SCHEDULE_TIMELINE_CACHE_KEY_TTL = 60 * 60  # 60 minutes
+
 
 def _get_notification_title(seconds_until_going_oncall: int) -> str:
     return f"Your on-call shift starts in {humanize.naturaldelta(seconds_until_going_oncall)}"
@@ -60,13 +69,15 @@ def _get_fcm_message(
     device_to_notify: "FCMDevice",
     seconds_until_going_oncall: int,
     schedule_event: ScheduleEvent,
+    mobile_app_user_settings: typing.Optional["MobileAppUserSettings"] = None,
 ) -> Message:
     # avoid circular import
     from apps.mobile_app.models import MobileAppUserSettings
 
     thread_id = f"{schedule.public_primary_key}:{user.public_primary_key}:going-oncall"
 
-    mobile_app_user_settings, _ = MobileAppUserSettings.objects.get_or_create(user=user)
+    if mobile_app_user_settings is None:
+        mobile_app_user_settings, _ = MobileAppUserSettings.objects.get_or_create(user=user)
     notification_title = _get_notification_title(seconds_until_going_oncall)
     notification_subtitle = _get_notification_subtitle(schedule, schedule_event, mobile_app_user_settings)
 
@@ -121,7 +132,6 @@ def _should_we_send_push_notification(
     an `int` which represents the # of seconds until the oncall shift starts.
     """
     NOTIFICATION_TIMING_BUFFER = 7 * 60  # 7 minutes in seconds
-    FIFTEEN_MINUTES_IN_SECONDS = 15 * 60
 
     # this _should_ always be positive since final_events is returning only events in the future
     seconds_until_shift_starts = math.floor((schedule_event["start"] - now).total_seconds())
@@ -142,7 +152,7 @@ def _should_we_send_push_notification(
         timing_window_lower, timing_window_upper, seconds_until_shift_starts
     )
     shift_starts_within_fifteen_minutes = _shift_starts_within_range(
-        0, FIFTEEN_MINUTES_IN_SECONDS, seconds_until_shift_starts
+        0, GOING_ONCALL_NOTIFICATION_WINDOW_SECONDS, seconds_until_shift_starts
     )
 
     timing_logging_msg = (
@@ -167,15 +177,27 @@ def _generate_cache_key(user_pk: str, schedule_event: ScheduleEvent) -> str:
     return f"going_oncall_push_notification:{user_pk}:{schedule_event['shift']['pk']}"
 
 
+def _get_schedule_timeline_digest(schedule: OnCallSchedule) -> str:
+    """
+    Digest of the cached schedule iCal files, final events are the same as long as the digest doesn't change.
+    Cached files are dropped or refreshed whenever shifts, overrides or imported calendars change.
+    """
+    digest = hashlib.md5()
+    for ical_file in (schedule.cached_ical_file_primary, schedule.cached_ical_file_overrides):
+        digest.update((ical_file or "").encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _generate_schedule_timeline_cache_key(schedule_pk: int) -> str:
+    return f"going_oncall_push_notification_timeline:{schedule_pk}"
+
+
 @shared_dedicated_queue_retry_task(autoretry_for=(Exception,), retry_backoff=True, max_retries=MAX_RETRIES)
 def conditionally_send_going_oncall_push_notifications_for_schedule(schedule_pk) -> None:
     # avoid circular import
     from apps.mobile_app.models import FCMDevice, MobileAppUserSettings
 
-    PUSH_NOTIFICATION_TRACKING_CACHE_KEY_TTL = 60 * 60  # 60 minutes
-    user_cache: typing.Dict[str, User] = {}
-    device_cache: typing.Dict[str, "FCMDevice"] = {}
-
     logger.info(f"Start calculate_going_oncall_push_notifications_for_schedule for schedule {schedule_pk}")
 
     try:
@@ -185,53 +207,96 @@ def conditionally_send_going_oncall_push_notifications_for_schedule(schedule_pk)
         return
 
     now = timezone.now()
+
+    # skip schedules with no shifts starting soon, as long as the timeline is the same as on the previous run
+    timeline_cache_key = _generate_schedule_timeline_cache_key(schedule_pk)
+    timeline = cache.get(timeline_cache_key)
+    if (
+        timeline is not None
+        and timeline["digest"] == _get_schedule_timeline_digest(schedule)
+        and (timeline["next_shift_start"] - now).total_seconds() > GOING_ONCALL_NOTIFICATION_WINDOW_SECONDS
+    ):
+        logger.info(f"Skipping schedule {schedule_pk}, timeline didn't change and no shifts are starting soon")
+        return
+
     datetime_end = now + datetime.timedelta(days=7)
     schedule_final_events = schedule.final_events(now, datetime_end)
 
+    next_shift_start = min(
+        (e["start"] for e in schedule_final_events if e["users"] and e["start"] > now), default=datetime_end
+    )
+    cache.set(
+        timeline_cache_key,
+        {"digest": _get_schedule_timeline_digest(schedule), "next_shift_start": next_shift_start},
+        SCHEDULE_TIMELINE_CACHE_KEY_TTL,
+    )
+
+    # only shifts starting soon can get a notification on this run
+    upcoming_events = [
+        e
+        for e in schedule_final_events
+        if e["users"]
+        and _shift_starts_within_range(
+            0, GOING_ONCALL_NOTIFICATION_WINDOW_SECONDS, math.floor((e["start"] - now).total_seconds())
+        )
+    ]
+    if not upcoming_events:
+        return
+
+    users = {
+        user.public_primary_key: user
+        for user in User.objects.filter(
+            public_primary_key__in={user["pk"] for e in upcoming_events for user in e["users"]}
+        )
+    }
+    user_ids = [user.pk for user in users.values()]
+    devices = FCMDevice.get_active_devices_for_users(user_ids)
+    mobile_app_user_settings = MobileAppUserSettings.get_or_create_for_users(
+        [user_id for user_id in user_ids if user_id in devices]
+    )
+
     relevant_cache_keys = [
         _generate_cache_key(user["pk"], schedule_event)
-        for schedule_event in schedule_final_events
+        for schedule_event in upcoming_events
         for user in schedule_event["users"]
     ]
-
     relevant_notifications_already_sent = cache.get_many(relevant_cache_keys)
+    sent_notifications = set()
 
-    for schedule_event in schedule_final_events:
-        users = schedule_event["users"]
-
-        for user in users:
+    for schedule_event in upcoming_events:
+        for user in schedule_event["users"]:
             user_pk = user["pk"]
 
-            user = user_cache.get(user_pk, None)
+            user = users.get(user_pk)
             if user is None:
-                try:
-                    user = User.objects.get(public_primary_key=user_pk)
-                    user_cache[user_pk] = user
-                except User.DoesNotExist:
-                    logger.warning(f"User {user_pk} does not exist")
-                    continue
-
-            device_to_notify = device_cache.get(user_pk, None)
-            if device_to_notify is None:
-                device_to_notify = FCMDevice.get_active_device_for_user(user)
+                logger.warning(f"User {user_pk} does not exist")
+                continue
 
-                if not device_to_notify:
-                    continue
-                else:
-                    device_cache[user_pk] = device_to_notify
-
-            mobile_app_user_settings, _ = MobileAppUserSettings.objects.get_or_create(user=user)
+            device_to_notify = devices.get(user.pk)
+            if not device_to_notify:
+                continue
 
             cache_key = _generate_cache_key(user_pk, schedule_event)
-            already_sent_this_push_notification = cache_key in relevant_notifications_already_sent
+            already_sent_this_push_notification = (
+                cache_key in relevant_notifications_already_sent or cache_key in sent_notifications
+            )
             seconds_until_going_oncall = _should_we_send_push_notification(
-                now, mobile_app_user_settings, schedule_event
+                now, mobile_app_user_settings[user.pk], schedule_event
             )
 
             if seconds_until_going_oncall is not None and not already_sent_this_push_notification:
-                message = _get_fcm_message(user, schedule, device_to_notify, seconds_until_going_oncall, schedule_event)
+                message = _get_fcm_message(
+                    user,
+                    schedule,
+                    device_to_notify,
+                    seconds_until_going_oncall,
+                    schedule_event,
+                    mobile_app_user_settings=mobile_app_user_settings[user.pk],
+                )
                 send_push_notification(device_to_notify, message)
+                # mark as sent right away, so the notification is not sent again if the task is retried
                 cache.set(cache_key, True, PUSH_NOTIFICATION_TRACKING_CACHE_KEY_TTL)
+                sent_notifications.add(cache_key)
             else:
                 logger.info(
                     f"Skipping sending going oncall push notification for user {user_pk} and shift {schedule_event['shift']['pk']}. "
@@ -1,35 +1,64 @@
 import json
 import logging
+import time
 import typing
 
 from celery.utils.log import get_task_logger
 from firebase_admin.messaging import APNSPayload, Aps, ApsAlert, CriticalSound, Message
 
 from apps.alerts.models import AlertGroup
+from apps.metrics_exporter.constants import (
+    MOBILE_PUSH_BATCH_DURATION_SECONDS,
+    MOBILE_PUSH_NOTIFICATIONS_FAILED,
+    MOBILE_PUSH_NOTIFICATIONS_SENT,
+)
+from apps.metrics_exporter.helpers import metrics_increment_internal_counter, metrics_set_internal_gauge
 from apps.mobile_app.alert_rendering import get_push_notification_subtitle
 from apps.mobile_app.types import FCMMessageData, MessageType, Platform
-from apps.mobile_app.utils import MAX_RETRIES, construct_fcm_message, send_push_notification
+from apps.mobile_app.utils import (
+    FCM_MAX_MESSAGES_PER_BATCH,
+    MAX_RETRIES,
+    PushNotificationStatus,
+    construct_fcm_message,
+    send_push_notification,
+    send_push_notifications,
+)
 from apps.user_management.models import User
+from common.cache_queue import CacheBatchQueue
 from common.custom_celery_tasks import shared_dedicated_queue_retry_task
 
 if typing.TYPE_CHECKING:
-    from apps.mobile_app.models import FCMDevice
+    from apps.mobile_app.models import FCMDevice, MobileAppUserSettings
 
 
 logger = get_task_logger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# push notifications for the same alert group queued within this time are sent in a single batch
+NEW_ALERT_GROUP_PUSH_BATCH_WINDOW_SECONDS = 1
+new_alert_group_push_queue = CacheBatchQueue("new_alert_group_push_notifications")
+
 
-def _get_fcm_message(alert_group: AlertGroup, user: User, device_to_notify: "FCMDevice", critical: bool) -> Message:
+def _get_fcm_message(
+    alert_group: AlertGroup,
+    user: User,
+    device_to_notify: "FCMDevice",
+    critical: bool,
+    mobile_app_user_settings: typing.Optional["MobileAppUserSettings"] = None,
+    number_of_alerts: typing.Optional[int] = None,
+    alert_subtitle: typing.Optional[str] = None,
+) -> Message:
     # avoid circular import
     from apps.mobile_app.models import MobileAppUserSettings
 
     thread_id = f"{alert_group.channel.organization.public_primary_key}:{alert_group.public_primary_key}"
 
     alert_title = "New Important Alert" if critical else "New Alert"
-    alert_subtitle = get_push_notification_subtitle(alert_group)
+    if alert_subtitle is None:
+        alert_subtitle = get_push_notification_subtitle(alert_group)
 
-    mobile_app_user_settings, _ = MobileAppUserSettings.objects.get_or_create(user=user)
+    if mobile_app_user_settings is None:
+        mobile_app_user_settings, _ = MobileAppUserSettings.objects.get_or_create(user=user)
 
     # critical defines the type of notification.
     # we use overrideDND to establish if the notification should sound even if DND is on
@@ -68,7 +97,8 @@ def _get_fcm_message(alert_group: AlertGroup, user: User, device_to_notify: "FCM
         "important_notification_override_dnd": json.dumps(mobile_app_user_settings.important_notification_override_dnd),
     }
 
-    number_of_alerts = alert_group.alerts.count()
+    if number_of_alerts is None:
+        number_of_alerts = alert_group.alerts.count()
     apns_payload = APNSPayload(
         aps=Aps(
             thread_id=thread_id,
@@ -89,10 +119,33 @@ def _get_fcm_message(alert_group: AlertGroup, user: User, device_to_notify: "FCM
     return construct_fcm_message(message_type, device_to_notify, thread_id, fcm_message_data, apns_payload)
 
 
+def _create_error_log_records(alert_group, notifications):
+    # avoid circular import
+    from apps.alerts.models import AlertGroupInvolvedUser
+    from apps.base.models import UserNotificationPolicyLogRecord
+
+    # bulk_create doesn't send post_save signals, so add the involved users explicitly
+    AlertGroupInvolvedUser.objects.add((user.pk, alert_group.pk) for user, _ in notifications)
+    UserNotificationPolicyLogRecord.objects.bulk_create(
+        [
+            UserNotificationPolicyLogRecord(
+                author=user,
+                type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_FAILED,
+                notification_policy=notification_policy,
+                alert_group=alert_group,
+                reason="Mobile push notification error",
+                notification_step=notification_policy.step,
+                notification_channel=notification_policy.notify_by,
+            )
+            for user, notification_policy in notifications
+        ]
+    )
+
+
 @shared_dedicated_queue_retry_task(autoretry_for=(Exception,), retry_backoff=True, max_retries=MAX_RETRIES)
 def notify_user_about_new_alert_group(user_pk, alert_group_pk, notification_policy_pk, critical):
     # avoid circular import
-    from apps.base.models import UserNotificationPolicy, UserNotificationPolicyLogRecord
+    from apps.base.models import UserNotificationPolicy
     from apps.mobile_app.models import FCMDevice
 
     try:
@@ -117,15 +170,7 @@ def notify_user_about_new_alert_group(user_pk, alert_group_pk, notification_poli
         """
         Utility method to create a UserNotificationPolicyLogRecord with error
         """
-        UserNotificationPolicyLogRecord.objects.create(
-            author=user,
-            type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_FAILED,
-            notification_policy=notification_policy,
-            alert_group=alert_group,
-            reason="Mobile push notification error",
-            notification_step=notification_policy.step,
-            notification_channel=notification_policy.notify_by,
-        )
+        _create_error_log_records(alert_group, [(user, notification_policy)])
 
     device_to_notify = FCMDevice.get_active_device_for_user(user)
 
@@ -137,3 +182,118 @@ def notify_user_about_new_alert_group(user_pk, alert_group_pk, notification_poli
 
     message = _get_fcm_message(alert_group, user, device_to_notify, critical)
     send_push_notification(device_to_notify, message, _create_error_log_record)
+
+
+def queue_new_alert_group_push_notification(user_pk, alert_group_pk, notification_policy_pk, critical):
+    """
+    Queue a push notification to be sent by notify_users_about_new_alert_group together with the other notifications
+    for the same alert group queued within NEW_ALERT_GROUP_PUSH_BATCH_WINDOW_SECONDS.
+    """
+    if new_alert_group_push_queue.push(alert_group_pk, (user_pk, notification_policy_pk, critical)):
+        notify_users_about_new_alert_group.apply_async(
+            (alert_group_pk,), countdown=NEW_ALERT_GROUP_PUSH_BATCH_WINDOW_SECONDS
+        )
+
+
+@shared_dedicated_queue_retry_task(autoretry_for=(Exception,), retry_backoff=True, max_retries=MAX_RETRIES)
+def notify_users_about_new_alert_group(alert_group_pk):
+    """Send the push notifications queued for the alert group by queue_new_alert_group_push_notification"""
+    # avoid circular import
+    from apps.base.models import UserNotificationPolicy
+    from apps.mobile_app.models import FCMDevice, MobileAppUserSettings
+
+    with new_alert_group_push_queue.pop(alert_group_pk) as queued_notifications:
+        if queued_notifications is None:
+            # notifications are being sent by another task, try again later
+            notify_users_about_new_alert_group.apply_async(
+                (alert_group_pk,), countdown=NEW_ALERT_GROUP_PUSH_BATCH_WINDOW_SECONDS
+            )
+            return
+
+        if queued_notifications.pending:
+            # some notifications are not stored yet, send them with the next task
+            notify_users_about_new_alert_group.apply_async(
+                (alert_group_pk,), countdown=NEW_ALERT_GROUP_PUSH_BATCH_WINDOW_SECONDS
+            )
+
+        if not queued_notifications:
+            return
+
+        try:
+            alert_group = AlertGroup.objects.select_related("channel__organization").get(pk=alert_group_pk)
+        except AlertGroup.DoesNotExist:
+            logger.warning(f"Alert group {alert_group_pk} does not exist")
+            return
+
+        user_pks = {user_pk for user_pk, _, _ in queued_notifications}
+        users = User.objects.in_bulk(user_pks)
+        notification_policies = UserNotificationPolicy.objects.in_bulk({pk for _, pk, _ in queued_notifications})
+
+        devices = FCMDevice.get_active_devices_for_users(user_pks)
+        mobile_app_user_settings = MobileAppUserSettings.get_or_create_for_users(user_pks)
+
+        # render the alert group once for all the users
+        number_of_alerts = alert_group.alerts.count()
+        alert_subtitle = get_push_notification_subtitle(alert_group)
+        notifications = []
+        devices_and_messages = []
+        failed_notifications = []
+        for queue_index, (user_pk, notification_policy_pk, critical) in enumerate(queued_notifications):
+            user = users.get(user_pk)
+            notification_policy = notification_policies.get(notification_policy_pk)
+            if user is None or notification_policy is None:
+                logger.warning(f"User {user_pk} or user notification policy {notification_policy_pk} does not exist")
+                continue
+
+            device_to_notify = devices.get(user_pk)
+            # create an error log in case user has no devices set up
+            if not device_to_notify:
+                failed_notifications.append((user, notification_policy))
+                logger.error(f"Error while sending a mobile push notification: user {user_pk} has no device set up")
+                continue
+
+            message = _get_fcm_message(
+                alert_group,
+                user,
+                device_to_notify,
+                critical,
+                mobile_app_user_settings=mobile_app_user_settings[user_pk],
+                number_of_alerts=number_of_alerts,
+                alert_subtitle=alert_subtitle,
+            )
+            notifications.append((queue_index, user, notification_policy, critical))
+            devices_and_messages.append((device_to_notify, message))
+
+        sent_count = 0
+        duration = 0.0
+        for i in range(0, len(devices_and_messages), FCM_MAX_MESSAGES_PER_BATCH):
+            start = time.perf_counter()
+            statuses = send_push_notifications(devices_and_messages[i : i + FCM_MAX_MESSAGES_PER_BATCH])
+            duration += time.perf_counter() - start
+
+            for (queue_index, user, notification_policy, critical), status in zip(
+                notifications[i : i + FCM_MAX_MESSAGES_PER_BATCH], statuses
+            ):
+                if status == PushNotificationStatus.SENT:
+                    sent_count += 1
+                elif status == PushNotificationStatus.FAILED:
+                    # error log records are created after sending, notification is processed again on task retry
+                    failed_notifications.append((user, notification_policy))
+                    continue
+                else:
+                    # retry separately, so other users don't get duplicate notifications
+                    notify_user_about_new_alert_group.apply_async(
+                        kwargs={
+                            "user_pk": user.pk,
+                            "alert_group_pk": alert_group_pk,
+                            "notification_policy_pk": notification_policy.pk,
+                            "critical": critical,
+                        },
+                    )
+                # don't send the notification again if the task is retried after an error
+                queued_notifications.mark_processed(queue_index)
+        metrics_set_internal_gauge(MOBILE_PUSH_BATCH_DURATION_SECONDS, duration)
+
+        _create_error_log_records(alert_group, failed_notifications)
+        metrics_increment_internal_counter(MOBILE_PUSH_NOTIFICATIONS_SENT, sent_count)
+        metrics_increment_internal_counter(MOBILE_PUSH_NOTIFICATIONS_FAILED, len(notifications) - sent_count)
@@ -407,8 +407,8 @@ def test_conditionally_send_going_oncall_push_notifications_for_schedule(
     mock_fcm_message = {"foo": "bar"}
 
     schedule_event = _create_schedule_event(
-        timezone.now(),
-        timezone.now(),
+        timezone.now() + timezone.timedelta(minutes=5),
+        timezone.now() + timezone.timedelta(hours=1),
         shift_pk,
         [
             {
@@ -438,7 +438,14 @@ def test_conditionally_send_going_oncall_push_notifications_for_schedule(
 
     conditionally_send_going_oncall_push_notifications_for_schedule(schedule.pk)
 
-    mock_get_fcm_message.assert_called_once_with(user, schedule, device, seconds_until_shift_starts, schedule_event)
+    mock_get_fcm_message.assert_called_once_with(
+        user,
+        schedule,
+        device,
+        seconds_until_shift_starts,
+        schedule_event,
+        mobile_app_user_settings=MobileAppUserSettings.objects.get(user=user),
+    )
     mock_send_push_notification.assert_called_once_with(device, mock_fcm_message)
     assert cache.get(cache_key) is True
 
@@ -455,6 +462,141 @@ def test_conditionally_send_going_oncall_push_notifications_for_schedule(
     assert cache.get(cache_key) is True
 
 
+@mock.patch("apps.mobile_app.tasks.going_oncall_notification.OnCallSchedule.final_events")
+@mock.patch("apps.mobile_app.tasks.going_oncall_notification.send_push_notification")
+@pytest.mark.django_db
+def test_conditionally_send_going_oncall_push_notifications_for_schedule_bulk(
+    mock_send_push_notification,
+    mock_oncall_schedule_final_events,
+    make_organization,
+    make_user_for_organization,
+    make_schedule,
+    django_assert_max_num_queries,
+):
+    organization = make_organization()
+    users = [make_user_for_organization(organization) for _ in range(5)]
+    for user in users:
+        FCMDevice.objects.create(user=user, registration_id=f"device_{user.pk}")
+        MobileAppUserSettings.objects.create(user=user, info_notifications_enabled=True)
+
+    now = timezone.now()
+    mock_oncall_schedule_final_events.return_value = [
+        _create_schedule_event(
+            now + timezone.timedelta(minutes=5),
+            now + timezone.timedelta(hours=1),
+            "shift1",
+            [{"pk": user.public_primary_key} for user in users[:3]],
+        ),
+        _create_schedule_event(
+            now + timezone.timedelta(minutes=10),
+            now + timezone.timedelta(hours=1),
+            "shift2",
+            [{"pk": user.public_primary_key} for user in users[3:]],
+        ),
+        # starts too late to send a notification
+        _create_schedule_event(
+            now + timezone.timedelta(hours=2),
+            now + timezone.timedelta(hours=3),
+            "shift3",
+            [{"pk": user.public_primary_key} for user in users],
+        ),
+    ]
+    schedule = make_schedule(organization, schedule_class=OnCallScheduleWeb)
+
+    # schedule (polymorphic), users, devices and settings are fetched once for all the events
+    with django_assert_max_num_queries(6):
+        conditionally_send_going_oncall_push_notifications_for_schedule(schedule.pk)
+
+    assert mock_send_push_notification.call_count == 5
+    assert cache.get(f"going_oncall_push_notification:{users[0].public_primary_key}:shift1") is True
+    assert cache.get(f"going_oncall_push_notification:{users[4].public_primary_key}:shift2") is True
+    assert cache.get(f"going_oncall_push_notification:{users[0].public_primary_key}:shift3") is None
+
+
+@mock.patch("apps.mobile_app.tasks.going_oncall_notification.OnCallSchedule.final_events")
+@mock.patch("apps.mobile_app.tasks.going_oncall_notification.send_push_notification")
+@pytest.mark.django_db
+def test_conditionally_send_going_oncall_push_notifications_for_schedule_retry(
+    mock_send_push_notification,
+    mock_oncall_schedule_final_events,
+    make_organization,
+    make_user_for_organization,
+    make_schedule,
+):
+    organization = make_organization()
+    users = [make_user_for_organization(organization) for _ in range(3)]
+    for user in users:
+        FCMDevice.objects.create(user=user, registration_id=f"device_{user.pk}")
+        MobileAppUserSettings.objects.create(user=user, info_notifications_enabled=True)
+
+    now = timezone.now()
+    mock_oncall_schedule_final_events.return_value = [
+        _create_schedule_event(
+            now + timezone.timedelta(minutes=5),
+            now + timezone.timedelta(hours=1),
+            "shift1",
+            [{"pk": user.public_primary_key} for user in users],
+        ),
+    ]
+    schedule = make_schedule(organization, schedule_class=OnCallScheduleWeb)
+
+    mock_send_push_notification.side_effect = [None, Exception("error"), None, None]
+    with pytest.raises(Exception, match="error"):
+        conditionally_send_going_oncall_push_notifications_for_schedule(schedule.pk)
+
+    # the task retry doesn't notify the first user again
+    conditionally_send_going_oncall_push_notifications_for_schedule(schedule.pk)
+    notified_devices = [c.args[0].registration_id for c in mock_send_push_notification.call_args_list]
+    assert notified_devices == [f"device_{user.pk}" for user in [users[0], users[1], users[1], users[2]]]
+
+
+@mock.patch("apps.mobile_app.tasks.going_oncall_notification.OnCallSchedule.final_events")
+@mock.patch("apps.mobile_app.tasks.going_oncall_notification.send_push_notification")
+@pytest.mark.django_db
+def test_conditionally_send_going_oncall_push_notifications_for_schedule_timeline_not_changed(
+    mock_send_push_notification,
+    mock_oncall_schedule_final_events,
+    make_organization_and_user,
+    make_schedule,
+):
+    organization, user = make_organization_and_user()
+    FCMDevice.objects.create(user=user, registration_id="test_device_id")
+    MobileAppUserSettings.objects.create(user=user, info_notifications_enabled=True)
+
+    now = timezone.now()
+    mock_oncall_schedule_final_events.return_value = [
+        _create_schedule_event(
+            now + timezone.timedelta(hours=2),
+            now + timezone.timedelta(hours=3),
+            "shift1",
+            [{"pk": user.public_primary_key}],
+        ),
+    ]
+    schedule = make_schedule(organization, schedule_class=OnCallScheduleWeb, cached_ical_file_primary="ical")
+
+    conditionally_send_going_oncall_push_notifications_for_schedule(schedule.pk)
+    assert mock_oncall_schedule_final_events.call_count == 1
+
+    # the next shift doesn't start soon and the schedule didn't change, final events are not recalculated
+    conditionally_send_going_oncall_push_notifications_for_schedule(schedule.pk)
+    assert mock_oncall_schedule_final_events.call_count == 1
+
+    # the shift starts soon
+    with mock.patch(
+        "apps.mobile_app.tasks.going_oncall_notification.timezone.now",
+        return_value=now + timezone.timedelta(hours=1, minutes=50),
+    ):
+        conditionally_send_going_oncall_push_notifications_for_schedule(schedule.pk)
+    assert mock_oncall_schedule_final_events.call_count == 2
+    mock_send_push_notification.assert_called_once()
+
+    # the schedule changed
+    schedule.cached_ical_file_primary = "updated ical"
+    schedule.save(update_fields=["cached_ical_file_primary"])
+    conditionally_send_going_oncall_push_notifications_for_schedule(schedule.pk)
+    assert mock_oncall_schedule_final_events.call_count == 3
+
+
 @mock.patch(
     "apps.mobile_app.tasks.going_oncall_notification.conditionally_send_going_oncall_push_notifications_for_schedule"
 )
@@ -1,10 +1,25 @@
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
+from firebase_admin import exceptions, messaging
 
 from apps.base.models import UserNotificationPolicy, UserNotificationPolicyLogRecord
+from apps.metrics_exporter.constants import (
+    MOBILE_PUSH_BATCH_DURATION_SECONDS,
+    MOBILE_PUSH_NOTIFICATIONS_FAILED,
+    MOBILE_PUSH_NOTIFICATIONS_SENT,
+)
+from apps.metrics_exporter.helpers import get_internal_metric_key
 from apps.mobile_app.models import FCMDevice, MobileAppUserSettings
-from apps.mobile_app.tasks.new_alert_group import _get_fcm_message, notify_user_about_new_alert_group
+from apps.mobile_app.tasks.new_alert_group import (
+    NEW_ALERT_GROUP_PUSH_BATCH_WINDOW_SECONDS,
+    _get_fcm_message,
+    new_alert_group_push_queue,
+    notify_user_about_new_alert_group,
+    notify_users_about_new_alert_group,
+    queue_new_alert_group_push_notification,
+)
 
 MOBILE_APP_BACKEND_ID = 5
 CLOUD_LICENSE_NAME = "Cloud"
@@ -171,3 +186,192 @@ def test_fcm_message_user_settings_critical_override_dnd_disabled(
     apns_sound = message.apns.payload.aps.sound
     assert apns_sound.critical is False
     assert message.apns.payload.aps.custom_data["interruption-level"] == "time-sensitive"
+
+
+@pytest.fixture
+def fcm_stub(settings):
+    """
+    Local stand-in for the FCM batch API, responds to every message with the result for its token:
+    sent by default, or the exception set in `errors`.
+    """
+    settings.LICENSE = CLOUD_LICENSE_NAME
+    settings.IS_OPEN_SOURCE = False
+
+    class FCMStub:
+        def __init__(self):
+            self.batches = []
+            self.errors = {}
+
+        def send_all(self, messages, dry_run=False, app=None):
+            self.batches.append(messages)
+            return messaging.BatchResponse(
+                [
+                    messaging.SendResponse(
+                        None if m.token in self.errors else {"name": m.token}, self.errors.get(m.token)
+                    )
+                    for m in messages
+                ]
+            )
+
+    stub = FCMStub()
+    with patch.object(messaging, "send_all", side_effect=stub.send_all):
+        yield stub
+
+
+@pytest.fixture
+def make_users_with_mobile_app(make_user_for_organization, make_user_notification_policy):
+    def _make_users_with_mobile_app(organization, count, device=True):
+        result = []
+        for i in range(count):
+            user = make_user_for_organization(organization)
+            if device:
+                FCMDevice.objects.create(user=user, registration_id=f"device_{user.pk}")
+            notification_policy = make_user_notification_policy(
+                user, UserNotificationPolicy.Step.NOTIFY, notify_by=MOBILE_APP_BACKEND_ID
+            )
+            result.append((user, notification_policy))
+        return result
+
+    return _make_users_with_mobile_app
+
+
+@pytest.mark.django_db
+def test_queue_new_alert_group_push_notification_schedules_single_task(
+    make_organization, make_alert_receive_channel, make_alert_group, make_users_with_mobile_app
+):
+    organization = make_organization()
+    alert_group = make_alert_group(make_alert_receive_channel(organization))
+    notifications = make_users_with_mobile_app(organization, 3)
+
+    with patch.object(notify_users_about_new_alert_group, "apply_async") as mock_apply_async:
+        for user, notification_policy in notifications:
+            queue_new_alert_group_push_notification(user.pk, alert_group.pk, notification_policy.pk, False)
+
+    mock_apply_async.assert_called_once_with((alert_group.pk,), countdown=NEW_ALERT_GROUP_PUSH_BATCH_WINDOW_SECONDS)
+
+
+@pytest.mark.django_db
+def test_notify_users_about_new_alert_group_sends_single_batch(
+    fcm_stub,
+    make_organization,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+    make_users_with_mobile_app,
+    django_assert_max_num_queries,
+):
+    organization = make_organization()
+    alert_group = make_alert_group(make_alert_receive_channel(organization))
+    make_alert(alert_group=alert_group, raw_request_data={})
+    notifications = make_users_with_mobile_app(organization, 5)
+    for user, notification_policy in notifications:
+        queue_new_alert_group_push_notification(user.pk, alert_group.pk, notification_policy.pk, True)
+
+    # number of queries doesn't depend on the number of users
+    with django_assert_max_num_queries(10):
+        notify_users_about_new_alert_group(alert_group.pk)
+
+    assert len(fcm_stub.batches) == 1
+    assert [m.token for m in fcm_stub.batches[0]] == [f"device_{user.pk}" for user, _ in notifications]
+    assert all(m.data["type"] == "oncall.critical_message" for m in fcm_stub.batches[0])
+    assert MobileAppUserSettings.objects.filter(user__in=[user for user, _ in notifications]).count() == 5
+
+    assert cache.get(get_internal_metric_key(MOBILE_PUSH_NOTIFICATIONS_SENT)) == 5
+    assert cache.get(get_internal_metric_key(MOBILE_PUSH_NOTIFICATIONS_FAILED)) == 0
+    assert cache.get(get_internal_metric_key(MOBILE_PUSH_BATCH_DURATION_SECONDS)) is not None
+
+    # queued notifications are sent only once
+    notify_users_about_new_alert_group(alert_group.pk)
+    assert len(fcm_stub.batches) == 1
+
+
+@pytest.mark.django_db
+def test_notify_users_about_new_alert_group_errors(
+    fcm_stub,
+    make_organization,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+    make_users_with_mobile_app,
+):
+    organization = make_organization()
+    alert_group = make_alert_group(make_alert_receive_channel(organization))
+    make_alert(alert_group=alert_group, raw_request_data={})
+    (
+        (sent_user, _),
+        (unregistered_user, _),
+        (unavailable_user, unavailable_policy),
+    ) = notifications = make_users_with_mobile_app(organization, 3)
+    [(no_device_user, no_device_policy)] = make_users_with_mobile_app(organization, 1, device=False)
+    for user, notification_policy in notifications + [(no_device_user, no_device_policy)]:
+        queue_new_alert_group_push_notification(user.pk, alert_group.pk, notification_policy.pk, False)
+
+    fcm_stub.errors = {
+        f"device_{unregistered_user.pk}": messaging.UnregisteredError("unregistered"),
+        f"device_{unavailable_user.pk}": exceptions.UnavailableError("unavailable"),
+    }
+    with patch.object(notify_user_about_new_alert_group, "apply_async") as mock_retry:
+        notify_users_about_new_alert_group(alert_group.pk)
+
+    # temporary errors are retried for the single user
+    mock_retry.assert_called_once_with(
+        kwargs={
+            "user_pk": unavailable_user.pk,
+            "alert_group_pk": alert_group.pk,
+            "notification_policy_pk": unavailable_policy.pk,
+            "critical": False,
+        },
+    )
+    # unregistered device is removed
+    assert not FCMDevice.objects.filter(user=unregistered_user).exists()
+    assert set(
+        alert_group.personal_log_records.filter(
+            type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_FAILED
+        ).values_list("author_id", flat=True)
+    ) == {unregistered_user.pk, no_device_user.pk}
+
+    assert cache.get(get_internal_metric_key(MOBILE_PUSH_NOTIFICATIONS_SENT)) == 1
+    assert cache.get(get_internal_metric_key(MOBILE_PUSH_NOTIFICATIONS_FAILED)) == 2
+
+
+@pytest.mark.django_db
+def test_notify_users_about_new_alert_group_error_after_send(
+    fcm_stub,
+    make_organization,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+    make_users_with_mobile_app,
+):
+    organization = make_organization()
+    alert_group = make_alert_group(make_alert_receive_channel(organization))
+    make_alert(alert_group=alert_group, raw_request_data={})
+    notifications = make_users_with_mobile_app(organization, 3)
+    for user, notification_policy in notifications:
+        queue_new_alert_group_push_notification(user.pk, alert_group.pk, notification_policy.pk, False)
+
+    with patch("apps.mobile_app.tasks.new_alert_group.metrics_increment_internal_counter", side_effect=Exception):
+        with pytest.raises(Exception):
+            notify_users_about_new_alert_group(alert_group.pk)
+    assert len(fcm_stub.batches) == 1
+
+    # the task retry doesn't send the notifications again
+    notify_users_about_new_alert_group(alert_group.pk)
+    assert len(fcm_stub.batches) == 1
+
+
+@pytest.mark.django_db
+def test_notify_users_about_new_alert_group_queue_locked(
+    fcm_stub, make_organization, make_alert_receive_channel, make_alert_group, make_users_with_mobile_app
+):
+    organization = make_organization()
+    alert_group = make_alert_group(make_alert_receive_channel(organization))
+    [(user, notification_policy)] = make_users_with_mobile_app(organization, 1)
+    queue_new_alert_group_push_notification(user.pk, alert_group.pk, notification_policy.pk, False)
+
+    with new_alert_group_push_queue.pop(alert_group.pk):
+        with patch.object(notify_users_about_new_alert_group, "apply_async") as mock_apply_async:
+            notify_users_about_new_alert_group(alert_group.pk)
+
+    mock_apply_async.assert_called_once_with((alert_group.pk,), countdown=NEW_ALERT_GROUP_PUSH_BATCH_WINDOW_SECONDS)
+    assert fcm_stub.batches == []
@@ -1,9 +1,11 @@
+import enum
 import json
 import logging
 import typing
 
 import requests
 from django.conf import settings
+from firebase_admin import messaging
 from firebase_admin.exceptions import FirebaseError
 from firebase_admin.messaging import AndroidConfig, APNSConfig, APNSPayload, Message
 from requests import HTTPError
@@ -18,10 +20,20 @@ if typing.TYPE_CHECKING:
 
 
 MAX_RETRIES = 1 if settings.DEBUG else 10
+# max number of messages in a single FCM batch request
+FCM_MAX_MESSAGES_PER_BATCH = 500
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
+class PushNotificationStatus(enum.Enum):
+    SENT = "sent"
+    # the notification can't be delivered, e.g. the device is not registered anymore
+    FAILED = "failed"
+    # temporary error, the notification can be retried
+    RETRY = "retry"
+
+
 def _send_push_notification_to_fcm_relay(message: Message) -> requests.Response:
     """
     Send push notification to FCM relay on cloud instance: apps.mobile_app.fcm_relay.FCMRelayView
@@ -76,6 +88,78 @@ def send_push_notification(
             raise response
 
 
+def send_push_notifications(
+    devices_and_messages: typing.List[typing.Tuple["FCMDevice", Message]]
+) -> typing.List[PushNotificationStatus]:
+    """
+    Send push notifications to multiple devices.
+    Cloud instances send up to FCM_MAX_MESSAGES_PER_BATCH messages in a single FCM batch request,
+    OSS instances send messages one by one through FCM relay.
+    Returns the status of every notification, in the same order as devices_and_messages.
+    """
+    from apps.mobile_app.models import FCMDevice
+
+    if settings.IS_OPEN_SOURCE:
+        # FCM relay uses cloud connection to send push notifications
+        from apps.oss_installation.models import CloudConnector
+
+        if not CloudConnector.objects.exists():
+            logger.error("Error while sending mobile push notifications: not connected to cloud")
+            return [PushNotificationStatus.FAILED] * len(devices_and_messages)
+
+        statuses = []
+        for _, message in devices_and_messages:
+            try:
+                _send_push_notification_to_fcm_relay(message)
+                statuses.append(PushNotificationStatus.SENT)
+            except HTTPError as e:
+                logger.error(f"Error while sending a mobile push notification: HTTP error {e.response.status_code}")
+                if status.HTTP_400_BAD_REQUEST <= e.response.status_code < status.HTTP_500_INTERNAL_SERVER_ERROR:
+                    # do not retry on HTTP client errors (4xx errors)
+                    statuses.append(PushNotificationStatus.FAILED)
+                else:
+                    statuses.append(PushNotificationStatus.RETRY)
+            except Exception as e:
+                logger.error(f"Error while sending a mobile push notification: {e}")
+                statuses.append(PushNotificationStatus.RETRY)
+        return statuses
+
+    statuses = []
+    for i in range(0, len(devices_and_messages), FCM_MAX_MESSAGES_PER_BATCH):
+        batch = devices_and_messages[i : i + FCM_MAX_MESSAGES_PER_BATCH]
+        registration_ids = [device.registration_id for device, _ in batch]
+        messages = []
+        for device, message in batch:
+            message.token = device.registration_id
+            messages.append(message)
+
+        try:
+            responses = messaging.send_all(messages, app=settings.FCM_DJANGO_SETTINGS["DEFAULT_FIREBASE_APP"]).responses
+        except Exception as e:
+            logger.error(f"Error while sending a batch of mobile push notifications: {e}")
+            statuses.extend([PushNotificationStatus.RETRY] * len(batch))
+            continue
+
+        # https://firebase.google.com/docs/cloud-messaging/http-server-ref#interpret-downstream
+        try:
+            deactivated_registration_ids = set(
+                FCMDevice.objects.deactivate_devices_with_error_results(registration_ids, responses)
+            )
+        except Exception as e:
+            # the messages are already sent, failed ones are retried and deactivated on retry
+            logger.error(f"Error while deactivating devices after sending mobile push notifications: {e}")
+            deactivated_registration_ids = set()
+        for registration_id, response in zip(registration_ids, responses):
+            if response.success:
+                statuses.append(PushNotificationStatus.SENT)
+            elif registration_id in deactivated_registration_ids:
+                statuses.append(PushNotificationStatus.FAILED)
+            else:
+                logger.error(f"Error while sending a mobile push notification: {response.exception}")
+                statuses.append(PushNotificationStatus.RETRY)
+    return statuses
+
+
 def construct_fcm_message(
     message_type: MessageType,
     device_to_notify: "FCMDevice",
@@ -1,7 +1,8 @@
 from django.db.models import Prefetch
 from rest_framework import serializers
 
-from apps.alerts.models import AlertGroup
+from apps.alerts.models import AlertGroup, ArchivedAlertGroup, ChannelFilter
+from apps.public_api.incident_export import get_pk_from_resume_token
 from apps.telegram.models.message import TelegramMessage
 from common.api_helpers.mixins import EagerLoadingMixin
 from common.constants.alert_group_restrictions import IS_RESTRICTED_TITLE
@@ -55,3 +56,66 @@ class IncidentSerializer(EagerLoadingMixin, serializers.ModelSerializer):
             return obj.channel_filter.public_primary_key
         else:
             return None
+
+
+class ArchivedIncidentSerializer(serializers.ModelSerializer):
+    """
+    Serializes archived alert groups (see ArchivedAlertGroup) with the same fields as IncidentSerializer.
+    """
+
+    id = serializers.CharField(read_only=True, source="public_primary_key")
+    integration_id = serializers.CharField(source="get_alert_group.channel.public_primary_key")
+    route_id = serializers.SerializerMethodField()
+    created_at = serializers.DateTimeField(source="started_at")
+    alerts_count = serializers.SerializerMethodField()
+    state = serializers.SerializerMethodField()
+    acknowledged_at = serializers.DateTimeField(source="get_alert_group.acknowledged_at")
+    title = serializers.SerializerMethodField()
+    permalinks = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ArchivedAlertGroup
+        fields = IncidentSerializer.Meta.fields
+
+    def get_title(self, obj):
+        alert_group = obj.get_alert_group()
+        return IS_RESTRICTED_TITLE if alert_group.is_restricted else alert_group.web_title_cache
+
+    def get_alerts_count(self, obj):
+        return obj.get_alerts_count()
+
+    def get_state(self, obj):
+        return obj.get_alert_group().state
+
+    def get_route_id(self, obj):
+        # the route could have been deleted after the alert group was archived
+        return (
+            ChannelFilter.objects.filter(pk=obj.get_alert_group().channel_filter_id)
+            .values_list("public_primary_key", flat=True)
+            .first()
+        )
+
+    def get_permalinks(self, obj):
+        return obj.get_permalinks()
+
+
+class IncidentExportQueryParamsSerializer(serializers.Serializer):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    export_format = serializers.ChoiceField(choices=[NDJSON, CSV], default=NDJSON)
+    # resume token of the last received row, to resume an interrupted export
+    resume_after = serializers.CharField(required=False)
+    created_after = serializers.DateTimeField(required=False)
+    created_before = serializers.DateTimeField(required=False)
+
+    def validate_resume_after(self, value):
+        try:
+            return get_pk_from_resume_token(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+
+    def validate(self, attrs):
+        if "created_after" in attrs and "created_before" in attrs and attrs["created_after"] > attrs["created_before"]:
+            raise serializers.ValidationError("created_after must be less than or equal to created_before")
+        return attrs
@@ -1,3 +1,5 @@
+import csv
+import json
 from unittest.mock import patch
 
 import pytest
@@ -5,9 +7,11 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from apps.alerts.alert_group_archive import archive_alert_group_batch
 from apps.alerts.constants import ActionSource
 from apps.alerts.models import AlertGroup, AlertReceiveChannel
 from apps.alerts.tasks import delete_alert_group, wipe
+from apps.public_api.incident_export import get_resume_token
 
 
 def construct_expected_response_from_alert_groups(alert_groups):
@@ -109,6 +113,47 @@ def test_get_alert_groups(alert_group_public_api_setup):
     assert response.json() == expected_response
 
 
+@pytest.mark.django_db
+def test_get_alert_group(alert_group_public_api_setup):
+    token, alert_groups, _, _ = alert_group_public_api_setup
+    alert_group = alert_groups[0]
+    alert_group.resolve()
+    alert_group.refresh_from_db()
+    expected_response = construct_expected_response_from_alert_groups(AlertGroup.objects.filter(pk=alert_group.pk))
+    client = APIClient()
+
+    url = reverse("api-public:alert_groups-detail", kwargs={"pk": alert_group.public_primary_key})
+    response = client.get(url, format="json", HTTP_AUTHORIZATION=token)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == expected_response["results"][0]
+
+    # archived alert groups are returned the same way
+    archive_alert_group_batch([alert_group.pk])
+    assert not AlertGroup.objects.filter(pk=alert_group.pk).exists()
+
+    response = client.get(url, format="json", HTTP_AUTHORIZATION=token)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == expected_response["results"][0]
+
+
+@pytest.mark.django_db
+def test_get_alert_group_not_found(alert_group_public_api_setup, make_organization_and_user_with_token):
+    token, alert_groups, _, _ = alert_group_public_api_setup
+    alert_group = alert_groups[0]
+    alert_group.resolve()
+    archive_alert_group_batch([alert_group.pk])
+    _, _, other_token = make_organization_and_user_with_token()
+    client = APIClient()
+
+    url = reverse("api-public:alert_groups-detail", kwargs={"pk": alert_group.public_primary_key})
+    response = client.get(url, format="json", HTTP_AUTHORIZATION=other_token)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    url = reverse("api-public:alert_groups-detail", kwargs={"pk": "NONEXISTENT"})
+    response = client.get(url, format="json", HTTP_AUTHORIZATION=token)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.django_db
 def test_get_alert_groups_filter_by_integration(
     alert_group_public_api_setup,
@@ -298,6 +343,119 @@ def test_pagination(settings, alert_group_public_api_setup):
     assert result["next"].startswith("https://test.com/test/prefixed/urls")
 
 
+def _get_export_rows(response):
+    return [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+
+
+@pytest.mark.django_db
+def test_export_alert_groups(alert_group_public_api_setup, django_assert_num_queries):
+    token, alert_groups, _, _ = alert_group_public_api_setup
+    alert_groups[1].acknowledged = True
+    alert_groups[1].save()
+    client = APIClient()
+
+    url = reverse("api-public:alert_groups-export")
+    response = client.get(url, HTTP_AUTHORIZATION=token)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/x-ndjson"
+
+    # 3 alert groups are exported in 2 chunks, 1 extra query to check there are no more alert groups
+    with patch("apps.public_api.incident_export.INCIDENT_EXPORT_CHUNK_SIZE", 2):
+        with django_assert_num_queries(3):
+            rows = _get_export_rows(response)
+
+    expected_response = construct_expected_response_from_alert_groups(
+        AlertGroup.objects.filter(pk__in=[alert_group.pk for alert_group in alert_groups]).order_by("pk")
+    )
+    assert rows == [
+        {
+            "id": alert_group["id"],
+            "integration_id": alert_group["integration_id"],
+            "route_id": alert_group["route_id"],
+            "state": alert_group["state"],
+            "created_at": alert_group["created_at"],
+            "resolved_at": alert_group["resolved_at"],
+            "acknowledged_at": alert_group["acknowledged_at"],
+            "silenced_at": None,
+            "title": alert_group["title"],
+            "resume_token": get_resume_token(AlertGroup.objects.get(public_primary_key=alert_group["id"]).pk),
+        }
+        for alert_group in expected_response["results"]
+    ]
+    assert rows[1]["state"] == "acknowledged"
+
+
+@pytest.mark.django_db
+def test_export_alert_groups_csv(alert_group_public_api_setup):
+    token, alert_groups, _, _ = alert_group_public_api_setup
+    client = APIClient()
+
+    url = reverse("api-public:alert_groups-export")
+    response = client.get(url + "?export_format=csv", HTTP_AUTHORIZATION=token)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "text/csv"
+
+    rows = list(csv.DictReader(b"".join(response.streaming_content).decode().splitlines()))
+    assert [row["id"] for row in rows] == [alert_group.public_primary_key for alert_group in alert_groups]
+    assert rows[0]["resolved_at"] == ""
+
+
+@pytest.mark.django_db
+def test_export_alert_groups_resume_and_filters(alert_group_public_api_setup):
+    token, alert_groups, integrations, _ = alert_group_public_api_setup
+    client = APIClient()
+
+    url = reverse("api-public:alert_groups-export")
+    rows = _get_export_rows(client.get(url, HTTP_AUTHORIZATION=token))
+    resume_token = rows[0]["resume_token"]
+
+    response = client.get(url + f"?resume_after={resume_token}", HTTP_AUTHORIZATION=token)
+    assert response.status_code == status.HTTP_200_OK
+    assert [row["id"] for row in _get_export_rows(response)] == [
+        alert_group.public_primary_key for alert_group in alert_groups[1:]
+    ]
+
+    # list filters are applied
+    response = client.get(
+        url + f"?resume_after={resume_token}&integration_id={integrations[0].public_primary_key}",
+        HTTP_AUTHORIZATION=token,
+    )
+    assert [row["id"] for row in _get_export_rows(response)] == [alert_groups[1].public_primary_key]
+
+    # the export can be resumed after the last received alert group is deleted (e.g. archived)
+    alert_groups[0].delete()
+    response = client.get(url + f"?resume_after={resume_token}", HTTP_AUTHORIZATION=token)
+    assert response.status_code == status.HTTP_200_OK
+    assert [row["id"] for row in _get_export_rows(response)] == [
+        alert_group.public_primary_key for alert_group in alert_groups[1:]
+    ]
+
+    response = client.get(url + "?created_before=2000-01-01T00:00:00Z", HTTP_AUTHORIZATION=token)
+    assert _get_export_rows(response) == []
+
+
+@pytest.mark.parametrize(
+    "query_params",
+    [
+        "?export_format=xml",
+        "?resume_after=unknown",
+        "?created_after=2000-01-02T00:00:00Z&created_before=2000-01-01T00:00:00Z",
+        "?state=unknown",
+    ],
+)
+@pytest.mark.django_db
+def test_export_alert_groups_invalid_params(alert_group_public_api_setup, query_params):
+    token, _, _, _ = alert_group_public_api_setup
+    client = APIClient()
+
+    url = reverse("api-public:alert_groups-export")
+    response = client.get(url + query_params, HTTP_AUTHORIZATION=token)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.parametrize(
     "acknowledged,resolved,attached,maintenance,status_code",
     [
@@ -1,4 +1,5 @@
 from django.db.models import Q
+from django.http import StreamingHttpResponse
 from django_filters import rest_framework as filters
 from rest_framework import mixins, status
 from rest_framework.decorators import action
@@ -8,17 +9,23 @@ from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 from apps.alerts.constants import ActionSource
-from apps.alerts.models import AlertGroup
+from apps.alerts.models import AlertGroup, ArchivedAlertGroup
 from apps.alerts.tasks import delete_alert_group, wipe
 from apps.auth_token.auth import ApiTokenAuthentication
 from apps.public_api.constants import VALID_DATE_FOR_DELETE_INCIDENT
 from apps.public_api.helpers import is_valid_group_creation_date, team_has_slack_token_for_deleting
-from apps.public_api.serializers import IncidentSerializer
+from apps.public_api.incident_export import iter_incident_export_rows, render_csv, render_ndjson
+from apps.public_api.serializers import (
+    ArchivedIncidentSerializer,
+    IncidentExportQueryParamsSerializer,
+    IncidentSerializer,
+)
 from apps.public_api.throttlers.user_throttle import UserThrottle
 from common.api_helpers.exceptions import BadRequest
 from common.api_helpers.filters import ByTeamModelFieldFilterMixin, get_team_queryset
 from common.api_helpers.mixins import RateLimitHeadersMixin
 from common.api_helpers.paginators import FiftyPageSizePaginator
+from common.database import get_random_readonly_database_key_if_present_otherwise_default
 
 
 class IncidentByTeamFilter(ByTeamModelFieldFilterMixin, filters.FilterSet):
@@ -92,6 +99,22 @@ class IncidentView(RateLimitHeadersMixin, mixins.ListModelMixin, mixins.DestroyM
         except AlertGroup.DoesNotExist:
             raise NotFound
 
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            instance = self.get_object()
+        except NotFound:
+            # alert groups archived by archive_alert_groups are still readable
+            try:
+                archived_alert_group = ArchivedAlertGroup.objects.get(
+                    organization=self.request.auth.organization, public_primary_key=self.kwargs["pk"]
+                )
+            except ArchivedAlertGroup.DoesNotExist:
+                raise NotFound
+            return Response(ArchivedIncidentSerializer(archived_alert_group).data)
+
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
+
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         if not isinstance(request.data, dict):
@@ -117,6 +140,32 @@ class IncidentView(RateLimitHeadersMixin, mixins.ListModelMixin, mixins.DestroyM
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @action(methods=["get"], detail=False)
+    def export(self, request):
+        """
+        Stream alert groups matching the list filters as NDJSON or CSV rows with flat columns.
+        Alert groups are exported in the same order every time, so an interrupted export can be resumed by
+        passing the "resume_token" of the last received row as "resume_after".
+        """
+        serializer = IncidentExportQueryParamsSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        using = get_random_readonly_database_key_if_present_otherwise_default()
+        queryset = self.filter_queryset(self.get_queryset()).using(using)
+        if "created_after" in params:
+            queryset = queryset.filter(started_at__gte=params["created_after"])
+        if "created_before" in params:
+            queryset = queryset.filter(started_at__lte=params["created_before"])
+
+        rows = iter_incident_export_rows(queryset, after_pk=params.get("resume_after", 0))
+        if params["export_format"] == IncidentExportQueryParamsSerializer.CSV:
+            response = StreamingHttpResponse(render_csv(rows), content_type="text/csv")
+            response["Content-Disposition"] = 'attachment; filename="alert_groups.csv"'
+        else:
+            response = StreamingHttpResponse(render_ndjson(rows), content_type="application/x-ndjson")
+        return response
+
     @action(methods=["post"], detail=True)
     def acknowledge(self, request, pk):
         alert_group = self.get_object()
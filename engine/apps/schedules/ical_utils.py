@@ -46,7 +46,6 @@ if TYPE_CHECKING:
     from apps.schedules.models import OnCallSchedule
     from apps.schedules.models.on_call_schedule import OnCallScheduleQuerySet
     from apps.user_management.models import Organization, User
-    from apps.user_management.models.user import UserQuerySet
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -368,7 +367,11 @@ def list_users_to_notify_from_ical_for_period(
 
 def get_oncall_users_for_multiple_schedules(
     schedules: typing.List["OnCallSchedule"], events_datetime=None
-) -> typing.Dict["OnCallSchedule", UserQuerySet]:
+) -> typing.Dict[int, typing.List["User"]]:
+    """
+    Retrieve on-call users for multiple schedules, returns {schedule_pk: users}.
+    Users of all the schedules are fetched with a single query per organization.
+    """
     if events_datetime is None:
         events_datetime = datetime.datetime.now(timezone.utc)
 
@@ -376,12 +379,25 @@ def get_oncall_users_for_multiple_schedules(
     if not schedules:
         return {}
 
-    # Get on-call users
-    oncall_users = {}
+    # Get on-call usernames for every schedule
+    usernames_by_schedule: typing.Dict[int, typing.Set[str]] = {}
+    schedules_by_organization: typing.Dict[int, typing.List["OnCallSchedule"]] = {}
     for schedule in schedules:
-        # pass user list to list_users_to_notify_from_ical
-        schedule_oncall_users = list_users_to_notify_from_ical(schedule, events_datetime=events_datetime)
-        oncall_users.update({schedule.pk: schedule_oncall_users})
+        events = schedule.final_events(events_datetime, events_datetime)
+        usernames_by_schedule[schedule.pk] = {u["email"] for event in events for u in event.get("users", [])}
+        schedules_by_organization.setdefault(schedule.organization_id, []).append(schedule)
+
+    # Get on-call users, same as list_users_to_notify_from_ical for every schedule
+    oncall_users = {}
+    for organization_schedules in schedules_by_organization.values():
+        usernames = set().union(*(usernames_by_schedule[schedule.pk] for schedule in organization_schedules))
+        users = users_in_ical(list(usernames), organization_schedules[0].organization) if usernames else []
+        for schedule in organization_schedules:
+            schedule_usernames = usernames_by_schedule[schedule.pk]
+            schedule_emails = {username.lower() for username in schedule_usernames}
+            oncall_users[schedule.pk] = [
+                u for u in users if u.username in schedule_usernames or (u.email and u.email.lower() in schedule_emails)
+            ]
 
     return oncall_users
 
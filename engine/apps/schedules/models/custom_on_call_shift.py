@@ -25,7 +25,7 @@ from apps.schedules.tasks import (
     schedule_notify_about_gaps_in_schedule,
 )
 from apps.user_management.models import User
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -38,20 +38,10 @@ logger.setLevel(logging.DEBUG)
 
 
 def generate_public_primary_key_for_custom_oncall_shift():
-    prefix = "O"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while CustomOnCallShift.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="CustomOnCallShift"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("O")
 
 
-class CustomOnCallShift(models.Model):
+class CustomOnCallShift(PublicPrimaryKeyModelMixin, models.Model):
     parent_shift: typing.Optional["CustomOnCallShift"]
     schedules: "RelatedManager['OnCallSchedule']"
 
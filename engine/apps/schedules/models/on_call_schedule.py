@@ -43,7 +43,7 @@ from apps.schedules.ical_utils import (
 from apps.schedules.models import CustomOnCallShift
 from apps.user_management.models import User
 from common.database import NON_POLYMORPHIC_CASCADE, NON_POLYMORPHIC_SET_NULL
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -136,17 +136,7 @@ DurationMap = typing.Dict[str, datetime.timedelta]
 
 
 def generate_public_primary_key_for_oncall_schedule_channel():
-    prefix = "S"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while OnCallSchedule.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="OnCallSchedule"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("S")
 
 
 class OnCallScheduleQuerySet(PolymorphicQuerySet):
@@ -164,7 +154,7 @@ class OnCallScheduleQuerySet(PolymorphicQuerySet):
         )
 
 
-class OnCallSchedule(PolymorphicModel):
+class OnCallSchedule(PublicPrimaryKeyModelMixin, PolymorphicModel):
     custom_shifts: "RelatedManager['CustomOnCallShift']"
     organization: "Organization"
     shift_swap_requests: "RelatedManager['ShiftSwapRequest']"
@@ -9,7 +9,7 @@ from django.utils import timezone
 
 from apps.schedules import exceptions
 from apps.schedules.tasks import refresh_ical_final_schedule
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from apps.schedules.models import OnCallSchedule
@@ -19,17 +19,7 @@ if typing.TYPE_CHECKING:
 
 
 def generate_public_primary_key_for_shift_swap_request() -> str:
-    prefix = "SSR"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while ShiftSwapRequest.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="ShiftSwapRequest"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("SSR")
 
 
 class ShiftSwapRequestQueryset(models.QuerySet):
@@ -48,7 +38,7 @@ class ShiftSwapRequestManager(models.Manager):
         return self.get_queryset().filter(benefactor__isnull=True, swap_start__gt=now)
 
 
-class ShiftSwapRequest(models.Model):
+class ShiftSwapRequest(PublicPrimaryKeyModelMixin, models.Model):
     beneficiary: "User"
     benefactor: typing.Optional["User"]
     schedule: "OnCallSchedule"
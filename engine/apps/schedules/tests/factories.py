@@ -7,7 +7,7 @@ from apps.schedules.models import (
     OnCallScheduleWeb,
     ShiftSwapRequest,
 )
-from common.utils import UniqueFaker
+from common.tests.factories import UniqueFaker
 
 
 class OnCallScheduleFactory(factory.DjangoModelFactory):
@@ -1,7 +1,8 @@
 import logging
 import typing
 
-from apps.slack.client import SlackClient
+from apps.metrics_exporter.constants import SLACK_MESSAGE_UPDATES_SENT, SLACK_MESSAGE_UPDATES_SKIPPED
+from apps.metrics_exporter.helpers import metrics_increment_internal_counter
 from apps.slack.errors import (
     SlackAPIChannelArchivedError,
     SlackAPIChannelInactiveError,
@@ -14,19 +15,22 @@ from apps.slack.errors import (
 
 if typing.TYPE_CHECKING:
     from apps.alerts.models import AlertGroup
+    from apps.slack.client import SlackClient
     from apps.slack.models import SlackTeamIdentity
 
 logger = logging.getLogger(__name__)
 
 
 class AlertGroupSlackService:
-    _slack_client: SlackClient
+    _slack_client: "SlackClient"
 
     def __init__(
         self,
         slack_team_identity: "SlackTeamIdentity",
-        slack_client: typing.Optional[SlackClient] = None,
+        slack_client: typing.Optional["SlackClient"] = None,
     ):
+        from apps.slack.client import SlackClient
+
         self.slack_team_identity = slack_team_identity
         if slack_client is not None:
             self._slack_client = slack_client
@@ -35,15 +39,29 @@ class AlertGroupSlackService:
 
     def update_alert_group_slack_message(self, alert_group: "AlertGroup") -> None:
         from apps.alerts.models import AlertReceiveChannel
+        from apps.slack.models import SlackMessage
 
         logger.info(f"Update message for alert_group {alert_group.pk}")
+        slack_message = alert_group.slack_message
+        attachments = alert_group.render_slack_attachments()
+        blocks = alert_group.render_slack_blocks()
+
+        rendered_fingerprint = SlackMessage.get_rendered_fingerprint(attachments, blocks)
+        if rendered_fingerprint == slack_message.rendered_fingerprint:
+            metrics_increment_internal_counter(SLACK_MESSAGE_UPDATES_SKIPPED)
+            logger.info(f"Message for alert_group {alert_group.pk} is up to date, skip updating it")
+            return
+
         try:
             self._slack_client.chat_update(
-                channel=alert_group.slack_message.channel_id,
-                ts=alert_group.slack_message.slack_id,
-                attachments=alert_group.render_slack_attachments(),
-                blocks=alert_group.render_slack_blocks(),
+                channel=slack_message.channel_id,
+                ts=slack_message.slack_id,
+                attachments=attachments,
+                blocks=blocks,
             )
+            slack_message.rendered_fingerprint = rendered_fingerprint
+            slack_message.save(update_fields=["rendered_fingerprint"])
+            metrics_increment_internal_counter(SLACK_MESSAGE_UPDATES_SENT)
             logger.info(f"Message has been updated for alert_group {alert_group.pk}")
         except SlackAPIRatelimitError as e:
             if alert_group.channel.integration != AlertReceiveChannel.INTEGRATION_MAINTENANCE:
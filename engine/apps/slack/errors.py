@@ -1,9 +1,10 @@
 import typing
 
-from slack_sdk.web import SlackResponse
-
 from apps.slack.constants import SLACK_RATE_LIMIT_DELAY
 
+if typing.TYPE_CHECKING:
+    from slack_sdk.web import SlackResponse
+
 
 class UnexpectedResponse(typing.TypedDict):
     status: int
@@ -19,7 +20,7 @@ class SlackAPIError(Exception):
 
     errors: tuple[str, ...]
 
-    def __init__(self, response: UnexpectedResponse | SlackResponse):
+    def __init__(self, response: "UnexpectedResponse | SlackResponse"):
         super().__init__(f"Slack API error! Response: {response}")
         self.response = response
 
@@ -39,7 +40,7 @@ class SlackAPIChannelArchivedError(SlackAPIError):
 class SlackAPIRatelimitError(SlackAPIError):
     errors = ("ratelimited", "rate_limited", "message_limit_exceeded")
 
-    def __init__(self, response: SlackResponse):
+    def __init__(self, response: "SlackResponse"):
         super().__init__(response)
         self.retry_after = int(response.headers.get("Retry-After", SLACK_RATE_LIMIT_DELAY))
 
@@ -101,7 +102,7 @@ _error_to_error_class = {
 }
 
 
-def get_error_class(response: UnexpectedResponse | SlackResponse) -> typing.Type[SlackAPIError]:
+def get_error_class(response: "UnexpectedResponse | SlackResponse") -> typing.Type[SlackAPIError]:
     """Get an appropriate error class for the response"""
 
     if isinstance(response, dict):  # UnexpectedResponse
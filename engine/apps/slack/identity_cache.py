@@ -0,0 +1,94 @@
+"""
+Short-lived cache for Slack identities resolved on every incoming Slack request.
+
+The Slack events endpoint has to acknowledge requests within Slack's 3 second deadline, so the identities
+that are looked up for every payload (team, user and bot) are cached for a short time. Cached entries are dropped
+whenever the underlying identity is saved or deleted (see the `post_save`/`post_delete` receivers in
+`apps.slack.models`), which covers Slack app installs and uninstalls.
+"""
+import logging
+import typing
+
+from django.core.cache import cache
+
+if typing.TYPE_CHECKING:
+    from apps.slack.client import SlackClient
+    from apps.slack.models import SlackTeamIdentity, SlackUserIdentity
+
+logger = logging.getLogger(__name__)
+
+SLACK_IDENTITY_CACHE_TIMEOUT = 60
+# bot -> bot user mapping never changes for a given bot, so it can be cached for longer
+SLACK_BOT_USER_ID_CACHE_TIMEOUT = 60 * 10
+
+
+def _slack_team_identity_cache_key(slack_team_id: str) -> str:
+    return f"slack_team_identity_{slack_team_id}"
+
+
+def _slack_user_identity_cache_key(slack_team_identity_pk: int, slack_user_id: str) -> str:
+    return f"slack_user_identity_{slack_team_identity_pk}_{slack_user_id}"
+
+
+def _slack_bot_user_id_cache_key(slack_team_identity_pk: int, bot_id: str) -> str:
+    return f"slack_bot_user_id_{slack_team_identity_pk}_{bot_id}"
+
+
+def get_slack_team_identity(slack_team_id: str | None) -> typing.Optional["SlackTeamIdentity"]:
+    from apps.slack.models import SlackTeamIdentity
+
+    if slack_team_id is None:
+        return None
+
+    cache_key = _slack_team_identity_cache_key(slack_team_id)
+    slack_team_identity = cache.get(cache_key)
+    if slack_team_identity is not None:
+        return slack_team_identity
+
+    try:
+        slack_team_identity = SlackTeamIdentity.objects.get(slack_id=slack_team_id)
+    except SlackTeamIdentity.DoesNotExist:
+        return None
+
+    cache.set(cache_key, slack_team_identity, timeout=SLACK_IDENTITY_CACHE_TIMEOUT)
+    return slack_team_identity
+
+
+def get_slack_user_identity(
+    slack_team_identity: "SlackTeamIdentity", slack_user_id: str
+) -> typing.Optional["SlackUserIdentity"]:
+    from apps.slack.models import SlackUserIdentity
+
+    cache_key = _slack_user_identity_cache_key(slack_team_identity.pk, slack_user_id)
+    slack_user_identity = cache.get(cache_key)
+    if slack_user_identity is not None:
+        return slack_user_identity
+
+    slack_user_identity = SlackUserIdentity.objects.filter(
+        slack_id=slack_user_id,
+        slack_team_identity=slack_team_identity,
+    ).first()
+
+    if slack_user_identity is not None:
+        cache.set(cache_key, slack_user_identity, timeout=SLACK_IDENTITY_CACHE_TIMEOUT)
+    return slack_user_identity
+
+
+def get_bot_user_id(slack_client: "SlackClient", slack_team_identity: "SlackTeamIdentity", bot_id: str) -> str:
+    cache_key = _slack_bot_user_id_cache_key(slack_team_identity.pk, bot_id)
+    bot_user_id = cache.get(cache_key)
+    if bot_user_id is not None:
+        return bot_user_id
+
+    response = slack_client.bots_info(bot=bot_id)
+    bot_user_id = response.get("bot", {}).get("user_id", "")
+    cache.set(cache_key, bot_user_id, timeout=SLACK_BOT_USER_ID_CACHE_TIMEOUT)
+    return bot_user_id
+
+
+def invalidate_slack_team_identity(slack_team_id: str) -> None:
+    cache.delete(_slack_team_identity_cache_key(slack_team_id))
+
+
+def invalidate_slack_user_identity(slack_team_identity_pk: int, slack_user_id: str) -> None:
+    cache.delete(_slack_user_identity_cache_key(slack_team_identity_pk, slack_user_id))
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.20 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('slack', '0004_auto_20230913_1020'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='slackmessage',
+            name='rendered_fingerprint',
+            field=models.CharField(default=None, max_length=64, null=True),
+        ),
+    ]
@@ -2,24 +2,14 @@ from django.conf import settings
 from django.core.validators import MinLengthValidator
 from django.db import models
 
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 
 def generate_public_primary_key_for_slack_channel():
-    prefix = "H"
-    new_public_primary_key = generate_public_primary_key(prefix)
+    return generate_public_primary_key("H")
 
-    failure_counter = 0
-    while SlackChannel.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="SlackChannel"
-        )
-        failure_counter += 1
 
-    return new_public_primary_key
-
-
-class SlackChannel(models.Model):
+class SlackChannel(PublicPrimaryKeyModelMixin, models.Model):
     public_primary_key = models.CharField(
         max_length=20,
         validators=[MinLengthValidator(settings.PUBLIC_PRIMARY_KEY_MIN_LENGTH + 1)],
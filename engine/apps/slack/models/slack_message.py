@@ -1,3 +1,5 @@
+import hashlib
+import json
 import logging
 import time
 import typing
@@ -5,7 +7,6 @@ import uuid
 
 from django.db import models
 
-from apps.slack.client import SlackClient
 from apps.slack.errors import (
     SlackAPIChannelArchivedError,
     SlackAPIError,
@@ -60,12 +61,20 @@ class SlackMessage(models.Model):
     # ID of a latest celery task to update the message
     active_update_task_id = models.CharField(max_length=100, null=True, default=None)
 
+    # hash of the attachments and blocks last posted to Slack, used to skip updates that don't change the message
+    rendered_fingerprint = models.CharField(max_length=64, null=True, default=None)
+
     class Meta:
         # slack_id is unique within the context of a channel or conversation
         constraints = [
             models.UniqueConstraint(fields=["slack_id", "channel_id", "_slack_team_identity"], name="unique slack_id")
         ]
 
+    @staticmethod
+    def get_rendered_fingerprint(attachments, blocks) -> str:
+        rendered = json.dumps({"attachments": attachments, "blocks": blocks}, sort_keys=True, default=str)
+        return hashlib.sha256(rendered.encode()).hexdigest()
+
     @property
     def slack_team_identity(self):
         if self._slack_team_identity is None:
@@ -81,6 +90,8 @@ class SlackMessage(models.Model):
 
     @property
     def permalink(self) -> typing.Optional[str]:
+        from apps.slack.client import SlackClient
+
         if self.cached_permalink or not self.slack_team_identity:
             return self.cached_permalink
 
@@ -98,6 +109,7 @@ class SlackMessage(models.Model):
 
     def send_slack_notification(self, user, alert_group, notification_policy):
         from apps.base.models import UserNotificationPolicyLogRecord
+        from apps.slack.client import SlackClient
 
         slack_message = alert_group.slack_message
         user_verbal = user.get_username_with_slack_verbal(mention=True)
@@ -3,9 +3,10 @@ import typing
 
 from django.db import models
 from django.db.models import JSONField
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from apps.api.permissions import RBACPermission
-from apps.slack.client import SlackClient
 from apps.slack.constants import SLACK_INVALID_AUTH_RESPONSE, SLACK_WRONG_TEAM_NAMES
 from apps.slack.errors import (
     SlackAPIChannelNotFoundError,
@@ -13,12 +14,14 @@ from apps.slack.errors import (
     SlackAPIInvalidAuthError,
     SlackAPITokenError,
 )
+from apps.slack.identity_cache import invalidate_slack_team_identity
 from apps.user_management.models.user import User
 from common.insight_log.chatops_insight_logs import ChatOpsEvent, ChatOpsTypePlug, write_chatops_insight_log
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
 
+    from apps.slack.client import SlackClient
     from apps.user_management.models import Organization
 
 logger = logging.getLogger(__name__)
@@ -90,6 +93,8 @@ class SlackTeamIdentity(models.Model):
 
     @property
     def bot_id(self):
+        from apps.slack.client import SlackClient
+
         if self.cached_bot_id is None:
             sc = SlackClient(self)
             auth = sc.auth_test()
@@ -99,6 +104,8 @@ class SlackTeamIdentity(models.Model):
 
     @property
     def members(self):
+        from apps.slack.client import SlackClient
+
         sc = SlackClient(self)
 
         next_cursor = None
@@ -112,6 +119,8 @@ class SlackTeamIdentity(models.Model):
 
     @property
     def name(self):
+        from apps.slack.client import SlackClient
+
         if self.cached_name is None or self.cached_name in SLACK_WRONG_TEAM_NAMES:
             try:
                 sc = SlackClient(self)
@@ -125,6 +134,8 @@ class SlackTeamIdentity(models.Model):
 
     @property
     def app_id(self):
+        from apps.slack.client import SlackClient
+
         if not self.cached_app_id:
             sc = SlackClient(self)
             result = sc.bots_info(bot=self.bot_id)
@@ -134,6 +145,8 @@ class SlackTeamIdentity(models.Model):
         return self.cached_app_id
 
     def get_users_from_slack_conversation_for_organization(self, channel_id, organization):
+        from apps.slack.client import SlackClient
+
         sc = SlackClient(self)
         members = self.get_conversation_members(sc, channel_id)
 
@@ -142,10 +155,18 @@ class SlackTeamIdentity(models.Model):
             **User.build_permissions_query(RBACPermission.Permissions.CHATOPS_WRITE, organization),
         )
 
-    def get_conversation_members(self, slack_client: SlackClient, channel_id: str):
+    def get_conversation_members(self, slack_client: "SlackClient", channel_id: str):
         try:
             return slack_client.paginated_api_call(
                 "conversations_members", paginated_key="members", channel=channel_id
             )["members"]
         except (SlackAPITokenError, SlackAPIFetchMembersFailedError, SlackAPIChannelNotFoundError):
             return []
+
+
+@receiver(post_save, sender=SlackTeamIdentity)
+@receiver(post_delete, sender=SlackTeamIdentity)
+def listen_for_slack_team_identity_model_change(
+    sender: SlackTeamIdentity, instance: SlackTeamIdentity, **kwargs
+) -> None:
+    invalidate_slack_team_identity(instance.slack_id)
@@ -3,8 +3,9 @@ import typing
 
 import requests
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
-from apps.slack.client import SlackClient
 from apps.slack.constants import SLACK_BOT_ID
 from apps.slack.errors import (
     SlackAPICannotDMBotError,
@@ -12,6 +13,7 @@ from apps.slack.errors import (
     SlackAPITokenError,
     SlackAPIUserNotFoundError,
 )
+from apps.slack.identity_cache import invalidate_slack_user_identity
 from apps.slack.scenarios.notified_user_not_in_channel import NotifiedUserNotInChannelStep
 from apps.user_management.models import Organization, User
 
@@ -104,6 +106,8 @@ class SlackUserIdentity(models.Model):
         return self.slack_login
 
     def send_link_to_slack_message(self, slack_message):
+        from apps.slack.client import SlackClient
+
         blocks = [
             {
                 "type": "section",
@@ -159,6 +163,8 @@ class SlackUserIdentity(models.Model):
 
     @property
     def slack_login(self):
+        from apps.slack.client import SlackClient
+
         if self.cached_slack_login is None or self.cached_slack_login == "slack_token_revoked_unable_to_cache_login":
             sc = SlackClient(self.slack_team_identity)
             try:
@@ -179,6 +185,8 @@ class SlackUserIdentity(models.Model):
 
     @property
     def timezone(self):
+        from apps.slack.client import SlackClient
+
         if self.cached_timezone is None or self.cached_timezone == "None":
             sc = SlackClient(self.slack_team_identity)
             try:
@@ -198,6 +206,8 @@ class SlackUserIdentity(models.Model):
 
     @property
     def im_channel_id(self):
+        from apps.slack.client import SlackClient
+
         if self.cached_im_channel_id is None:
             sc = SlackClient(self.slack_team_identity)
             try:
@@ -210,6 +220,8 @@ class SlackUserIdentity(models.Model):
         return self.cached_im_channel_id
 
     def update_profile_info(self):
+        from apps.slack.client import SlackClient
+
         sc = SlackClient(self.slack_team_identity)
         logger.info("Update user profile info")
         try:
@@ -251,3 +263,11 @@ class SlackUserIdentity(models.Model):
         except User.DoesNotExist:
             user = None
         return user
+
+
+@receiver(post_save, sender=SlackUserIdentity)
+@receiver(post_delete, sender=SlackUserIdentity)
+def listen_for_slack_user_identity_model_change(
+    sender: SlackUserIdentity, instance: SlackUserIdentity, **kwargs
+) -> None:
+    invalidate_slack_user_identity(instance.slack_team_identity_id, instance.slack_id)
@@ -9,11 +9,10 @@ from django.db.models import JSONField
 from django.utils import timezone
 
 from apps.api.permissions import RBACPermission
-from apps.slack.client import SlackClient
 from apps.slack.errors import SlackAPIError, SlackAPIPermissionDeniedError
 from apps.slack.models import SlackTeamIdentity
 from apps.user_management.models.user import User
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -26,20 +25,10 @@ logger = logging.getLogger(__name__)
 
 
 def generate_public_primary_key_for_slack_user_group():
-    prefix = "G"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while SlackUserGroup.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="SlackUserGroup"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("G")
 
 
-class SlackUserGroup(models.Model):
+class SlackUserGroup(PublicPrimaryKeyModelMixin, models.Model):
     escalation_policies: "RelatedManager['EscalationPolicy']"
     oncall_schedules: "RelatedManager['OnCallSchedule']"
 
@@ -70,6 +59,8 @@ class SlackUserGroup(models.Model):
 
     @property
     def can_be_updated(self) -> bool:
+        from apps.slack.client import SlackClient
+
         sc = SlackClient(self.slack_team_identity, timeout=5)
 
         try:
@@ -110,6 +101,8 @@ class SlackUserGroup(models.Model):
             pass
 
     def update_members(self, slack_ids):
+        from apps.slack.client import SlackClient
+
         sc = SlackClient(self.slack_team_identity)
 
         sc.usergroups_users_update(usergroup=self.slack_id, users=slack_ids)
@@ -125,6 +118,8 @@ class SlackUserGroup(models.Model):
 
     @classmethod
     def update_or_create_slack_usergroup_from_slack(cls, slack_id: str, slack_team_identity: SlackTeamIdentity) -> None:
+        from apps.slack.client import SlackClient
+
         sc = SlackClient(slack_team_identity)
         usergroups = sc.usergroups_list()["usergroups"]
 
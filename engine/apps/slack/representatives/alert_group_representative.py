@@ -5,12 +5,19 @@ from django.conf import settings
 
 from apps.alerts.constants import ActionSource
 from apps.alerts.representative import AlertGroupAbstractRepresentative
+from apps.metrics_exporter.constants import SLACK_ALERT_GROUP_ACTIONS_COALESCED
+from apps.metrics_exporter.helpers import metrics_increment_internal_counter
 from apps.slack.scenarios.scenario_step import ScenarioStep
+from common.cache_queue import CacheBatchQueue
 from common.custom_celery_tasks import shared_dedicated_queue_retry_task
 
 logger = get_task_logger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# action signals for the same alert group received within this time are processed together
+ALERT_GROUP_ACTIONS_BATCH_WINDOW_SECONDS = 2
+alert_group_actions_queue = CacheBatchQueue("slack_alert_group_actions")
+
 
 @shared_dedicated_queue_retry_task(
     autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else None
@@ -48,16 +55,9 @@ def on_create_alert_slack_representative_async(alert_pk):
     logger.debug(f"Finish on_create_alert_slack_representative for alert {alert_pk} from alert_group {alert.group_id}")
 
 
-@shared_dedicated_queue_retry_task(
-    autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else None
-)
-def on_alert_group_action_triggered_async(log_record_id):
-    from apps.alerts.models import AlertGroupLogRecord
-
-    logger.debug(f"SLACK representative: get log record {log_record_id}")
-
-    log_record = AlertGroupLogRecord.objects.get(pk=log_record_id)
+def _process_alert_group_action(log_record):
     alert_group_id = log_record.alert_group_id
+    log_record_id = log_record.pk
     logger.debug(f"Start on_alert_group_action_triggered for alert_group {alert_group_id}, log record {log_record_id}")
     instance = AlertGroupSlackRepresentative(log_record)
     if instance.is_applicable():
@@ -79,6 +79,78 @@ def on_alert_group_action_triggered_async(log_record_id):
     logger.debug(f"Finish on_alert_group_action_triggered for alert_group {alert_group_id}, log record {log_record_id}")
 
 
+@shared_dedicated_queue_retry_task(
+    autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else None
+)
+def on_alert_group_action_triggered_async(log_record_id):
+    from apps.alerts.models import AlertGroupLogRecord
+
+    logger.debug(f"SLACK representative: get log record {log_record_id}")
+
+    log_record = AlertGroupLogRecord.objects.get(pk=log_record_id)
+    _process_alert_group_action(log_record)
+
+
+@shared_dedicated_queue_retry_task(
+    autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else None
+)
+def on_alert_group_actions_triggered_async(alert_group_id):
+    """
+    Process action log records queued for the alert group by AlertGroupSlackRepresentative.on_alert_group_action_triggered.
+    Handlers of AlertGroupLogRecord.MESSAGE_UPDATE_TYPES only re-render the alert group message with its current state,
+    so only the latest of them is processed.
+    """
+    from apps.alerts.models import AlertGroupLogRecord
+
+    with alert_group_actions_queue.pop(alert_group_id) as log_record_ids:
+        if log_record_ids is None:
+            # actions are being processed by another task, try again later
+            on_alert_group_actions_triggered_async.apply_async(
+                (alert_group_id,), countdown=ALERT_GROUP_ACTIONS_BATCH_WINDOW_SECONDS
+            )
+            return
+
+        if log_record_ids.pending:
+            # some actions are not stored yet, process them with the next task
+            on_alert_group_actions_triggered_async.apply_async(
+                (alert_group_id,), countdown=ALERT_GROUP_ACTIONS_BATCH_WINDOW_SECONDS
+            )
+
+        if not log_record_ids:
+            return
+
+        log_records = AlertGroupLogRecord.objects.filter(pk__in=log_record_ids).select_related(
+            "alert_group__channel__organization__slack_team_identity", "author"
+        )
+        log_records = sorted(log_records, key=lambda log_record: log_record.pk)
+        last_message_update_pk = max(
+            (
+                log_record.pk
+                for log_record in log_records
+                if log_record.type in AlertGroupLogRecord.MESSAGE_UPDATE_TYPES
+            ),
+            default=None,
+        )
+
+        coalesced = 0
+        for log_record in log_records:
+            if log_record.type in AlertGroupLogRecord.MESSAGE_UPDATE_TYPES and log_record.pk != last_message_update_pk:
+                coalesced += 1
+                continue
+
+            try:
+                _process_alert_group_action(log_record)
+            except Exception as e:
+                # retry failed log records separately, so other actions are not posted twice
+                logger.warning(f"Error while processing log record {log_record.pk} in SLACK representative: {e}")
+                on_alert_group_action_triggered_async.apply_async(
+                    (log_record.pk,), countdown=ALERT_GROUP_ACTIONS_BATCH_WINDOW_SECONDS
+                )
+
+        if coalesced:
+            metrics_increment_internal_counter(SLACK_ALERT_GROUP_ACTIONS_COALESCED, coalesced)
+
+
 @shared_dedicated_queue_retry_task(
     autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else None
 )
@@ -154,8 +226,22 @@ class AlertGroupSlackRepresentative(AlertGroupAbstractRepresentative):
 
         if action_source == ActionSource.SLACK or force_sync:
             on_alert_group_action_triggered_async(log_record_id)
+            return
+
+        if isinstance(log_record, AlertGroupLogRecord):
+            alert_group_id = log_record.alert_group_id
         else:
-            on_alert_group_action_triggered_async.apply_async((log_record_id,))
+            alert_group_id = (
+                AlertGroupLogRecord.objects.filter(pk=log_record_id).values_list("alert_group_id", flat=True).first()
+            )
+            if alert_group_id is None:
+                logger.debug(f"Log record {log_record_id} doesn't exist")
+                return
+
+        if alert_group_actions_queue.push(alert_group_id, log_record_id):
+            on_alert_group_actions_triggered_async.apply_async(
+                (alert_group_id,), countdown=ALERT_GROUP_ACTIONS_BATCH_WINDOW_SECONDS
+            )
 
     @classmethod
     def on_alert_group_update_log_report(cls, **kwargs):
@@ -0,0 +1,117 @@
+import typing
+from collections import defaultdict
+
+from apps.slack.types import EventPayload, EventType, PayloadType, ScenarioRoute
+
+if typing.TYPE_CHECKING:
+    from apps.slack.scenarios.scenario_step import ScenarioStep
+
+# (position of the route in the routing list, step)
+_RouteMatch = typing.Tuple[int, typing.Type["ScenarioStep"]]
+
+
+class _PrefixIndex:
+    """
+    Index of route ids matched by `str.startswith`.
+    Lookups only probe the distinct route id lengths instead of iterating over all the routes.
+    """
+
+    def __init__(self) -> None:
+        self._routes: typing.Dict[str, typing.List[_RouteMatch]] = defaultdict(list)
+        self._lengths: typing.List[int] = []
+
+    def add(self, prefix: str, route_match: _RouteMatch) -> None:
+        self._routes[prefix].append(route_match)
+        self._lengths = sorted({len(p) for p in self._routes})
+
+    def lookup(self, value: str) -> typing.List[_RouteMatch]:
+        matches: typing.List[_RouteMatch] = []
+        for length in self._lengths:
+            if length > len(value):
+                break
+            matches.extend(self._routes.get(value[:length], []))
+        return matches
+
+
+class ScenarioRouter:
+    """
+    Routing table compiled once from the list of scenario routes.
+
+    `match` returns the steps for a Slack payload in the same order as they appear in the routing list,
+    so the result is equivalent to checking every route against the payload one by one.
+    """
+
+    def __init__(self, routes: ScenarioRoute.RoutingSteps) -> None:
+        self._channel_message_routes: typing.Dict[str, typing.List[_RouteMatch]] = defaultdict(list)
+        self._slash_command_routes: typing.Dict[str, typing.List[_RouteMatch]] = defaultdict(list)
+        self._event_routes: typing.Dict[str, typing.List[_RouteMatch]] = defaultdict(list)
+        self._interactive_message_routes: typing.Dict[str, _PrefixIndex] = defaultdict(_PrefixIndex)
+        self._block_action_routes: typing.Dict[str, _PrefixIndex] = defaultdict(_PrefixIndex)
+        self._dialog_submission_routes: typing.Dict[str, typing.List[_RouteMatch]] = defaultdict(list)
+        self._view_submission_routes = _PrefixIndex()
+        self._message_action_routes: typing.Dict[str, typing.List[_RouteMatch]] = defaultdict(list)
+
+        for position, route in enumerate(routes):
+            route_match = (position, route["step"])
+            route_payload_type = route["payload_type"]
+
+            if "message_channel_type" in route:
+                self._channel_message_routes[route["message_channel_type"]].append(route_match)
+
+            if route_payload_type == PayloadType.SLASH_COMMAND:
+                for command_name in route["command_name"]:
+                    self._slash_command_routes[command_name].append(route_match)
+            elif route_payload_type == PayloadType.EVENT_CALLBACK:
+                # event_name is used for stateful
+                if "event_name" not in route:
+                    self._event_routes[route["event_type"]].append(route_match)
+            elif route_payload_type == PayloadType.INTERACTIVE_MESSAGE:
+                self._interactive_message_routes[route["action_type"]].add(route["action_name"], route_match)
+            elif route_payload_type == PayloadType.BLOCK_ACTIONS:
+                self._block_action_routes[route["block_action_type"]].add(route["block_action_id"], route_match)
+            elif route_payload_type == PayloadType.DIALOG_SUBMISSION:
+                self._dialog_submission_routes[route["dialog_callback_id"]].append(route_match)
+            elif route_payload_type == PayloadType.VIEW_SUBMISSION:
+                self._view_submission_routes.add(route["view_callback_id"], route_match)
+            elif route_payload_type == PayloadType.MESSAGE_ACTION:
+                for callback_id in route["message_action_callback_id"]:
+                    self._message_action_routes[callback_id].append(route_match)
+
+    @staticmethod
+    def _steps(matches: typing.Iterable[_RouteMatch]) -> typing.List[typing.Type["ScenarioStep"]]:
+        return [step for _, step in sorted(matches, key=lambda route_match: route_match[0])]
+
+    def match_channel_message(self, channel_type: EventType | None) -> typing.List[typing.Type["ScenarioStep"]]:
+        return self._steps(self._channel_message_routes.get(channel_type, []))
+
+    def match(self, payload: EventPayload) -> typing.List[typing.Type["ScenarioStep"]]:
+        payload_type = payload.get("type")
+        payload_command = payload.get("command")
+        payload_callback_id = payload.get("callback_id")
+        payload_actions = payload.get("actions", [])
+
+        matches: typing.List[_RouteMatch] = []
+
+        # Slash commands have no "type"
+        if payload_command:
+            matches.extend(self._slash_command_routes.get(payload_command, []))
+
+        if payload_type == PayloadType.EVENT_CALLBACK:
+            matches.extend(self._event_routes.get(payload.get("event", {}).get("type"), []))
+        elif payload_type == PayloadType.INTERACTIVE_MESSAGE:
+            for action in payload_actions:
+                # Action name may also contain action arguments. So only beginning is used for routing.
+                if action["type"] in self._interactive_message_routes:
+                    matches.extend(self._interactive_message_routes[action["type"]].lookup(action["name"]))
+        elif payload_type == PayloadType.BLOCK_ACTIONS:
+            for action in payload_actions:
+                if action["type"] in self._block_action_routes:
+                    matches.extend(self._block_action_routes[action["type"]].lookup(action["action_id"]))
+        elif payload_type == PayloadType.DIALOG_SUBMISSION:
+            matches.extend(self._dialog_submission_routes.get(payload_callback_id, []))
+        elif payload_type == PayloadType.VIEW_SUBMISSION:
+            matches.extend(self._view_submission_routes.lookup(payload["view"]["callback_id"]))
+        elif payload_type == PayloadType.MESSAGE_ACTION:
+            matches.extend(self._message_action_routes.get(payload_callback_id, []))
+
+        return self._steps(matches)
@@ -77,6 +77,7 @@ class UpdateAppearanceStep(scenario_step.ScenarioStep):
         payload: EventPayload,
     ) -> None:
         from apps.alerts.models import AlertGroup
+        from apps.slack.models import SlackMessage
 
         private_metadata = json.loads(payload["view"]["private_metadata"])
         alert_group_pk = private_metadata["alert_group_pk"]
@@ -86,12 +87,15 @@ class UpdateAppearanceStep(scenario_step.ScenarioStep):
         attachments = alert_group.render_slack_attachments()
         blocks = alert_group.render_slack_blocks()
 
+        slack_message = alert_group.slack_message
         self._slack_client.chat_update(
-            channel=alert_group.slack_message.channel_id,
-            ts=alert_group.slack_message.slack_id,
+            channel=slack_message.channel_id,
+            ts=slack_message.slack_id,
             attachments=attachments,
             blocks=blocks,
         )
+        slack_message.rendered_fingerprint = SlackMessage.get_rendered_fingerprint(attachments, blocks)
+        slack_message.save(update_fields=["rendered_fingerprint"])
 
 
 STEPS_ROUTING: ScenarioRoute.RoutingSteps = [
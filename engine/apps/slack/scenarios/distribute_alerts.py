@@ -29,7 +29,6 @@ from apps.slack.errors import (
 )
 from apps.slack.scenarios import scenario_step
 from apps.slack.scenarios.slack_renderer import AlertGroupLogSlackRenderer
-from apps.slack.slack_formatter import SlackFormatter
 from apps.slack.tasks import (
     post_or_update_log_report_message_task,
     send_message_to_thread_if_bot_not_in_channel,
@@ -129,6 +128,8 @@ class AlertShootingStep(scenario_step.ScenarioStep):
         channel_id: str,
         blocks: Block.AnyBlocks,
     ) -> None:
+        from apps.slack.models import SlackMessage
+
         # channel_id can be None if general log channel for slack_team_identity is not set
         if channel_id is None:
             logger.info(f"Failed to post message to Slack for alert_group {alert_group.pk} because channel_id is None")
@@ -144,6 +145,7 @@ class AlertShootingStep(scenario_step.ScenarioStep):
                 organization=alert_group.channel.organization,
                 _slack_team_identity=slack_team_identity,
                 channel_id=channel_id,
+                rendered_fingerprint=SlackMessage.get_rendered_fingerprint(attachments, blocks),
             )
 
             # If alert was made out of a message:
@@ -391,6 +393,8 @@ class SelectAttachGroupStep(AlertGroupActionsMixin, scenario_step.ScenarioStep):
         self._slack_client.views_open(trigger_id=payload["trigger_id"], view=view)
 
     def get_select_incidents_blocks(self, alert_group: AlertGroup) -> Block.AnyBlocks:
+        from apps.slack.slack_formatter import SlackFormatter
+
         collected_options: typing.List[CompositionObjectOption] = []
         blocks: Block.AnyBlocks = []
 
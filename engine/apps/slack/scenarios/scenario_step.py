@@ -3,7 +3,6 @@ import logging
 import typing
 
 from apps.slack.alert_group_slack_service import AlertGroupSlackService
-from apps.slack.client import SlackClient
 
 if typing.TYPE_CHECKING:
     from apps.slack.models import SlackTeamIdentity, SlackUserIdentity
@@ -20,6 +19,8 @@ class ScenarioStep(object):
         organization: typing.Optional["Organization"] = None,
         user: typing.Optional["User"] = None,
     ):
+        from apps.slack.client import SlackClient
+
         self._slack_client = SlackClient(slack_team_identity)
         self.slack_team_identity = slack_team_identity
         self.organization = organization
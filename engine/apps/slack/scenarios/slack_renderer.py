@@ -14,18 +14,20 @@ class AlertGroupLogSlackRenderer:
         from apps.alerts.models import AlertGroupLogRecord
         from apps.base.models import UserNotificationPolicyLogRecord
 
+        def _render_log_record(log_record):
+            if type(log_record) == AlertGroupLogRecord:
+                return f"{log_record.rendered_incident_log_line(for_slack=True)}\n"
+            elif type(log_record) == UserNotificationPolicyLogRecord:
+                return f"{log_record.rendered_notification_log_line(for_slack=True)}\n"
+
         log_builder = IncidentLogBuilder(alert_group)
-        all_log_records = log_builder.get_log_records_list()
+        # list of rendered AlertGroupLogRecord and UserNotificationPolicyLogRecord logs
+        rendered_log_records = log_builder.get_rendered_log_records_list("slack", _render_log_record)
 
         attachments = []
 
         # get rendered logs
-        result = ""
-        for log_record in all_log_records:  # list of AlertGroupLogRecord and UserNotificationPolicyLogRecord logs
-            if type(log_record) == AlertGroupLogRecord:
-                result += f"{log_record.rendered_incident_log_line(for_slack=True)}\n"
-            elif type(log_record) == UserNotificationPolicyLogRecord:
-                result += f"{log_record.rendered_notification_log_line(for_slack=True)}\n"
+        result = "".join(rendered_log_records)
 
         attachments.append(
             {
@@ -10,7 +10,6 @@ from django.utils import timezone
 
 from apps.alerts.tasks.compare_escalations import compare_escalations
 from apps.slack.alert_group_slack_service import AlertGroupSlackService
-from apps.slack.client import SlackClient
 from apps.slack.constants import CACHE_UPDATE_INCIDENT_SLACK_MESSAGE_LIFETIME, SLACK_BOT_ID
 from apps.slack.errors import (
     SlackAPIInvalidAuthError,
@@ -147,8 +146,8 @@ def send_message_to_thread_if_bot_not_in_channel(alert_group_pk, slack_team_iden
     """
     Send message to alert group's thread if bot is not in current channel
     """
-
     from apps.alerts.models import AlertGroup
+    from apps.slack.client import SlackClient
     from apps.slack.models import SlackTeamIdentity
 
     slack_team_identity = SlackTeamIdentity.objects.get(pk=slack_team_identity_pk)
@@ -338,6 +337,7 @@ def populate_slack_usergroups():
     autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else None
 )
 def populate_slack_usergroups_for_team(slack_team_identity_id):
+    from apps.slack.client import SlackClient
     from apps.slack.models import SlackTeamIdentity, SlackUserGroup
 
     slack_team_identity = SlackTeamIdentity.objects.get(pk=slack_team_identity_id)
@@ -451,6 +451,7 @@ def populate_slack_channels_for_team(slack_team_identity_id: int, cursor: Option
     ids in cache and restart the task with the last successful pagination cursor to avoid any data loss during delay
     time.
     """
+    from apps.slack.client import SlackClient
     from apps.slack.models import SlackChannel, SlackTeamIdentity
 
     slack_team_identity = SlackTeamIdentity.objects.get(pk=slack_team_identity_id)
@@ -1,7 +1,7 @@
 import factory
 
 from apps.slack.models import SlackChannel, SlackMessage, SlackTeamIdentity, SlackUserGroup, SlackUserIdentity
-from common.utils import UniqueFaker
+from common.tests.factories import UniqueFaker
 
 
 class SlackTeamIdentityFactory(factory.DjangoModelFactory):
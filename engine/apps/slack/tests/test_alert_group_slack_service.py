@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from apps.metrics_exporter.constants import SLACK_MESSAGE_UPDATES_SENT, SLACK_MESSAGE_UPDATES_SKIPPED
+from apps.metrics_exporter.helpers import get_internal_metric_key
+from apps.slack.alert_group_slack_service import AlertGroupSlackService
+from apps.slack.client import SlackClient
+
+
+@pytest.mark.django_db
+def test_update_alert_group_slack_message_skips_unchanged_message(
+    make_organization_with_slack_team_identity,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+    make_slack_message,
+):
+    organization, slack_team_identity = make_organization_with_slack_team_identity()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(alert_receive_channel)
+    make_alert(alert_group=alert_group, raw_request_data={})
+    slack_message = make_slack_message(alert_group=alert_group, channel_id="CHANNEL_ID", slack_id="SLACK_ID")
+
+    service = AlertGroupSlackService(slack_team_identity)
+    with patch.object(SlackClient, "chat_update") as mock_chat_update:
+        service.update_alert_group_slack_message(alert_group)
+        service.update_alert_group_slack_message(alert_group)
+
+    mock_chat_update.assert_called_once()
+    slack_message.refresh_from_db()
+    assert slack_message.rendered_fingerprint is not None
+    assert cache.get(get_internal_metric_key(SLACK_MESSAGE_UPDATES_SENT)) == 1
+    assert cache.get(get_internal_metric_key(SLACK_MESSAGE_UPDATES_SKIPPED)) == 1
+
+    # message is updated again when the rendered content changes
+    alert_group.acknowledge_by_source()
+    with patch.object(SlackClient, "chat_update") as mock_chat_update:
+        service.update_alert_group_slack_message(alert_group)
+    mock_chat_update.assert_called_once()
+    assert cache.get(get_internal_metric_key(SLACK_MESSAGE_UPDATES_SENT)) == 2
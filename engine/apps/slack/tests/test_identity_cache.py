@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.slack.client import SlackClient
+from apps.slack.identity_cache import get_bot_user_id, get_slack_team_identity, get_slack_user_identity
+
+
+@pytest.mark.django_db
+def test_get_slack_team_identity_cached(make_slack_team_identity):
+    slack_team_identity = make_slack_team_identity(slack_id="T123")
+
+    assert get_slack_team_identity("T123").pk == slack_team_identity.pk
+    with CaptureQueriesContext(connection) as queries:
+        assert get_slack_team_identity("T123").pk == slack_team_identity.pk
+    assert len(queries) == 0
+
+    assert get_slack_team_identity("UNKNOWN") is None
+    assert get_slack_team_identity(None) is None
+
+
+@pytest.mark.django_db
+def test_get_slack_team_identity_invalidated_on_save(make_slack_team_identity):
+    slack_team_identity = make_slack_team_identity(slack_id="T123", bot_user_id="B1")
+    assert get_slack_team_identity("T123").bot_user_id == "B1"
+
+    # e.g. the app is reinstalled
+    slack_team_identity.bot_user_id = "B2"
+    slack_team_identity.save()
+    assert get_slack_team_identity("T123").bot_user_id == "B2"
+
+    slack_team_identity.delete()
+    assert get_slack_team_identity("T123") is None
+
+
+@pytest.mark.django_db
+def test_get_slack_user_identity_cached(make_slack_team_identity, make_slack_user_identity):
+    slack_team_identity = make_slack_team_identity()
+    slack_user_identity = make_slack_user_identity(slack_team_identity=slack_team_identity, slack_id="U1")
+
+    assert get_slack_user_identity(slack_team_identity, "U1").pk == slack_user_identity.pk
+    with CaptureQueriesContext(connection) as queries:
+        assert get_slack_user_identity(slack_team_identity, "U1").pk == slack_user_identity.pk
+    assert len(queries) == 0
+
+    # missing identities are not cached, so a newly connected user is picked up right away
+    assert get_slack_user_identity(slack_team_identity, "U2") is None
+    new_slack_user_identity = make_slack_user_identity(slack_team_identity=slack_team_identity, slack_id="U2")
+    assert get_slack_user_identity(slack_team_identity, "U2").pk == new_slack_user_identity.pk
+
+
+@pytest.mark.django_db
+def test_get_bot_user_id_cached(make_slack_team_identity):
+    slack_team_identity = make_slack_team_identity()
+    slack_client = SlackClient(slack_team_identity)
+
+    with patch.object(SlackClient, "bots_info", return_value={"bot": {"user_id": "U_BOT"}}) as mock_bots_info:
+        assert get_bot_user_id(slack_client, slack_team_identity, "B1") == "U_BOT"
+        assert get_bot_user_id(slack_client, slack_team_identity, "B1") == "U_BOT"
+
+    mock_bots_info.assert_called_once_with(bot="B1")
@@ -0,0 +1,135 @@
+import pytest
+
+from apps.slack.routing import ScenarioRouter
+from apps.slack.scenarios.scenario_step import ScenarioStep
+from apps.slack.types import BlockActionType, EventType, InteractiveMessageActionType, PayloadType
+
+
+class StepA(ScenarioStep):
+    pass
+
+
+class StepB(ScenarioStep):
+    pass
+
+
+class StepC(ScenarioStep):
+    pass
+
+
+ROUTES = [
+    {
+        "payload_type": PayloadType.BLOCK_ACTIONS,
+        "block_action_type": BlockActionType.BUTTON,
+        "block_action_id": "StepAB",
+        "step": StepA,
+    },
+    {
+        "payload_type": PayloadType.BLOCK_ACTIONS,
+        "block_action_type": BlockActionType.BUTTON,
+        "block_action_id": "Step",
+        "step": StepB,
+    },
+    {
+        "payload_type": PayloadType.BLOCK_ACTIONS,
+        "block_action_type": BlockActionType.STATIC_SELECT,
+        "block_action_id": "StepAB",
+        "step": StepC,
+    },
+    {
+        "payload_type": PayloadType.INTERACTIVE_MESSAGE,
+        "action_type": InteractiveMessageActionType.BUTTON,
+        "action_name": "StepA",
+        "step": StepA,
+    },
+    {
+        "payload_type": PayloadType.SLASH_COMMAND,
+        "command_name": ["/oncall", "/escalate"],
+        "step": StepB,
+    },
+    {
+        "payload_type": PayloadType.EVENT_CALLBACK,
+        "event_type": EventType.MESSAGE,
+        "message_channel_type": EventType.MESSAGE_CHANNEL,
+        "step": StepC,
+    },
+    {
+        "payload_type": PayloadType.EVENT_CALLBACK,
+        "event_type": EventType.MESSAGE,
+        "step": StepA,
+    },
+    {
+        "payload_type": PayloadType.VIEW_SUBMISSION,
+        "view_callback_id": "StepB",
+        "step": StepB,
+    },
+    {
+        "payload_type": PayloadType.MESSAGE_ACTION,
+        "message_action_callback_id": ["add_resolution_note"],
+        "step": StepC,
+    },
+]
+
+
+def _match_by_iteration(payload):
+    """Reference implementation: check every route against the payload one by one."""
+    steps = []
+    for route in ROUTES:
+        route_payload_type = route["payload_type"]
+        if payload.get("command") and route_payload_type == PayloadType.SLASH_COMMAND:
+            if payload["command"] in route["command_name"]:
+                steps.append(route["step"])
+        if payload.get("type") != route_payload_type:
+            continue
+        if route_payload_type == PayloadType.EVENT_CALLBACK and payload["event"]["type"] == route["event_type"]:
+            steps.append(route["step"])
+        if route_payload_type == PayloadType.BLOCK_ACTIONS:
+            for action in payload["actions"]:
+                if action["type"] == route["block_action_type"] and action["action_id"].startswith(
+                    route["block_action_id"]
+                ):
+                    steps.append(route["step"])
+        if route_payload_type == PayloadType.INTERACTIVE_MESSAGE:
+            for action in payload["actions"]:
+                if action["type"] == route["action_type"] and action["name"].startswith(route["action_name"]):
+                    steps.append(route["step"])
+        if route_payload_type == PayloadType.VIEW_SUBMISSION:
+            if payload["view"]["callback_id"].startswith(route["view_callback_id"]):
+                steps.append(route["step"])
+        if route_payload_type == PayloadType.MESSAGE_ACTION:
+            if payload["callback_id"] in route["message_action_callback_id"]:
+                steps.append(route["step"])
+    return steps
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"type": PayloadType.BLOCK_ACTIONS, "actions": [{"type": BlockActionType.BUTTON, "action_id": "StepAB_1"}]},
+        {"type": PayloadType.BLOCK_ACTIONS, "actions": [{"type": BlockActionType.BUTTON, "action_id": "StepC"}]},
+        {"type": PayloadType.BLOCK_ACTIONS, "actions": [{"type": BlockActionType.BUTTON, "action_id": "Ste"}]},
+        {
+            "type": PayloadType.BLOCK_ACTIONS,
+            "actions": [
+                {"type": BlockActionType.STATIC_SELECT, "action_id": "StepAB"},
+                {"type": BlockActionType.BUTTON, "action_id": "StepAB"},
+            ],
+        },
+        {"type": PayloadType.INTERACTIVE_MESSAGE, "actions": [{"type": "button", "name": "StepA_args"}]},
+        {"command": "/escalate"},
+        {"command": "/unknown"},
+        {"type": PayloadType.EVENT_CALLBACK, "event": {"type": EventType.MESSAGE}},
+        {"type": PayloadType.EVENT_CALLBACK, "event": {"type": EventType.APP_MENTION}},
+        {"type": PayloadType.VIEW_SUBMISSION, "view": {"callback_id": "StepB_modal"}},
+        {"type": PayloadType.MESSAGE_ACTION, "callback_id": "add_resolution_note"},
+    ],
+)
+def test_scenario_router_matches_iteration_order(payload):
+    router = ScenarioRouter(ROUTES)
+    assert router.match(payload) == _match_by_iteration(payload)
+
+
+def test_scenario_router_match_channel_message():
+    router = ScenarioRouter(ROUTES)
+    assert router.match_channel_message(EventType.MESSAGE_CHANNEL) == [StepC]
+    assert router.match_channel_message(None) == []
@@ -2,7 +2,6 @@ import enum
 import typing
 from datetime import datetime
 
-from apps.slack.client import SlackClient
 from apps.slack.errors import SlackAPIChannelNotFoundError
 
 if typing.TYPE_CHECKING:
@@ -62,6 +61,8 @@ class SlackDateFormat(enum.StrEnum):
 
 
 def post_message_to_channel(organization: "Organization", channel_id: str, text: str) -> None:
+    from apps.slack.client import SlackClient
+
     if not organization.slack_team_identity:
         return
 
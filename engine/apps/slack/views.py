@@ -17,6 +17,8 @@ from apps.auth_token.auth import PluginAuthentication
 from apps.base.utils import live_settings
 from apps.slack.client import SlackClient
 from apps.slack.errors import SlackAPIError
+from apps.slack.identity_cache import get_bot_user_id, get_slack_team_identity, get_slack_user_identity
+from apps.slack.routing import ScenarioRouter
 from apps.slack.scenarios.alertgroup_appearance import STEPS_ROUTING as ALERTGROUP_APPEARANCE_ROUTING
 
 # Importing routes from scenarios
@@ -43,7 +45,7 @@ from common.insight_log import ChatOpsEvent, ChatOpsTypePlug, write_chatops_insi
 from common.oncall_gateway import delete_slack_connector
 
 from .errors import SlackAPITokenError
-from .models import SlackMessage, SlackTeamIdentity, SlackUserIdentity
+from .models import SlackMessage, SlackTeamIdentity
 
 SCENARIOS_ROUTES: ScenarioRoute.RoutingSteps = []
 SCENARIOS_ROUTES.extend(ONBOARDING_STEPS_ROUTING)
@@ -63,6 +65,17 @@ SCENARIOS_ROUTES.extend(MANAGE_RESPONDERS_ROUTING)
 SCENARIOS_ROUTES.extend(DECLARE_INCIDENT_ROUTING)
 SCENARIOS_ROUTES.extend(NOTIFIED_USER_NOT_IN_CHANNEL_ROUTING)
 
+SCENARIOS_ROUTER = ScenarioRouter(SCENARIOS_ROUTES)
+
+# payload types for which a step can return a response to Slack instead of the default empty 200
+STEP_RESULT_RESPONSE_PAYLOAD_TYPES = (
+    PayloadType.INTERACTIVE_MESSAGE,
+    PayloadType.DIALOG_SUBMISSION,
+    PayloadType.VIEW_SUBMISSION,
+)
+
+EDIT_SCHEDULE_ACTIONS = {s["block_action_id"] for s in SCHEDULES_ROUTING}
+
 logger = logging.getLogger(__name__)
 
 
@@ -138,15 +151,12 @@ class SlackEventApiEndpointView(APIView):
 
         payload_type = payload.get("type")
         payload_type_is_block_actions = payload_type == PayloadType.BLOCK_ACTIONS
-        payload_command = payload.get("command")
-        payload_callback_id = payload.get("callback_id")
         payload_actions = payload.get("actions", [])
         payload_user = payload.get("user")
         payload_user_id = payload.get("user_id")
 
-        edit_schedule_actions = {s["block_action_id"] for s in SCHEDULES_ROUTING}
         payload_action_edit_schedule = (
-            payload_actions[0].get("action_id") in edit_schedule_actions if payload_actions else False
+            payload_actions[0].get("action_id") in EDIT_SCHEDULE_ACTIONS if payload_actions else False
         )
 
         payload_event = payload.get("event", {})
@@ -219,8 +229,7 @@ class SlackEventApiEndpointView(APIView):
             elif (
                 payload_event_bot_id and slack_team_identity and payload_event_channel_type == EventType.MESSAGE_CHANNEL
             ):
-                response = sc.bots_info(bot=payload_event_bot_id)
-                bot_user_id = response.get("bot", {}).get("user_id", "")
+                bot_user_id = get_bot_user_id(sc, slack_team_identity, payload_event_bot_id)
 
                 # Don't react on own bot's messages.
                 if bot_user_id == slack_team_identity.bot_user_id:
@@ -239,10 +248,7 @@ class SlackEventApiEndpointView(APIView):
             slack_user_id = payload_user_id
 
         if slack_user_id is not None and slack_user_id != slack_team_identity.bot_user_id:
-            slack_user_identity = SlackUserIdentity.objects.filter(
-                slack_id=slack_user_id,
-                slack_team_identity=slack_team_identity,
-            ).first()
+            slack_user_identity = get_slack_user_identity(slack_team_identity, slack_user_id)
 
         organization = self._get_organization_from_payload(payload, slack_team_identity)
         logger.info("Organization: " + str(organization))
@@ -315,13 +321,11 @@ class SlackEventApiEndpointView(APIView):
                     ]
                 )
             ):
-                for route in SCENARIOS_ROUTES:
-                    if payload_event_channel_type == route.get("message_channel_type"):
-                        Step = route["step"]
-                        logger.info("Routing to {}".format(Step))
-                        step = Step(slack_team_identity, organization, user)
-                        step.process_scenario(slack_user_identity, slack_team_identity, payload)
-                        step_was_found = True
+                for Step in SCENARIOS_ROUTER.match_channel_message(payload_event_channel_type):
+                    logger.info("Routing to {}".format(Step))
+                    step = Step(slack_team_identity, organization, user)
+                    step.process_scenario(slack_user_identity, slack_team_identity, payload)
+                    step_was_found = True
             # We don't do anything on app mention, but we doesn't want to unsubscribe from this event yet.
             if event_type == EventType.APP_MENTION:
                 logger.info(f"Received event of type {EventType.APP_MENTION} from slack. Skipping.")
@@ -329,80 +333,13 @@ class SlackEventApiEndpointView(APIView):
 
         # Routing to Steps based on routing rules
         if not step_was_found:
-            for route in SCENARIOS_ROUTES:
-                route_payload_type = route["payload_type"]
-
-                # Slash commands have to "type"
-                if payload_command and route_payload_type == PayloadType.SLASH_COMMAND:
-                    if payload_command in route["command_name"]:
-                        Step = route["step"]
-                        logger.info("Routing to {}".format(Step))
-                        step = Step(slack_team_identity, organization, user)
-                        step.process_scenario(slack_user_identity, slack_team_identity, payload)
-                        step_was_found = True
-
-                if payload_type == route_payload_type:
-                    if payload_type == PayloadType.EVENT_CALLBACK:
-                        if payload_event_type == route["event_type"]:
-                            # event_name is used for stateful
-                            if "event_name" not in route:
-                                Step = route["step"]
-                                logger.info("Routing to {}".format(Step))
-                                step = Step(slack_team_identity, organization, user)
-                                step.process_scenario(slack_user_identity, slack_team_identity, payload)
-                                step_was_found = True
-
-                    if payload_type == PayloadType.INTERACTIVE_MESSAGE:
-                        for action in payload_actions:
-                            if action["type"] == route["action_type"]:
-                                # Action name may also contain action arguments.
-                                # So only beginning is used for routing.
-                                if action["name"].startswith(route["action_name"]):
-                                    Step = route["step"]
-                                    logger.info("Routing to {}".format(Step))
-                                    step = Step(slack_team_identity, organization, user)
-                                    result = step.process_scenario(slack_user_identity, slack_team_identity, payload)
-                                    if result is not None:
-                                        return result
-                                    step_was_found = True
-
-                    if payload_type_is_block_actions:
-                        for action in payload_actions:
-                            if action["type"] == route["block_action_type"]:
-                                if action["action_id"].startswith(route["block_action_id"]):
-                                    Step = route["step"]
-                                    logger.info("Routing to {}".format(Step))
-                                    step = Step(slack_team_identity, organization, user)
-                                    step.process_scenario(slack_user_identity, slack_team_identity, payload)
-                                    step_was_found = True
-
-                    if payload_type == PayloadType.DIALOG_SUBMISSION:
-                        if payload_callback_id == route["dialog_callback_id"]:
-                            Step = route["step"]
-                            logger.info("Routing to {}".format(Step))
-                            step = Step(slack_team_identity, organization, user)
-                            result = step.process_scenario(slack_user_identity, slack_team_identity, payload)
-                            if result is not None:
-                                return result
-                            step_was_found = True
-
-                    if payload_type == PayloadType.VIEW_SUBMISSION:
-                        if payload["view"]["callback_id"].startswith(route["view_callback_id"]):
-                            Step = route["step"]
-                            logger.info("Routing to {}".format(Step))
-                            step = Step(slack_team_identity, organization, user)
-                            result = step.process_scenario(slack_user_identity, slack_team_identity, payload)
-                            if result is not None:
-                                return result
-                            step_was_found = True
-
-                    if payload_type == PayloadType.MESSAGE_ACTION:
-                        if payload_callback_id in route["message_action_callback_id"]:
-                            Step = route["step"]
-                            logger.info("Routing to {}".format(Step))
-                            step = Step(slack_team_identity, organization, user)
-                            step.process_scenario(slack_user_identity, slack_team_identity, payload)
-                            step_was_found = True
+            for Step in SCENARIOS_ROUTER.match(payload):
+                logger.info("Routing to {}".format(Step))
+                step = Step(slack_team_identity, organization, user)
+                result = step.process_scenario(slack_user_identity, slack_team_identity, payload)
+                if result is not None and payload_type in STEP_RESULT_RESPONSE_PAYLOAD_TYPES:
+                    return result
+                step_was_found = True
 
         if not step_was_found:
             raise Exception("Step is undefined" + str(payload))
@@ -420,10 +357,7 @@ class SlackEventApiEndpointView(APIView):
 
             return None
 
-        try:
-            return SlackTeamIdentity.objects.get(slack_id=_slack_team_id())
-        except SlackTeamIdentity.DoesNotExist:
-            return None
+        return get_slack_team_identity(_slack_team_id())
 
     @staticmethod
     def _get_organization_from_payload(
@@ -3,7 +3,7 @@ import logging
 from apps.alerts.models import AlertGroup
 from apps.alerts.representative import AlertGroupAbstractRepresentative
 from apps.telegram.models import TelegramMessage
-from apps.telegram.tasks import edit_message, on_create_alert_telegram_representative_async
+from apps.telegram.tasks import on_create_alert_telegram_representative_async, queue_messages_edit
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -46,15 +46,15 @@ class AlertGroupTelegramRepresentative(AlertGroupAbstractRepresentative):
 
     # Process all alert group actions (ack, resolve, etc.)
     def on_alert_group_action(self):
-        messages_to_edit = self.log_record.alert_group.telegram_messages.filter(
+        alert_group = self.log_record.alert_group
+        messages_to_edit = alert_group.telegram_messages.filter(
             message_type__in=(
                 TelegramMessage.ALERT_GROUP_MESSAGE,
                 TelegramMessage.ACTIONS_MESSAGE,
                 TelegramMessage.PERSONAL_MESSAGE,
             )
-        )
-        for message in messages_to_edit:
-            edit_message.delay(message_pk=message.pk)
+        ).values_list("pk", flat=True)
+        queue_messages_edit(alert_group.pk, list(messages_to_edit))
 
     @classmethod
     def on_alert_group_update_log_report(cls, **kwargs):
@@ -68,10 +68,8 @@ class AlertGroupTelegramRepresentative(AlertGroupAbstractRepresentative):
                 TelegramMessage.LOG_MESSAGE,
                 TelegramMessage.PERSONAL_MESSAGE,
             )
-        )
-
-        for message in messages_to_edit:
-            edit_message.delay(message_pk=message.pk)
+        ).values_list("pk", flat=True)
+        queue_messages_edit(alert_group.pk, list(messages_to_edit))
 
     @classmethod
     def on_alert_group_action_triggered(cls, **kwargs):
@@ -1,10 +1,7 @@
 import logging
+import typing
 from typing import Optional, Tuple, Union
 
-from telegram import Bot, InlineKeyboardMarkup, Message, ParseMode
-from telegram.error import BadRequest, InvalidToken, Unauthorized
-from telegram.utils.request import Request
-
 from apps.alerts.models import AlertGroup
 from apps.base.utils import live_settings
 from apps.telegram.models import TelegramMessage
@@ -12,24 +9,34 @@ from apps.telegram.renderers.keyboard import TelegramKeyboardRenderer
 from apps.telegram.renderers.message import TelegramMessageRenderer
 from common.api_helpers.utils import create_engine_url
 
+if typing.TYPE_CHECKING:
+    from telegram import Bot, InlineKeyboardMarkup, Message
+
 logger = logging.getLogger(__name__)
 
 
 class TelegramClient:
     ALLOWED_UPDATES = ("message", "callback_query")
-    PARSE_MODE = ParseMode.HTML
+    PARSE_MODE = "HTML"  # telegram.ParseMode.HTML
 
     def __init__(self, token: Optional[str] = None):
         self.token = token or live_settings.TELEGRAM_TOKEN
 
         if self.token is None:
+            from telegram.error import InvalidToken
+
             raise InvalidToken()
 
     @property
-    def api_client(self) -> Bot:
+    def api_client(self) -> "Bot":
+        from telegram import Bot
+        from telegram.utils.request import Request
+
         return Bot(self.token, request=Request(read_timeout=15))
 
     def is_chat_member(self, chat_id: Union[int, str]) -> bool:
+        from telegram.error import Unauthorized
+
         try:
             self.api_client.get_chat(chat_id=chat_id)
             return True
@@ -60,7 +67,7 @@ class TelegramClient:
         alert_group: AlertGroup,
         reply_to_message_id: Optional[int] = None,
     ) -> TelegramMessage:
-        text, keyboard = self._get_message_and_keyboard(message_type=message_type, alert_group=alert_group)
+        text, keyboard = self.get_message_and_keyboard(message_type=message_type, alert_group=alert_group)
 
         raw_message = self.send_raw_message(
             chat_id=chat_id, text=text, keyboard=keyboard, reply_to_message_id=reply_to_message_id
@@ -75,9 +82,11 @@ class TelegramClient:
         self,
         chat_id: Union[int, str],
         text: str,
-        keyboard: Optional[InlineKeyboardMarkup] = None,
+        keyboard: Optional["InlineKeyboardMarkup"] = None,
         reply_to_message_id: Optional[int] = None,
-    ) -> Message:
+    ) -> "Message":
+        from telegram.error import BadRequest
+
         try:
             message = self.api_client.send_message(
                 chat_id=chat_id,
@@ -94,7 +103,7 @@ class TelegramClient:
         return message
 
     def edit_message(self, message: TelegramMessage) -> TelegramMessage:
-        text, keyboard = self._get_message_and_keyboard(
+        text, keyboard = self.get_message_and_keyboard(
             message_type=message.message_type, alert_group=message.alert_group
         )
 
@@ -106,8 +115,8 @@ class TelegramClient:
         chat_id: Union[int, str],
         message_id: Union[int, str],
         text: str,
-        keyboard: Optional[InlineKeyboardMarkup] = None,
-    ) -> Union[Message, bool]:
+        keyboard: Optional["InlineKeyboardMarkup"] = None,
+    ) -> Union["Message", bool]:
         return self.api_client.edit_message_text(
             chat_id=chat_id,
             message_id=message_id,
@@ -118,9 +127,9 @@ class TelegramClient:
         )
 
     @staticmethod
-    def _get_message_and_keyboard(
+    def get_message_and_keyboard(
         message_type: int, alert_group: AlertGroup
-    ) -> Tuple[str, Optional[InlineKeyboardMarkup]]:
+    ) -> Tuple[str, Optional["InlineKeyboardMarkup"]]:
         message_renderer = TelegramMessageRenderer(alert_group=alert_group)
         keyboard_renderer = TelegramKeyboardRenderer(alert_group=alert_group)
 
@@ -157,6 +166,6 @@ class TelegramClient:
             text = message_renderer.render_link_to_channel_message(include_title=include_title)
             keyboard = keyboard_renderer.render_link_to_channel_keyboard(link=link)
         else:
-            raise Exception(f"_get_message_and_keyboard with type {message_type} is not implemented")
+            raise Exception(f"get_message_and_keyboard with type {message_type} is not implemented")
 
         return text, keyboard
@@ -1,8 +1,6 @@
 import logging
 from functools import wraps
 
-from telegram import error
-
 from apps.telegram.client import TelegramClient
 
 logger = logging.getLogger(__name__)
@@ -11,6 +9,8 @@ logger = logging.getLogger(__name__)
 def handle_missing_token(f):
     @wraps(f)
     def decorated(*args, **kwargs):
+        from telegram import error
+
         try:
             TelegramClient()
         except error.InvalidToken as e:
@@ -28,6 +28,8 @@ def handle_missing_token(f):
 def ignore_bot_deleted(f):
     @wraps(f)
     def decorated(*args, **kwargs):
+        from telegram import error
+
         try:
             return f(*args, **kwargs)
         except error.Unauthorized:
@@ -36,42 +38,11 @@ def ignore_bot_deleted(f):
     return decorated
 
 
-def ignore_message_unchanged(f):
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        try:
-            return f(*args, **kwargs)
-        except error.BadRequest as e:
-            if "Message is not modified" in e.message:
-                logger.warning(
-                    f"Tried to change Telegram message, but update is identical to original message. "
-                    f"args: {args}, kwargs: {kwargs}"
-                )
-            else:
-                raise e
-
-    return decorated
-
-
-def ignore_message_to_edit_deleted(f):
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        try:
-            return f(*args, **kwargs)
-        except error.BadRequest as e:
-            if "Message to edit not found" in e.message:
-                logger.warning(
-                    f"Tried to edit Telegram message, but message was deleted. args: {args}, kwargs: {kwargs}"
-                )
-            else:
-                raise e
-
-    return decorated
-
-
 def ignore_reply_to_message_deleted(f):
     @wraps(f)
     def decorated(*args, **kwargs):
+        from telegram import error
+
         try:
             return f(*args, **kwargs)
         except error.BadRequest as e:
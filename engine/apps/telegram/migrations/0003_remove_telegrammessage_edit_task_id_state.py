@@ -0,0 +1,18 @@
+# Generated by Django 3.2.20 on 2026-10-19 12:00
+
+import common.migrations.remove_field
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telegram', '0002_alter_telegrammessage_message_type'),
+    ]
+
+    operations = [
+        common.migrations.remove_field.RemoveFieldState(
+            model_name='TelegramMessage',
+            name='edit_task_id',
+        ),
+    ]
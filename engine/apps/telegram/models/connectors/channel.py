@@ -5,13 +5,12 @@ from django.conf import settings
 from django.core.validators import MinLengthValidator
 from django.db import models
 from django.db.models import Q
-from telegram import error
 
 from apps.alerts.models import AlertGroup
 from apps.telegram.client import TelegramClient
 from apps.telegram.models import TelegramMessage
 from common.insight_log.chatops_insight_logs import ChatOpsEvent, ChatOpsTypePlug, write_chatops_insight_log
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -23,20 +22,10 @@ logger = logging.getLogger(__name__)
 
 
 def generate_public_primary_key_for_telegram_to_at_connector() -> str:
-    prefix = "Z"
-    new_public_primary_key = generate_public_primary_key(prefix)
+    return generate_public_primary_key("Z")
 
-    failure_counter = 0
-    while TelegramToOrganizationConnector.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="TelegramToOrganizationConnector"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
 
-
-class TelegramToOrganizationConnector(models.Model):
+class TelegramToOrganizationConnector(PublicPrimaryKeyModelMixin, models.Model):
     channel_filter: "RelatedManager['ChannelFilter']"
 
     public_primary_key = models.CharField(
@@ -116,6 +105,8 @@ class TelegramToOrganizationConnector(models.Model):
         )
 
     def send_alert_group_message(self, alert_group: AlertGroup) -> None:
+        from telegram import error
+
         telegram_client = TelegramClient()
 
         try:
@@ -1,5 +1,4 @@
 from django.db import models
-from telegram import error
 
 from apps.alerts.models import AlertGroup
 from apps.base.models import UserNotificationPolicy, UserNotificationPolicyLogRecord
@@ -67,6 +66,8 @@ class TelegramToUserConnector(models.Model):
 
     # send the actual alert group and log to user's DM
     def send_full_alert_group(self, alert_group: AlertGroup, notification_policy: UserNotificationPolicy) -> None:
+        from telegram import error
+
         try:
             telegram_client = TelegramClient()
         except error.InvalidToken:
@@ -128,6 +129,8 @@ class TelegramToUserConnector(models.Model):
 
     # send DM message with the link to the alert group post in channel
     def send_link_to_channel_message(self, alert_group: AlertGroup, notification_policy: UserNotificationPolicy):
+        from telegram import error
+
         try:
             telegram_client = TelegramClient()
         except error.InvalidToken:
@@ -1,8 +1,12 @@
-import telegram
+import typing
+
 from django.db import models
 
 from apps.alerts.models import AlertGroup
 
+if typing.TYPE_CHECKING:
+    import telegram
+
 
 class TelegramMessage(models.Model):
     (
@@ -38,16 +42,15 @@ class TelegramMessage(models.Model):
         related_name="telegram_messages",
     )
 
-    # field for task debouncing for apps.telegram.tasks.edit_message
-    edit_task_id = models.CharField(max_length=100, null=True, default=None)
-
     @property
     def link(self) -> str:
         chat_slug = self.chat_id[-10:]
         return f"https://t.me/c/{chat_slug}/{self.message_id}?thread={self.message_id}"
 
     @staticmethod
-    def create_from_message(message: telegram.Message, message_type: int, alert_group: AlertGroup) -> "TelegramMessage":
+    def create_from_message(
+        message: "telegram.Message", message_type: int, alert_group: AlertGroup
+    ) -> "TelegramMessage":
         return TelegramMessage.objects.create(
             message_id=message.message_id, chat_id=message.chat.id, message_type=message_type, alert_group=alert_group
         )
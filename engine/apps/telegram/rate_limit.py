@@ -0,0 +1,51 @@
+"""
+Rate limiting for Telegram Bot API calls shared by all the workers.
+
+Telegram allows a bot to send about 30 messages per second overall, 20 messages per minute to the same group
+or channel and about one message per second to the same private chat. Hitting the limits results in RetryAfter
+errors, so the limits are checked before calling the API.
+"""
+import math
+import time
+import typing
+
+from django.core.cache import cache
+
+# (max calls, period in seconds)
+TELEGRAM_GLOBAL_RATE_LIMIT = (30, 1)
+TELEGRAM_GROUP_CHAT_RATE_LIMIT = (20, 60)
+TELEGRAM_PRIVATE_CHAT_RATE_LIMIT = (1, 1)
+
+
+def _take_token(key: str, rate_limit: typing.Tuple[int, int]) -> float:
+    """
+    Take a token from a bucket of `max calls` tokens which is refilled every `period` seconds.
+    Returns 0 if a token was taken, otherwise the number of seconds until the bucket is refilled.
+    """
+    max_calls, period = rate_limit
+    now = time.time()
+    window = math.floor(now / period)
+    bucket_key = f"telegram_rate_limit_{key}_{window}"
+
+    cache.add(bucket_key, 0, timeout=period * 2)
+    if cache.incr(bucket_key) > max_calls:
+        return (window + 1) * period - now
+    return 0
+
+
+def get_chat_rate_limit(chat_id: typing.Union[int, str]) -> typing.Tuple[int, int]:
+    # group and channel ids are negative
+    if str(chat_id).startswith("-"):
+        return TELEGRAM_GROUP_CHAT_RATE_LIMIT
+    return TELEGRAM_PRIVATE_CHAT_RATE_LIMIT
+
+
+def acquire(chat_id: typing.Union[int, str]) -> float:
+    """
+    Check both per-chat and global rate limits before calling Telegram API for the chat.
+    Returns 0 if the call is allowed, otherwise the number of seconds to wait before trying again.
+    """
+    wait = _take_token(f"chat_{chat_id}", get_chat_rate_limit(chat_id))
+    if wait:
+        return wait
+    return _take_token("global", TELEGRAM_GLOBAL_RATE_LIMIT)
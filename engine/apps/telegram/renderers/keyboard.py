@@ -1,11 +1,12 @@
 import typing
 from enum import Enum
 
-from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-
 from apps.alerts.models import AlertGroup
 from apps.telegram.utils import CallbackQueryFactory
 
+if typing.TYPE_CHECKING:
+    from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
 
 class Action(Enum):
     ACKNOWLEDGE = "acknowledge"
@@ -40,7 +41,9 @@ class TelegramKeyboardRenderer:
         self.alert_group = alert_group
 
     # Inline keyboard with controls for alert group message
-    def render_actions_keyboard(self) -> typing.Optional[InlineKeyboardMarkup]:
+    def render_actions_keyboard(self) -> typing.Optional["InlineKeyboardMarkup"]:
+        from telegram import InlineKeyboardMarkup
+
         if self.alert_group.root_alert_group is not None:
             # No keyboard for attached alert group
             return None
@@ -64,22 +67,24 @@ class TelegramKeyboardRenderer:
         return InlineKeyboardMarkup(rows)
 
     @staticmethod
-    def render_link_to_channel_keyboard(link: str) -> InlineKeyboardMarkup:
+    def render_link_to_channel_keyboard(link: str) -> "InlineKeyboardMarkup":
+        from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
         button = InlineKeyboardButton(text="Go to the alert group", url=link)
         return InlineKeyboardMarkup([[button]])
 
     @property
-    def acknowledge_button(self) -> InlineKeyboardButton:
+    def acknowledge_button(self) -> "InlineKeyboardButton":
         action = Action.ACKNOWLEDGE if not self.alert_group.acknowledged else Action.UNACKNOWLEDGE
         return self._render_button(text=action.value.capitalize(), action=action)
 
     @property
-    def resolve_button(self) -> InlineKeyboardButton:
+    def resolve_button(self) -> "InlineKeyboardButton":
         action = Action.RESOLVE if not self.alert_group.resolved else Action.UNRESOLVE
         return self._render_button(text=action.value.capitalize(), action=action)
 
     @property
-    def silence_buttons(self) -> typing.List[InlineKeyboardButton]:
+    def silence_buttons(self) -> typing.List["InlineKeyboardButton"]:
         silence_forever_button = self._render_button(text="🔕 forever", action=Action.SILENCE)
 
         silence_delay_one_hour = 3600  # one hour
@@ -95,10 +100,12 @@ class TelegramKeyboardRenderer:
         return [silence_forever_button, silence_one_hour_button, silence_four_hours_button]
 
     @property
-    def unsilence_button(self) -> InlineKeyboardButton:
+    def unsilence_button(self) -> "InlineKeyboardButton":
         return self._render_button(text=Action.UNSILENCE.value.capitalize(), action=Action.UNSILENCE)
 
     def _render_button(self, text: str, action: Action, action_data: typing.Optional[typing.Union[int, str]] = None):
+        from telegram import InlineKeyboardButton
+
         action_code = ACTION_TO_CODE_MAP[action.value]
         callback_data_args: typing.List[typing.Union[int, str]] = [self.alert_group.pk, action_code]
         if action_data is not None:
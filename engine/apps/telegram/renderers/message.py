@@ -5,7 +5,6 @@ from apps.alerts.incident_appearance.renderers.telegram_renderer import (
 from apps.alerts.incident_log_builder import IncidentLogBuilder
 from apps.alerts.models import AlertGroup, AlertGroupLogRecord
 from apps.base.models import UserNotificationPolicyLogRecord
-from apps.slack.slack_formatter import SlackFormatter
 from common.utils import is_string_with_visible_characters
 
 MAX_TELEGRAM_MESSAGE_LENGTH = 4096
@@ -25,25 +24,24 @@ class TelegramMessageRenderer:
         return text
 
     def render_log_message(self, max_message_length: int = MAX_TELEGRAM_MESSAGE_LENGTH) -> str:
+        from apps.slack.slack_formatter import SlackFormatter
+
         start_line_text = "Alert group log:\n"
 
         slack_formatter = SlackFormatter(self.alert_group.channel.organization)
-        log_builder = IncidentLogBuilder(alert_group=self.alert_group)
-        log_records = log_builder.get_log_records_list()
 
-        log_lines = []
-        for log_record in log_records:
+        def _render_log_record(log_record):
             if isinstance(log_record, AlertGroupLogRecord):
                 log_line = log_record.rendered_incident_log_line(html=True)
 
                 # dirty hack to deal with attach / unattach logs
                 log_line = slack_formatter.render_text(log_line, process_markdown=True)
-                log_line = log_line.replace("<p>", "").replace("</p>", "")
-
-                log_lines.append(log_line)
+                return log_line.replace("<p>", "").replace("</p>", "")
             elif isinstance(log_record, UserNotificationPolicyLogRecord):
-                log_line = log_record.rendered_notification_log_line(html=True)
-                log_lines.append(log_line)
+                return log_record.rendered_notification_log_line(html=True)
+
+        log_builder = IncidentLogBuilder(alert_group=self.alert_group)
+        log_lines = log_builder.get_rendered_log_records_list("telegram", _render_log_record)
 
         message_trimmed_text = MESSAGE_TRIMMED_TEXT.format(link=self.alert_group.web_link)
         max_log_lines_length = max_message_length - len(start_line_text) - len(message_trimmed_text)
@@ -1,20 +1,15 @@
 import logging
+import math
 
-from celery import uuid as celery_uuid
 from celery.utils.log import get_task_logger
 from django.conf import settings
-from telegram import error
+from django.core.cache import cache
 
 from apps.alerts.models import Alert, AlertGroup
 from apps.base.models import UserNotificationPolicy
+from apps.telegram import rate_limit as telegram_rate_limit
 from apps.telegram.client import TelegramClient
-from apps.telegram.decorators import (
-    handle_missing_token,
-    ignore_bot_deleted,
-    ignore_message_to_edit_deleted,
-    ignore_message_unchanged,
-    ignore_reply_to_message_deleted,
-)
+from apps.telegram.decorators import handle_missing_token, ignore_bot_deleted, ignore_reply_to_message_deleted
 from apps.telegram.models import TelegramMessage, TelegramToOrganizationConnector
 from common.custom_celery_tasks import shared_dedicated_queue_retry_task
 from common.utils import OkToRetry
@@ -28,6 +23,8 @@ logger.setLevel(logging.DEBUG)
 )
 @handle_missing_token
 def register_telegram_webhook(token=None):
+    from telegram import error
+
     if settings.FEATURE_TELEGRAM_LONG_POLLING_ENABLED:
         return
 
@@ -39,46 +36,116 @@ def register_telegram_webhook(token=None):
         logger.warning(f"Tried to register Telegram webhook using token: {telegram_client.token}, got error: {e}")
 
 
+# edits requested within this time are merged into a single edit of the latest alert group state
+TELEGRAM_EDIT_DEBOUNCE_SECONDS = 1
+TELEGRAM_EDIT_QUEUE_TIMEOUT = 60 * 60
+TELEGRAM_EDIT_TASK_TIMEOUT = 60 * 5
+
+
+def _get_pending_edit_key(message_pk):
+    return f"telegram_message_pending_edit_{message_pk}"
+
+
+def _get_edits_scheduled_key(alert_group_pk):
+    return f"telegram_message_edits_scheduled_{alert_group_pk}"
+
+
+def queue_messages_edit(alert_group_pk, message_pks, countdown=TELEGRAM_EDIT_DEBOUNCE_SECONDS):
+    """
+    Mark Telegram messages of the alert group to be edited by edit_alert_group_messages.
+    Edits for the same message requested before the task runs are merged.
+    """
+    if not message_pks:
+        return
+
+    cache.set_many({_get_pending_edit_key(pk): True for pk in message_pks}, timeout=TELEGRAM_EDIT_QUEUE_TIMEOUT)
+    # pending edits are stored before checking the flag, so they're either picked up by a scheduled task
+    # or schedule a new one
+    if cache.add(_get_edits_scheduled_key(alert_group_pk), True, timeout=TELEGRAM_EDIT_TASK_TIMEOUT):
+        edit_alert_group_messages.apply_async((alert_group_pk,), countdown=countdown)
+
+
 @shared_dedicated_queue_retry_task(
-    bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else None
+    autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else None
 )
-@ignore_message_unchanged
-@ignore_message_to_edit_deleted
-@ignore_bot_deleted
-def edit_message(self, message_pk):
-    message = TelegramMessage.objects.get(pk=message_pk)
-    telegram_client = TelegramClient()
+@handle_missing_token
+def edit_alert_group_messages(alert_group_pk):
+    """
+    Edit the Telegram messages of the alert group that have pending edits.
+    Each message type is rendered once for all the channel and personal messages.
+    """
+    from telegram import error
 
-    # if edit_task_id was not set at the time task was invoked, assign it and rerun the task
-    if message.edit_task_id is None:
-        task_id = celery_uuid()
-        message.edit_task_id = task_id
-        message.save(update_fields=["edit_task_id"])
+    # edits requested after this point schedule a new task
+    cache.delete(_get_edits_scheduled_key(alert_group_pk))
 
-        edit_message.apply_async((message_pk,), task_id=task_id)
+    try:
+        alert_group = AlertGroup.objects.select_related("channel__organization").get(pk=alert_group_pk)
+    except AlertGroup.DoesNotExist:
+        logger.warning(f"Alert group {alert_group_pk} does not exist")
         return
 
-    if message.edit_task_id != edit_message.request.id:
-        logger.debug("Dropping the task since another task was scheduled already.")
+    messages = list(alert_group.telegram_messages.all())
+    pending_edit_keys = cache.get_many([_get_pending_edit_key(message.pk) for message in messages])
+    messages = [message for message in messages if _get_pending_edit_key(message.pk) in pending_edit_keys]
+    if not messages:
         return
+    cache.delete_many(pending_edit_keys.keys())
 
-    try:
-        telegram_client.edit_message(message=message)
-    except error.BadRequest as e:
-        if "Message is not modified" in e.message:
-            pass
-    except (error.RetryAfter, error.TimedOut) as e:
-        countdown = getattr(e, "retry_after", 3)
-
-        task_id = celery_uuid()
-        message.edit_task_id = task_id
-        message.save(update_fields=["edit_task_id"])
-
-        edit_message.apply_async((message_pk,), countdown=countdown, task_id=task_id)
-        return
+    telegram_client = TelegramClient()
+    rendered_messages = {}
+
+    for i, message in enumerate(messages):
+        wait = telegram_rate_limit.acquire(message.chat_id)
+        if wait:
+            queue_messages_edit(alert_group_pk, [m.pk for m in messages[i:]], countdown=math.ceil(wait))
+            return
+
+        # use the same alert group instance for all the messages
+        message.alert_group = alert_group
+        if message.message_type not in rendered_messages:
+            rendered_messages[message.message_type] = telegram_client.get_message_and_keyboard(
+                message_type=message.message_type, alert_group=alert_group
+            )
+        text, keyboard = rendered_messages[message.message_type]
 
-    message.edit_task_id = None
-    message.save(update_fields=["edit_task_id"])
+        try:
+            telegram_client.edit_raw_message(
+                chat_id=message.chat_id, message_id=message.message_id, text=text, keyboard=keyboard
+            )
+        except error.BadRequest as e:
+            if "Message is not modified" in e.message or "Message to edit not found" in e.message:
+                logger.warning(f"Skip editing Telegram message {message.pk}: {e.message}")
+            else:
+                _restore_pending_edits(messages[i:])
+                raise
+        except error.Unauthorized:
+            logger.warning(f"Tried to edit Telegram message {message.pk}, but user deleted the bot")
+        except (error.RetryAfter, error.TimedOut) as e:
+            countdown = getattr(e, "retry_after", 3)
+            queue_messages_edit(alert_group_pk, [m.pk for m in messages[i:]], countdown=countdown)
+            return
+        except Exception:
+            _restore_pending_edits(messages[i:])
+            raise
+
+
+def _restore_pending_edits(messages):
+    # pending edits are cleared before editing, so edits requested meanwhile aren't lost;
+    # on unexpected errors they're restored for the task retry to pick up
+    cache.set_many(
+        {_get_pending_edit_key(message.pk): True for message in messages}, timeout=TELEGRAM_EDIT_QUEUE_TIMEOUT
+    )
+
+
+@shared_dedicated_queue_retry_task(
+    bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else None
+)
+def edit_message(self, message_pk):
+    # kept for tasks queued before edits were merged by edit_alert_group_messages
+    message = TelegramMessage.objects.filter(pk=message_pk).first()
+    if message is not None:
+        queue_messages_edit(message.alert_group_id, [message.pk])
 
 
 @shared_dedicated_queue_retry_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=None)
@@ -120,6 +187,8 @@ def send_link_to_channel_message_or_fallback_to_full_alert_group(
 @ignore_reply_to_message_deleted
 @ignore_bot_deleted
 def send_log_and_actions_message(self, channel_chat_id, group_chat_id, channel_message_id, reply_to_message_id):
+    from telegram import error
+
     with OkToRetry(task=self, exc=TelegramMessage.DoesNotExist, num_retries=5):
         try:
             channel_message = TelegramMessage.objects.get(chat_id=channel_chat_id, message_id=channel_message_id)
@@ -184,6 +253,7 @@ def on_create_alert_telegram_representative_async(self, alert_pk):
     """
     It's async in order to prevent Telegram downtime or formatting issues causing delay with SMS and other destinations.
     """
+    from telegram import error
 
     alert = Alert.objects.get(pk=alert_pk)
     alert_group = alert.group
@@ -213,5 +283,4 @@ def on_create_alert_telegram_representative_async(self, alert_pk):
             TelegramMessage.PERSONAL_MESSAGE,
         )
     )
-    for message in messages_to_edit:
-        edit_message.delay(message_pk=message.pk)
+    queue_messages_edit(alert_group.pk, [message.pk for message in messages_to_edit])
@@ -7,7 +7,7 @@ from apps.telegram.models import (
     TelegramToUserConnector,
     TelegramVerificationCode,
 )
-from common.utils import UniqueFaker
+from common.tests.factories import UniqueFaker
 
 
 class TelegramToUserConnectorFactory(factory.DjangoModelFactory):
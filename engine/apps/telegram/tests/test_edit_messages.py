@@ -0,0 +1,170 @@
+from unittest.mock import patch
+
+import pytest
+from telegram import error
+
+from apps.telegram import rate_limit as telegram_rate_limit
+from apps.telegram.client import TelegramClient
+from apps.telegram.models import TelegramMessage
+from apps.telegram.tasks import TELEGRAM_EDIT_DEBOUNCE_SECONDS, edit_alert_group_messages, queue_messages_edit
+
+
+@pytest.fixture()
+def alert_group_with_telegram_messages(
+    settings, make_organization, make_alert_receive_channel, make_alert_group, make_alert, make_telegram_message
+):
+    settings.TELEGRAM_TOKEN = "token"
+
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(alert_receive_channel)
+    make_alert(alert_group=alert_group, raw_request_data=alert_receive_channel.config.example_payload)
+
+    channel_message = make_telegram_message(alert_group, TelegramMessage.ALERT_GROUP_MESSAGE, chat_id="-100")
+    personal_messages = [
+        make_telegram_message(alert_group, TelegramMessage.PERSONAL_MESSAGE, chat_id=str(chat_id))
+        for chat_id in range(1, 4)
+    ]
+    return alert_group, channel_message, personal_messages
+
+
+@pytest.mark.django_db
+def test_queue_messages_edit_debounced(alert_group_with_telegram_messages):
+    alert_group, channel_message, personal_messages = alert_group_with_telegram_messages
+
+    with patch.object(edit_alert_group_messages, "apply_async") as mock_edit_alert_group_messages:
+        queue_messages_edit(alert_group.pk, [channel_message.pk])
+        queue_messages_edit(alert_group.pk, [channel_message.pk, personal_messages[0].pk])
+
+    mock_edit_alert_group_messages.assert_called_once_with((alert_group.pk,), countdown=TELEGRAM_EDIT_DEBOUNCE_SECONDS)
+
+    with patch.object(TelegramClient, "edit_raw_message") as mock_edit_raw_message:
+        edit_alert_group_messages(alert_group.pk)
+
+    # every message is edited once
+    assert sorted(c.kwargs["chat_id"] for c in mock_edit_raw_message.call_args_list) == sorted(
+        [channel_message.chat_id, personal_messages[0].chat_id]
+    )
+
+    # pending edits are cleared
+    with patch.object(TelegramClient, "edit_raw_message") as mock_edit_raw_message:
+        edit_alert_group_messages(alert_group.pk)
+    assert not mock_edit_raw_message.called
+
+
+@pytest.mark.django_db
+def test_edit_alert_group_messages_renders_once_per_message_type(alert_group_with_telegram_messages):
+    alert_group, channel_message, personal_messages = alert_group_with_telegram_messages
+    queue_messages_edit(alert_group.pk, [channel_message.pk] + [m.pk for m in personal_messages])
+
+    with patch.object(TelegramClient, "edit_raw_message") as mock_edit_raw_message:
+        with patch.object(
+            TelegramClient, "get_message_and_keyboard", return_value=("text", None)
+        ) as mock_get_message_and_keyboard:
+            edit_alert_group_messages(alert_group.pk)
+
+    assert mock_edit_raw_message.call_count == 4
+    assert mock_get_message_and_keyboard.call_count == 2
+    assert sorted(c.kwargs["message_type"] for c in mock_get_message_and_keyboard.call_args_list) == [
+        TelegramMessage.ALERT_GROUP_MESSAGE,
+        TelegramMessage.PERSONAL_MESSAGE,
+    ]
+
+
+@pytest.mark.django_db
+def test_edit_alert_group_messages_rate_limited(alert_group_with_telegram_messages):
+    alert_group, channel_message, personal_messages = alert_group_with_telegram_messages
+    queue_messages_edit(alert_group.pk, [m.pk for m in personal_messages])
+
+    with patch.object(TelegramClient, "edit_raw_message") as mock_edit_raw_message:
+        with patch.object(telegram_rate_limit, "acquire", side_effect=[0, 2.5]):
+            with patch.object(edit_alert_group_messages, "apply_async") as mock_edit_alert_group_messages:
+                edit_alert_group_messages(alert_group.pk)
+
+    # the first message is edited, the rest is rescheduled
+    assert mock_edit_raw_message.call_count == 1
+    mock_edit_alert_group_messages.assert_called_once_with((alert_group.pk,), countdown=3)
+
+    with patch.object(TelegramClient, "edit_raw_message") as mock_edit_raw_message:
+        edit_alert_group_messages(alert_group.pk)
+    assert mock_edit_raw_message.call_count == 2
+
+
+@pytest.mark.django_db
+def test_edit_alert_group_messages_retry_after(alert_group_with_telegram_messages):
+    alert_group, channel_message, _ = alert_group_with_telegram_messages
+    queue_messages_edit(alert_group.pk, [channel_message.pk])
+
+    with patch.object(TelegramClient, "edit_raw_message", side_effect=error.RetryAfter(10)):
+        with patch.object(edit_alert_group_messages, "apply_async") as mock_edit_alert_group_messages:
+            edit_alert_group_messages(alert_group.pk)
+
+    mock_edit_alert_group_messages.assert_called_once_with((alert_group.pk,), countdown=10)
+
+
+@pytest.mark.django_db
+def test_edit_alert_group_messages_message_not_modified(alert_group_with_telegram_messages):
+    alert_group, channel_message, personal_messages = alert_group_with_telegram_messages
+    queue_messages_edit(alert_group.pk, [channel_message.pk, personal_messages[0].pk])
+
+    with patch.object(
+        TelegramClient,
+        "edit_raw_message",
+        side_effect=[error.BadRequest("Message is not modified"), None],
+    ) as mock_edit_raw_message:
+        edit_alert_group_messages(alert_group.pk)
+
+    assert mock_edit_raw_message.call_count == 2
+
+
+@pytest.mark.django_db
+def test_edit_alert_group_messages_unexpected_error(alert_group_with_telegram_messages):
+    alert_group, channel_message, personal_messages = alert_group_with_telegram_messages
+    queue_messages_edit(alert_group.pk, [channel_message.pk] + [m.pk for m in personal_messages])
+
+    # the retry runs right away, so the per-chat rate limit would postpone it
+    with patch("apps.telegram.tasks.telegram_rate_limit.acquire", return_value=0), patch.object(
+        TelegramClient, "edit_raw_message", side_effect=[None, ConnectionError, None, None, None]
+    ) as mock_edit_raw_message:
+        with pytest.raises(ConnectionError):
+            edit_alert_group_messages(alert_group.pk)
+        edited_chat_ids = [mock_edit_raw_message.call_args_list[0].kwargs["chat_id"]]
+
+        # the task retry edits the messages that weren't edited
+        edit_alert_group_messages(alert_group.pk)
+        edited_chat_ids += [c.kwargs["chat_id"] for c in mock_edit_raw_message.call_args_list[2:]]
+
+    assert mock_edit_raw_message.call_count == 5
+    assert sorted(edited_chat_ids) == sorted([channel_message.chat_id] + [m.chat_id for m in personal_messages])
+
+
+@pytest.mark.parametrize(
+    "chat_id,max_calls",
+    [
+        ("-100", telegram_rate_limit.TELEGRAM_GROUP_CHAT_RATE_LIMIT[0]),
+        ("100", telegram_rate_limit.TELEGRAM_PRIVATE_CHAT_RATE_LIMIT[0]),
+    ],
+)
+def test_rate_limit_per_chat(chat_id, max_calls):
+    with patch("apps.telegram.rate_limit.time.time", return_value=1000.5):
+        for _ in range(max_calls):
+            assert telegram_rate_limit.acquire(chat_id) == 0
+        assert telegram_rate_limit.acquire(chat_id) > 0
+
+
+def test_rate_limit_global():
+    max_calls, period = telegram_rate_limit.TELEGRAM_GLOBAL_RATE_LIMIT
+    with patch("apps.telegram.rate_limit.time.time", return_value=1000.5):
+        for chat_id in range(max_calls):
+            assert telegram_rate_limit.acquire(chat_id) == 0
+        assert telegram_rate_limit.acquire(max_calls) == 0.5
+
+    # bucket is refilled
+    with patch("apps.telegram.rate_limit.time.time", return_value=1000.5 + period):
+        assert telegram_rate_limit.acquire(max_calls) == 0
+
+
+def test_queue_messages_edit_no_messages():
+    with patch.object(edit_alert_group_messages, "apply_async") as mock_edit_alert_group_messages:
+        queue_messages_edit(1, [])
+    assert not mock_edit_alert_group_messages.called
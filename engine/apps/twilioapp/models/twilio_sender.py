@@ -1,5 +1,4 @@
 from django.db import models
-from twilio.rest import Client
 
 
 class TwilioAccount(models.Model):
@@ -10,6 +9,8 @@ class TwilioAccount(models.Model):
     api_key_secret = models.CharField(max_length=64, null=True, default=None)
 
     def get_twilio_api_client(self):
+        from twilio.rest import Client
+
         if self.api_key_sid and self.api_key_secret:
             return Client(self.api_key_sid, self.api_key_secret, self.account_sid)
         else:
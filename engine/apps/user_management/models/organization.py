@@ -13,7 +13,7 @@ from apps.alerts.models import MaintainableObject
 from apps.user_management.subscription_strategy import FreePublicBetaSubscriptionStrategy
 from common.insight_log import ChatOpsEvent, ChatOpsTypePlug, write_chatops_insight_log
 from common.oncall_gateway import create_oncall_connector, delete_oncall_connector, delete_slack_connector
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -33,17 +33,7 @@ logger = logging.getLogger(__name__)
 
 
 def generate_public_primary_key_for_organization():
-    prefix = "O"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while Organization.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="Organization"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("O")
 
 
 class ProvisionedPlugin(typing.TypedDict):
@@ -76,7 +66,7 @@ class OrganizationManager(models.Manager):
 # TODO: in a subsequent PR, remove the inheritance from MaintainableObject (plus generate the database migration file)
 # this will remove the maintenance related columns that're no longer used on the organization object
 # class Organization(models.Model):
-class Organization(MaintainableObject):
+class Organization(PublicPrimaryKeyModelMixin, MaintainableObject):
     auth_tokens: "RelatedManager['ApiAuthToken']"
     custom_on_call_shifts: "RelatedManager['CustomOnCallShift']"
     migration_destination: typing.Optional["Region"]
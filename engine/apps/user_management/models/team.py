@@ -7,7 +7,7 @@ from django.db import models, transaction
 from apps.alerts.models import AlertReceiveChannel, ChannelFilter
 from apps.metrics_exporter.helpers import metrics_add_integration_to_cache, metrics_bulk_update_team_label_cache
 from apps.metrics_exporter.metrics_cache_manager import MetricsCacheManager
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -19,17 +19,7 @@ if typing.TYPE_CHECKING:
 
 
 def generate_public_primary_key_for_team() -> str:
-    prefix = "T"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while Team.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="Team"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("T")
 
 
 class TeamManager(models.Manager["Team"]):
@@ -129,7 +119,7 @@ class TeamManager(models.Manager["Team"]):
         metrics_bulk_update_team_label_cache(metrics_teams_to_update, organization.id)
 
 
-class Team(models.Model):
+class Team(PublicPrimaryKeyModelMixin, models.Model):
     current_team_users: "RelatedManager['User']"
     custom_on_call_shifts: "RelatedManager['CustomOnCallShift']"
     oncall_schedules: "RelatedManager['AlertGroupLogRecord']"
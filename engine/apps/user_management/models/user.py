@@ -1,5 +1,4 @@
 import datetime
-import json
 import logging
 import typing
 from urllib.parse import urljoin
@@ -20,7 +19,7 @@ from apps.api.permissions import (
     user_is_authorized,
 )
 from apps.schedules.tasks import drop_cached_ical_for_custom_events_for_organization
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -43,17 +42,7 @@ class RoleInQuery(typing.TypedDict):
 
 
 def generate_public_primary_key_for_user():
-    prefix = "U"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while User.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="User"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("U")
 
 
 def default_working_hours():
@@ -69,12 +58,55 @@ def default_working_hours():
 class UserManager(models.Manager["User"]):
     @staticmethod
     def sync_for_team(team, api_members: list[dict]):
-        user_ids = tuple(member["userId"] for member in api_members)
-        users = team.organization.users.filter(user_id__in=user_ids)
-        team.users.set(users)
+        User.objects.sync_for_teams(team.organization, {team.pk: api_members})
 
     @staticmethod
-    def sync_for_organization(organization, api_users: list[dict]):
+    def sync_for_teams(organization, api_members: dict[int, list[dict]]):
+        """
+        Sync members for multiple teams at once, api_members maps team pk to the team members returned by Grafana API.
+        Memberships are compared in memory, only added and removed memberships are written to the database.
+        """
+        from apps.user_management.models import Team
+
+        TeamMembership = Team.users.through
+
+        grafana_user_ids = {member["userId"] for members in api_members.values() for member in members}
+        user_pks = dict(organization.users.filter(user_id__in=grafana_user_ids).values_list("user_id", "pk"))
+        memberships = {
+            (team_pk, user_pks[member["userId"]])
+            for team_pk, members in api_members.items()
+            for member in members
+            if member["userId"] in user_pks
+        }
+
+        existing_memberships = {
+            (team_pk, user_pk): membership_pk
+            for membership_pk, team_pk, user_pk in TeamMembership.objects.filter(team_id__in=api_members).values_list(
+                "pk", "team_id", "user_id"
+            )
+        }
+
+        memberships_to_delete = [
+            membership_pk for membership, membership_pk in existing_memberships.items() if membership not in memberships
+        ]
+        if memberships_to_delete:
+            TeamMembership.objects.filter(pk__in=memberships_to_delete).delete()
+
+        memberships_to_create = [
+            TeamMembership(team_id=team_pk, user_id=user_pk)
+            for team_pk, user_pk in memberships
+            if (team_pk, user_pk) not in existing_memberships
+        ]
+        TeamMembership.objects.bulk_create(memberships_to_create, batch_size=5000, ignore_conflicts=True)
+
+    @staticmethod
+    def sync_for_organization(
+        organization, api_users: list[dict], changed_user_ids: typing.Optional[typing.Set[int]] = None
+    ):
+        """
+        Create, delete and update organization users to match Grafana users.
+        If changed_user_ids is passed, only these existing users are compared with Grafana users and updated.
+        """
         from apps.base.models import UserNotificationPolicy
 
         grafana_users = {user["userId"]: user for user in api_users}
@@ -117,8 +149,9 @@ class UserManager(models.Manager["User"]):
         organization.users.filter(user_id__in=user_ids_to_delete).delete()
 
         # update existing users if any fields have changed
+        user_ids_to_compare = existing_user_ids if changed_user_ids is None else existing_user_ids & changed_user_ids
         users_to_update = []
-        for user in organization.users.filter(user_id__in=existing_user_ids):
+        for user in organization.users.filter(user_id__in=user_ids_to_compare):
             grafana_user = grafana_users[user.user_id]
             g_user_role = getattr(LegacyAccessControlRole, grafana_user["role"].upper(), LegacyAccessControlRole.NONE)
 
@@ -128,12 +161,7 @@ class UserManager(models.Manager["User"]):
                 or user.username != grafana_user["login"]
                 or user.role != g_user_role
                 or user.avatar_url != grafana_user["avatarUrl"]
-                # instead of looping through the array of permission objects, simply take the hash
-                # of the string representation of the data structures and compare.
-                # Need to first convert the lists of objects to strings because lists/dicts are not hashable
-                # (because lists and dicts are not hashable.. as they are mutable)
-                # https://stackoverflow.com/a/22003440
-                or hash(json.dumps(user.permissions)) != hash(json.dumps(grafana_user["permissions"]))
+                or user.permissions != grafana_user["permissions"]
             ):
                 user.email = grafana_user["email"]
                 user.name = grafana_user["name"]
@@ -163,7 +191,7 @@ class UserQuerySet(models.QuerySet):
         return super().delete()
 
 
-class User(models.Model):
+class User(PublicPrimaryKeyModelMixin, models.Model):
     acknowledged_alert_groups: "RelatedManager['AlertGroup']"
     auth_tokens: "RelatedManager['ApiAuthToken']"
     current_team: typing.Optional["Team"]
@@ -1,16 +1,46 @@
+import hashlib
+import json
 import logging
+import typing
+from concurrent.futures import ThreadPoolExecutor
 
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 
 from apps.grafana_plugin.helpers.client import GcomAPIClient, GrafanaAPIClient
+from apps.metrics_exporter.constants import ORGANIZATION_SYNC_DIFFS_APPLIED, ORGANIZATION_SYNC_DIFFS_SKIPPED
+from apps.metrics_exporter.helpers import metrics_increment_internal_counter
 from apps.user_management.models import Organization, Team, User
 from apps.user_management.signals import org_sync_signal
 
 logger = get_task_logger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# max number of concurrent requests to Grafana API when fetching team members
+TEAM_MEMBERS_SYNC_MAX_WORKERS = 10
+# digests of the last synced Grafana API responses, the database is fully compared at least this often
+SYNC_DIGEST_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _get_digest(data: typing.Any) -> str:
+    return hashlib.md5(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def _get_sync_digest_cache_key(organization: Organization, name: str) -> str:
+    return f"organization_sync_digest_{name}_{organization.pk}"
+
+
+def _is_sync_needed(organization: Organization, name: str, digest: str, previous: typing.Optional[dict]) -> bool:
+    """Check if the Grafana API response changed since the last sync, and record the result in metrics"""
+    if previous is not None and previous["digest"] == digest:
+        logger.debug(f"Skipping {name} sync for Organization {organization.pk}, Grafana API response didn't change")
+        metrics_increment_internal_counter(ORGANIZATION_SYNC_DIFFS_SKIPPED)
+        return False
+    metrics_increment_internal_counter(ORGANIZATION_SYNC_DIFFS_APPLIED)
+    return True
+
 
 def sync_organization(organization: Organization) -> None:
     grafana_api_client = GrafanaAPIClient(api_url=organization.grafana_url, api_token=organization.api_token)
@@ -87,7 +117,25 @@ def sync_users(client: GrafanaAPIClient, organization: Organization, **kwargs) -
     # check if api_users are shaped correctly. e.g. for paused instance, the response is not a list.
     if not api_users or not isinstance(api_users, (tuple, list)):
         return
-    User.objects.sync_for_organization(organization=organization, api_users=api_users)
+
+    user_digests = {user["userId"]: _get_digest(user) for user in api_users}
+    digest = _get_digest(user_digests)
+    cache_key = _get_sync_digest_cache_key(organization, "users")
+    previous = cache.get(cache_key)
+    if not _is_sync_needed(organization, "users", digest, previous):
+        return
+
+    # only compare users that changed since the last sync
+    changed_user_ids = None
+    if previous is not None:
+        changed_user_ids = {
+            user_id for user_id, user_digest in user_digests.items() if previous["users"].get(user_id) != user_digest
+        }
+
+    User.objects.sync_for_organization(
+        organization=organization, api_users=api_users, changed_user_ids=changed_user_ids
+    )
+    cache.set(cache_key, {"digest": digest, "users": user_digests}, SYNC_DIGEST_CACHE_TIMEOUT)
 
 
 def sync_teams(client: GrafanaAPIClient, organization: Organization, **kwargs) -> None:
@@ -95,15 +143,33 @@ def sync_teams(client: GrafanaAPIClient, organization: Organization, **kwargs) -
     if not api_teams_result:
         return
     api_teams = api_teams_result["teams"]
+
+    digest = _get_digest(api_teams)
+    cache_key = _get_sync_digest_cache_key(organization, "teams")
+    if not _is_sync_needed(organization, "teams", digest, cache.get(cache_key)):
+        return
+
     Team.objects.sync_for_organization(organization=organization, api_teams=api_teams)
+    cache.set(cache_key, {"digest": digest}, SYNC_DIGEST_CACHE_TIMEOUT)
 
 
 def sync_team_members(client: GrafanaAPIClient, organization: Organization) -> None:
-    for team in organization.teams.all():
-        members, _ = client.get_team_members(team.team_id)
-        if not members:
-            continue
-        User.objects.sync_for_team(team=team, api_members=members)
+    teams = list(organization.teams.all())
+    if not teams:
+        return
+
+    # fetch members of all the teams concurrently, then sync all the memberships at once
+    with ThreadPoolExecutor(max_workers=min(len(teams), TEAM_MEMBERS_SYNC_MAX_WORKERS)) as executor:
+        results = executor.map(lambda team: client.get_team_members(team.team_id), teams)
+        api_members = {team.pk: members for team, (members, _) in zip(teams, results) if members}
+
+    digest = _get_digest({team_pk: sorted(m["userId"] for m in members) for team_pk, members in api_members.items()})
+    cache_key = _get_sync_digest_cache_key(organization, "team_members")
+    if not _is_sync_needed(organization, "team_members", digest, cache.get(cache_key)):
+        return
+
+    User.objects.sync_for_teams(organization=organization, api_members=api_members)
+    cache.set(cache_key, {"digest": digest}, SYNC_DIGEST_CACHE_TIMEOUT)
 
 
 def sync_users_for_teams(client: GrafanaAPIClient, organization: Organization, **kwargs) -> None:
@@ -1,7 +1,7 @@
 import factory
 
 from apps.user_management.models import Organization, Region, Team, User
-from common.utils import UniqueFaker
+from common.tests.factories import UniqueFaker
 
 
 class OrganizationFactory(factory.DjangoModelFactory):
@@ -2,13 +2,23 @@ from unittest.mock import patch
 
 import pytest
 from django.conf import settings
+from django.core.cache import cache
 from django.test import override_settings
 
 from apps.alerts.models import AlertReceiveChannel
 from apps.api.permissions import LegacyAccessControlRole
 from apps.grafana_plugin.helpers.client import GcomAPIClient, GrafanaAPIClient
+from apps.metrics_exporter.constants import ORGANIZATION_SYNC_DIFFS_APPLIED, ORGANIZATION_SYNC_DIFFS_SKIPPED
+from apps.metrics_exporter.helpers import get_internal_metric_key
 from apps.user_management.models import Team, User
-from apps.user_management.sync import check_grafana_incident_is_enabled, cleanup_organization, sync_organization
+from apps.user_management.sync import (
+    check_grafana_incident_is_enabled,
+    cleanup_organization,
+    sync_organization,
+    sync_team_members,
+    sync_teams,
+    sync_users,
+)
 
 
 @pytest.mark.django_db
@@ -158,6 +168,139 @@ def test_sync_users_for_team(make_organization, make_user_for_organization, make
     assert team.users.get() == users[0]
 
 
+@pytest.mark.django_db
+def test_sync_users_skipped_if_not_changed(make_organization, make_user_for_organization):
+    organization = make_organization()
+    users = tuple(make_user_for_organization(organization, user_id=user_id) for user_id in (1, 2))
+    api_users = [
+        {
+            "userId": user.user_id,
+            "email": "test@test.test",
+            "name": "Test",
+            "login": user.username,
+            "role": "admin",
+            "avatarUrl": "/test/1234",
+            "permissions": [],
+        }
+        for user in users
+    ]
+    client = GrafanaAPIClient(api_url=organization.grafana_url, api_token=organization.api_token)
+
+    with patch.object(User.objects, "sync_for_organization", wraps=User.objects.sync_for_organization) as mock_sync:
+        with patch.object(GrafanaAPIClient, "get_users", return_value=api_users):
+            sync_users(client, organization)
+            # nothing changed in Grafana
+            sync_users(client, organization)
+
+        mock_sync.assert_called_once_with(organization=organization, api_users=api_users, changed_user_ids=None)
+
+        # only the changed user is compared with the database
+        api_users[1] = {**api_users[1], "name": "Updated"}
+        with patch.object(GrafanaAPIClient, "get_users", return_value=api_users):
+            sync_users(client, organization)
+
+        assert mock_sync.call_count == 2
+        assert mock_sync.call_args.kwargs["changed_user_ids"] == {users[1].user_id}
+
+    users[1].refresh_from_db()
+    assert users[1].name == "Updated"
+    assert cache.get(get_internal_metric_key(ORGANIZATION_SYNC_DIFFS_APPLIED)) == 2
+    assert cache.get(get_internal_metric_key(ORGANIZATION_SYNC_DIFFS_SKIPPED)) == 1
+
+
+@pytest.mark.django_db
+def test_sync_teams_skipped_if_not_changed(make_organization):
+    organization = make_organization()
+    api_teams_result = (
+        {"teams": [{"id": 1, "name": "Test", "email": "test@test.test", "avatarUrl": "test.test/test"}]},
+        None,
+    )
+    client = GrafanaAPIClient(api_url=organization.grafana_url, api_token=organization.api_token)
+
+    with patch.object(Team.objects, "sync_for_organization") as mock_sync:
+        with patch.object(GrafanaAPIClient, "get_teams", return_value=api_teams_result):
+            sync_teams(client, organization)
+            sync_teams(client, organization)
+
+    mock_sync.assert_called_once()
+    assert cache.get(get_internal_metric_key(ORGANIZATION_SYNC_DIFFS_SKIPPED)) == 1
+
+
+@pytest.mark.django_db
+def test_sync_users_for_organization_changed_user_ids(make_organization, make_user_for_organization):
+    organization = make_organization()
+    users = tuple(make_user_for_organization(organization, user_id=user_id) for user_id in (1, 2))
+    api_users = tuple(
+        {
+            "userId": user.user_id,
+            "email": "test@test.test",
+            "name": "Updated",
+            "login": user.username,
+            "role": "admin",
+            "avatarUrl": "/test/1234",
+            "permissions": [],
+        }
+        for user in users
+    )
+
+    User.objects.sync_for_organization(organization, api_users=api_users, changed_user_ids={users[0].user_id})
+
+    assert [user.name for user in organization.users.order_by("user_id")] == ["Updated", users[1].name]
+
+
+@pytest.mark.django_db
+def test_sync_users_for_teams(make_organization, make_user_for_organization, make_team, django_assert_num_queries):
+    organization = make_organization()
+    teams = tuple(make_team(organization) for _ in range(3))
+    users = tuple(make_user_for_organization(organization) for _ in range(3))
+    teams[0].users.add(users[0], users[1])
+    teams[1].users.add(users[0])
+    teams[2].users.add(users[2])
+    TeamMembership = Team.users.through
+    unchanged_membership = TeamMembership.objects.get(team=teams[0], user=users[0])
+
+    api_members = {
+        teams[0].pk: [{"userId": users[0].user_id}, {"userId": users[2].user_id}],
+        teams[1].pk: [],
+        # unknown user is ignored
+        teams[2].pk: [{"userId": users[2].user_id}, {"userId": 12345}],
+    }
+
+    # users, existing memberships, delete and insert
+    with django_assert_num_queries(4):
+        User.objects.sync_for_teams(organization, api_members=api_members)
+
+    assert set(teams[0].users.all()) == {users[0], users[2]}
+    assert teams[1].users.count() == 0
+    assert set(teams[2].users.all()) == {users[2]}
+    # existing memberships are kept as is
+    assert TeamMembership.objects.filter(pk=unchanged_membership.pk).exists()
+
+
+@pytest.mark.django_db
+def test_sync_team_members(make_organization, make_user_for_organization, make_team):
+    organization = make_organization()
+    teams = tuple(make_team(organization) for _ in range(20))
+    users = tuple(make_user_for_organization(organization) for _ in range(2))
+    # members of the team are not changed if the API call fails
+    failed_team = make_team(organization)
+    failed_team.users.add(users[0])
+
+    def get_team_members(team_id):
+        if team_id == failed_team.team_id:
+            return None, {"connected": False}
+        return [{"orgId": organization.org_id, "teamId": team_id, "userId": users[team_id % 2].user_id}], None
+
+    client = GrafanaAPIClient(api_url=organization.grafana_url, api_token=organization.api_token)
+    with patch.object(GrafanaAPIClient, "get_team_members", side_effect=get_team_members) as mock_get_team_members:
+        sync_team_members(client, organization)
+
+    assert mock_get_team_members.call_count == 21
+    for team in teams:
+        assert list(team.users.all()) == [users[team.team_id % 2]]
+    assert list(failed_team.users.all()) == [users[0]]
+
+
 @pytest.mark.django_db
 @patch.object(GrafanaAPIClient, "is_rbac_enabled_for_organization", return_value=False)
 @patch.object(
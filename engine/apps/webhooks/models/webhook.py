@@ -24,7 +24,7 @@ from apps.webhooks.utils import (
 )
 from common.jinja_templater import apply_jinja_template
 from common.jinja_templater.apply_jinja_template import JinjaTemplateError, JinjaTemplateWarning
-from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
+from common.public_primary_keys import PublicPrimaryKeyModelMixin, generate_public_primary_key
 
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
@@ -39,17 +39,7 @@ logger.setLevel(logging.DEBUG)
 
 
 def generate_public_primary_key_for_webhook():
-    prefix = "WH"
-    new_public_primary_key = generate_public_primary_key(prefix)
-
-    failure_counter = 0
-    while Webhook.objects.filter(public_primary_key=new_public_primary_key).exists():
-        new_public_primary_key = increase_public_primary_key_length(
-            failure_counter=failure_counter, prefix=prefix, model_name="Webhook"
-        )
-        failure_counter += 1
-
-    return new_public_primary_key
+    return generate_public_primary_key("WH")
 
 
 class WebhookQueryset(models.QuerySet):
@@ -65,7 +55,7 @@ class WebhookManager(models.Manager):
         return self.get_queryset().hard_delete()
 
 
-class Webhook(models.Model):
+class Webhook(PublicPrimaryKeyModelMixin, models.Model):
     escalation_policies: "RelatedManager['EscalationPolicy']"
 
     objects = WebhookManager()
@@ -2,7 +2,7 @@ import factory
 import pytz
 
 from apps.webhooks.models import Webhook, WebhookResponse
-from common.utils import UniqueFaker
+from common.tests.factories import UniqueFaker
 
 
 class CustomWebhookFactory(factory.DjangoModelFactory):
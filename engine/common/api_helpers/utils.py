@@ -8,7 +8,6 @@ from django.conf import settings
 from django.core.validators import URLValidator
 from django.utils import dateparse, timezone
 from django.utils.regex_helper import _lazy_re_compile
-from icalendar import Calendar
 from rest_framework import serializers
 from rest_framework.request import Request
 
@@ -94,6 +93,8 @@ class CurrentUserDefault:
 
 
 def validate_ical_url(url):
+    from icalendar import Calendar
+
     if url:
         if settings.BASE_URL in url:
             raise serializers.ValidationError("Potential self-reference")
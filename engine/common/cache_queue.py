@@ -0,0 +1,151 @@
+import contextlib
+import logging
+import time
+import typing
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBatchQueue:
+    """
+    Queue of items shared by all the workers and stored in the cache, used to process items pushed for the same key
+    (e.g. notifications for the same alert group) within a short time window by a single task.
+
+    Usage:
+        if queue.push(key, item):
+            # the first item in the window schedules the task
+            process_task.apply_async((key,), countdown=window)
+
+        # in the task
+        with queue.pop(key) as items:
+            if items is None or items.pending:
+                # items are being processed by another task or are not stored yet, try again later
+                ...
+            for index, item in enumerate(items):
+                process(item)
+                items.mark_processed(index)
+
+    Items are marked as processed when the `pop` block exits without an exception, so a task retried on error
+    processes the same items again, except for the items marked with `mark_processed` (e.g. notifications already
+    sent). An item that is not stored within `missing_item_timeout` after it was pushed (e.g. the pushing process
+    died or the item was evicted) is skipped, so it doesn't block the items pushed after it.
+    """
+
+    def __init__(
+        self, name: str, timeout: int = 60 * 60, task_timeout: int = 60 * 5, missing_item_timeout: int = 60
+    ) -> None:
+        self.name = name
+        # how long items are kept in the queue
+        self.timeout = timeout
+        # how long a scheduled or running task is expected to take before another one can be scheduled
+        self.task_timeout = task_timeout
+        # how long to wait for an item pushed before the last one to be stored
+        self.missing_item_timeout = missing_item_timeout
+
+    def _counter_key(self, key) -> str:
+        return f"{self.name}_counter_{key}"
+
+    def _processed_key(self, key) -> str:
+        return f"{self.name}_processed_{key}"
+
+    def _item_key(self, key, index: int) -> str:
+        return f"{self.name}_{key}_{index}"
+
+    def _missing_item_key(self, key, index: int) -> str:
+        return f"{self.name}_missing_{key}_{index}"
+
+    def _scheduled_key(self, key) -> str:
+        return f"{self.name}_scheduled_{key}"
+
+    def _lock_key(self, key) -> str:
+        return f"{self.name}_lock_{key}"
+
+    def push(self, key, item: typing.Any) -> bool:
+        """Add item to the queue. Returns True if the caller should schedule a task to process the queue."""
+        counter_key = self._counter_key(key)
+        cache.add(counter_key, 0, timeout=self.timeout)
+        index = cache.incr(counter_key)
+        # keep the counter while items are being pushed, so it doesn't restart while some are not processed yet
+        cache.touch(counter_key, timeout=self.timeout)
+        cache.set(self._item_key(key, index), item, timeout=self.timeout)
+
+        # the item is stored before checking the flag, so it's either picked up by an already scheduled task
+        # or the caller schedules a new one
+        return cache.add(self._scheduled_key(key), True, timeout=self.task_timeout)
+
+    @contextlib.contextmanager
+    def pop(self, key) -> typing.Iterator[typing.Optional["CacheBatch"]]:
+        """Get the items pushed since the last processed item. Yields None if another task holds the queue."""
+        lock_key = self._lock_key(key)
+        if not cache.add(lock_key, True, timeout=self.task_timeout):
+            yield None
+            return
+
+        try:
+            # items pushed after this point schedule a new task
+            cache.delete(self._scheduled_key(key))
+
+            last_index = cache.get(self._counter_key(key), 0)
+            processed_index = cache.get(self._processed_key(key), 0)
+            if processed_index > last_index:
+                # the counter expired and started over
+                processed_index = 0
+
+            item_keys = [self._item_key(key, i) for i in range(processed_index + 1, last_index + 1)]
+            stored_items = cache.get_many(item_keys)
+            items = []
+            popped_item_keys = []
+            missing_item_keys = []
+            pending = False
+            for index, item_key in enumerate(item_keys, start=processed_index + 1):
+                if item_key in stored_items:
+                    if stored_items[item_key] != _PROCESSED:
+                        items.append(stored_items[item_key])
+                        popped_item_keys.append(item_key)
+                    continue
+
+                missing_item_key = self._missing_item_key(key, index)
+                missing_since = cache.get_or_set(missing_item_key, time.time(), timeout=self.timeout)
+                if time.time() - missing_since < self.missing_item_timeout:
+                    # not stored yet, the rest is processed when the queue is popped again
+                    item_keys = item_keys[: index - processed_index - 1]
+                    pending = True
+                    break
+                logger.warning(f"Skipping item {index} of {self.name} queue {key}, it was not stored")
+                missing_item_keys.append(missing_item_key)
+
+            yield CacheBatch(items, popped_item_keys, self.timeout, pending)
+
+            if item_keys:
+                cache.set(self._processed_key(key), processed_index + len(item_keys), timeout=self.timeout)
+                cache.delete_many(item_keys + missing_item_keys)
+        finally:
+            cache.delete(lock_key)
+
+
+# stored in place of items processed before the `pop` block exits
+_PROCESSED = "__processed__"
+
+
+class CacheBatch(list):
+    """Items popped from CacheBatchQueue."""
+
+    def __init__(
+        self,
+        items: typing.Iterable[typing.Any] = (),
+        item_keys: typing.Sequence[str] = (),
+        timeout: int = 0,
+        pending: bool = False,
+    ) -> None:
+        # arguments other than items are optional, so the batch can be copied as a list (e.g. by Django lookups)
+        super().__init__(items)
+        self._item_keys = item_keys
+        self._timeout = timeout
+        # items pushed after the popped ones are not stored yet, the queue should be popped again later
+        self.pending = pending
+
+    def mark_processed(self, index: int) -> None:
+        """Mark the item as processed, so it is not processed again if the `pop` block exits with an exception."""
+        cache.set(self._item_keys[index], _PROCESSED, timeout=self._timeout)
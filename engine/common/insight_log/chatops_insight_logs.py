@@ -33,10 +33,11 @@ def write_chatops_insight_log(author, event_name: ChatOpsEvent, chatops_type: st
             user_id = author.public_primary_key
             username = json.dumps(author.username)
 
-            log_line = f"tenant_id={tenant_id} author_id={user_id} author={username} action_type=chat_ops action_name={event_name.value} chat_ops_type={chatops_type.lower()}"  # noqa
-            for k, v in kwargs.items():
-                log_line += f" {k}={json.dumps(v)}"
+            log_line = [
+                f"tenant_id={tenant_id} author_id={user_id} author={username} action_type=chat_ops action_name={event_name.value} chat_ops_type={chatops_type.lower()}"  # noqa
+            ]
+            log_line.extend(f"{k}={json.dumps(v)}" for k, v in kwargs.items())
 
-            insight_logger.info(log_line)
+            insight_logger.info(" ".join(log_line))
     except Exception as e:
         logger.warning(f"insight_log.failed_to_write_chatops_insight_log exception={e}")
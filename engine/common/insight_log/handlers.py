@@ -0,0 +1,107 @@
+import logging
+import os
+import queue
+import threading
+
+# sentinel put to the queue to stop the writer thread
+_STOP = object()
+
+
+class BufferedInsightLogHandler(logging.StreamHandler):
+    """
+    Stream handler that formats and writes records from a background thread.
+    Logging calls only put the record to a queue, the writer thread drains the queue and writes the lines in batches
+    with a single write to the stream. If the writer falls behind by more than `max_queue_size` records,
+    records are written synchronously so they are not lost.
+
+    Writes are serialized with a separate lock instead of the handler lock: logging holds the handler lock while
+    calling `emit` and `flush` (see Handler.handle and logging.shutdown), and `flush` waits for the writer thread,
+    so the writer thread must never wait for the handler lock.
+    """
+
+    def __init__(self, stream=None, batch_size: int = 500, max_queue_size: int = 10000) -> None:
+        super().__init__(stream)
+        self.batch_size = batch_size
+        self.max_queue_size = max_queue_size
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._thread_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def _ensure_writer(self) -> None:
+        # threads don't survive fork (celery and uwsgi workers), so start a new writer in each process
+        if self._pid == os.getpid():
+            return
+        with self._thread_lock:
+            if self._pid == os.getpid():
+                return
+            # records inherited from the parent process are written by the parent
+            self._queue = queue.SimpleQueue()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._queue,), name="insight-log-writer", daemon=True
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _run(self, records_queue: queue.SimpleQueue) -> None:
+        while True:
+            batch = [records_queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(records_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = []
+            for item in batch:
+                if isinstance(item, logging.LogRecord):
+                    records.append(item)
+                    continue
+                # flush or stop request, write the records queued before it
+                self._write(records)
+                records = []
+                if item is _STOP:
+                    return
+                item.set()
+            self._write(records)
+
+    def _write(self, records) -> None:
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        if not lines:
+            return
+
+        with self._write_lock:
+            try:
+                self.stream.write(self.terminator.join(lines) + self.terminator)
+                self.stream.flush()
+            except Exception:
+                self.handleError(records[0])
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._ensure_writer()
+        if self._queue.qsize() >= self.max_queue_size:
+            # StreamHandler.emit calls self.flush, which would wait for the writer thread
+            self._write([record])
+        else:
+            self._queue.put(record)
+
+    def flush(self) -> None:
+        """Wait until all the queued records are written."""
+        if self._pid == os.getpid() and self._thread is not threading.current_thread() and self._thread.is_alive():
+            flushed = threading.Event()
+            self._queue.put(flushed)
+            flushed.wait()
+        super().flush()
+
+    def close(self) -> None:
+        if self._pid == os.getpid() and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._pid = None
+        super().close()
@@ -10,11 +10,20 @@ def is_insight_logs_enabled(organization):
     is_insight_logs_enabled checks if inside logs enabled for given organization.
     Now it checks if oncall is deployed on same cluster that its grafana instance to be able to forward logs
     to Loki through logs-forwarder.
+
+    The result is cached on the organization instance, so writing many insight logs for the same organization
+    (e.g. bulk API operations) checks it only once.
     """
+    cached = getattr(organization, "_insight_logs_enabled", None)
+    if cached is not None and cached[0] == organization.cluster_slug:
+        return cached[1]
+
     logger.info(
         "is_insight_logs_enabled: "
         f"IS_OPEN_SOURCE={settings.IS_OPEN_SOURCE} "
         f"ONCALL_BACKEND_REGION={settings.ONCALL_BACKEND_REGION} "
         f"cluster_slug={organization.cluster_slug}"
     )
-    return not settings.IS_OPEN_SOURCE and settings.ONCALL_BACKEND_REGION == organization.cluster_slug
+    enabled = not settings.IS_OPEN_SOURCE and settings.ONCALL_BACKEND_REGION == organization.cluster_slug
+    organization._insight_logs_enabled = (organization.cluster_slug, enabled)
+    return enabled
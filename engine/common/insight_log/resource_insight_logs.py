@@ -76,16 +76,17 @@ def write_resource_insight_log(instance: InsightLoggable, author, event: EntityE
                 entity_id = instance.id
             entity_name = json.dumps(instance.insight_logs_verbal)
             metadata = instance.insight_logs_metadata
-            log_line = f"tenant_id={tenant_id} author_id={author_id} author={author} action_type=resource action_name={event.value} resource_type={entity_type} resource_id={entity_id} resource_name={entity_name}"  # noqa
-            for k, v in metadata.items():
-                log_line += f" {k}={json.dumps(v)}"
+            log_line = [
+                f"tenant_id={tenant_id} author_id={author_id} author={author} action_type=resource action_name={event.value} resource_type={entity_type} resource_id={entity_id} resource_name={entity_name}"  # noqa
+            ]
+            log_line.extend(f"{k}={json.dumps(v)}" for k, v in metadata.items())
             if prev_state and new_state:
                 prev_state, new_state = state_diff_finder(prev_state, new_state)
                 prev_state = escape_json_str_for_insight_log(json.dumps(format_state_for_insight_log(prev_state)))
                 new_state = escape_json_str_for_insight_log(json.dumps(format_state_for_insight_log(new_state)))
-                log_line += f' prev_state="{prev_state}"'
-                log_line += f' new_state="{new_state}"'
-            insight_logger.info(log_line)
+                log_line.append(f'prev_state="{prev_state}"')
+                log_line.append(f'new_state="{new_state}"')
+            insight_logger.info(" ".join(log_line))
     except Exception as e:
         logger.warning(f"insight_log.failed_to_write_entity_insight_log exception={e} instance_id={instance.id}")
 
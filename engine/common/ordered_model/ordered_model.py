@@ -171,13 +171,9 @@ class OrderedModel(models.Model):
             self.save(update_fields=["order"])
             return
 
-        # Temporarily set order values to NULL to avoid unique constraint violations.
-        pks = [self.pk] + [instance.pk for instance in instances_to_move]
-        self._manager.filter(pk__in=pks).update(order=None)
-
         # Update orders to appropriate unique values.
         self.order = order
-        self._manager.filter(pk__in=pks).bulk_update([self] + instances_to_move, fields=["order"])
+        self._update_orders({instance.pk: instance.order for instance in [self] + instances_to_move})
 
     @_retry(OperationalError)  # retry on deadlock
     def swap(self, order: int) -> None:
@@ -220,12 +216,41 @@ class OrderedModel(models.Model):
                 self.save(update_fields=["order"])
                 return
 
-            # Temporarily set order values to NULL to avoid unique constraint violations.
-            self._manager.filter(pk__in=[self.pk, other.pk]).update(order=None)
-
             # Swap order values.
             self.order, other.order = other.order, self.order
-            self._manager.filter(pk__in=[self.pk, other.pk]).bulk_update([self, other], fields=["order"])
+            self._update_orders({self.pk: typing.cast(int, self.order), other.pk: typing.cast(int, other.order)})
+
+    @classmethod
+    @_retry(OperationalError)  # retry on deadlock
+    def reorder(cls, pks: list[typing.Any], **ordering_params: typing.Any) -> None:
+        """
+        Reorder instances with given pks, so they follow the order of pks.
+        The instances take the orders they currently occupy, other instances in the ordering queryset are not moved,
+        so passing all pks from the ordering queryset applies an arbitrary new ordering to the whole queryset.
+        The ordering queryset is locked once, and orders are updated with two UPDATE statements regardless of the
+        number of instances being moved, so it's preferred over multiple to() / swap() calls.
+        Example:
+            a = OrderedModel(order=1)
+            b = OrderedModel(order=2)
+            c = OrderedModel(order=5)
+
+            OrderedModel.reorder([c.pk, a.pk, b.pk])
+            assert (a.order, b.order, c.order) == (2, 5, 1)  # [a, b, c] -> [c, a, b]
+        """
+        if set(ordering_params) != set(cls.order_with_respect_to):
+            raise ValueError(f"Ordering params must be: {', '.join(cls.order_with_respect_to)}.")
+        if len(set(pks)) != len(pks):
+            raise ValueError("Pks must be unique.")
+
+        with transaction.atomic():
+            instances = cls._lock_queryset(cls._meta.default_manager.filter(**ordering_params))
+
+            current_orders = {instance.pk: instance.order for instance in instances}
+            if any(pk not in current_orders for pk in pks):
+                raise cls.DoesNotExist()
+
+            new_orders = dict(zip(pks, sorted(typing.cast(int, current_orders[pk]) for pk in pks)))
+            cls._update_orders({pk: order for pk, order in new_orders.items() if current_orders[pk] != order})
 
     def next(self) -> typing.Self | None:
         """
@@ -258,7 +283,33 @@ class OrderedModel(models.Model):
         Locks the ordering queryset with SELECT FOR UPDATE and returns the queryset as a list.
         This allows to prevent concurrent updates from different transactions.
         """
-        return list(self._get_ordering_queryset().select_for_update().only("pk", "order"))
+        return self._lock_queryset(self._get_ordering_queryset())
+
+    @staticmethod
+    def _lock_queryset(queryset: models.QuerySet[typing.Self]) -> list[typing.Self]:
+        # Rows are locked in pk order, so concurrent transactions acquire locks in the same order and don't deadlock.
+        # Locking in the "order" order is prone to deadlocks, as orders are changed by the transactions themselves.
+        instances = list(queryset.select_for_update().only("pk", "order").order_by("pk"))
+        return sorted(instances, key=lambda instance: (instance.order is None, instance.order))
+
+    @classmethod
+    def _update_orders(cls, orders: dict[typing.Any, int]) -> None:
+        """
+        Set orders for instances with given pks using a single CASE statement.
+        Must be called within a transaction that locks the ordering queryset.
+        """
+        if not orders:
+            return
+
+        queryset = cls._meta.default_manager.filter(pk__in=orders.keys())
+
+        # Temporarily set order values to NULL to avoid unique constraint violations.
+        queryset.update(order=None)
+
+        # Update orders to appropriate unique values.
+        queryset.update(
+            order=models.Case(*[models.When(pk=pk, then=models.Value(order)) for pk, order in orders.items()])
+        )
 
     @property
     def _manager(self):
@@ -33,6 +33,52 @@ class OrderedModelViewSet(ModelViewSet):
 
         return Response(status=status.HTTP_200_OK)
 
+    @action(detail=False, methods=["put"])
+    def reorder(self, request: Request) -> Response:
+        """
+        Apply a new ordering to instances of a single ordering queryset (e.g. all steps of an escalation chain).
+        Expects a list of public primary keys in the desired order, listed instances take the orders they currently
+        occupy, so other instances of the ordering queryset are not moved.
+        """
+        public_primary_keys = self._get_reorder_param(request)
+
+        instances = {
+            instance.public_primary_key: instance
+            for instance in self.get_queryset().filter(public_primary_key__in=public_primary_keys)
+        }
+        if len(instances) != len(public_primary_keys):
+            raise BadRequest(detail="Invalid order")
+
+        ordered_instances = [instances[public_primary_key] for public_primary_key in public_primary_keys]
+        ordering_params = ordered_instances[0]._ordering_params
+        if any(instance._ordering_params != ordering_params for instance in ordered_instances):
+            raise BadRequest(detail="Unable to reorder instances from different ordering groups")
+
+        for instance in ordered_instances:
+            self.check_object_permissions(request, instance)
+
+        model = type(ordered_instances[0])
+        prev_states = {instance.pk: self._get_insight_logs_serialized(instance) for instance in ordered_instances}
+        prev_orders = {instance.pk: instance.order for instance in ordered_instances}
+        try:
+            model.reorder([instance.pk for instance in ordered_instances], **ordering_params)
+        except (ValueError, model.DoesNotExist):
+            raise BadRequest(detail="Invalid order")
+
+        for instance in ordered_instances:
+            instance.refresh_from_db(fields=["order"])
+            if instance.order == prev_orders[instance.pk]:
+                continue
+            write_resource_insight_log(
+                instance=instance,
+                author=self.request.user,
+                event=EntityEvent.UPDATED,
+                prev_state=prev_states[instance.pk],
+                new_state=self._get_insight_logs_serialized(instance),
+            )
+
+        return Response(status=status.HTTP_200_OK)
+
     @staticmethod
     def _get_insight_logs_serialized(instance):
         try:
@@ -54,3 +100,18 @@ class OrderedModelViewSet(ModelViewSet):
         serializer.is_valid(raise_exception=True)
 
         return serializer.validated_data["position"]
+
+    @staticmethod
+    def _get_reorder_param(request: Request) -> list[str]:
+        """
+        Get "order" parameter from request data + validate it.
+        Used by the reorder action on ordered models.
+        """
+
+        class ReorderSerializer(serializers.Serializer):
+            order = serializers.ListField(child=serializers.CharField(), allow_empty=False)
+
+        serializer = ReorderSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        return serializer.validated_data["order"]
@@ -2,28 +2,71 @@ import logging
 
 from django.conf import settings
 from django.core.exceptions import FieldError
+from django.db import IntegrityError, router, transaction
 from django.utils.crypto import get_random_string
 
 logger = logging.getLogger(__name__)
 
+PUBLIC_PRIMARY_KEY_MAX_ATTEMPTS = 5
+
 
 def generate_public_primary_key(prefix: str, length: int = settings.PUBLIC_PRIMARY_KEY_MIN_LENGTH) -> str:
     return prefix + get_random_string(length=length, allowed_chars=settings.PUBLIC_PRIMARY_KEY_ALLOWED_CHARS)
 
 
-def increase_public_primary_key_length(
-    failure_counter: int, prefix: str, model_name: str, max_attempt_count: int = 5
-) -> str:
-    if failure_counter < max_attempt_count:
-        logger.warning(
-            f"Let's try increase a {model_name} "
-            f"new_public_primary_key length "
-            f"({failure_counter + 1}/{max_attempt_count}) times"
-        )
+class PublicPrimaryKeyModelMixin:
+    """
+    Model mixin that makes sure a generated public_primary_key is unique without querying the database before
+    every insert.
+
+    The default public_primary_key has ~61 bits of entropy (12 characters out of 34 allowed), so a collision is
+    extremely unlikely. New objects are inserted right away relying on the unique constraint, and the insert is
+    retried with a new key only if it fails with IntegrityError because of the key. Inside a transaction a failed
+    insert would break the whole transaction, so there the key is checked before the insert instead, as that is
+    cheaper than wrapping every insert in a savepoint.
+
+    Only keys generated by the field default are replaced, explicitly set keys are never changed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # objects loaded from the database are initialized with positional args
+        generated = not args and "public_primary_key" not in kwargs
+        self._generated_public_primary_key = self.public_primary_key if generated else None
+
+    def reset_public_primary_key(self) -> None:
+        """Generate a new public_primary_key, e.g. when saving a copy of an existing object."""
+        self.public_primary_key = self._generated_public_primary_key = self._meta.get_field(
+            "public_primary_key"
+        ).get_default()
 
-        return generate_public_primary_key(
-            prefix=prefix, length=settings.PUBLIC_PRIMARY_KEY_MIN_LENGTH + failure_counter
+    def save(self, *args, **kwargs):
+        if self.pk is not None or self.public_primary_key != self._generated_public_primary_key:
+            return super().save(*args, **kwargs)
+
+        using = kwargs.get("using") or router.db_for_write(self.__class__, instance=self)
+
+        for attempt in range(1, PUBLIC_PRIMARY_KEY_MAX_ATTEMPTS + 1):
+            if transaction.get_connection(using).in_atomic_block:
+                if not self._public_primary_key_exists(using):
+                    return super().save(*args, **kwargs)
+            else:
+                try:
+                    return super().save(*args, **kwargs)
+                except IntegrityError:
+                    if not self._public_primary_key_exists(using):
+                        raise
+
+            logger.warning(
+                f"{self.__class__.__name__} public_primary_key collision, "
+                f"generating a new one ({attempt}/{PUBLIC_PRIMARY_KEY_MAX_ATTEMPTS})"
+            )
+            self.reset_public_primary_key()
+
+        raise FieldError(
+            f"A count of {self.__class__.__name__} new_public_primary_key generation "
+            f"attempts is more than {PUBLIC_PRIMARY_KEY_MAX_ATTEMPTS}!"
         )
-    raise FieldError(
-        f"A count of {model_name} new_public_primary_key generation " f"attempts is more than {max_attempt_count}!"
-    )
+
+    def _public_primary_key_exists(self, using: str) -> bool:
+        return self.__class__._base_manager.using(using).filter(public_primary_key=self.public_primary_key).exists()
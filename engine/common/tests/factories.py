@@ -0,0 +1,13 @@
+import factory
+
+
+# Faker that always returns unique values
+class UniqueFaker(factory.Faker):
+    @classmethod
+    def _get_faker(cls, locale=None):
+        return super()._get_faker(locale).unique
+
+    @classmethod
+    def clear(cls, locale=None):
+        """Forget already generated values"""
+        cls._get_faker(locale).clear()
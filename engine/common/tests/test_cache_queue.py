@@ -0,0 +1,98 @@
+import time
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from common.cache_queue import CacheBatchQueue
+
+
+def test_cache_batch_queue_push_pop():
+    queue = CacheBatchQueue("test")
+
+    # only the first push in the window schedules a task
+    assert queue.push(1, "a") is True
+    assert queue.push(1, "b") is False
+    assert queue.push(2, "c") is True
+
+    with queue.pop(1) as items:
+        assert items == ["a", "b"]
+
+    # items pushed after pop schedule a new task
+    assert queue.push(1, "d") is True
+    with queue.pop(1) as items:
+        assert items == ["d"]
+
+    with queue.pop(1) as items:
+        assert items == []
+
+    with queue.pop(2) as items:
+        assert items == ["c"]
+
+
+def test_cache_batch_queue_locked():
+    queue = CacheBatchQueue("test")
+    queue.push(1, "a")
+
+    with queue.pop(1) as items:
+        with queue.pop(1) as locked_items:
+            assert locked_items is None
+        assert items == ["a"]
+
+
+def test_cache_batch_queue_error_keeps_items():
+    queue = CacheBatchQueue("test")
+    queue.push(1, "a")
+
+    with pytest.raises(ValueError):
+        with queue.pop(1):
+            raise ValueError
+
+    with queue.pop(1) as items:
+        assert items == ["a"]
+
+
+def test_cache_batch_queue_mark_processed():
+    queue = CacheBatchQueue("test")
+    queue.push(1, "a")
+    queue.push(1, "b")
+    queue.push(1, "c")
+
+    with pytest.raises(ValueError):
+        with queue.pop(1) as items:
+            items.mark_processed(0)
+            items.mark_processed(2)
+            raise ValueError
+
+    with queue.pop(1) as items:
+        assert items == ["b"]
+
+    with queue.pop(1) as items:
+        assert items == []
+
+
+def test_cache_batch_queue_missing_item():
+    queue = CacheBatchQueue("test", missing_item_timeout=60)
+    queue.push(1, "a")
+    queue.push(1, "b")
+    queue.push(1, "c")
+    # the item is not stored yet or was evicted
+    cache.delete(queue._item_key(1, 2))
+
+    with queue.pop(1) as items:
+        assert items == ["a"]
+        assert items.pending
+
+    with queue.pop(1) as items:
+        assert items == []
+        assert items.pending
+
+    # the item is skipped after the timeout, so the items after it are not stuck
+    with patch("common.cache_queue.time.time", return_value=time.time() + 60):
+        with queue.pop(1) as items:
+            assert items == ["c"]
+            assert not items.pending
+
+    queue.push(1, "d")
+    with queue.pop(1) as items:
+        assert items == ["d"]
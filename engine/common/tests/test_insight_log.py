@@ -0,0 +1,111 @@
+import io
+import json
+import logging
+import threading
+import time
+import weakref
+from unittest.mock import patch
+
+import pytest
+from django.test import override_settings
+
+from common.insight_log import EntityEvent, write_resource_insight_log
+from common.insight_log.handlers import BufferedInsightLogHandler
+from common.insight_log.insight_logs_enabled_check import is_insight_logs_enabled
+
+
+def _make_record(message):
+    return logging.LogRecord("insight_logger", logging.INFO, __file__, 0, message, None, None)
+
+
+def test_buffered_insight_log_handler():
+    stream = io.StringIO()
+    handler = BufferedInsightLogHandler(stream, batch_size=3)
+    handler.setFormatter(logging.Formatter("insight=true %(message)s"))
+
+    for i in range(10):
+        handler.emit(_make_record(f"line {i}"))
+    handler.flush()
+
+    assert stream.getvalue() == "".join(f"insight=true line {i}\n" for i in range(10))
+
+    handler.emit(_make_record("last line"))
+    handler.close()
+    assert stream.getvalue().endswith("insight=true last line\n")
+
+
+def test_buffered_insight_log_handler_queue_full():
+    stream = io.StringIO()
+    handler = BufferedInsightLogHandler(stream, max_queue_size=0)
+
+    handler.emit(_make_record("line"))
+    # written synchronously
+    assert stream.getvalue() == "line\n"
+    handler.close()
+
+
+class _SlowStream(io.StringIO):
+    def write(self, value):
+        time.sleep(0.01)
+        return super().write(value)
+
+
+def test_buffered_insight_log_handler_logger_queue_full_and_shutdown():
+    stream = _SlowStream()
+    handler = BufferedInsightLogHandler(stream, batch_size=1, max_queue_size=5)
+    logger = logging.getLogger("test_buffered_insight_log_handler")
+    logger.propagate = False
+    logger.addHandler(handler)
+
+    def _log_and_shutdown():
+        # logging through the logger holds the handler lock while emitting, queue overflows on slow writes
+        for i in range(20):
+            logger.info(f"line {i}")
+        # records are still queued, shutdown holds the handler lock while flushing and closing
+        logging.shutdown(handlerList=[weakref.ref(handler)])
+
+    thread = threading.Thread(target=_log_and_shutdown, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    logger.removeHandler(handler)
+
+    assert not thread.is_alive()
+    assert sorted(stream.getvalue().splitlines()) == sorted(f"line {i}" for i in range(20))
+
+
+@pytest.mark.django_db
+@override_settings(IS_OPEN_SOURCE=False, ONCALL_BACKEND_REGION="prod-us-central-0")
+def test_is_insight_logs_enabled_cached(make_organization):
+    organization = make_organization(cluster_slug="prod-us-central-0")
+
+    with patch("common.insight_log.insight_logs_enabled_check.logger") as mock_logger:
+        assert is_insight_logs_enabled(organization)
+        assert is_insight_logs_enabled(organization)
+    assert mock_logger.info.call_count == 1
+
+    organization.cluster_slug = "prod-eu-west-0"
+    assert not is_insight_logs_enabled(organization)
+
+
+@pytest.mark.django_db
+@override_settings(IS_OPEN_SOURCE=False, ONCALL_BACKEND_REGION="prod-us-central-0")
+def test_write_resource_insight_log(make_organization_and_user, make_escalation_chain):
+    organization, user = make_organization_and_user()
+    organization.cluster_slug = "prod-us-central-0"
+    escalation_chain = make_escalation_chain(organization)
+
+    with patch("common.insight_log.resource_insight_logs.insight_logger") as mock_insight_logger:
+        write_resource_insight_log(
+            instance=escalation_chain,
+            author=user,
+            event=EntityEvent.UPDATED,
+            prev_state={"name": "old"},
+            new_state={"name": "new"},
+        )
+
+    log_line = mock_insight_logger.info.call_args.args[0]
+    assert log_line.startswith(
+        f"tenant_id={organization.stack_id} author_id={user.public_primary_key} author={json.dumps(user.username)}"
+    )
+    assert f"resource_id={escalation_chain.public_primary_key}" in log_line
+    assert log_line.endswith(' prev_state="{\\"name\\": \\"old\\"}" new_state="{\\"name\\": \\"new\\"}"')
@@ -208,6 +208,56 @@ def test_ordered_model_swap():
         assert _orders_are_sequential()
 
 
+@pytest.mark.django_db
+def test_ordered_model_reorder(django_assert_num_queries):
+    instances = [TestOrderedModel.objects.create(test_field="test") for _ in range(5)]
+
+    def _ids(indices):
+        return [instances[i].id for i in indices]
+
+    # reorder the whole queryset: lock + 2 updates in a transaction
+    with django_assert_num_queries(5):
+        TestOrderedModel.reorder(_ids([4, 2, 0, 3, 1]), test_field="test")
+    assert _get_ids() == _ids([4, 2, 0, 3, 1])
+    assert _orders_are_sequential()
+
+    # reorder a subset, other instances keep their orders
+    TestOrderedModel.reorder(_ids([1, 4]), test_field="test")
+    assert _get_ids() == _ids([1, 2, 0, 3, 4])
+    assert _orders_are_sequential()
+
+    # same order, nothing to update
+    with django_assert_num_queries(3):
+        TestOrderedModel.reorder(_ids([1, 2, 0, 3, 4]), test_field="test")
+    assert _get_ids() == _ids([1, 2, 0, 3, 4])
+
+
+@pytest.mark.django_db
+def test_ordered_model_reorder_non_sequential_orders():
+    instances = [TestOrderedModel.objects.create(test_field="test", order=order) for order in (1, 5, 10)]
+
+    TestOrderedModel.reorder([instances[2].id, instances[0].id, instances[1].id], test_field="test")
+    assert _get_ids() == [instances[2].id, instances[0].id, instances[1].id]
+    assert _get_orders() == [1, 5, 10]
+
+
+@pytest.mark.django_db
+def test_ordered_model_reorder_invalid():
+    instances = [TestOrderedModel.objects.create(test_field="test") for _ in range(3)]
+    other_instance = TestOrderedModel.objects.create(test_field="test1")
+
+    with pytest.raises(ValueError):
+        TestOrderedModel.reorder([instances[1].id, instances[0].id])
+
+    with pytest.raises(ValueError):
+        TestOrderedModel.reorder([instances[1].id, instances[1].id], test_field="test")
+
+    with pytest.raises(TestOrderedModel.DoesNotExist):
+        TestOrderedModel.reorder([other_instance.id, instances[0].id], test_field="test")
+
+    assert _get_ids() == [instance.id for instance in instances]
+
+
 @pytest.mark.django_db
 def test_order_with_respect_to_isolation():
     instances = [TestOrderedModel.objects.create(test_field="test") for _ in range(5)]
@@ -221,6 +271,7 @@ def test_order_with_respect_to_isolation():
 
     instances[0].to(8)
     instances[1].swap(7)
+    TestOrderedModel.reorder([instance.id for instance in reversed(instances)], test_field="test")
 
     for idx, instance in enumerate(other_instances):
         instance.refresh_from_db()
@@ -404,3 +455,86 @@ def test_ordered_model_create_swap_and_delete_concurrent():
     assert not exceptions
     assert _orders_are_sequential()
     assert list(TestOrderedModel.objects.values_list("extra_field", flat=True)) == expected_extra_field_values
+
+
+@pytest.mark.skipif(SKIP_CONCURRENT, reason="OrderedModel concurrent tests are skipped to speed up tests")
+@pytest.mark.django_db(transaction=True)
+def test_ordered_model_reorder_concurrent():
+    THREADS = 300
+    exceptions = []
+
+    TestOrderedModel.objects.all().delete()  # clear table
+    instances = [TestOrderedModel.objects.create(test_field="test") for _ in range(THREADS)]
+    ids = [instance.id for instance in instances]
+
+    random.seed(42)
+    orderings = [random.sample(ids, len(ids)) for _ in range(THREADS)]
+    positions = [random.randint(0, THREADS - 1) for _ in range(THREADS)]
+
+    def reorder(idx):
+        try:
+            TestOrderedModel.reorder(orderings[idx], test_field="test")
+        except Exception as e:
+            exceptions.append(("reorder", e))
+
+    def to(idx):
+        try:
+            instances[idx].to(positions[idx])
+        except Exception as e:
+            exceptions.append(("to", e))
+
+    def swap(idx):
+        try:
+            instances[idx].swap(positions[idx])
+        except Exception as e:
+            exceptions.append(("swap", e))
+
+    threads = [threading.Thread(target=reorder, args=(idx,)) for idx in range(0, THREADS, 3)]
+    threads += [threading.Thread(target=to, args=(idx,)) for idx in range(1, THREADS, 3)]
+    threads += [threading.Thread(target=swap, args=(idx,)) for idx in range(2, THREADS, 3)]
+    random.shuffle(threads)
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # can only check that orders are still sequential and that there are no exceptions
+    # can't check the exact order because it changes depending on the order of execution
+    assert not exceptions
+    assert _orders_are_sequential()
+    assert sorted(_get_ids()) == sorted(ids)
+
+
+@pytest.mark.skipif(SKIP_CONCURRENT, reason="OrderedModel concurrent tests are skipped to speed up tests")
+@pytest.mark.django_db(transaction=True)
+def test_ordered_model_reorder_disjoint_subsets_concurrent():
+    """Check that concurrent reorders of disjoint subsets don't affect each other."""
+
+    THREADS = 100
+    exceptions = []
+
+    TestOrderedModel.objects.all().delete()  # clear table
+    instances = [TestOrderedModel.objects.create(test_field="test") for _ in range(THREADS * 2)]
+
+    def reorder(idx):
+        try:
+            # swap each pair of adjacent instances
+            TestOrderedModel.reorder([instances[idx * 2 + 1].id, instances[idx * 2].id], test_field="test")
+        except Exception as e:
+            exceptions.append(e)
+
+    threads = [threading.Thread(target=reorder, args=(idx,)) for idx in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not exceptions
+    assert _orders_are_sequential()
+
+    # reorders don't overlap, so the final order is deterministic
+    expected_ids = []
+    for idx in range(THREADS):
+        expected_ids += [instances[idx * 2 + 1].id, instances[idx * 2].id]
+    assert _get_ids() == expected_ids
@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.exceptions import FieldError
+from django.db import IntegrityError
+
+from apps.base.models import LiveSetting
+
+
+@pytest.mark.parametrize(
+    "transaction",
+    [
+        pytest.param(False, marks=pytest.mark.django_db),
+        pytest.param(True, marks=pytest.mark.django_db(transaction=True)),
+    ],
+)
+def test_public_primary_key_collision(transaction, django_assert_num_queries):
+    LiveSetting.objects.create(name="EMAIL_HOST", public_primary_key="LAAAAAAAAAAAA")
+
+    with patch("common.public_primary_keys.get_random_string", side_effect=["AAAAAAAAAAAA", "BBBBBBBBBBBB"]):
+        live_setting = LiveSetting(name="EMAIL_PORT")
+        # inside a transaction the key is checked before the insert (2 checks + insert),
+        # otherwise the insert is retried on IntegrityError (insert + check + insert)
+        with django_assert_num_queries(3):
+            live_setting.save()
+
+    assert live_setting.public_primary_key == "LBBBBBBBBBBBB"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_public_primary_key_no_existence_check():
+    live_setting = LiveSetting(name="EMAIL_PORT")
+    with patch.object(LiveSetting, "_public_primary_key_exists") as mocked_exists:
+        live_setting.save()
+
+    mocked_exists.assert_not_called()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_public_primary_key_explicit_not_replaced():
+    LiveSetting.objects.create(name="EMAIL_HOST", public_primary_key="LAAAAAAAAAAAA")
+
+    with pytest.raises(IntegrityError):
+        LiveSetting.objects.create(name="EMAIL_PORT", public_primary_key="LAAAAAAAAAAAA")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_public_primary_key_other_integrity_error():
+    LiveSetting.objects.create(name="EMAIL_HOST")
+
+    # the key doesn't exist, so the error is not caused by a key collision
+    with pytest.raises(IntegrityError):
+        LiveSetting.objects.create(name="EMAIL_HOST")
+
+
+@pytest.mark.django_db
+def test_public_primary_key_max_attempts():
+    LiveSetting.objects.create(name="EMAIL_HOST", public_primary_key="LAAAAAAAAAAAA")
+
+    with patch("common.public_primary_keys.get_random_string", return_value="AAAAAAAAAAAA"):
+        with pytest.raises(FieldError):
+            LiveSetting.objects.create(name="EMAIL_PORT")
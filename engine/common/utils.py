@@ -6,9 +6,6 @@ import re
 import time
 from functools import reduce
 
-import factory
-import markdown2
-from bs4 import BeautifulSoup
 from celery.utils.log import get_task_logger
 from celery.utils.time import get_exponential_backoff_interval
 from django.utils.html import urlize
@@ -16,13 +13,6 @@ from django.utils.html import urlize
 logger = get_task_logger(__name__)
 
 
-# Faker that always returns unique values
-class UniqueFaker(factory.Faker):
-    @classmethod
-    def _get_faker(cls, locale=None):
-        return super()._get_faker(locale).unique
-
-
 # Context manager for tasks that are intended to retry
 # It will rerun the whole task if exception(s) exc has happened
 class OkToRetry:
@@ -149,6 +139,8 @@ def str_or_backup(string, backup):
 
 
 def clean_html(text):
+    from bs4 import BeautifulSoup
+
     text = "".join(BeautifulSoup(text, features="html.parser").find_all(string=True))
     return text
 
@@ -159,6 +151,8 @@ def convert_slack_md_to_html(text):
 
 
 def convert_md_to_html(text):
+    import markdown2
+
     # Markdown expects two or more spaces at the end of a line to indicate a line break.
     # Adding two spaces to any line break to support templates that were built without this in mind.
     # https://daringfireball.net/projects/markdown/syntax#p
@@ -194,6 +188,8 @@ def convert_md_to_html(text):
 
 
 def clean_markup(text):
+    import markdown2
+
     html = markdown2.markdown(text, extras=["cuddled-lists", "fenced-code-blocks", "pyshell"]).strip()
     cleaned = clean_html(html)
     stroke_matches = re.findall(r"~\w+~", cleaned)
@@ -211,6 +207,8 @@ def urlize_with_respect_to_a(html):
     """
     Wrap links into <a> tag if not already
     """
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, features="html.parser")
     textNodes = soup.find_all(string=True)
     for textNode in textNodes:
@@ -8,6 +8,7 @@ from importlib import import_module, reload
 
 import pytest
 from celery import Task
+from django.core.cache import cache
 from django.db.models.signals import post_save
 from django.urls import clear_url_caches
 from django.utils import timezone
@@ -90,6 +91,7 @@ from apps.user_management.tests.factories import OrganizationFactory, RegionFact
 from apps.webhooks.presets.preset_options import WebhookPresetOptions
 from apps.webhooks.tests.factories import CustomWebhookFactory, WebhookResponseFactory
 from apps.webhooks.tests.test_webhook_presets import TEST_WEBHOOK_PRESET_ID, TestWebhookPreset
+from common.tests.factories import UniqueFaker
 
 register(OrganizationFactory)
 register(UserFactory)
@@ -183,6 +185,19 @@ def mock_is_labels_feature_enabled(settings):
     setattr(settings, "FEATURE_LABELS_ENABLED", True)
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # cached model instances and counters must not leak between tests
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_unique_faker():
+    # test data is rolled back after each test, so unique values can be reused,
+    # otherwise the pool of unique words runs out as the number of tests grows
+    UniqueFaker.clear()
+
+
 @pytest.fixture
 def make_organization():
     def _make_organization(**kwargs):
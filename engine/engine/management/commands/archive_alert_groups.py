@@ -0,0 +1,39 @@
+import datetime
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from apps.alerts.alert_group_archive import ArchiveResult, archive_alert_groups
+
+
+class Command(BaseCommand):
+    """
+    Move resolved alert groups older than a given number of days, with their alerts and log records, to archive.
+    Alert groups are archived in batches of transactions with a limited number of rows, so the command can be
+    interrupted and run again at any time. Use --dry-run to see how many alert groups and rows would be archived.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=settings.ALERT_GROUP_ARCHIVE_AFTER_DAYS,
+            help="Archive alert groups resolved more than this number of days ago "
+            "(defaults to ALERT_GROUP_ARCHIVE_AFTER_DAYS)",
+        )
+        parser.add_argument("--max-batches", type=int, default=None, help="Maximum number of batches to archive")
+        parser.add_argument("--dry-run", action="store_true", help="Only report what would be archived")
+
+    def handle(self, *args, older_than_days, max_batches, dry_run, **options):
+        if older_than_days is None:
+            raise CommandError("--older-than-days is required when ALERT_GROUP_ARCHIVE_AFTER_DAYS is not set")
+
+        verb = "Would archive" if dry_run else "Archived"
+        result = ArchiveResult()
+        for batch_result in archive_alert_groups(
+            datetime.timedelta(days=older_than_days), max_batches=max_batches, dry_run=dry_run
+        ):
+            result += batch_result
+            self.stdout.write(f"{verb} {result.alert_groups} alert groups so far, {result.rows} rows")
+
+        self.stdout.write(f"{verb} {result.alert_groups} alert groups, {result.rows} rows")
@@ -0,0 +1,87 @@
+from django.core.management import BaseCommand
+from django.db.models import Min
+
+from apps.alerts.models import AlertGroup, AlertGroupInvolvedUser, AlertGroupLogRecord
+from apps.base.models import UserNotificationPolicyLogRecord
+
+
+class Command(BaseCommand):
+    """
+    Populate AlertGroupInvolvedUser for alert groups created before the table was introduced.
+    Alert groups are processed in batches by primary key, so the command can be interrupted and resumed
+    from a given alert group using --start-from.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of alert groups per batch")
+        parser.add_argument("--start-from", type=int, default=0, help="Alert group id to start from")
+
+    def handle(self, *args, batch_size, start_from, **options):
+        alert_group_ids = AlertGroup.objects.filter(id__gte=start_from).order_by("id").values_list("id", flat=True)
+
+        last_id = start_from - 1
+        while True:
+            batch_ids = list(alert_group_ids.filter(id__gt=last_id)[:batch_size])
+            if not batch_ids:
+                break
+
+            count = self.backfill(batch_ids[0], batch_ids[-1])
+            last_id = batch_ids[-1]
+            self.stdout.write(f"Processed alert groups up to {last_id}, {count} involved users found")
+
+    @staticmethod
+    def backfill(from_id, to_id):
+        involved_users = {}
+
+        def _add(user_id, alert_group_id, involved_at):
+            key = (user_id, alert_group_id)
+            if user_id is not None and (key not in involved_users or involved_at < involved_users[key]):
+                involved_users[key] = involved_at
+
+        notified_users = (
+            UserNotificationPolicyLogRecord.objects.filter(alert_group__id__range=(from_id, to_id))
+            .values("author_id", "alert_group_id")
+            .annotate(first_involved_at=Min("created_at"))
+            .order_by()
+        )
+        for row in notified_users:
+            _add(row["author_id"], row["alert_group_id"], row["first_involved_at"])
+
+        acting_users = (
+            AlertGroupLogRecord.objects.filter(
+                alert_group__id__range=(from_id, to_id),
+                type__in=AlertGroupLogRecord.INVOLVED_USER_TYPES,
+                author__isnull=False,
+            )
+            .values("author_id", "alert_group_id")
+            .annotate(first_involved_at=Min("created_at"))
+            .order_by()
+        )
+        for row in acting_users:
+            _add(row["author_id"], row["alert_group_id"], row["first_involved_at"])
+
+        # alert groups acted on before log records had authors
+        alert_groups = AlertGroup.objects.filter(id__range=(from_id, to_id)).values(
+            "id",
+            "started_at",
+            "acknowledged_by_user_id",
+            "acknowledged_at",
+            "resolved_by_user_id",
+            "resolved_at",
+            "silenced_by_user_id",
+            "silenced_at",
+        )
+        for row in alert_groups:
+            _add(row["acknowledged_by_user_id"], row["id"], row["acknowledged_at"] or row["started_at"])
+            _add(row["resolved_by_user_id"], row["id"], row["resolved_at"] or row["started_at"])
+            _add(row["silenced_by_user_id"], row["id"], row["silenced_at"] or row["started_at"])
+
+        AlertGroupInvolvedUser.objects.bulk_create(
+            [
+                AlertGroupInvolvedUser(user_id=user_id, alert_group_id=alert_group_id, first_involved_at=involved_at)
+                for (user_id, alert_group_id), involved_at in involved_users.items()
+            ],
+            batch_size=5000,
+            ignore_conflicts=True,
+        )
+        return len(involved_users)
@@ -0,0 +1,62 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.alerts.alert_group_archive import ArchiveResult, archive_alert_group_batch
+from apps.alerts.models import Alert, AlertGroup, AlertGroupLogRecord, AlertReceiveChannel, ArchivedAlertGroup
+
+
+class Command(BaseCommand):
+    """
+    Measure alert group archival throughput on synthetic data.
+    Resolved alert groups with alerts and log records are created in the given integration, archived and the
+    archived copies are deleted afterwards, run it against a non-production database.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("integration", help="Public primary key of the integration to create alert groups in")
+        parser.add_argument("--alert-groups", type=int, default=500, help="Number of alert groups to archive")
+        parser.add_argument("--alerts", type=int, default=10, help="Number of alerts per alert group")
+        parser.add_argument("--log-records", type=int, default=10, help="Number of log records per alert group")
+
+    def handle(self, *args, **options):
+        integration = AlertReceiveChannel.objects.get(public_primary_key=options["integration"])
+
+        alert_group_ids = self.create_synthetic_data(
+            integration, options["alert_groups"], options["alerts"], options["log_records"]
+        )
+
+        result = ArchiveResult()
+        start = time.perf_counter()
+        for i in range(0, len(alert_group_ids), 100):
+            result += archive_alert_group_batch(alert_group_ids[i : i + 100])
+        seconds = time.perf_counter() - start
+
+        self.stdout.write(
+            f"archived {result.alert_groups} alert groups ({result.rows} rows) in {seconds * 1000:.1f} ms "
+            f"({result.alert_groups / seconds:.0f} alert groups/s, {result.rows / seconds:.0f} rows/s)"
+        )
+        ArchivedAlertGroup.objects.filter(alert_group_id__in=alert_group_ids).delete()
+
+    @staticmethod
+    def create_synthetic_data(integration: AlertReceiveChannel, alert_groups: int, alerts: int, log_records: int):
+        resolved_at = timezone.now() - datetime.timedelta(days=365)
+        alert_group_ids = []
+        for _ in range(alert_groups):
+            alert_group = AlertGroup.objects.create(
+                channel=integration, resolved=True, resolved_at=resolved_at, web_title_cache="benchmark"
+            )
+            alert_group_ids.append(alert_group.pk)
+
+            Alert.objects.bulk_create(
+                [Alert(group=alert_group, title="benchmark", raw_request_data={"benchmark": i}) for i in range(alerts)]
+            )
+            AlertGroupLogRecord.objects.bulk_create(
+                [
+                    AlertGroupLogRecord(alert_group=alert_group, type=AlertGroupLogRecord.TYPE_ESCALATION_TRIGGERED)
+                    for _ in range(log_records)
+                ]
+            )
+        return alert_group_ids
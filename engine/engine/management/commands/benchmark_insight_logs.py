@@ -0,0 +1,53 @@
+import logging
+import os
+import time
+
+from django.core.management.base import BaseCommand
+
+from common.insight_log.handlers import BufferedInsightLogHandler
+
+LOG_LINE = (
+    'tenant_id=1 author_id=UABCDEFGHIJKL author="user" action_type=resource action_name=updated '
+    'resource_type=escalation_policy resource_id=EABCDEFGHIJKL resource_name="step" team="General"'
+)
+
+
+class Command(BaseCommand):
+    """
+    Compare the time spent on the calling thread when writing insight logs with a synchronous stream handler
+    and with the buffered handler.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lines", type=int, default=10000, help="Number of log lines to write")
+        parser.add_argument("--output", default=os.devnull, help="File to write the log lines to")
+
+    def handle(self, *args, **options):
+        lines = options["lines"]
+        with open(options["output"], "w") as stream:
+            for handler in (logging.StreamHandler(stream), BufferedInsightLogHandler(stream)):
+                emit_seconds, total_seconds = self.run_benchmark(handler, lines)
+                self.stdout.write(
+                    f"{handler.__class__.__name__}: {lines} lines, "
+                    f"calling thread {emit_seconds * 1000:.1f} ms ({emit_seconds / lines * 1e6:.2f} us/line), "
+                    f"until written {total_seconds * 1000:.1f} ms"
+                )
+
+    @staticmethod
+    def run_benchmark(handler: logging.Handler, lines: int) -> tuple[float, float]:
+        handler.setFormatter(logging.Formatter("insight=true logger=%(name)s %(message)s"))
+        logger = logging.getLogger("insight_logger_benchmark")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        try:
+            start = time.perf_counter()
+            for _ in range(lines):
+                logger.info(LOG_LINE)
+            emit_seconds = time.perf_counter() - start
+            handler.flush()
+            total_seconds = time.perf_counter() - start
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+        return emit_seconds, total_seconds
@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.alerts.models import Alert, AlertGroup
+
+
+class Command(BaseCommand):
+    """
+    Compare alert insert throughput when the public_primary_key is checked with a query before every insert
+    (previous behaviour) and when inserts rely on the unique constraint.
+    Alerts are added to the given alert group and deleted afterwards, run it against a non-production database.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("alert_group", help="Public primary key of the alert group to add alerts to")
+        parser.add_argument("--alerts", type=int, default=1000, help="Number of alerts to insert per run")
+
+    def handle(self, *args, **options):
+        alert_group = AlertGroup.objects.get(public_primary_key=options["alert_group"])
+        alerts = options["alerts"]
+
+        for name, check_before_insert in (("check before insert", True), ("unique constraint", False)):
+            seconds = self.run_benchmark(alert_group, alerts, check_before_insert)
+            self.stdout.write(f"{name}: {alerts} alerts in {seconds * 1000:.1f} ms ({alerts / seconds:.0f} alerts/s)")
+
+    @staticmethod
+    def run_benchmark(alert_group: AlertGroup, alerts: int, check_before_insert: bool) -> float:
+        alert_pks = []
+        start = time.perf_counter()
+        for _ in range(alerts):
+            alert = Alert(group=alert_group, title="benchmark", raw_request_data={})
+            if check_before_insert:
+                Alert.objects.filter(public_primary_key=alert.public_primary_key).exists()
+            alert.save()
+            alert_pks.append(alert.pk)
+        seconds = time.perf_counter() - start
+
+        Alert.objects.filter(pk__in=alert_pks).delete()
+        return seconds
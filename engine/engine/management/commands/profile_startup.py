@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+import typing
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+STARTUP_SCRIPT = """
+import django
+import psutil
+
+django.setup()
+{extra}
+print(psutil.Process().memory_info().rss)
+"""
+
+# Worker start also imports the task modules of all the registered apps
+CELERY_STARTUP = """
+from engine.celery import app
+
+app.loader.import_default_modules()
+"""
+
+
+class ImportTime(typing.NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> typing.List[ImportTime]:
+    """
+    Parse the output of `python -X importtime`, lines look like:
+    "import time:       self [us] |  cumulative | imported package"
+    """
+    result = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, module = line[len("import time:") :].split("|")
+            # nested imports are indented by two spaces per level
+            depth = (len(module) - len(module.lstrip()) - 1) // 2
+            result.append(ImportTime(module.strip(), int(self_us), int(cumulative_us), depth))
+        except ValueError:
+            # header line
+            continue
+    return result
+
+
+class Command(BaseCommand):
+    """
+    Measure the time spent importing modules and the memory used by a fresh process during django.setup().
+    Useful to find heavy modules imported at startup by web and celery processes.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=30, help="Number of slowest imports to show")
+        parser.add_argument(
+            "--celery", action="store_true", help="Also load the celery app and task modules, like a worker does"
+        )
+
+    def handle(self, *args, **options):
+        script = STARTUP_SCRIPT.format(extra=CELERY_STARTUP if options["celery"] else "")
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script], env=env, capture_output=True, text=True
+        )
+        if process.returncode != 0:
+            raise CommandError(process.stderr)
+
+        imports = parse_importtime(process.stderr)
+        total_us = sum(i.cumulative_us for i in imports if i.depth == 0)
+        rss = int(process.stdout.strip().splitlines()[-1])
+
+        self.stdout.write(f"{'cumulative [ms]':>16} {'self [ms]':>10}  module")
+        for i in sorted(imports, key=lambda i: i.cumulative_us, reverse=True)[: options["top"]]:
+            self.stdout.write(f"{i.cumulative_us / 1000:>16.1f} {i.self_us / 1000:>10.1f}  {i.module}")
+
+        self.stdout.write(f"Total import time: {total_us / 1000:.1f} ms")
+        self.stdout.write(f"Resident memory after startup: {rss / 1024 / 1024:.1f} MiB")
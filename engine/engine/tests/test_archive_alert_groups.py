@@ -0,0 +1,32 @@
+import datetime
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.alerts.models import AlertGroup, ArchivedAlertGroup
+
+
+@pytest.mark.django_db
+def test_archive_alert_groups(make_organization, make_alert_receive_channel, make_alert_group, make_alert):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(
+        alert_receive_channel, resolved=True, resolved_at=timezone.now() - datetime.timedelta(days=10)
+    )
+    make_alert(alert_group, raw_request_data={})
+
+    call_command("archive_alert_groups", older_than_days=7, dry_run=True)
+    assert AlertGroup.objects.filter(pk=alert_group.pk).exists()
+
+    call_command("archive_alert_groups", older_than_days=7)
+    assert not AlertGroup.objects.filter(pk=alert_group.pk).exists()
+    assert ArchivedAlertGroup.objects.get().alert_group_id == alert_group.pk
+
+
+@pytest.mark.django_db
+@override_settings(ALERT_GROUP_ARCHIVE_AFTER_DAYS=None)
+def test_archive_alert_groups_requires_age():
+    with pytest.raises(CommandError):
+        call_command("archive_alert_groups")
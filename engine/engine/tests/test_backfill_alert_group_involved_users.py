@@ -0,0 +1,43 @@
+import pytest
+from django.core.management import call_command
+
+from apps.alerts.models import AlertGroupInvolvedUser, AlertGroupLogRecord
+from apps.base.models import UserNotificationPolicyLogRecord
+
+
+@pytest.mark.django_db
+def test_backfill_alert_group_involved_users(
+    make_organization,
+    make_user_for_organization,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert_group_log_record,
+    make_user_notification_policy_log_record,
+):
+    organization = make_organization()
+    notified_user = make_user_for_organization(organization)
+    acknowledging_user = make_user_for_organization(organization)
+    resolving_user = make_user_for_organization(organization)
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_groups = [make_alert_group(alert_receive_channel) for _ in range(3)]
+
+    # the fixtures don't send post_save signals, so involved users are not populated
+    make_user_notification_policy_log_record(
+        author=notified_user,
+        alert_group=alert_groups[0],
+        type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_TRIGGERED,
+    )
+    make_alert_group_log_record(alert_groups[1], AlertGroupLogRecord.TYPE_ACK, acknowledging_user)
+    make_alert_group_log_record(alert_groups[1], AlertGroupLogRecord.TYPE_UN_ACK, notified_user)
+    alert_groups[2].resolved_by_user = resolving_user
+    alert_groups[2].save(update_fields=["resolved_by_user"])
+    # already populated involved users are kept
+    AlertGroupInvolvedUser.objects.add([(acknowledging_user.pk, alert_groups[1].pk)])
+
+    call_command("backfill_alert_group_involved_users", batch_size=2)
+
+    assert set(AlertGroupInvolvedUser.objects.values_list("user_id", "alert_group_id")) == {
+        (notified_user.pk, alert_groups[0].pk),
+        (acknowledging_user.pk, alert_groups[1].pk),
+        (resolving_user.pk, alert_groups[2].pk),
+    }
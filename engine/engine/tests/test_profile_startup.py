@@ -0,0 +1,14 @@
+from engine.management.commands.profile_startup import ImportTime, parse_importtime
+
+
+def test_parse_importtime():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   encodings.aliases\n"
+        "import time:       300 |        420 | encodings\n"
+        "some other output\n"
+    )
+    assert parse_importtime(output) == [
+        ImportTime("encodings.aliases", 120, 120, 1),
+        ImportTime("encodings", 300, 420, 0),
+    ]
@@ -355,7 +355,7 @@ LOGGING = {
             "formatter": "standard",
         },
         "insight_logger": {
-            "class": "logging.StreamHandler",
+            "class": "common.insight_log.handlers.BufferedInsightLogHandler",
             "formatter": "insight_logger",
         },
     },
@@ -483,6 +483,11 @@ ALERT_GROUP_ESCALATION_AUDITOR_CELERY_TASK_HEARTBEAT_URL = os.getenv(
     "ALERT_GROUP_ESCALATION_AUDITOR_CELERY_TASK_HEARTBEAT_URL", None
 )
 
+# Resolved alert groups older than this number of days are moved to archive by a periodic task, disabled if not set
+# (see apps.alerts.alert_group_archive)
+ALERT_GROUP_ARCHIVE_AFTER_DAYS = getenv_integer("ALERT_GROUP_ARCHIVE_AFTER_DAYS", None)
+ALERT_GROUP_ARCHIVE_MAX_BATCHES_PER_RUN = getenv_integer("ALERT_GROUP_ARCHIVE_MAX_BATCHES_PER_RUN", 10)
+
 CELERY_BEAT_SCHEDULE_FILENAME = os.getenv("CELERY_BEAT_SCHEDULE_FILENAME", "celerybeat-schedule")
 
 CELERY_BEAT_SCHEDULE = {
@@ -568,6 +573,11 @@ CELERY_BEAT_SCHEDULE = {
         "schedule": crontab(minute="*/2"),  # every 2 minutes
         "args": (),
     },
+    "flush_heartbeat_pings": {
+        "task": "apps.heartbeat.tasks.flush_heartbeat_pings",
+        "schedule": 60,
+        "args": (),
+    },
 }
 
 if ESCALATION_AUDITOR_ENABLED:
@@ -581,6 +591,13 @@ if ESCALATION_AUDITOR_ENABLED:
         "args": (),
     }
 
+if ALERT_GROUP_ARCHIVE_AFTER_DAYS is not None:
+    CELERY_BEAT_SCHEDULE["archive_alert_groups"] = {
+        "task": "apps.alerts.tasks.archive_alert_groups.archive_alert_groups",
+        "schedule": 10 * 60,
+        "args": (),
+    }
+
 INTERNAL_IPS = ["127.0.0.1"]
 
 SELF_IP = os.environ.get("SELF_IP")
@@ -3,9 +3,11 @@ CELERY_TASK_ROUTES = {
     "apps.alerts.tasks.sync_grafana_alerting_contact_points.disconnect_integration_from_alerting_contact_points": {
         "queue": "default"
     },
+    "apps.alerts.tasks.archive_alert_groups.archive_alert_groups": {"queue": "default"},
     "apps.alerts.tasks.delete_alert_group.delete_alert_group": {"queue": "default"},
     "apps.alerts.tasks.invalidate_web_cache_for_alert_group.invalidate_web_cache_for_alert_group": {"queue": "default"},
     "apps.alerts.tasks.send_alert_group_signal.send_alert_group_signal": {"queue": "default"},
+    "apps.alerts.tasks.send_alert_group_signal.send_alert_group_signal_for_bulk_action": {"queue": "default"},
     "apps.alerts.tasks.wipe.wipe": {"queue": "default"},
     "common.oncall_gateway.tasks.create_oncall_connector_async": {"queue": "default"},
     "common.oncall_gateway.tasks.delete_oncall_connector_async": {"queue": "default"},
@@ -74,6 +76,8 @@ CELERY_TASK_ROUTES = {
     "apps.schedules.tasks.notify_about_gaps_in_schedule.notify_about_gaps_in_schedule": {"queue": "default"},
     "celery.backend_cleanup": {"queue": "default"},
     "apps.heartbeat.tasks.check_heartbeats": {"queue": "default"},
+    "apps.heartbeat.tasks.flush_heartbeat_pings": {"queue": "default"},
+    "apps.heartbeat.tasks.create_heartbeat_alerts": {"queue": "critical"},
     "apps.oss_installation.tasks.send_cloud_heartbeat_task": {"queue": "default"},
     "apps.oss_installation.tasks.send_usage_stats_report": {"queue": "default"},
     "apps.oss_installation.tasks.sync_users_with_cloud": {"queue": "default"},
@@ -102,10 +106,12 @@ CELERY_TASK_ROUTES = {
     "apps.base.tasks.process_failed_to_invoke_celery_tasks": {"queue": "critical"},
     "apps.base.tasks.process_failed_to_invoke_celery_tasks_batch": {"queue": "critical"},
     "apps.email.tasks.notify_user_async": {"queue": "critical"},
+    "apps.email.tasks.notify_users_async": {"queue": "critical"},
     "apps.integrations.tasks.create_alert": {"queue": "critical"},
     "apps.integrations.tasks.create_alertmanager_alerts": {"queue": "critical"},
     "apps.integrations.tasks.start_notify_about_integration_ratelimit": {"queue": "critical"},
     "apps.mobile_app.tasks.new_alert_group.notify_user_about_new_alert_group": {"queue": "critical"},
+    "apps.mobile_app.tasks.new_alert_group.notify_users_about_new_alert_group": {"queue": "critical"},
     "apps.mobile_app.tasks.going_oncall_notification.conditionally_send_going_oncall_push_notifications_for_schedule": {
         "queue": "critical"
     },
@@ -152,8 +158,10 @@ CELERY_TASK_ROUTES = {
         "queue": "slack"
     },
     "apps.slack.representatives.alert_group_representative.on_alert_group_action_triggered_async": {"queue": "slack"},
+    "apps.slack.representatives.alert_group_representative.on_alert_group_actions_triggered_async": {"queue": "slack"},
     "apps.slack.representatives.alert_group_representative.on_alert_group_update_log_report_async": {"queue": "slack"},
     # TELEGRAM
+    "apps.telegram.tasks.edit_alert_group_messages": {"queue": "telegram"},
     "apps.telegram.tasks.edit_message": {"queue": "telegram"},
     "apps.telegram.tasks.on_create_alert_telegram_representative_async": {"queue": "telegram"},
     "apps.telegram.tasks.register_telegram_webhook": {"queue": "telegram"},
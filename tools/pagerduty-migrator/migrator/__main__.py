@@ -3,14 +3,15 @@ import datetime
 from pdpyras import APISession
 
 from migrator import oncall_api_client
+from migrator.checkpoint import Checkpoint, migrate_resources
 from migrator.config import (
     EXPERIMENTAL_MIGRATE_EVENT_RULES,
+    MIGRATION_CHECKPOINT_FILE,
     MODE,
     MODE_PLAN,
     PAGERDUTY_API_TOKEN,
 )
 from migrator.report import (
-    TAB,
     escalation_policy_report,
     format_escalation_policy,
     format_integration,
@@ -145,39 +146,72 @@ def main() -> None:
 
         return
 
+    checkpoint = Checkpoint(MIGRATION_CHECKPOINT_FILE)
+
     print("▶ Migrating user notification rules...")
-    for user in users:
-        if user["oncall_user"]:
-            migrate_notification_rules(user)
-            print(TAB + format_user(user))
+    migrate_resources(
+        checkpoint,
+        "users",
+        [user for user in users if user["oncall_user"]],
+        migrate_notification_rules,
+        format_user,
+    )
 
     print("▶ Migrating schedules...")
-    for schedule in schedules:
-        if not schedule["unmatched_users"] and not schedule["migration_errors"]:
-            migrate_schedule(schedule, user_id_map)
-            print(TAB + format_schedule(schedule))
+    migrate_resources(
+        checkpoint,
+        "schedules",
+        [
+            schedule
+            for schedule in schedules
+            if not schedule["unmatched_users"] and not schedule["migration_errors"]
+        ],
+        lambda schedule: migrate_schedule(schedule, user_id_map),
+        format_schedule,
+        result_key="oncall_schedule",
+    )
 
     print("▶ Migrating escalation policies...")
-    for policy in escalation_policies:
-        if not policy["unmatched_users"] and not policy["flawed_schedules"]:
-            migrate_escalation_policy(policy, users, schedules)
-            print(TAB + format_escalation_policy(policy))
+    migrate_resources(
+        checkpoint,
+        "escalation_policies",
+        [
+            policy
+            for policy in escalation_policies
+            if not policy["unmatched_users"] and not policy["flawed_schedules"]
+        ],
+        lambda policy: migrate_escalation_policy(policy, users, schedules),
+        format_escalation_policy,
+        result_key="oncall_escalation_chain",
+    )
 
     print("▶ Migrating integrations...")
-    for integration in integrations:
-        if (
-            integration["oncall_type"]
+    migrate_resources(
+        checkpoint,
+        "integrations",
+        [
+            integration
+            for integration in integrations
+            if integration["oncall_type"]
             and not integration["is_escalation_policy_flawed"]
-        ):
-            migrate_integration(integration, escalation_policies)
-            print(TAB + format_integration(integration))
+        ],
+        lambda integration: migrate_integration(integration, escalation_policies),
+        format_integration,
+    )
 
     if rulesets is not None:
         print("▶ Migrating event rules (global rulesets)...")
-        for ruleset in rulesets:
-            if not ruleset["flawed_escalation_policies"]:
-                migrate_ruleset(ruleset, escalation_policies, services)
-                print(TAB + format_ruleset(ruleset))
+        migrate_resources(
+            checkpoint,
+            "rulesets",
+            [
+                ruleset
+                for ruleset in rulesets
+                if not ruleset["flawed_escalation_policies"]
+            ],
+            lambda ruleset: migrate_ruleset(ruleset, escalation_policies, services),
+            format_ruleset,
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,79 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Optional
+
+from migrator.config import MIGRATION_CONCURRENCY
+from migrator.report import TAB
+
+
+class Checkpoint:
+    """
+    Migration progress stored in a JSON file, so an interrupted migration can be resumed
+    without migrating completed resources again.
+    """
+
+    def __init__(self, path: Optional[str]) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._data: dict[str, dict[str, Any]] = {}
+
+        if path and os.path.exists(path):
+            with open(path) as f:
+                self._data = json.load(f)
+
+    def is_done(self, resource_type: str, resource_id: str) -> bool:
+        return resource_id in self._data.get(resource_type, {})
+
+    def get(self, resource_type: str, resource_id: str) -> Any:
+        return self._data.get(resource_type, {}).get(resource_id)
+
+    def set(self, resource_type: str, resource_id: str, value: Any) -> None:
+        with self._lock:
+            self._data.setdefault(resource_type, {})[resource_id] = value
+            if not self.path:
+                return
+
+            # write to a temporary file first, so the checkpoint is not corrupted if the migration is interrupted
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._data, f)
+            os.replace(tmp_path, self.path)
+
+
+def migrate_resources(
+    checkpoint: Checkpoint,
+    resource_type: str,
+    resources: list[dict],
+    migrate: Callable[[dict], None],
+    format_resource: Callable[[dict], str],
+    result_key: Optional[str] = None,
+) -> None:
+    """
+    Migrate resources of the same type, up to MIGRATION_CONCURRENCY at a time.
+    Resources migrated by a previous run are skipped, resource[result_key] is restored from the checkpoint
+    so resources of other types can refer to them.
+    """
+
+    def _migrate(resource: dict) -> None:
+        if checkpoint.is_done(resource_type, resource["id"]):
+            if result_key:
+                resource[result_key] = checkpoint.get(resource_type, resource["id"])
+        else:
+            migrate(resource)
+            checkpoint.set(
+                resource_type,
+                resource["id"],
+                resource[result_key] if result_key else None,
+            )
+        print(TAB + format_resource(resource))
+
+    executor = ThreadPoolExecutor(max_workers=MIGRATION_CONCURRENCY)
+    try:
+        futures = [executor.submit(_migrate, resource) for resource in resources]
+        for future in as_completed(futures):
+            # stop the migration on the first error
+            future.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
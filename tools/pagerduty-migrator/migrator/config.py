@@ -13,6 +13,14 @@ ONCALL_API_URL = urljoin(
     "api/v1/",
 )
 
+# Max number of resources of the same type migrated concurrently.
+# Resource types are still migrated one after another, as they depend on each other.
+MIGRATION_CONCURRENCY = int(os.getenv("MIGRATION_CONCURRENCY", "1"))
+assert MIGRATION_CONCURRENCY >= 1
+
+# Path to a file to store migration progress in, so an interrupted migration can be resumed
+MIGRATION_CHECKPOINT_FILE = os.getenv("MIGRATION_CHECKPOINT_FILE")
+
 ONCALL_DELAY_OPTIONS = [1, 5, 15, 30, 60]
 PAGERDUTY_TO_ONCALL_CONTACT_METHOD_MAP = {
     "sms_contact_method": "notify_by_sms",
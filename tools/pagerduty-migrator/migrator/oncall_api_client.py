@@ -1,35 +1,69 @@
+import threading
+import time
 from contextlib import suppress
-from time import sleep
 from urllib.parse import urljoin
 
 import requests
 from requests import HTTPError
 from requests.adapters import HTTPAdapter, Retry
 
-from migrator.config import ONCALL_API_TOKEN, ONCALL_API_URL
+from migrator.config import MIGRATION_CONCURRENCY, ONCALL_API_TOKEN, ONCALL_API_URL
 
 
-def api_call(method: str, path: str, **kwargs) -> requests.Response:
-    url = urljoin(ONCALL_API_URL, path)
+class RateLimiter:
+    """
+    Pause requests made by all the threads until the time requested by the Retry-After header of a 429 response.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self) -> None:
+        while True:
+            with self._lock:
+                delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
 
-    # Retry on network errors
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+def _create_session() -> requests.Session:
     session = requests.Session()
-    retries = Retry(total=5, backoff_factor=0.1)
-    session.mount("http://", HTTPAdapter(max_retries=retries))
-    session.mount("https://", HTTPAdapter(max_retries=retries))
+    session.headers["Authorization"] = ONCALL_API_TOKEN
 
-    response = session.request(
-        method, url, headers={"Authorization": ONCALL_API_TOKEN}, **kwargs
+    # Retry on network errors, keep a connection for every thread in the pool
+    retries = Retry(total=5, backoff_factor=0.1)
+    adapter = HTTPAdapter(
+        max_retries=retries, pool_maxsize=max(MIGRATION_CONCURRENCY, 10)
     )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+session = _create_session()
+rate_limiter = RateLimiter()
+
+
+def api_call(method: str, path: str, **kwargs) -> requests.Response:
+    url = urljoin(ONCALL_API_URL, path)
+
+    while True:
+        rate_limiter.wait()
+        response = session.request(method, url, **kwargs)
+        if response.status_code != 429:
+            break
+        rate_limiter.pause(float(response.headers["Retry-After"]))
 
     try:
         response.raise_for_status()
     except HTTPError as e:
-        if e.response.status_code == 429:
-            cooldown_seconds = int(e.response.headers["Retry-After"])
-            sleep(cooldown_seconds)
-            return api_call(method, path, **kwargs)
-        elif e.response.status_code == 400:
+        if e.response.status_code == 400:
             resp_json = None
             with suppress(requests.exceptions.JSONDecodeError):
                 resp_json = response.json()
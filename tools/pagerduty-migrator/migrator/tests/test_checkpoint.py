@@ -0,0 +1,60 @@
+from unittest.mock import Mock
+
+import pytest
+
+from migrator.checkpoint import Checkpoint, migrate_resources
+
+
+def _migrate_schedule(schedule: dict) -> None:
+    schedule["oncall_schedule"] = {"id": "ONCALL_" + schedule["id"]}
+
+
+def test_migrate_resources_resumes_from_checkpoint(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    schedules = [{"id": "S1"}, {"id": "S2"}, {"id": "S3"}]
+
+    def _migrate_schedule_or_fail(schedule: dict) -> None:
+        if schedule["id"] == "S2":
+            raise Exception("failed")
+        _migrate_schedule(schedule)
+
+    # the migration fails on the second schedule
+    migrate = Mock(side_effect=_migrate_schedule_or_fail)
+    with pytest.raises(Exception, match="failed"):
+        migrate_resources(
+            Checkpoint(path),
+            "schedules",
+            schedules,
+            migrate,
+            str,
+            result_key="oncall_schedule",
+        )
+
+    # the next run only migrates the failed schedule, results of the previous run are restored
+    schedules = [{"id": "S1"}, {"id": "S2"}, {"id": "S3"}]
+    migrate = Mock(side_effect=_migrate_schedule)
+    migrate_resources(
+        Checkpoint(path),
+        "schedules",
+        schedules,
+        migrate,
+        str,
+        result_key="oncall_schedule",
+    )
+
+    migrated_ids = [call.args[0]["id"] for call in migrate.call_args_list]
+    assert "S1" not in migrated_ids
+    assert "S2" in migrated_ids
+    assert [s["oncall_schedule"]["id"] for s in schedules] == [
+        "ONCALL_S1",
+        "ONCALL_S2",
+        "ONCALL_S3",
+    ]
+
+
+def test_checkpoint_without_file():
+    checkpoint = Checkpoint(None)
+    checkpoint.set("users", "U1", None)
+
+    assert checkpoint.is_done("users", "U1")
+    assert not checkpoint.is_done("users", "U2")
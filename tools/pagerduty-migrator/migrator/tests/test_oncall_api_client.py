@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from migrator import oncall_api_client
+
+
+def _response(status_code: int, headers: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b"{}"
+    return response
+
+
+def test_api_call_retries_after_rate_limit():
+    responses = [_response(429, {"Retry-After": "3"}), _response(200)]
+    clock = {"now": 1000.0}
+
+    def _sleep(seconds: float) -> None:
+        clock["now"] += seconds
+
+    with patch.object(
+        oncall_api_client, "rate_limiter", oncall_api_client.RateLimiter()
+    ), patch.object(
+        oncall_api_client.session, "request", side_effect=responses
+    ) as mock_request, patch(
+        "migrator.oncall_api_client.time.monotonic", side_effect=lambda: clock["now"]
+    ), patch(
+        "migrator.oncall_api_client.time.sleep", side_effect=_sleep
+    ) as mock_sleep:
+        response = oncall_api_client.api_call("get", "users")
+
+    assert response.status_code == 200
+    assert mock_request.call_count == 2
+    # the next request waits for the time requested by Retry-After
+    mock_sleep.assert_called_once_with(3.0)
+
+
+def test_api_call_uses_shared_session():
+    with patch.object(
+        oncall_api_client.session, "request", return_value=_response(200)
+    ) as mock_request:
+        oncall_api_client.api_call("get", "users")
+        oncall_api_client.api_call("get", "schedules")
+
+    assert mock_request.call_count == 2
+    assert oncall_api_client.session.headers["Authorization"] == "test"
+
+
+def test_api_call_raises_http_errors():
+    with patch.object(
+        oncall_api_client.session, "request", return_value=_response(500)
+    ):
+        with pytest.raises(requests.exceptions.HTTPError):
+            oncall_api_client.api_call("get", "users")